@@ -0,0 +1,73 @@
+from alertalot.actions.sub_actions.create_alarms_in_regions_action import CreateAlarmsInRegionsAction
+from alertalot.generic.execution_plan import ExecutionPlan
+from alertalot.generic.output import Output, OutputLevel
+from alertalot.generic.args_object import ArgsObject
+
+
+def execute(run_args: ArgsObject, output: Output):
+    """
+    Create the alarms of a plan file written by the --plan action. The targets are not described again,
+    and the alarms are not rendered again.
+    
+    The variables and template files are not required. If they are passed, they and the target arguments
+    must be the ones the plan was computed with: their hash is checked against the hash recorded in the
+    plan, so that a plan computed from stale inputs is not applied, unless --ignore-inputs-hash is set.
+    
+    If a shard is provided, only the alarms of that shard are created, so that several runners can apply
+    the same plan in parallel.
+    
+    Args:
+        run_args (ArgsObject): CLI command line arguments
+        output (Output): Output object to use
+    
+    Raises:
+        ValueError: If the inputs of the run do not match the inputs of the plan.
+        AlarmsCreationException: If any of the alarms failed to be created.
+    """
+    output.print_step(f"Loading plan file {run_args.apply_file}...")
+    plan = output.spinner(lambda: ExecutionPlan.load(run_args.apply_file))
+    shard = run_args.shard
+    
+    output.print_key_value({
+        "Created At": plan.created_at,
+        "Inputs Hash": plan.inputs_hash,
+        "Regions": ", ".join(plan.regions),
+        "Alarms": len(plan),
+        "Shard": f"{shard[0] + 1}/{shard[1]}" if shard is not None else "All",
+    }, level=OutputLevel.NORMAL)
+    
+    if not plan.regions:
+        raise ValueError(f"Plan file {run_args.apply_file} has no regions")
+    
+    if run_args.ignore_inputs_hash or (not run_args.var_files and run_args.template_file is None):
+        output.print_bullet("Inputs hash not checked", level=OutputLevel.NORMAL)
+    else:
+        __check_inputs(run_args, plan)
+    
+    CreateAlarmsInRegionsAction.execute(
+        run_args,
+        output,
+        plan.regions,
+        lambda region_args, _: plan.alarms(region_args.region, shard))
+
+
+def __check_inputs(run_args: ArgsObject, plan: ExecutionPlan) -> None:
+    """
+    Check that the inputs of the run are the inputs the plan was computed from.
+    
+    Args:
+        run_args (ArgsObject): CLI command line arguments
+        plan (ExecutionPlan): The plan to apply
+    
+    Raises:
+        ValueError: If the inputs are missing, or do not match the plan's inputs hash.
+    """
+    if not run_args.var_files or run_args.template_file is None:
+        raise ValueError(
+            "The plan's inputs can not be checked without both the --vars-file and --template-file arguments "
+            "it was computed with. Pass both, none, or set --ignore-inputs-hash to apply the plan anyway.")
+    
+    if ExecutionPlan.hash_run_inputs(run_args, plan.regions) != plan.inputs_hash:
+        raise ValueError(
+            f"Plan file {run_args.apply_file} was computed from other inputs: the variables, template or "
+            "targets changed since. Compute the plan again, or set --ignore-inputs-hash to apply it anyway.")
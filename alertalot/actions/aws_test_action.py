@@ -1,5 +1,4 @@
 import sys
-import boto3
 
 from botocore.exceptions import ClientError
 
@@ -18,7 +17,7 @@ def execute(run_args: ArgsObject, output: Output):
     output.print_step("Testing...")
     
     try:
-        sts = boto3.client("sts")
+        sts = run_args.clients.client("sts")
         identity = sts.get_caller_identity()
         
         if run_args.is_verbose:
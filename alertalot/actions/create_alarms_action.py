@@ -1,46 +1,76 @@
-import time
+from typing import Any
+from functools import partial
 
-from alertalot.actions.sub_actions.create_alarm_action import CreateAlarmAction
-from alertalot.actions.sub_actions.load_target_action import LoadTargetAction
-from alertalot.actions.sub_actions.load_template_action import LoadTemplateAction
-from alertalot.actions.sub_actions.load_variables_file_action import LoadVariableFilesAction
-from alertalot.generic.output import Output, OutputLevel
+from alertalot.actions.sub_actions.build_requests_action import BuildRequestsAction
+from alertalot.actions.sub_actions.stream_requests_action import StreamRequestsAction
+from alertalot.actions.sub_actions.sync_requests_action import SyncRequestsAction
+from alertalot.actions.sub_actions.resolve_regions_action import ResolveRegionsAction
+from alertalot.actions.sub_actions.create_alarms_in_regions_action import CreateAlarmsInRegionsAction
+from alertalot.generic.output import Output
 from alertalot.generic.args_object import ArgsObject
+from alertalot.generic.sync_state import SyncState
 
 
 def execute(run_args: ArgsObject, output: Output):
     """
-    Create the alarms for an entity.
+    Create the alarms for one or more entities. The template is rendered once for each entity.
+    
+    If more than one region is provided, the alarms are created in all the regions in parallel. Each
+    region loads its own variables and targets, and is rate limited separately.
+    
+    If a journal file is provided, every completed alarm is recorded in it. When resuming, alarms
+    already recorded in the journal are skipped.
+    
+    With the --stream argument, the template is parsed, rendered and created one entry at a time, see
+    StreamRequestsAction.
+    
+    With the --sync argument, only the instances launched since the previous sync are targeted, see
+    SyncRequestsAction. The sync state is only updated if all the alarms were created.
     
     Currently, supports only AWS/EC2 namespaced metrics
     
     Args:
         run_args (ArgsObject): CLI command line arguments
         output (Output): Output object to use
+    
+    Raises:
+        AlarmsCreationException: If any of the alarms failed to be created.
     """
     if len(run_args.var_files) == 0:
         raise ValueError("No parameters file provided")
-    if run_args.ec2_id is None:
-        raise ValueError("Target must be provided. Missing --ec2-id argument.")
-
-    # 1. Load variables file
-    variables = LoadVariableFilesAction.execute(run_args, output)
+    if run_args.sync_file is not None:
+        if run_args.ec2_ids:
+            raise ValueError("Targets of --sync are selected with --ec2-filter, --ec2-id can not be used.")
+    elif not run_args.ec2_ids and not run_args.ec2_filters:
+        raise ValueError("Target must be provided. Missing --ec2-id, --ec2-ids-file or --ec2-filter argument.")
+    
+    regions = ResolveRegionsAction.execute(run_args, output)
     
-    # 2. Load the target object
-    LoadTargetAction.execute(run_args, output, variables)
+    if run_args.sync_file is None:
+        CreateAlarmsInRegionsAction.execute(
+            run_args,
+            output,
+            regions,
+            StreamRequestsAction.execute if run_args.is_stream else __build_requests)
+        return
     
-    # 3. Load and validate alarms config
-    validator = LoadTemplateAction.execute(run_args, output, variables)
+    state = SyncState.load(run_args.sync_file)
     
-    # 4. Create the alarms.
-    start_time = time.time()
+    CreateAlarmsInRegionsAction.execute(run_args, output, regions, partial(SyncRequestsAction.execute, state=state))
     
-    for config in validator.parsed_config:
-        CreateAlarmAction.execute(output, config)
-        
-    runtime = time.time() - start_time
+    state.save()
+    output.print_bullet(f"Sync state saved to {state.path}")
+
+
+def __build_requests(run_args: ArgsObject, output: Output) -> list[tuple[str, dict[str, Any]]]:
+    """
+    Render the alarms of all the targets of a region.
     
-    # 5. Output success
-    output.print_step("All alarms created")
-    output.print_bullet(f"Total {len(validator.parsed_config)} alarms created", level=OutputLevel.NORMAL)
-    output.print_bullet(f"In {runtime:.2f} seconds")
+    Args:
+        run_args (ArgsObject): CLI command line arguments, bound to the region
+        output (Output): Output object to use
+    
+    Returns:
+        list[tuple[str, dict[str, Any]]]: The target identifier and PutMetricAlarm request of each alarm.
+    """
+    return BuildRequestsAction.execute(run_args, output)[1]
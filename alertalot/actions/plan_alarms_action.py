@@ -0,0 +1,57 @@
+from alertalot.actions.sub_actions.build_requests_action import BuildRequestsAction
+from alertalot.actions.sub_actions.resolve_regions_action import ResolveRegionsAction
+from alertalot.generic.execution_plan import ExecutionPlan
+from alertalot.generic.concurrent_executor import ConcurrentExecutor
+from alertalot.generic.output import Output, OutputLevel
+from alertalot.generic.args_object import ArgsObject
+
+
+def execute(run_args: ArgsObject, output: Output):
+    """
+    Resolve the alarms of all the targets and regions, and write them to a plan file without creating them.
+    The plan can then be applied with the --apply action.
+    
+    Args:
+        run_args (ArgsObject): CLI command line arguments
+        output (Output): Output object to use
+    """
+    if len(run_args.var_files) == 0:
+        raise ValueError("No parameters file provided")
+    if run_args.template_file is None:
+        raise ValueError("No template file provided. Missing the --template-file argument.")
+    if not run_args.ec2_ids and not run_args.ec2_filters:
+        raise ValueError("Target must be provided. Missing --ec2-id, --ec2-ids-file or --ec2-filter argument.")
+    
+    regions = ResolveRegionsAction.execute(run_args, output)
+    plan = ExecutionPlan(ExecutionPlan.hash_run_inputs(run_args, regions))
+    
+    if len(regions) == 1:
+        plan.add_region(regions[0], *BuildRequestsAction.execute(run_args.for_region(regions[0]), output))
+    else:
+        # Live displays, like the spinner, can not be nested, so the regions print only errors.
+        region_output = output.quiet()
+        executor = ConcurrentExecutor(len(regions))
+        
+        output.print_step(f"Resolving alarms in {len(regions)} regions...", level=OutputLevel.NORMAL)
+        
+        results = output.spinner(lambda: executor.run(
+            (region, lambda r=region: BuildRequestsAction.execute(run_args.for_region(r), region_output))
+            for region in regions
+        ))
+        
+        for result in results:
+            if not result.is_success:
+                raise result.error
+            
+            plan.add_region(result.name, *result.result)
+    
+    plan.save(run_args.plan_file)
+    
+    output.print_step("Plan saved", level=OutputLevel.NORMAL)
+    output.print_key_value({
+        "Plan File": run_args.plan_file,
+        "Regions": ", ".join(plan.regions),
+        "Targets": sum(len(plan.targets(region)) for region in plan.regions),
+        "Alarms": len(plan),
+        "Inputs Hash": plan.inputs_hash,
+    }, level=OutputLevel.NORMAL)
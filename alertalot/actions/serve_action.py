@@ -0,0 +1,37 @@
+import signal
+
+from typing import Callable
+
+from alertalot.daemon.daemon_server import DaemonServer
+from alertalot.generic.file_cache import FileCache
+from alertalot.generic.memory_file_cache import MemoryFileCache
+from alertalot.generic.args_object import ArgsObject
+from alertalot.generic.output import Output, OutputLevel
+
+
+def execute(run_args: ArgsObject, output: Output, runner: Callable[..., int]):
+    """
+    Serve runs forwarded by thin clients on a Unix socket, until the process is interrupted or terminated.
+    
+    Args:
+        run_args (ArgsObject): CLI command line arguments
+        output (Output): Output object to use
+        runner (Callable[..., int]): Function executing a single forwarded run
+    """
+    if run_args.socket_path is None:
+        raise ValueError("No socket path provided, use --socket to set it")
+    
+    # Parsed files are kept in memory between runs, on top of the on-disk cache if there is one.
+    FileCache.set_default(MemoryFileCache(FileCache.default()))
+    
+    # Terminating the server stops it like an interrupt, so the socket file is removed.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    
+    server = DaemonServer(run_args.socket_path, runner)
+    
+    output.print_step(f"Serving requests on {server.path}...", level=OutputLevel.NORMAL)
+    
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        output.print_success("Server stopped")
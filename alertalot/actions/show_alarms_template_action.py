@@ -1,4 +1,4 @@
-from alertalot.actions.sub_actions.load_target_action import LoadTargetAction
+from alertalot.actions.sub_actions.load_targets_action import LoadTargetsAction
 from alertalot.actions.sub_actions.load_template_action import LoadTemplateAction
 from alertalot.actions.sub_actions.load_variables_file_action import LoadVariableFilesAction
 from alertalot.generic.variables import Variables
@@ -11,8 +11,8 @@ def execute(run_args: ArgsObject, output: Output):
     """
     Load and print the alarms configuration file.
     
-    If AWS Resource ID is provided, any $VARIABLE in the config string will be replaced with
-    corresponding values from this resource
+    If AWS Resource IDs or filters are provided, the template is printed once for each target, and any
+    $VARIABLE in the config string will be replaced with corresponding values from that target.
     
     If the variables config file is provided, any $VARIABLE in the config string will be replaced with
     corresponding values from the variables file.
@@ -30,14 +30,19 @@ def execute(run_args: ArgsObject, output: Output):
     if run_args.var_files:
         variables.update(LoadVariableFilesAction.execute(run_args, output))
     
-    if entity_object is not None:
-        target = LoadTargetAction.execute(run_args, output)
-        values = entity_object.get_resource_values(target)
+    if entity_object is None:
+        validator = LoadTemplateAction.execute(run_args, output, variables, is_strict=run_args.is_strict)
         
-        variables.update(values)
+        output.print_line()
+        output.print_yaml(validator.parsed_config, level=OutputLevel.NORMAL)
+        return
     
-    validator = LoadTemplateAction.execute(run_args, output, variables, is_strict=run_args.is_strict)
+    entity_object, targets = LoadTargetsAction.execute(run_args, output)
     
-    output.print_line()
-    output.print_yaml(validator.parsed_config, level=OutputLevel.NORMAL)
-    
\ No newline at end of file
+    for target in targets:
+        target_variables = variables.overlay(entity_object.get_resource_values(target))
+        validator = LoadTemplateAction.execute(run_args, output, target_variables, is_strict=run_args.is_strict)
+        
+        output.print_line()
+        output.print_step(f"Template for instance {entity_object.get_entity_id(target)}:", level=OutputLevel.NORMAL)
+        output.print_yaml(validator.parsed_config, level=OutputLevel.NORMAL)
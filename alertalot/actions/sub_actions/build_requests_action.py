@@ -0,0 +1,47 @@
+from typing import Any
+
+from alertalot.generic.output import Output
+from alertalot.generic.args_object import ArgsObject
+from alertalot.actions.sub_actions.create_alarm_action import CreateAlarmAction
+from alertalot.actions.sub_actions.load_targets_action import LoadTargetsAction
+from alertalot.actions.sub_actions.render_alarms_action import RenderAlarmsAction
+from alertalot.actions.sub_actions.load_variables_file_action import LoadVariableFilesAction
+
+
+class BuildRequestsAction:
+    """
+    Action responsible for resolving the PutMetricAlarm requests of all the targets in a region.
+    """
+    @staticmethod
+    def execute(
+            run_args: ArgsObject,
+            output: Output
+    ) -> tuple[dict[str, dict[str, str]], list[tuple[str, dict[str, Any]]]]:
+        """
+        Load the variables and the targets of the region, and render the template for each target.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments, bound to the region
+            output (Output): Output object to use
+        
+        Returns:
+            tuple[dict[str, dict[str, str]], list[tuple[str, dict[str, Any]]]]: The resource values of each
+                target, keyed by the target identifier, and the target identifier and PutMetricAlarm request
+                of each alarm.
+        """
+        # 1. Load variables file
+        variables = LoadVariableFilesAction.execute(run_args, output)
+        
+        # 2. Load the target objects
+        entity_object, targets = LoadTargetsAction.execute(run_args, output)
+        
+        # 3. Load the alarms config, and validate it for each target
+        configs = RenderAlarmsAction.execute(run_args, output, variables, entity_object, targets)
+        
+        snapshot = {
+            entity_object.get_entity_id(target): entity_object.get_resource_values(target)
+            for target in targets
+        }
+        requests = [(target, CreateAlarmAction.to_request(config)) for target, config in configs]
+        
+        return snapshot, requests
@@ -1,8 +1,11 @@
-from typing import Any
+import functools
 
-import boto3
+from typing import Any
 
-from alertalot.generic.output import Output, OutputLevel
+from alertalot.generic.target_type import TargetType
+from alertalot.backends.alarm_backend import AlarmBackend
+from alertalot.entities.base_aws_entity import BaseAwsEntity
+from alertalot.entities.aws_entity_factory import AwsEntityFactory
 
 
 class CreateAlarmAction:
@@ -12,55 +15,52 @@ class CreateAlarmAction:
     
     @staticmethod
     def execute(
-            output: Output,
-            config: dict[str, Any]
-    ) -> None:
+            backend: AlarmBackend,
+            request: dict[str, Any]
+    ) -> dict[str, Any]:
         """
-        Create a single Alarm for an entity
+        Create or update a single Alarm for an entity.
+        
+        This action does not write any output, so it is safe to execute it from a worker thread
+        using a shared backend.
         
         Args:
-            output (Output): Output object to use
-            config (dict[str, Any]): The alarm's configuration
-        """
-        cloudwatch = boto3.client('cloudwatch')
-        name = config["alarm-name"]
+            backend (AlarmBackend): The backend to write the alarm to
+            request (dict[str, Any]): The PutMetricAlarm arguments, as returned by to_request
         
-        output.print_step(f"Creating alarm \"{name}\"...", OutputLevel.NORMAL)
+        Returns:
+            dict[str, Any]: The request sent to the backend
+        """
+        backend.put_metric_alarm(request)
         
-        cloudwatch_config = {
-            "AlarmName": config["alarm-name"],
-            "ComparisonOperator": config["comparison-operator"],
-            "EvaluationPeriods": config["evaluation-periods"],
-            "MetricName": config["metric-name"],
-            "Period": config["period"],
-            "Statistic": config["statistic"],
-            "Threshold": config["threshold"],
-            "ActionsEnabled": False
-        }
+        return request
+    
+    @staticmethod
+    def to_request(config: dict[str, Any]) -> dict[str, Any]:
+        """
+        Convert the alarm's configuration into the PutMetricAlarm request.
         
-        if "namespace" in config:
-            cloudwatch_config["Namespace"] = config["namespace"]
+        Args:
+            config (dict[str, Any]): The alarm's configuration
         
-        if "alarm-actions" in config:
-            cloudwatch_config["ActionsEnabled"] = True
-            cloudwatch_config["AlarmActions"] = config["alarm-actions"]
-
-        if "treat-missing-data" in config:
-            cloudwatch_config["TreatMissingData"] = config["treat-missing-data"]
-
-        if "unit" in config:
-            cloudwatch_config["Unit"] = config["unit"]
-
-        if "tags" in config:
-            tags_dict = config.get("tags", {})
-            cloudwatch_config["Tags"] = [{"Key": key, "Value": value} for key, value in tags_dict.items()]
-            
-        if "dimensions" in config:
-            dim_dict = config.get("dimensions", {})
-            cloudwatch_config["Dimensions"] = [{"Name": key, "Value": value} for key, value in dim_dict.items()]
+        Returns:
+            dict[str, Any]: The PutMetricAlarm arguments
+        """
+        return CreateAlarmAction.__entity(config.get("type", TargetType.GENERIC.value)).to_boto3_alarm(config)
+    
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def __entity(target_type: str) -> BaseAwsEntity:
+        """
+        Get the entity converting the alarms of a type. Converting an alarm does not use the entity's
+        clients, so a single entity of each type is shared by all the alarms, instead of creating one
+        for each alarm of the render hot path.
         
-        output.print_bullet("Alarm configuration:", level=OutputLevel.VERBOSE)
-        output.print_yaml(cloudwatch_config, level=OutputLevel.VERBOSE)
+        Args:
+            target_type (str): The type of the alarm.
         
-        output.spinner(lambda: cloudwatch.put_metric_alarm(**cloudwatch_config))
-        output.print_success("Alarm Created")
+        Returns:
+            BaseAwsEntity: The entity.
+        """
+        return AwsEntityFactory.from_type(target_type)
@@ -0,0 +1,149 @@
+from typing import Any
+
+from alertalot.aws.alarms_diff import AlarmsDiff, AlarmChange
+from alertalot.backends.alarm_backend import AlarmBackend
+from alertalot.backends.alarm_backend_factory import AlarmBackendFactory
+from alertalot.generic.journal import Journal
+from alertalot.generic.output import Output, OutputLevel
+from alertalot.generic.args_object import ArgsObject
+from alertalot.generic.concurrent_executor import ConcurrentExecutor, TaskResult
+from alertalot.actions.sub_actions.create_alarm_action import CreateAlarmAction
+
+
+class CreateAlarmsBatchAction:
+    """
+    Action responsible for creating a set of alarms concurrently.
+    """
+    
+    @staticmethod
+    def execute(  # pylint: disable=too-many-locals
+            run_args: ArgsObject,
+            output: Output,
+            alarms: list[tuple[str, dict[str, Any]]],
+            journal: Journal | None = None
+    ) -> list[TaskResult]:
+        """
+        Create or update all the alarms that are new or modified, using a bounded pool of workers that
+        share a single alarm backend, selected by the --backend argument.
+        
+        Alarms already recorded in the journal with the same content are skipped. The existing alarms
+        are fetched in bulk for the rest, and alarms that did not change are not put again. A failure to
+        put one alarm does not stop the others. Each alarm is recorded in the journal as soon as it is
+        known to be up to date. The outcome of each alarm is printed once all the alarms are processed.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments
+            output (Output): Output object to use
+            alarms (list[tuple[str, dict[str, Any]]]): The target identifier and PutMetricAlarm request of
+                each alarm to create
+            journal (Journal | None): Journal of the completed alarms, if any
+        
+        Returns:
+            list[TaskResult]: The result of each alarm, in the same order as the alarms. For successful
+                alarms, the result holds the AlarmChange that was applied.
+        """
+        max_in_flight = run_args.max_in_flight
+        executor = ConcurrentExecutor(max_in_flight)
+        
+        # Backends are thread safe, so a single backend is shared by all workers.
+        backend = AlarmBackendFactory.from_args(run_args)
+        region = run_args.region or ""
+        targets = [target for target, _ in alarms]
+        requests = [request for _, request in alarms]
+        hashes = [Journal.content_hash(request) if journal is not None else "" for request in requests]
+        changes: list[AlarmChange | None] = [None] * len(requests)
+        
+        if journal is not None:
+            for i, request in enumerate(requests):
+                if journal.is_completed(region, targets[i], request["AlarmName"], hashes[i]):
+                    changes[i] = AlarmChange.SKIPPED
+            
+            skipped = changes.count(AlarmChange.SKIPPED)
+            output.print_bullet(f"Skipping {skipped} alarms completed according to the journal {journal.path}")
+        
+        pending = [i for i, change in enumerate(changes) if change is None]
+        
+        output.print_step("Loading existing alarms...")
+        diff = output.spinner(lambda: AlarmsDiff.load(backend, [requests[i]["AlarmName"] for i in pending]))
+        output.print_bullet(f"Found {len(diff)} existing alarms")
+        
+        for i in pending:
+            changes[i] = diff.change_for(requests[i])
+            
+            if changes[i] == AlarmChange.UNCHANGED and journal is not None:
+                journal.record(region, targets[i], requests[i]["AlarmName"], hashes[i], changes[i].value)
+        
+        changed = [i for i in pending if changes[i] != AlarmChange.UNCHANGED]
+        
+        output.print_step(f"Putting {len(changed)} new or modified alarms...", OutputLevel.NORMAL)
+        output.print_bullet(f"Max in flight: {max_in_flight}")
+        output.print_bullet(f"Backend: {backend.name}")
+        
+        if backend.is_dry_run:
+            output.print_bullet("Dry run, alarms are not written to CloudWatch", level=OutputLevel.NORMAL)
+        
+        for i in changed:
+            output.print_bullet(
+                f"Alarm \"{requests[i]['AlarmName']}\" ({changes[i].value}):",
+                level=OutputLevel.VERBOSE)
+            output.print_yaml(requests[i], level=OutputLevel.VERBOSE)
+        
+        put_results = iter(output.spinner(lambda: executor.run(
+            (
+                requests[i]["AlarmName"],
+                lambda i=i: CreateAlarmsBatchAction.__put(
+                    backend, requests[i], changes[i], journal, (region, targets[i], hashes[i]))
+            )
+            for i in changed
+        )))
+        
+        results = [
+            next(put_results) if change in (AlarmChange.CREATE, AlarmChange.UPDATE)
+            else TaskResult(request["AlarmName"], result=change)
+            for request, change in zip(requests, changes)
+        ]
+        
+        for result in results:
+            if result.is_success:
+                output.print_success(
+                    f"Alarm \"{result.name}\" {result.result.value}",
+                    alarm=result.name,
+                    result=result.result.value)
+            else:
+                output.print_failure(
+                    f"Alarm \"{result.name}\" failed: {result.error}",
+                    level=OutputLevel.QUITE,
+                    alarm=result.name,
+                    error=str(result.error))
+        
+        return results
+    
+    
+    @staticmethod
+    def __put(
+            backend: AlarmBackend,
+            request: dict[str, Any],
+            change: AlarmChange,
+            journal: Journal | None,
+            journal_key: tuple[str, str, str]
+    ) -> AlarmChange:
+        """
+        Put a single alarm, and record it in the journal.
+        
+        Args:
+            backend (AlarmBackend): The backend to write the alarm to
+            request (dict[str, Any]): The PutMetricAlarm arguments
+            change (AlarmChange): The change this request applies
+            journal (Journal | None): Journal of the completed alarms, if any
+            journal_key (tuple[str, str, str]): The region, target and content hash to journal the alarm with
+        
+        Returns:
+            AlarmChange: The applied change.
+        """
+        CreateAlarmAction.execute(backend, request)
+        
+        if journal is not None:
+            region, target, content_hash = journal_key
+            journal.record(region, target, request["AlarmName"], content_hash, change.value)
+        
+        return change
@@ -0,0 +1,219 @@
+import time
+
+from typing import Any, Callable, Iterable
+
+from alertalot.aws.alarms_diff import AlarmChange
+from alertalot.actions.sub_actions.create_alarms_batch_action import CreateAlarmsBatchAction
+from alertalot.actions.sub_actions.create_alarms_stream_action import CreateAlarmsStreamAction
+from alertalot.actions.sub_actions.open_journal_action import OpenJournalAction
+from alertalot.exception.alarms_creation_exception import AlarmsCreationException
+from alertalot.exception.invalid_template_exception import InvalidTemplateException
+from alertalot.generic.journal import Journal
+from alertalot.generic.concurrent_executor import ConcurrentExecutor, TaskResult
+from alertalot.generic.output import Output, OutputLevel
+from alertalot.generic.args_object import ArgsObject
+
+
+class CreateAlarmsInRegionsAction:
+    """
+    Action responsible for creating alarms in one or more regions, and reporting the result.
+    """
+    @staticmethod
+    def execute(
+            run_args: ArgsObject,
+            output: Output,
+            regions: list[str],
+            alarms_for: Callable[[ArgsObject, Output], Iterable[tuple[str, dict[str, Any]]]]) -> None:
+        """
+        Create the alarms of each region. If more than one region is provided, the regions are processed
+        in parallel, each with its own clients and rate limiter, and a consolidated report is printed.
+        
+        If a journal file is provided, every completed alarm is recorded in it. When resuming, alarms
+        already recorded in the journal are skipped.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments
+            output (Output): Output object to use
+            regions (list[str]): The regions to create the alarms in
+            alarms_for (Callable[[ArgsObject, Output], Iterable[tuple[str, dict[str, Any]]]]): Callback returning
+                the target identifier and PutMetricAlarm request of each alarm of a region. It is called with
+                the arguments bound to the region.
+        
+        Raises:
+            AlarmsCreationException: If any of the alarms, or any of the regions, failed.
+        """
+        journal = OpenJournalAction.execute(run_args, output)
+        
+        try:
+            if len(regions) == 1:
+                CreateAlarmsInRegionsAction.__create_in_single_region(
+                    run_args.for_region(regions[0]), output, alarms_for, journal)
+            else:
+                CreateAlarmsInRegionsAction.__create_in_regions(run_args, output, regions, alarms_for, journal)
+        finally:
+            if journal is not None:
+                journal.close()
+    
+    
+    @staticmethod
+    def __create_in_single_region(
+            run_args: ArgsObject,
+            output: Output,
+            alarms_for: Callable[[ArgsObject, Output], Iterable[tuple[str, dict[str, Any]]]],
+            journal: Journal | None) -> None:
+        """
+        Create the alarms in a single region, and print the result.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments, bound to the region
+            output (Output): Output object to use
+            alarms_for (Callable[[ArgsObject, Output], Iterable[tuple[str, dict[str, Any]]]]): The region's alarms
+            journal (Journal | None): Journal of the completed alarms, if any
+        
+        Raises:
+            AlarmsCreationException: If any of the alarms failed to be created.
+        """
+        start_time = time.time()
+        
+        results = CreateAlarmsInRegionsAction.__create_in_region(run_args, output, alarms_for, journal)
+        failures = [f"{result.name}: {result.error}" for result in results if not result.is_success]
+        
+        runtime = time.time() - start_time
+        
+        output.print_step("All alarms processed")
+        output.print_key_value(CreateAlarmsInRegionsAction.__summarize(results), level=OutputLevel.NORMAL)
+        output.print_bullet(f"In {runtime:.2f} seconds")
+        
+        if failures:
+            raise AlarmsCreationException(failures)
+    
+    @staticmethod
+    def __create_in_regions(
+            run_args: ArgsObject,
+            output: Output,
+            regions: list[str],
+            alarms_for: Callable[[ArgsObject, Output], Iterable[tuple[str, dict[str, Any]]]],
+            journal: Journal | None) -> None:
+        """
+        Create the alarms in all the regions in parallel, and print a consolidated report.
+        
+        The regions run concurrently, so their progress is not printed. Only the report is.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments
+            output (Output): Output object to use
+            regions (list[str]): The regions to create the alarms in
+            alarms_for (Callable[[ArgsObject, Output], Iterable[tuple[str, dict[str, Any]]]]): The regions' alarms
+            journal (Journal | None): Journal of the completed alarms, if any
+        
+        Raises:
+            AlarmsCreationException: If any of the alarms, or any of the regions, failed.
+        """
+        start_time = time.time()
+        
+        # Live displays, like the spinner, can not be nested, so the regions print only errors.
+        region_output = output.quiet()
+        executor = ConcurrentExecutor(len(regions))
+        
+        output.print_step(f"Creating alarms in {len(regions)} regions...", level=OutputLevel.NORMAL)
+        output.print_bullet(f"Regions: {', '.join(regions)}")
+        
+        region_results = output.spinner(lambda: executor.run(
+            (
+                region,
+                lambda r=region: CreateAlarmsInRegionsAction.__create_in_region(
+                    run_args.for_region(r), region_output, alarms_for, journal)
+            )
+            for region in regions
+        ))
+        
+        runtime = time.time() - start_time
+        
+        rows = []
+        failures = []
+        
+        for region_result in region_results:
+            region = region_result.name
+            
+            if region_result.is_success:
+                summary = CreateAlarmsInRegionsAction.__summarize(region_result.result)
+                rows.append([region, *summary.values(), f"{region_result.runtime:.2f}s"])
+                failures.extend(
+                    f"[{region}] {result.name}: {result.error}"
+                    for result in region_result.result if not result.is_success)
+            else:
+                rows.append([region, "-", "-", "-", "-", "-", f"{region_result.runtime:.2f}s"])
+                failures.extend(CreateAlarmsInRegionsAction.__region_failures(region_result))
+        
+        output.print_step("All regions processed")
+        output.print_table(
+            ["Region", "Created", "Updated", "Unchanged", "Skipped", "Failed", "Time"],
+            rows,
+            level=OutputLevel.NORMAL)
+        output.print_bullet(f"In {runtime:.2f} seconds")
+        
+        if failures:
+            raise AlarmsCreationException(failures)
+    
+    @staticmethod
+    def __create_in_region(
+            run_args: ArgsObject,
+            output: Output,
+            alarms_for: Callable[[ArgsObject, Output], Iterable[tuple[str, dict[str, Any]]]],
+            journal: Journal | None) -> list[TaskResult]:
+        """
+        Create the alarms of a single region. If the --stream argument is set, the alarms are created
+        while they are produced, otherwise they are all produced first.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments, bound to the region
+            output (Output): Output object to use
+            alarms_for (Callable[[ArgsObject, Output], Iterable[tuple[str, dict[str, Any]]]]): The region's alarms
+            journal (Journal | None): Journal of the completed alarms, if any
+        
+        Returns:
+            list[TaskResult]: The result of each alarm.
+        """
+        alarms = alarms_for(run_args, output)
+        
+        if run_args.is_stream:
+            return CreateAlarmsStreamAction.execute(run_args, output, alarms, journal)
+        
+        return CreateAlarmsBatchAction.execute(run_args, output, list(alarms), journal)
+    
+    @staticmethod
+    def __summarize(results: list[TaskResult]) -> dict[str, int]:
+        """
+        Count the alarms by their outcome.
+        
+        Args:
+            results (list[TaskResult]): The result of each alarm
+        
+        Returns:
+            dict[str, int]: The number of created, updated, unchanged, skipped and failed alarms.
+        """
+        changes = [result.result for result in results if result.is_success]
+        
+        return {
+            "Created": changes.count(AlarmChange.CREATE),
+            "Updated": changes.count(AlarmChange.UPDATE),
+            "Unchanged": changes.count(AlarmChange.UNCHANGED),
+            "Skipped": changes.count(AlarmChange.SKIPPED),
+            "Failed": len(results) - len(changes),
+        }
+    
+    @staticmethod
+    def __region_failures(region_result: TaskResult) -> list[str]:
+        """
+        Describe the error that stopped a region.
+        
+        Args:
+            region_result (TaskResult): The failed result of the region
+        
+        Returns:
+            list[str]: The failure messages, prefixed by the region.
+        """
+        if isinstance(region_result.error, InvalidTemplateException):
+            return [f"[{region_result.name}] {issue}" for issue in region_result.error.issues]
+        
+        return [f"[{region_result.name}] {region_result.error}"]
@@ -0,0 +1,53 @@
+from typing import Any, Iterable
+from itertools import islice
+
+from alertalot.generic.journal import Journal
+from alertalot.generic.output import Output
+from alertalot.generic.args_object import ArgsObject
+from alertalot.generic.concurrent_executor import TaskResult
+from alertalot.actions.sub_actions.create_alarms_batch_action import CreateAlarmsBatchAction
+
+
+class CreateAlarmsStreamAction:
+    """
+    Action responsible for creating a stream of alarms, a bounded chunk at a time.
+    """
+    
+    # Number of alarms read from the stream and created together. Matches the number of alarms a single
+    # DescribeAlarms call can fetch.
+    CHUNK_SIZE = 100
+    
+    
+    @staticmethod
+    def execute(
+            run_args: ArgsObject,
+            output: Output,
+            alarms: Iterable[tuple[str, dict[str, Any]]],
+            journal: Journal | None = None
+    ) -> list[TaskResult]:
+        """
+        Create or update the alarms as they are read from the stream. Only a single chunk of alarms is
+        held at a time, so the first alarms are created before the rest of the stream is produced.
+        
+        Each chunk is created like a batch, see CreateAlarmsBatchAction. A chunk holds at least as many
+        alarms as the maximum number of alarms in flight.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments
+            output (Output): Output object to use
+            alarms (Iterable[tuple[str, dict[str, Any]]]): The target identifier and PutMetricAlarm request
+                of each alarm to create
+            journal (Journal | None): Journal of the completed alarms, if any
+        
+        Returns:
+            list[TaskResult]: The result of each alarm, in the same order as the alarms.
+        """
+        chunk_size = max(CreateAlarmsStreamAction.CHUNK_SIZE, run_args.max_in_flight)
+        alarms = iter(alarms)
+        results = []
+        
+        while chunk := list(islice(alarms, chunk_size)):
+            results.extend(CreateAlarmsBatchAction.execute(run_args, output, chunk, journal))
+            output.print_bullet(f"Processed {len(results)} alarms so far")
+        
+        return results
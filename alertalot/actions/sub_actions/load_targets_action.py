@@ -0,0 +1,56 @@
+from typing import Any
+
+from alertalot.generic.output import Output, OutputLevel
+from alertalot.generic.profiler import Profiler
+from alertalot.generic.args_object import ArgsObject
+from alertalot.entities.base_aws_entity import BaseAwsEntity
+from alertalot.entities.aws_entity_factory import AwsEntityFactory
+
+
+class LoadTargetsAction:
+    """
+    Action responsible for loading all the targets from AWS based on the passed resource
+    IDs and filters.
+    """
+    @staticmethod
+    def execute(run_args: ArgsObject, output: Output) -> tuple[BaseAwsEntity, list[dict[str, Any]]]:
+        """
+        Load all the target instances, using batched describe calls.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments.
+            output (Output): Output object to use.
+        
+        Returns:
+            tuple[BaseAwsEntity, list[dict[str, Any]]]: The entity type of the targets, and the loaded targets.
+        """
+        entity_object = AwsEntityFactory.from_args(run_args)
+        
+        if entity_object is None:
+            raise ValueError("Target must be provided. Missing id argument.")
+        
+        ids = run_args.ec2_ids
+        filters = run_args.ec2_filters
+        
+        output.print_step("Loading instances...")
+        output.print_key_value({
+            "Instance IDs": len(ids) if ids else "Any",
+            "Filters": "\n".join(f"{f['Name']}={','.join(f['Values'])}" for f in filters) or "None",
+        })
+        
+        with Profiler.span("targets"):
+            if ids:
+                targets = output.spinner(lambda: list(entity_object.load_entities(ids, filters)))
+            else:
+                targets = output.spinner(lambda: list(entity_object.iter_entities(filters)))
+        
+        if ids:
+            found = {entity_object.get_entity_id(target) for target in targets}
+            missing = [entity_id for entity_id in ids if entity_id not in found]
+            
+            if missing and not filters:
+                raise ValueError(f"Instances not found: {', '.join(missing)}")
+        
+        output.print_success(f"Found {len(targets)} instances", level=OutputLevel.NORMAL)
+        
+        return entity_object, targets
@@ -1,4 +1,5 @@
 from alertalot.generic.output import Output
+from alertalot.generic.profiler import Profiler
 from alertalot.generic.variables import Variables
 from alertalot.generic.file_loader import load
 from alertalot.generic.args_object import ArgsObject
@@ -30,14 +31,18 @@ class LoadTemplateAction:
         output.print_bullet("Using Variables:")
         output.print_key_value(variables)
         
-        alarm_config = load(run_args.template_file)
+        with Profiler.span("template"):
+            alarm_config = load(run_args.template_file)
         
         validator = AlarmsConfigValidator(
             variables,
             alarm_config,
         )
         
-        if validator.validate(is_strict):
+        with Profiler.span("validation"):
+            is_valid = validator.validate(is_strict)
+        
+        if is_valid:
             output.print_success("File loaded")
             return validator
         else:
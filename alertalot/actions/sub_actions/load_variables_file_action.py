@@ -1,6 +1,7 @@
 import os
 
 from alertalot.generic.output import Output
+from alertalot.generic.profiler import Profiler
 from alertalot.generic.variables import Variables
 from alertalot.generic.args_object import ArgsObject
 
@@ -27,8 +28,9 @@ class LoadVariableFilesAction:
             "Variable Files": os.linesep.join(run_args.var_files),
         })
         
-        data = Variables.parse(run_args.var_files, run_args.region)
-        data.update(run_args.variables)
+        with Profiler.span("variables"):
+            data = Variables.parse(run_args.var_files, run_args.region)
+            data.update(run_args.variables)
         
         output.print_success("Files loaded")
         
@@ -0,0 +1,31 @@
+from alertalot.generic.journal import Journal
+from alertalot.generic.output import Output
+from alertalot.generic.args_object import ArgsObject
+
+
+class OpenJournalAction:
+    """
+    Action responsible for opening the journal of the completed alarms.
+    """
+    @staticmethod
+    def execute(run_args: ArgsObject, output: Output) -> Journal | None:
+        """
+        Open the journal file passed using the --journal or --resume argument. When resuming, the alarms
+        already recorded in the file are loaded.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments.
+            output (Output): Output object to use.
+        
+        Returns:
+            Journal | None: The open journal, or None if no journal file was provided.
+        """
+        if run_args.journal_file is None:
+            return None
+        
+        journal = Journal(run_args.journal_file, resume=run_args.is_resume)
+        journal.open()
+        
+        output.print_bullet(f"Journal {journal.path} has {len(journal)} completed alarms")
+        
+        return journal
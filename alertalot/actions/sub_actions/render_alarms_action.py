@@ -0,0 +1,84 @@
+from typing import Any
+from collections import Counter
+
+from alertalot.generic.output import Output
+from alertalot.generic.profiler import Profiler
+from alertalot.generic.variables import Variables
+from alertalot.generic.file_loader import load
+from alertalot.generic.args_object import ArgsObject
+from alertalot.entities.base_aws_entity import BaseAwsEntity
+from alertalot.exception.invalid_template_exception import InvalidTemplateException
+from alertalot.validation.alarms_template_compiler import AlarmsTemplateCompiler
+
+
+class RenderAlarmsAction:
+    """
+    Action responsible for rendering the alarms template once for each target.
+    """
+    @staticmethod
+    def execute(
+            run_args: ArgsObject,
+            output: Output,
+            variables: Variables,
+            entity_object: BaseAwsEntity,
+            targets: list[dict[str, Any]]) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Load and compile the alarms template file once, and render it with the variables of each target.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments
+            output (Output): Output object to use
+            variables (Variables): Variables shared by all targets
+            entity_object (BaseAwsEntity): The entity type of the targets
+            targets (list[dict[str, Any]]): The targets to render the template for
+        
+        Returns:
+            list[tuple[str, dict[str, Any]]]: The identifier of the target and the configuration of each alarm,
+                for all the targets.
+        
+        Raises:
+            InvalidTemplateException: If the template is not valid for any of the targets, or if the same
+                alarm name is rendered for more than one target.
+        """
+        output.print_step(f"Rendering template file {run_args.template_file} for {len(targets)} targets...")
+        output.print_bullet("Using Variables:")
+        output.print_key_value(variables)
+        
+        with Profiler.span("template"):
+            alarm_config = load(run_args.template_file)
+        
+        target_values = [
+            (entity_object.get_entity_id(target), entity_object.get_resource_values(target))
+            for target in targets
+        ]
+        
+        # Only the fields depending on the targets' values are validated and rendered per target.
+        compiler = AlarmsTemplateCompiler(
+            variables,
+            alarm_config,
+            target_keys={key for _, values in target_values for key in values})
+        
+        with Profiler.span("validation"):
+            if not compiler.compile():
+                raise InvalidTemplateException(run_args.template_file, compiler.issues)
+        
+        configs = []
+        issues = []
+        
+        for target_id, values in target_values:
+            with Profiler.span("render"):
+                target_configs, target_issues = compiler.render(values)
+            
+            configs.extend((target_id, config) for config in target_configs)
+            issues.extend(f"[{target_id}]{issue}" for issue in target_issues)
+        
+        names = Counter(config["alarm-name"] for _, config in configs)
+        issues.extend(
+            f"Alarm name '{name}' is rendered for more than one target" for name, count in names.items() if count > 1)
+        
+        if issues:
+            raise InvalidTemplateException(run_args.template_file, issues)
+        
+        output.print_success(f"Rendered {len(configs)} alarms")
+        
+        return configs
@@ -0,0 +1,54 @@
+from alertalot.generic.output import Output
+from alertalot.generic.args_object import ArgsObject
+
+
+class ResolveRegionsAction:
+    """
+    Action responsible for resolving the regions to run on.
+    """
+    
+    # Keyword used in the --region argument for all the regions enabled for the account.
+    ALL_REGIONS = "all"
+    
+    # Region used to list the enabled regions, if no other region was provided.
+    DISCOVERY_REGION = "us-east-1"
+    
+    
+    @staticmethod
+    def execute(run_args: ArgsObject, output: Output) -> list[str]:
+        """
+        Resolve the regions passed using the --region argument. The 'all' keyword is replaced by the
+        regions enabled for the account, as returned by ec2:DescribeRegions.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments.
+            output (Output): Output object to use.
+        
+        Returns:
+            list[str]: Unique regions to run on, in the order they were provided.
+        
+        Raises:
+            ValueError: If no region was provided.
+        """
+        regions = run_args.regions
+        
+        if not regions:
+            raise ValueError("No region provided. Missing the --region argument.")
+        
+        if ResolveRegionsAction.ALL_REGIONS not in regions:
+            return regions
+        
+        output.print_step("Loading enabled regions...")
+        
+        ec2 = run_args.clients.client("ec2", region=run_args.region or ResolveRegionsAction.DISCOVERY_REGION)
+        response = output.spinner(ec2.describe_regions)
+        enabled = sorted(region["RegionName"] for region in response["Regions"])
+        
+        output.print_success(f"Found {len(enabled)} regions")
+        
+        resolved = []
+        
+        for region in regions:
+            resolved.extend(enabled if region == ResolveRegionsAction.ALL_REGIONS else [region])
+        
+        return list(dict.fromkeys(resolved))
@@ -0,0 +1,143 @@
+from typing import Any, Iterator
+
+from alertalot.generic.output import Output
+from alertalot.generic.profiler import Profiler
+from alertalot.generic.variables import Variables
+from alertalot.generic.file_loader import iter_documents
+from alertalot.generic.args_object import ArgsObject
+from alertalot.exception.invalid_template_exception import InvalidTemplateException
+from alertalot.validation.alarms_template_compiler import AlarmsTemplateCompiler
+from alertalot.actions.sub_actions.create_alarm_action import CreateAlarmAction
+from alertalot.actions.sub_actions.load_targets_action import LoadTargetsAction
+from alertalot.actions.sub_actions.load_variables_file_action import LoadVariableFilesAction
+
+
+class StreamRequestsAction:
+    """
+    Action responsible for lazily resolving the PutMetricAlarm requests of all the targets in a region,
+    one template entry at a time.
+    """
+    @staticmethod
+    def execute(run_args: ArgsObject, output: Output) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Load the variables and the targets of the region, then parse the template entry by entry. Each
+        entry is compiled and rendered for all the targets before the next entry is parsed, so the
+        template is never fully loaded in memory.
+        
+        The template may be a multi-document YAML file or a JSON Lines file. Each document is either a
+        single alarm entry, or an object with an 'alarms' list, like a regular template.
+        
+        Unlike BuildRequestsAction, issues are only found when the entry holding them is reached. The
+        requests of the previous entries are already returned by then.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments, bound to the region
+            output (Output): Output object to use
+        
+        Returns:
+            Iterator[tuple[str, dict[str, Any]]]: The target identifier and PutMetricAlarm request of each
+                alarm.
+        
+        Raises:
+            InvalidTemplateException: If an entry is not valid for any of the targets, or if the same alarm
+                name is rendered more than once.
+        """
+        variables = LoadVariableFilesAction.execute(run_args, output)
+        entity_object, targets = LoadTargetsAction.execute(run_args, output)
+        
+        output.print_step(f"Streaming template file {run_args.template_file} for {len(targets)} targets...")
+        
+        target_values = [
+            (entity_object.get_entity_id(target), entity_object.get_resource_values(target))
+            for target in targets
+        ]
+        target_keys = {key for _, values in target_values for key in values}
+        names = set()
+        
+        for index, entry in enumerate(StreamRequestsAction.__iter_entries(run_args.template_file)):
+            for target_id, request in StreamRequestsAction.__render_entry(
+                    run_args, variables, target_values, target_keys=target_keys, index=index, entry=entry):
+                
+                if request["AlarmName"] in names:
+                    raise InvalidTemplateException(
+                        run_args.template_file,
+                        [f"Alarm name '{request['AlarmName']}' is rendered for more than one target"])
+                
+                names.add(request["AlarmName"])
+                
+                yield target_id, request
+        
+        output.print_success(f"Rendered {len(names)} alarms")
+    
+    
+    @staticmethod
+    def __iter_entries(path: str) -> Iterator[Any]:
+        """
+        Lazily parse the alarm entries of a streamed template.
+        
+        Args:
+            path (str): Path to the template file.
+        
+        Returns:
+            Iterator[Any]: The raw alarm entries, in order.
+        """
+        for document in iter_documents(path):
+            if document is None:
+                continue
+            
+            if isinstance(document, dict) and isinstance(document.get("alarms"), list):
+                yield from document["alarms"]
+            else:
+                yield document
+    
+    @staticmethod
+    def __render_entry(  # pylint: disable=too-many-arguments
+            run_args: ArgsObject,
+            variables: Variables,
+            target_values: list[tuple[str, dict[str, str]]],
+            *,
+            target_keys: set[str],
+            index: int,
+            entry: Any) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Compile a single alarm entry, and render it for all the targets.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments
+            variables (Variables): Variables shared by all targets
+            target_values (list[tuple[str, dict[str, str]]]): The identifier and resource values of each target
+            target_keys (set[str]): Names of the variables provided by the targets
+            index (int): The index of the entry in the template
+            entry (Any): The raw alarm entry
+        
+        Returns:
+            list[tuple[str, dict[str, Any]]]: The target identifier and PutMetricAlarm request of the entry's
+                alarm, for each target.
+        
+        Raises:
+            InvalidTemplateException: If the entry is not valid for any of the targets.
+        """
+        compiler = AlarmsTemplateCompiler(
+            variables,
+            {"alarms": [entry]},
+            target_keys=target_keys,
+            first_index=index)
+        
+        with Profiler.span("validation"):
+            if not compiler.compile():
+                raise InvalidTemplateException(run_args.template_file, compiler.issues)
+        
+        requests = []
+        issues = []
+        
+        for target_id, values in target_values:
+            with Profiler.span("render"):
+                configs, target_issues = compiler.render(values)
+            
+            requests.extend((target_id, CreateAlarmAction.to_request(config)) for config in configs)
+            issues.extend(f"[{target_id}]{issue}" for issue in target_issues)
+        
+        if issues:
+            raise InvalidTemplateException(run_args.template_file, issues)
+        
+        return requests
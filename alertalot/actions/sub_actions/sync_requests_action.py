@@ -0,0 +1,71 @@
+from typing import Any
+
+from alertalot.generic.output import Output, OutputLevel
+from alertalot.generic.profiler import Profiler
+from alertalot.generic.sync_state import SyncState
+from alertalot.generic.args_object import ArgsObject
+from alertalot.entities.aws_ec2_entity import AwsEc2Entity
+from alertalot.actions.sub_actions.create_alarm_action import CreateAlarmAction
+from alertalot.actions.sub_actions.render_alarms_action import RenderAlarmsAction
+from alertalot.actions.sub_actions.load_variables_file_action import LoadVariableFilesAction
+
+
+class SyncRequestsAction:
+    """
+    Action responsible for resolving the PutMetricAlarm requests of the targets launched in a region since
+    its last sync.
+    """
+    @staticmethod
+    def execute(run_args: ArgsObject, output: Output, state: SyncState) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Load the instances launched since the watermark of the region, and render the template for the
+        ones that were not synced yet. Only the days since the watermark are listed, unless the region
+        was never synced with the same filters, or the watermark is too old, in which case all the
+        instances are listed.
+        
+        The synced instances are staged in the state, which must be saved once their alarms are created.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments, bound to the region
+            output (Output): Output object to use
+            state (SyncState): The sync state
+        
+        Returns:
+            list[tuple[str, dict[str, Any]]]: The target identifier and PutMetricAlarm request of each alarm.
+        """
+        region = run_args.region
+        filters = run_args.ec2_filters
+        
+        variables = LoadVariableFilesAction.execute(run_args, output)
+        entity_object = AwsEc2Entity(run_args.clients)
+        
+        since = state.since(region, filters)
+        launch_filter = SyncState.launch_time_filter(since) if since is not None else None
+        
+        output.print_step("Loading instances launched since the last sync...")
+        output.print_key_value({
+            "Sync State": state.path,
+            "Watermark": state.watermark(region) or "None",
+            "Scan": ", ".join(launch_filter["Values"]) if launch_filter else "All instances",
+        })
+        
+        with Profiler.span("targets"):
+            targets = output.spinner(lambda: list(entity_object.iter_entities(
+                filters + [launch_filter] if launch_filter else filters)))
+        
+        new_targets = [
+            target for target in targets
+            if state.is_new(region, filters, entity_object.get_entity_id(target), target["LaunchTime"])
+        ]
+        
+        output.print_success(
+            f"Found {len(new_targets)} new instances, out of {len(targets)} listed", level=OutputLevel.NORMAL)
+        
+        configs = RenderAlarmsAction.execute(run_args, output, variables, entity_object, new_targets) \
+            if new_targets else []
+        
+        state.stage(region, filters, [
+            (entity_object.get_entity_id(target), target["LaunchTime"]) for target in new_targets
+        ])
+        
+        return [(target, CreateAlarmAction.to_request(config)) for target, config in configs]
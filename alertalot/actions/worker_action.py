@@ -0,0 +1,30 @@
+from alertalot.worker.sqs_queue import SqsQueue
+from alertalot.worker.launch_worker import LaunchWorker
+from alertalot.generic.args_object import ArgsObject
+from alertalot.generic.output import Output, OutputLevel
+
+
+def execute(run_args: ArgsObject, output: Output):
+    """
+    Create the alarms of EC2 instances as they launch, from the state change events of an SQS queue.
+    
+    Args:
+        run_args (ArgsObject): CLI command line arguments
+        output (Output): Output object to use
+    """
+    if len(run_args.var_files) == 0:
+        raise ValueError("No parameters file provided")
+    if run_args.template_file is None:
+        raise ValueError("No template file provided. Missing the --template-file argument.")
+    
+    queue = SqsQueue(run_args.clients.client("sqs"), run_args.worker_queue)
+    
+    output.print_step(f"Consuming launch events from {queue.url}...", level=OutputLevel.NORMAL)
+    output.print_bullet(f"Coalesce window: {run_args.coalesce_seconds} seconds")
+    
+    worker = LaunchWorker(run_args, output, queue, coalesce_seconds=run_args.coalesce_seconds)
+    
+    try:
+        worker.run(drain=run_args.is_drain)
+    except KeyboardInterrupt:
+        output.print_success("Worker stopped")
@@ -0,0 +1,140 @@
+from enum import Enum
+from typing import Any, Iterable
+
+from alertalot.backends.alarm_backend import AlarmBackend
+
+
+class AlarmChange(Enum):
+    """
+    The change required to bring an existing alarm in line with the requested configuration.
+    
+    Attributes:
+        CREATE: The alarm does not exist yet.
+        UPDATE: The alarm exists, but its configuration is different.
+        UNCHANGED: The alarm exists with the same configuration, so there is no need to put it.
+        SKIPPED: The alarm was already put with the same configuration by a previous run, according to
+            the run's journal, so it was not checked again.
+    """
+    CREATE = "create"
+    UPDATE = "update"
+    UNCHANGED = "unchanged"
+    SKIPPED = "skipped"
+
+
+class AlarmsDiff:
+    """
+    Compares PutMetricAlarm requests with the alarms that already exist in CloudWatch.
+    
+    The existing alarms are fetched in bulk from an alarm backend.
+    
+    Tags are not part of the comparison. DescribeAlarms does not return them, and PutMetricAlarm ignores
+    the tags of an alarm that already exists.
+    
+    Usage:
+        diff = AlarmsDiff.load(backend, [request["AlarmName"] for request in requests])
+        changed = [request for request in requests if diff.change_for(request) != AlarmChange.UNCHANGED]
+    """
+    
+    # Compared properties, and the value CloudWatch uses when the property is not set.
+    __COMPARED_PROPERTIES: dict[str, Any] = {
+        "AlarmName": None,
+        "AlarmDescription": None,
+        "ActionsEnabled": True,
+        "OKActions": [],
+        "AlarmActions": [],
+        "InsufficientDataActions": [],
+        "MetricName": None,
+        "Namespace": None,
+        "Statistic": None,
+        "ExtendedStatistic": None,
+        "Dimensions": [],
+        "Period": None,
+        "Unit": None,
+        "EvaluationPeriods": None,
+        "DatapointsToAlarm": None,
+        "Threshold": None,
+        "ComparisonOperator": None,
+        "TreatMissingData": "missing",
+        "EvaluateLowSampleCountPercentile": None,
+    }
+    
+    
+    def __init__(self, existing: dict[str, dict[str, Any]]):
+        """
+        Initialize the diff.
+        
+        Args:
+            existing (dict[str, dict[str, Any]]): The existing alarms as returned by DescribeAlarms,
+                keyed by the alarm name.
+        """
+        self.__existing = {name: AlarmsDiff.normalize(alarm) for name, alarm in existing.items()}
+    
+    
+    def __len__(self) -> int:
+        """
+        Get the number of existing alarms.
+        
+        Returns:
+            int: The number of existing alarms found.
+        """
+        return len(self.__existing)
+    
+    def change_for(self, request: dict[str, Any]) -> AlarmChange:
+        """
+        Get the change required for a PutMetricAlarm request.
+        
+        Args:
+            request (dict[str, Any]): The PutMetricAlarm arguments.
+        
+        Returns:
+            AlarmChange: The required change.
+        """
+        existing = self.__existing.get(request["AlarmName"])
+        
+        if existing is None:
+            return AlarmChange.CREATE
+        
+        if existing != AlarmsDiff.normalize(request):
+            return AlarmChange.UPDATE
+        
+        return AlarmChange.UNCHANGED
+    
+    
+    @staticmethod
+    def normalize(alarm: dict[str, Any]) -> dict[str, Any]:
+        """
+        Convert an alarm, either a PutMetricAlarm request or a DescribeAlarms result, into a form that
+        can be compared. Properties that are not set get their CloudWatch default, and lists that CloudWatch
+        does not keep in order are sorted.
+        
+        Args:
+            alarm (dict[str, Any]): The alarm.
+        
+        Returns:
+            dict[str, Any]: The normalized alarm.
+        """
+        normalized = {key: alarm.get(key, default) for key, default in AlarmsDiff.__COMPARED_PROPERTIES.items()}
+        
+        for key in ("OKActions", "AlarmActions", "InsufficientDataActions"):
+            normalized[key] = sorted(normalized[key])
+        
+        normalized["Dimensions"] = sorted((item["Name"], str(item["Value"])) for item in normalized["Dimensions"])
+        
+        if normalized["Threshold"] is not None:
+            normalized["Threshold"] = float(normalized["Threshold"])
+        
+        return normalized
+    
+    @staticmethod
+    def load(backend: AlarmBackend, names: Iterable[str]) -> "AlarmsDiff":
+        """
+        Fetch the existing alarms from the backend.
+        
+        Args:
+            backend (AlarmBackend): The backend to read the alarms from.
+            names (Iterable[str]): The names of the alarms to fetch.
+        
+        Returns:
+            AlarmsDiff: The diff against the alarms found. Names that do not exist are ignored.
+        """
+        return AlarmsDiff(backend.describe_alarms(names))
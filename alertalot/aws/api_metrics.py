@@ -0,0 +1,410 @@
+import os
+import json
+import time
+import tempfile
+import threading
+
+from typing import Any, Callable
+from functools import partial
+from datetime import datetime, timezone
+
+from alertalot.aws.rate_limiter import ApiRateLimiter
+
+
+class _ApiStats:
+    def __init__(self, buckets: int):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttles = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * (buckets + 1)
+
+
+class ApiMetrics:
+    """
+    Collect metrics about the AWS API calls of a run, for each API and region: the number of calls, errors,
+    retries and throttled attempts, the bytes sent and received, and a histogram of the calls' latency.
+    
+    The metrics are recorded by botocore hooks, attached to every client with ApiMetrics.attach. The hooks
+    do nothing unless a collector is set as the default, so a client can be attached once and used by
+    runs with and without metrics.
+    
+    A call is counted once, however many attempts it took. Its latency includes its retries and rate
+    limiting, and the bytes of all its attempts are counted. A call is an error if it raised, after
+    all its retries.
+    
+    Usage:
+        metrics = ApiMetrics(json_file="metrics.json", textfile="/var/lib/node_exporter/alertalot.prom")
+        ApiMetrics.set_default(metrics)
+        ...
+        metrics.write()
+    """
+    
+    # Upper bounds of the latency histogram buckets, in seconds. Same as the Prometheus client defaults.
+    LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    __default: "ApiMetrics | None" = None
+    __CONTEXT_KEY = "alertalot_api_metrics_start"
+    
+    __PROMETHEUS_COUNTERS = (
+        ("calls", "alertalot_aws_api_calls_total", "Number of AWS API calls, including the failed ones."),
+        ("errors", "alertalot_aws_api_errors_total", "Number of AWS API calls that failed after all their retries."),
+        ("retries", "alertalot_aws_api_retries_total", "Number of retried attempts of AWS API calls."),
+        ("throttles", "alertalot_aws_api_throttles_total", "Number of attempts of AWS API calls that were throttled."),
+        ("request_bytes", "alertalot_aws_api_request_bytes_total", "Bytes sent in AWS API requests."),
+        ("response_bytes", "alertalot_aws_api_response_bytes_total", "Bytes received in AWS API responses."),
+    )
+    
+    
+    def __init__(
+            self,
+            *,
+            json_file: str | None = None,
+            textfile: str | None = None,
+            clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize an empty collector.
+        
+        Args:
+            json_file (str | None): File the JSON report is written to by write.
+            textfile (str | None): File the Prometheus text format report is written to by write.
+            clock (Callable[[], float]): Monotonic clock returning the current time in seconds.
+        """
+        self.__json_file = json_file
+        self.__textfile = textfile
+        self.__clock = clock
+        self.__started_at = datetime.now(timezone.utc)
+        self.__started_clock = clock()
+        self.__lock = threading.Lock()
+        self.__stats: dict[tuple[str, str, str | None], _ApiStats] = {}
+    
+    
+    @property
+    def json_file(self) -> str | None:
+        """
+        The file the JSON report is written to.
+        
+        Returns:
+            str | None: The path, or None if no JSON report is written.
+        """
+        return self.__json_file
+    
+    @property
+    def textfile(self) -> str | None:
+        """
+        The file the Prometheus text format report is written to.
+        
+        Returns:
+            str | None: The path, or None if no Prometheus report is written.
+        """
+        return self.__textfile
+    
+    @property
+    def clock(self) -> Callable[[], float]:
+        """
+        The clock used to measure the calls.
+        
+        Returns:
+            Callable[[], float]: The clock.
+        """
+        return self.__clock
+    
+    
+    def record_call(
+            self,
+            api: str,
+            region: str | None,
+            latency: float,
+            *,
+            retries: int = 0,
+            is_error: bool = False) -> None:
+        """
+        Record a completed call.
+        
+        Args:
+            api (str): The API, in the format 'service.Operation'.
+            region (str | None): The region of the client.
+            latency (float): The duration of the call, in seconds.
+            retries (int): The number of attempts after the first one.
+            is_error (bool): True if the call failed.
+        """
+        bucket = next(
+            (i for i, bound in enumerate(self.LATENCY_BUCKETS) if latency <= bound),
+            len(self.LATENCY_BUCKETS))
+        
+        with self.__lock:
+            stats = self.__get_stats(api, region)
+            stats.calls += 1
+            stats.retries += retries
+            stats.errors += 1 if is_error else 0
+            stats.latency_sum += latency
+            stats.latency_buckets[bucket] += 1
+    
+    def record_attempt(
+            self,
+            api: str,
+            region: str | None,
+            *,
+            request_bytes: int = 0,
+            response_bytes: int = 0,
+            is_throttled: bool = False) -> None:
+        """
+        Record the bytes and the throttling of a single attempt of a call.
+        
+        Args:
+            api (str): The API, in the format 'service.Operation'.
+            region (str | None): The region of the client.
+            request_bytes (int): Bytes sent.
+            response_bytes (int): Bytes received.
+            is_throttled (bool): True if the attempt was throttled.
+        """
+        with self.__lock:
+            stats = self.__get_stats(api, region)
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            stats.throttles += 1 if is_throttled else 0
+    
+    def to_json(self) -> dict[str, Any]:
+        """
+        Build the JSON report.
+        
+        Returns:
+            dict[str, Any]: The report, with the totals of the run and the metrics of each API and region.
+        """
+        apis = []
+        
+        with self.__lock:
+            for (service, operation, region), stats in sorted(self.__stats.items(), key=lambda i: str(i[0])):
+                cumulative = 0
+                buckets = {}
+                
+                for bound, count in zip([*map(str, self.LATENCY_BUCKETS), "+Inf"], stats.latency_buckets):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                
+                apis.append({
+                    "service": service,
+                    "operation": operation,
+                    "region": region,
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "retries": stats.retries,
+                    "throttles": stats.throttles,
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "latency_seconds": {"sum": round(stats.latency_sum, 6), "buckets": buckets},
+                })
+        
+        totals = {
+            key: sum(api[key] for api in apis)
+            for key in ("calls", "errors", "retries", "throttles", "request_bytes", "response_bytes")
+        }
+        
+        return {
+            "started_at": self.__started_at.isoformat(),
+            "duration_seconds": round(self.__clock() - self.__started_clock, 6),
+            "totals": totals,
+            "apis": apis,
+        }
+    
+    def to_prometheus(self) -> str:
+        """
+        Build the Prometheus text format report, for the textfile collector of node_exporter.
+        
+        Returns:
+            str: The report.
+        """
+        report = self.to_json()
+        lines = []
+        
+        for key, name, description in self.__PROMETHEUS_COUNTERS:
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(f"{name}{{{ApiMetrics.__labels(api)}}} {api[key]}" for api in report["apis"])
+        
+        name = "alertalot_aws_api_call_duration_seconds"
+        lines.append(f"# HELP {name} Duration of AWS API calls, including their retries.")
+        lines.append(f"# TYPE {name} histogram")
+        
+        for api in report["apis"]:
+            labels = ApiMetrics.__labels(api)
+            
+            for bound, count in api["latency_seconds"]["buckets"].items():
+                lines.append(f"{name}_bucket{{{labels},le=\"{bound}\"}} {count}")
+            
+            lines.append(f"{name}_sum{{{labels}}} {api['latency_seconds']['sum']}")
+            lines.append(f"{name}_count{{{labels}}} {api['calls']}")
+        
+        name = "alertalot_last_run_timestamp_seconds"
+        lines.append(f"# HELP {name} Time the metrics were written at.")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {time.time():.3f}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def write(self) -> None:
+        """
+        Write the reports to their files. Files are replaced atomically, so a collector reading them never
+        sees a partial report.
+        """
+        if self.__json_file:
+            ApiMetrics.__write_atomically(self.__json_file, json.dumps(self.to_json(), indent=2))
+        
+        if self.__textfile:
+            ApiMetrics.__write_atomically(self.__textfile, self.to_prometheus())
+    
+    
+    def __get_stats(self, api: str, region: str | None) -> _ApiStats:
+        """
+        Get the stats of an API in a region, creating them on the first call. Must be called with the lock.
+        
+        Args:
+            api (str): The API, in the format 'service.Operation'.
+            region (str | None): The region.
+        
+        Returns:
+            _ApiStats: The stats.
+        """
+        service, operation = api.split(".", 1)
+        key = (service, operation, region)
+        
+        if key not in self.__stats:
+            self.__stats[key] = _ApiStats(len(self.LATENCY_BUCKETS))
+        
+        return self.__stats[key]
+    
+    
+    @staticmethod
+    def default() -> "ApiMetrics | None":
+        """
+        Get the collector recording the API calls of the current run.
+        
+        Returns:
+            ApiMetrics | None: The collector, or None if no metrics are recorded.
+        """
+        return ApiMetrics.__default
+    
+    @staticmethod
+    def set_default(metrics: "ApiMetrics | None") -> None:
+        """
+        Set the collector recording the API calls of the current run.
+        
+        Args:
+            metrics (ApiMetrics | None): The collector, or None to stop recording.
+        """
+        ApiMetrics.__default = metrics
+    
+    @staticmethod
+    def attach(client: Any) -> None:
+        """
+        Register hooks on a boto3 client, recording its calls with the default collector.
+        
+        Args:
+            client (Any): The boto3 client.
+        """
+        region = client.meta.region_name
+        events = client.meta.events
+        
+        events.register("before-parameter-build", ApiMetrics.__on_call_start)
+        events.register("after-call", partial(ApiMetrics.__on_call_end, region))
+        events.register("after-call-error", partial(ApiMetrics.__on_call_end, region))
+        events.register("before-send", partial(ApiMetrics.__on_before_send, region))
+        events.register("needs-retry", partial(ApiMetrics.__on_needs_retry, region))
+    
+    
+    @staticmethod
+    def __labels(api: dict[str, Any]) -> str:
+        """
+        Format the labels of an API for the Prometheus text format.
+        
+        Args:
+            api (dict[str, Any]): The API entry of the JSON report.
+        
+        Returns:
+            str: The labels, without the braces.
+        """
+        def escape(value: str | None) -> str:
+            return (value or "").replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        
+        return ",".join(f"{key}=\"{escape(api[key])}\"" for key in ("service", "operation", "region"))
+    
+    @staticmethod
+    def __write_atomically(path: str, content: str) -> None:
+        """
+        Write a file through a temporary file in the same directory, replaced once complete.
+        
+        Args:
+            path (str): The file to write.
+            content (str): The content of the file.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            
+            # mkstemp creates the file readable by its owner only, but collectors may run as another user.
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except OSError:
+            os.remove(temp_path)
+            raise
+    
+    @staticmethod
+    def __on_call_start(context: dict[str, Any] | None = None, **_) -> None:
+        metrics = ApiMetrics.__default
+        
+        if metrics is not None and context is not None:
+            context[ApiMetrics.__CONTEXT_KEY] = metrics.clock()
+    
+    @staticmethod
+    def __on_call_end(
+            region: str | None,
+            event_name: str,
+            context: dict[str, Any] | None = None,
+            http_response: Any = None,
+            **_) -> None:
+        metrics = ApiMetrics.__default
+        
+        if metrics is None or context is None or ApiMetrics.__CONTEXT_KEY not in context:
+            return
+        
+        start = context.pop(ApiMetrics.__CONTEXT_KEY)
+        is_error = http_response is None or http_response.status_code >= 300
+        
+        metrics.record_call(
+            ApiRateLimiter.api_from_event(event_name),
+            region,
+            metrics.clock() - start,
+            retries=context.get("retries", {}).get("attempt", 1) - 1,
+            is_error=is_error)
+    
+    @staticmethod
+    def __on_before_send(region: str | None, event_name: str, request: Any = None, **_) -> None:
+        metrics = ApiMetrics.__default
+        body = getattr(request, "body", None)
+        
+        if metrics is None or not isinstance(body, (bytes, str)):
+            return
+        
+        size = len(body.encode("utf-8") if isinstance(body, str) else body)
+        metrics.record_attempt(ApiRateLimiter.api_from_event(event_name), region, request_bytes=size)
+    
+    @staticmethod
+    def __on_needs_retry(region: str | None, event_name: str, response: Any = None, **_) -> None:
+        metrics = ApiMetrics.__default
+        
+        if metrics is None or response is None:
+            return
+        
+        http_response, parsed = response
+        
+        metrics.record_attempt(
+            ApiRateLimiter.api_from_event(event_name),
+            region,
+            response_bytes=len(http_response.content or b""),
+            is_throttled=parsed.get("Error", {}).get("Code") in ApiRateLimiter.THROTTLING_ERROR_CODES)
@@ -0,0 +1,296 @@
+import copy
+import threading
+
+from typing import Any
+from functools import partial
+
+import boto3
+import botocore.session
+
+from botocore.config import Config
+from botocore.credentials import CredentialProvider, CredentialResolver, RefreshableCredentials
+
+from alertalot.aws.api_metrics import ApiMetrics
+from alertalot.aws.rate_limiter import ApiRateLimiter
+from alertalot.generic.profiler import Profiler
+from alertalot.aws.throttled_client import ThrottledClient
+
+
+class _AssumedRoleProvider(CredentialProvider):
+    """
+    Credential provider of a session, returning the refreshable credentials of an assumed role.
+    """
+    
+    METHOD = "alertalot-assume-role"
+    
+    
+    def __init__(self, credentials: RefreshableCredentials):
+        """
+        Initialize the provider.
+        
+        Args:
+            credentials (RefreshableCredentials): The credentials of the role.
+        """
+        super().__init__()
+        self.__credentials = credentials
+    
+    
+    def load(self) -> Any:
+        """
+        Get the credentials of the role.
+        
+        Returns:
+            Any: The refreshable credentials.
+        """
+        return self.__credentials
+
+
+class ClientRegistry:
+    """
+    Registry of the boto3 sessions and clients used by a single run.
+    
+    Each client is created once, with a tuned botocore configuration, and reused for the rest of the run.
+    Clients are keyed by (service, region, role), where the role is an optional IAM role ARN to assume,
+    which also determines the target account.
+    
+    boto3 clients are thread safe, but creating them is not, so the registry guards client creation
+    with a lock and the returned clients can be shared between worker threads.
+    
+    All the calls are rate limited. Rate limits apply to each account and region separately, so each
+    (region, role) pair gets its own ApiRateLimiter.
+    
+    Usage:
+        clients = ClientRegistry(region="us-east-1", max_pool_connections=20)
+        cloudwatch = clients.client("cloudwatch")
+        ec2 = clients.client("ec2", region="eu-west-1", role_arn="arn:aws:iam::123456789012:role/alertalot")
+    """
+    
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            *,
+            region: str | None = None,
+            role_arn: str | None = None,
+            max_pool_connections: int = 10,
+            max_attempts: int = 5,
+            connect_timeout: float = 5,
+            read_timeout: float = 30,
+            api_tps: dict[str, float] | None = None):
+        """
+        Initialize the registry.
+        
+        Args:
+            region (str | None): The default region. If None, the region is resolved by boto3.
+            role_arn (str | None): The default IAM role to assume. If None, the caller's credentials are used.
+            max_pool_connections (int): Maximum number of open connections kept by each client.
+            max_attempts (int): Maximum number of attempts for each request, including the first one.
+            connect_timeout (float): Time in seconds to wait for a connection to be established.
+            read_timeout (float): Time in seconds to wait for a response once connected.
+            api_tps (dict[str, float] | None): Requests per second for each API, see ApiRateLimiter.
+        """
+        self.__region = region
+        self.__role_arn = role_arn
+        self.__api_tps = api_tps
+        self.__max_concurrency = max_pool_connections
+        
+        # The standard retry mode, as the client side rate limiting of the adaptive mode would compete with
+        # the token buckets and concurrency limits of ApiRateLimiter.
+        self.__config = Config(
+            max_pool_connections=max_pool_connections,
+            retries={"mode": "standard", "total_max_attempts": max_attempts},
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            tcp_keepalive=True,
+        )
+        
+        self.__lock = threading.RLock()
+        self.__sessions: dict[str | None, boto3.session.Session] = {}
+        self.__clients: dict[tuple[str, str | None, str | None], ThrottledClient] = {}
+        self.__limiters: dict[tuple[str | None, str | None], ApiRateLimiter] = {}
+    
+    
+    @property
+    def region(self) -> str | None:
+        """
+        The default region of the created clients.
+        
+        Returns:
+            str | None: The region, or None if it is resolved by boto3.
+        """
+        return self.__region
+    
+    @property
+    def role_arn(self) -> str | None:
+        """
+        The default IAM role assumed by the created clients.
+        
+        Returns:
+            str | None: The role ARN, or None if the caller's credentials are used.
+        """
+        return self.__role_arn
+    
+    @property
+    def config(self) -> Config:
+        """
+        The botocore configuration used for all the created clients.
+        
+        Returns:
+            Config: The botocore configuration.
+        """
+        return self.__config
+    
+    
+    def client(self, service: str, *, region: str | None = None, role_arn: str | None = None) -> ThrottledClient:
+        """
+        Get the rate limited client for a service, creating it on the first call.
+        
+        Args:
+            service (str): The AWS service name, for example 'cloudwatch'.
+            region (str | None): The region of the client. If None, the registry's region is used.
+            role_arn (str | None): The role to assume. If None, the registry's role is used.
+        
+        Returns:
+            ThrottledClient: The boto3 client, wrapped by the rate limiter.
+        """
+        return self.__get_client(service, region or self.__region, role_arn or self.__role_arn)
+    
+    def session(self, *, role_arn: str | None = None) -> boto3.session.Session:
+        """
+        Get the session for a role, creating it on the first call.
+        
+        All the regions share the same session, so credentials are resolved only once per role.
+        
+        Args:
+            role_arn (str | None): The role to assume. If None, the registry's role is used.
+        
+        Returns:
+            boto3.session.Session: The session.
+        """
+        return self.__get_session(role_arn or self.__role_arn)
+    
+    
+    def for_region(self, region: str) -> "ClientRegistry":
+        """
+        Get a registry that creates its clients in another region by default.
+        
+        The returned registry shares the sessions, clients and rate limiters of this registry, so
+        credentials are resolved once, and each region keeps a single rate limiter however it is accessed.
+        
+        Args:
+            region (str): The default region of the returned registry.
+        
+        Returns:
+            ClientRegistry: The registry for the region.
+        """
+        registry = copy.copy(self)
+        registry.__region = region  # pylint: disable=protected-access,unused-private-member
+        
+        return registry
+    
+    def limiter(self, *, region: str | None = None, role_arn: str | None = None) -> ApiRateLimiter:
+        """
+        Get the rate limiter used for a region and role, creating it on the first call.
+        
+        Args:
+            region (str | None): The region. If None, the registry's region is used.
+            role_arn (str | None): The role. If None, the registry's role is used.
+        
+        Returns:
+            ApiRateLimiter: The rate limiter.
+        """
+        key = (region or self.__region, role_arn or self.__role_arn)
+        
+        with self.__lock:
+            if key not in self.__limiters:
+                self.__limiters[key] = ApiRateLimiter(self.__api_tps, max_concurrency=self.__max_concurrency)
+            
+            return self.__limiters[key]
+    
+    
+    def __get_client(self, service: str, region: str | None, role_arn: str | None) -> ThrottledClient:
+        """
+        Get a client by its key, creating it on the first call.
+        
+        Args:
+            service (str): The AWS service name.
+            region (str | None): The region of the client.
+            role_arn (str | None): The role to assume, or None for the caller's credentials.
+        
+        Returns:
+            ThrottledClient: The rate limited boto3 client.
+        """
+        key = (service, region, role_arn)
+        
+        with self.__lock:
+            session = self.__get_session(role_arn)
+            
+            if key not in self.__clients:
+                client = session.client(service, region_name=region, config=self.__config)
+                Profiler.attach(client)
+                ApiMetrics.attach(client)
+                
+                self.__clients[key] = ThrottledClient(client, self.limiter(region=region, role_arn=role_arn))
+            
+            return self.__clients[key]
+    
+    def __get_session(self, role_arn: str | None) -> boto3.session.Session:
+        """
+        Get the session for a role, creating it on the first call.
+        
+        Args:
+            role_arn (str | None): The role to assume, or None for the caller's credentials.
+        
+        Returns:
+            boto3.session.Session: The session.
+        """
+        with self.__lock:
+            if role_arn not in self.__sessions:
+                if role_arn is None:
+                    self.__sessions[None] = boto3.session.Session(region_name=self.__region)
+                else:
+                    self.__sessions[role_arn] = self.__assume_role(role_arn)
+            
+            return self.__sessions[role_arn]
+    
+    def __assume_role(self, role_arn: str) -> boto3.session.Session:
+        """
+        Assume a role using the caller's credentials, and create a session for it.
+        
+        The session's credentials are refreshable: botocore assumes the role again before they expire, so
+        the clients already created for the role, like the ones held by a long running worker, keep working.
+        
+        Args:
+            role_arn (str): The role to assume.
+        
+        Returns:
+            boto3.session.Session: A session using the role's temporary credentials.
+        """
+        fetch = partial(self.__fetch_role_credentials, role_arn)
+        credentials = RefreshableCredentials.create_from_metadata(
+            metadata=fetch(),
+            refresh_using=fetch,
+            method=_AssumedRoleProvider.METHOD)
+        
+        session = botocore.session.Session()
+        session.register_component("credential_provider", CredentialResolver([_AssumedRoleProvider(credentials)]))
+        
+        return boto3.session.Session(botocore_session=session, region_name=self.__region)
+    
+    def __fetch_role_credentials(self, role_arn: str) -> dict[str, str]:
+        """
+        Assume a role using the caller's credentials.
+        
+        Args:
+            role_arn (str): The role to assume.
+        
+        Returns:
+            dict[str, str]: The temporary credentials, in the format of RefreshableCredentials metadata.
+        """
+        sts = self.__get_client("sts", self.__region, None)
+        credentials = sts.assume_role(RoleArn=role_arn, RoleSessionName="alertalot")["Credentials"]
+        
+        return {
+            "access_key": credentials["AccessKeyId"],
+            "secret_key": credentials["SecretAccessKey"],
+            "token": credentials["SessionToken"],
+            "expiry_time": credentials["Expiration"].isoformat(),
+        }
@@ -0,0 +1,445 @@
+import time
+import random
+import threading
+
+from typing import Any, Callable
+
+from botocore.exceptions import ClientError
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket, limiting the rate of requests to a fixed number of requests per second.
+    
+    Tokens are reserved in the order the callers arrive, so a caller that waits for a token is never
+    overtaken by a later one.
+    """
+    
+    def __init__(
+            self,
+            rate: float,
+            burst: float | None = None,
+            *,
+            clock: Callable[[], float] = time.monotonic,
+            sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize the token bucket. The bucket starts full.
+        
+        Args:
+            rate (float): Number of tokens added to the bucket every second.
+            burst (float | None): Maximum number of tokens in the bucket. Defaults to one second worth of tokens.
+            clock (Callable[[], float]): Monotonic clock, in seconds.
+            sleep (Callable[[float], None]): Function used to wait for a token.
+        
+        Raises:
+            ValueError: If the rate is not positive.
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        
+        self.__rate = float(rate)
+        self.__capacity = float(burst) if burst is not None else max(1.0, self.__rate)
+        self.__tokens = self.__capacity
+        self.__clock = clock
+        self.__sleep = sleep
+        self.__updated_at = clock()
+        self.__lock = threading.Lock()
+    
+    
+    @property
+    def rate(self) -> float:
+        """
+        The number of tokens added to the bucket every second.
+        
+        Returns:
+            float: Tokens per second.
+        """
+        return self.__rate
+    
+    
+    def acquire(self) -> float:
+        """
+        Take a single token from the bucket, waiting until one is available.
+        
+        Returns:
+            float: The time in seconds the caller waited for the token.
+        """
+        with self.__lock:
+            now = self.__clock()
+            
+            self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated_at) * self.__rate)
+            self.__updated_at = now
+            self.__tokens -= 1
+            
+            wait = -self.__tokens / self.__rate if self.__tokens < 0 else 0.0
+        
+        if wait > 0:
+            self.__sleep(wait)
+        
+        return wait
+
+
+class AdaptiveConcurrency:
+    """
+    Thread safe limit on the number of concurrent requests, adjusted using AIMD (additive increase,
+    multiplicative decrease).
+    
+    Every successful request increases the limit by 1/limit, so the limit grows by about one for each
+    full window of requests. A throttled request cuts the limit by the decrease factor. Throttling responses
+    usually arrive in bursts, so the limit is cut at most once per cooldown period.
+    """
+    
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            max_limit: int,
+            *,
+            min_limit: int = 1,
+            decrease_factor: float = 0.5,
+            cooldown: float = 1.0,
+            clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the concurrency limit. The limit starts at its maximum.
+        
+        Args:
+            max_limit (int): The maximum number of concurrent requests.
+            min_limit (int): The minimum number of concurrent requests.
+            decrease_factor (float): The limit is multiplied by this value when a request is throttled.
+            cooldown (float): Minimum time in seconds between two decreases of the limit.
+            clock (Callable[[], float]): Monotonic clock, in seconds.
+        """
+        self.__max_limit = float(max(max_limit, min_limit))
+        self.__min_limit = float(min_limit)
+        self.__limit = self.__max_limit
+        self.__decrease_factor = decrease_factor
+        self.__cooldown = cooldown
+        self.__clock = clock
+        self.__last_decrease = None
+        self.__in_flight = 0
+        self.__condition = threading.Condition()
+    
+    
+    @property
+    def limit(self) -> int:
+        """
+        The current number of requests allowed to execute at the same time.
+        
+        Returns:
+            int: The current limit.
+        """
+        return int(self.__limit)
+    
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests currently executing.
+        
+        Returns:
+            int: The number of requests holding a slot.
+        """
+        return self.__in_flight
+    
+    
+    def acquire(self) -> None:
+        """
+        Take a slot, waiting until the number of requests in flight is below the current limit.
+        """
+        with self.__condition:
+            while self.__in_flight >= int(self.__limit):
+                self.__condition.wait()
+            
+            self.__in_flight += 1
+    
+    def release(self, *, is_throttled: bool = False) -> None:
+        """
+        Release a slot taken by acquire, and adjust the limit based on the outcome of the request.
+        
+        Args:
+            is_throttled (bool): True if the request was throttled.
+        """
+        with self.__condition:
+            self.__in_flight -= 1
+            
+            if is_throttled:
+                self.on_throttle()
+            else:
+                self.__limit = min(self.__max_limit, self.__limit + 1 / self.__limit)
+            
+            self.__condition.notify_all()
+    
+    def on_throttle(self) -> None:
+        """
+        Decrease the limit after a throttling response, unless it was decreased within the cooldown period.
+        """
+        with self.__condition:
+            now = self.__clock()
+            
+            if self.__last_decrease is not None and now - self.__last_decrease < self.__cooldown:
+                return
+            
+            self.__last_decrease = now
+            self.__limit = max(self.__min_limit, self.__limit * self.__decrease_factor)
+
+
+class ApiRateLimiter:
+    """
+    Rate limiter for AWS API calls.
+    
+    Each API, identified as 'service.Operation' (for example 'cloudwatch.PutMetricAlarm'), gets a token
+    bucket with the configured requests per second, and an adaptive concurrency limit. A rate can also be
+    configured for a whole service (for example 'ec2'), in which case all the service's operations share
+    one bucket. APIs without a configured rate are not rate limited.
+    
+    Calls that fail with a throttling error are retried with a full jitter exponential backoff.
+    
+    Usage:
+        limiter = ApiRateLimiter({"cloudwatch.PutMetricAlarm": 3}, max_concurrency=10)
+        limiter.call("cloudwatch.PutMetricAlarm", cloudwatch.put_metric_alarm, **request)
+    """
+    
+    # Default rates, based on the default AWS API quotas.
+    DEFAULT_API_TPS: dict[str, float] = {
+        "cloudwatch.PutMetricAlarm": 3,
+        "cloudwatch.DeleteAlarms": 3,
+        "cloudwatch.DescribeAlarms": 9,
+        "ec2": 20,
+    }
+    
+    THROTTLING_ERROR_CODES = frozenset([
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "SlowDown",
+        "EC2ThrottledException",
+    ])
+    
+    
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            api_tps: dict[str, float] | None = None,
+            *,
+            max_concurrency: int = 10,
+            max_retries: int = 5,
+            base_delay: float = 0.5,
+            max_delay: float = 20.0,
+            sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            api_tps (dict[str, float] | None): Requests per second for each API or service. The values override
+                DEFAULT_API_TPS, and a value of 0 disables rate limiting for that API. A service's rate also
+                replaces the default rates of its operations, unless they are passed as well.
+            max_concurrency (int): The maximum number of concurrent calls for each API.
+            max_retries (int): The maximum number of retries for a throttled call, including the retries done
+                by botocore.
+            base_delay (float): The base backoff delay, in seconds.
+            max_delay (float): The maximum backoff delay, in seconds.
+            sleep (Callable[[float], None]): Function used to wait.
+        """
+        api_tps = api_tps or {}
+        defaults = {
+            api: tps for api, tps in ApiRateLimiter.DEFAULT_API_TPS.items()
+            if api.split(".", 1)[0] not in api_tps
+        }
+        
+        self.__api_tps = defaults | api_tps
+        self.__max_concurrency = max_concurrency
+        self.__max_retries = max_retries
+        self.__base_delay = base_delay
+        self.__max_delay = max_delay
+        self.__sleep = sleep
+        
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__buckets: dict[str, TokenBucket | None] = {}
+        self.__concurrency: dict[str, AdaptiveConcurrency] = {}
+    
+    
+    def bucket_for(self, api: str) -> TokenBucket | None:
+        """
+        Get the token bucket of an API.
+        
+        Args:
+            api (str): The API, in the format 'service.Operation'.
+        
+        Returns:
+            TokenBucket | None: The bucket, or None if the API is not rate limited.
+        """
+        key = self.__key_for(api)
+        
+        with self.__lock:
+            if key not in self.__buckets:
+                rate = self.rate_for(api)
+                self.__buckets[key] = TokenBucket(rate, sleep=self.__sleep) if rate else None
+            
+            return self.__buckets[key]
+    
+    def rate_for(self, api: str) -> float | None:
+        """
+        Get the requests per second allowed for an API.
+        
+        Args:
+            api (str): The API, in the format 'service.Operation'.
+        
+        Returns:
+            float | None: The rate, or None if the API is not rate limited.
+        """
+        return self.__api_tps.get(self.__key_for(api)) or None
+    
+    def concurrency_for(self, api: str) -> AdaptiveConcurrency:
+        """
+        Get the adaptive concurrency limit of an API.
+        
+        Args:
+            api (str): The API, in the format 'service.Operation'.
+        
+        Returns:
+            AdaptiveConcurrency: The concurrency limit.
+        """
+        with self.__lock:
+            if api not in self.__concurrency:
+                self.__concurrency[api] = AdaptiveConcurrency(self.__max_concurrency)
+            
+            return self.__concurrency[api]
+    
+    def call(self, api: str, callback: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call an API, retrying it with backoff while it is throttled.
+        
+        Args:
+            api (str): The API, in the format 'service.Operation'.
+            callback (Callable[..., Any]): The function that calls the API.
+            *args: Positional arguments for the callback.
+            **kwargs: Keyword arguments for the callback.
+        
+        Returns:
+            Any: The value returned by the callback.
+        
+        Raises:
+            ClientError: If the call failed, or was still throttled after all the retries.
+        """
+        concurrency = self.concurrency_for(api)
+        bucket = self.bucket_for(api)
+        attempt = 0
+        
+        while True:
+            concurrency.acquire()
+            
+            try:
+                if bucket is not None:
+                    bucket.acquire()
+                    
+                    # The token is already taken, so the request sent by an attached client must not take another.
+                    self.__local.prepaid = True
+                
+                result = callback(*args, **kwargs)
+            except ClientError as e:
+                is_throttled = ApiRateLimiter.is_throttling_error(e)
+                concurrency.release(is_throttled=is_throttled)
+                
+                # Retries already done by botocore count towards the limit, so the two retry loops do not multiply.
+                attempt += e.response.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+                
+                if not is_throttled or attempt >= self.__max_retries:
+                    raise
+                
+                self.__sleep(self.backoff(attempt))
+                attempt += 1
+                continue
+            except Exception:
+                concurrency.release()
+                raise
+            finally:
+                self.__local.prepaid = False
+            
+            concurrency.release()
+            return result
+    
+    def backoff(self, attempt: int) -> float:
+        """
+        Get a random delay before retrying a throttled call, using a full jitter exponential backoff.
+        
+        Args:
+            attempt (int): The number of retries already done.
+        
+        Returns:
+            float: The delay in seconds.
+        """
+        return random.uniform(0, min(self.__max_delay, self.__base_delay * (2 ** attempt)))
+    
+    def attach(self, client: Any) -> None:
+        """
+        Register hooks on a boto3 client, so that requests sent by it consume tokens, including paginated
+        requests and retries done by botocore itself, and throttling responses reduce the concurrency limit.
+        
+        Args:
+            client (Any): The boto3 client.
+        """
+        client.meta.events.register("before-send", self.__on_before_send)
+        client.meta.events.register_first("needs-retry", self.__on_needs_retry)
+    
+    
+    @staticmethod
+    def is_throttling_error(error: Exception) -> bool:
+        """
+        Check if an exception is a throttling error returned by AWS.
+        
+        Args:
+            error (Exception): The exception to check.
+        
+        Returns:
+            bool: True if the error is a throttling error.
+        """
+        if not isinstance(error, ClientError):
+            return False
+        
+        return error.response.get("Error", {}).get("Code") in ApiRateLimiter.THROTTLING_ERROR_CODES
+    
+    @staticmethod
+    def api_from_event(event_name: str) -> str:
+        """
+        Get the API name from a botocore event name.
+        
+        Args:
+            event_name (str): The event name, for example 'before-send.cloudwatch.PutMetricAlarm'.
+        
+        Returns:
+            str: The API, for example 'cloudwatch.PutMetricAlarm'.
+        """
+        return event_name.split(".", 1)[1]
+    
+    
+    def __key_for(self, api: str) -> str:
+        """
+        Get the key of the rate of an API: the API itself if it has a configured rate, its service otherwise.
+        
+        Args:
+            api (str): The API, in the format 'service.Operation'.
+        
+        Returns:
+            str: The key.
+        """
+        return api if api in self.__api_tps else api.split(".", 1)[0]
+    
+    def __on_before_send(self, event_name: str, **_) -> None:
+        if getattr(self.__local, "prepaid", False):
+            self.__local.prepaid = False
+            return
+        
+        bucket = self.bucket_for(ApiRateLimiter.api_from_event(event_name))
+        
+        if bucket is not None:
+            bucket.acquire()
+    
+    def __on_needs_retry(self, event_name: str, response: Any = None, **_) -> None:
+        if response is None:
+            return
+        
+        code = response[1].get("Error", {}).get("Code")
+        
+        if code in ApiRateLimiter.THROTTLING_ERROR_CODES:
+            self.concurrency_for(ApiRateLimiter.api_from_event(event_name)).on_throttle()
@@ -0,0 +1,81 @@
+from typing import Any, Callable
+from functools import partial
+
+from alertalot.aws.rate_limiter import ApiRateLimiter
+
+
+class ThrottledClient:
+    """
+    Wrapper for a boto3 client that calls every API operation through an ApiRateLimiter.
+    
+    Any attribute that is not an API operation, like `meta` or `get_paginator`, is taken from the
+    wrapped client as is.
+    """
+    
+    def __init__(self, client: Any, limiter: ApiRateLimiter):
+        """
+        Wrap a boto3 client. Also attaches the limiter's hooks to the client.
+        
+        Args:
+            client (Any): The boto3 client to wrap.
+            limiter (ApiRateLimiter): The rate limiter to use.
+        """
+        self.__client = client
+        self.__limiter = limiter
+        self.__service = client.meta.service_model.service_id.hyphenize()
+        self.__operations = client.meta.method_to_api_mapping
+        
+        limiter.attach(client)
+    
+    
+    @property
+    def client(self) -> Any:
+        """
+        The wrapped boto3 client.
+        
+        Returns:
+            Any: The boto3 client.
+        """
+        return self.__client
+    
+    @property
+    def limiter(self) -> ApiRateLimiter:
+        """
+        The rate limiter used by this client.
+        
+        Returns:
+            ApiRateLimiter: The rate limiter.
+        """
+        return self.__limiter
+    
+    
+    def __getattr__(self, name: str) -> Any:
+        """
+        Get an attribute of the wrapped client. API operations are wrapped by the rate limiter.
+        
+        Args:
+            name (str): The attribute name.
+        
+        Returns:
+            Any: The attribute.
+        """
+        attribute = getattr(self.__client, name)
+        
+        if name not in self.__operations:
+            return attribute
+        
+        return self.__wrap(f"{self.__service}.{self.__operations[name]}", attribute)
+    
+    
+    def __wrap(self, api: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap an API operation with the rate limiter.
+        
+        Args:
+            api (str): The API name, in the format 'service.Operation'.
+            method (Callable[..., Any]): The client's method.
+        
+        Returns:
+            Callable[..., Any]: The wrapped method.
+        """
+        return partial(self.__limiter.call, api, method)
@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
+
+
+class AlarmBackend(ABC):
+    """
+    Base abstract class for the stores alarms are written to.
+    
+    All the reads and writes of alarms go through a backend, so the same actions can run against the real
+    CloudWatch API, an in-memory emulator, or a recorder that only writes the requests to a file.
+    
+    Implementations must be thread safe, as a single backend is shared by all the workers of a region.
+    """
+    
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """
+        The name of the backend, as passed to the --backend argument.
+        
+        Returns:
+            str: The backend name.
+        """
+    
+    @property
+    def is_dry_run(self) -> bool:
+        """
+        Check if the backend does not apply the writes to CloudWatch.
+        
+        Returns:
+            bool: True if alarms are not actually created, updated or deleted.
+        """
+        return False
+    
+    
+    @abstractmethod
+    def put_metric_alarm(self, request: dict[str, Any]) -> None:
+        """
+        Create or update a single alarm.
+        
+        Args:
+            request (dict[str, Any]): The PutMetricAlarm arguments.
+        """
+    
+    @abstractmethod
+    def describe_alarms(self, names: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """
+        Fetch the existing metric alarms with the given names.
+        
+        Args:
+            names (Iterable[str]): The names of the alarms to fetch.
+        
+        Returns:
+            dict[str, dict[str, Any]]: The alarms found, in the DescribeAlarms format, keyed by the alarm name.
+                Names that do not exist are ignored.
+        """
+    
+    @abstractmethod
+    def delete_alarms(self, names: Iterable[str]) -> None:
+        """
+        Delete the alarms with the given names. Names that do not exist are ignored.
+        
+        Args:
+            names (Iterable[str]): The names of the alarms to delete.
+        """
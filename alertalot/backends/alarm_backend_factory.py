@@ -0,0 +1,49 @@
+from alertalot.generic.args_object import ArgsObject
+from alertalot.backends.alarm_backend import AlarmBackend
+
+
+class AlarmBackendFactory:
+    """
+    Factory for creating alarm backend instances.
+    """
+    
+    # Names accepted by the --backend argument.
+    BACKENDS = ("cloudwatch", "emulator", "recorder")
+    
+    
+    @staticmethod
+    def from_args(args: ArgsObject) -> AlarmBackend:
+        """
+        Create the backend selected by the command line arguments, for the region the arguments are bound to.
+        
+        Args:
+            args (ArgsObject): Command line arguments object.
+        
+        Returns:
+            AlarmBackend: The backend instance.
+        
+        Raises:
+            NotImplementedError: If the backend is not implemented.
+        """
+        # The backends are imported when used, as the command line parser only needs the names.
+        # pylint: disable=import-outside-toplevel
+        from alertalot.backends.cloudwatch_backend import CloudWatchBackend
+        from alertalot.backends.emulator_backend import EmulatorBackend
+        from alertalot.backends.recorder_backend import RecorderBackend
+        
+        match args.backend:
+            case "cloudwatch":
+                return CloudWatchBackend(args.clients.client("cloudwatch"))
+            case "emulator":
+                return EmulatorBackend(
+                    latency=args.emulator_latency,
+                    throttle_rate=args.emulator_throttle_rate,
+                    limiter=args.clients.limiter())
+            case "recorder":
+                return RecorderBackend(
+                    CloudWatchBackend(args.clients.client("cloudwatch")),
+                    path=args.record_file,
+                    region=args.region)
+            
+            case _:
+                raise NotImplementedError(f"Missing alarm backend '{args.backend}'")
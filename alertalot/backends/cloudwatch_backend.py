@@ -0,0 +1,56 @@
+from typing import Any, Iterable
+
+from alertalot.backends.alarm_backend import AlarmBackend
+
+
+class CloudWatchBackend(AlarmBackend):
+    """
+    Implementation of AlarmBackend for the CloudWatch API.
+    
+    DescribeAlarms and DeleteAlarms accept up to 100 alarm names per call, so names are sent in batches.
+    """
+    
+    # Maximum number of alarm names accepted by a single DescribeAlarms or DeleteAlarms call.
+    BATCH_SIZE = 100
+    
+    
+    def __init__(self, cloudwatch: Any):
+        """
+        Initialize the backend.
+        
+        Args:
+            cloudwatch (Any): The boto3 CloudWatch client to use. boto3 clients are thread safe, so the
+                client is shared by all the workers.
+        """
+        self.__cloudwatch = cloudwatch
+    
+    
+    @property
+    def name(self) -> str:
+        return "cloudwatch"
+    
+    
+    def put_metric_alarm(self, request: dict[str, Any]) -> None:
+        self.__cloudwatch.put_metric_alarm(**request)
+    
+    def describe_alarms(self, names: Iterable[str]) -> dict[str, dict[str, Any]]:
+        names = list(dict.fromkeys(names))
+        paginator = self.__cloudwatch.get_paginator("describe_alarms")
+        existing = {}
+        
+        for i in range(0, len(names), self.BATCH_SIZE):
+            pages = paginator.paginate(
+                AlarmNames=names[i:i + self.BATCH_SIZE],
+                AlarmTypes=["MetricAlarm"])
+            
+            for page in pages:
+                for alarm in page.get("MetricAlarms", []):
+                    existing[alarm["AlarmName"]] = alarm
+        
+        return existing
+    
+    def delete_alarms(self, names: Iterable[str]) -> None:
+        names = list(dict.fromkeys(names))
+        
+        for i in range(0, len(names), self.BATCH_SIZE):
+            self.__cloudwatch.delete_alarms(AlarmNames=names[i:i + self.BATCH_SIZE])
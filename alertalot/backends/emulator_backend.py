@@ -0,0 +1,220 @@
+import copy
+import time
+import random
+import threading
+
+from typing import Any, Callable, Iterable
+
+from botocore.exceptions import ClientError
+
+from alertalot.aws.rate_limiter import ApiRateLimiter
+from alertalot.backends.alarm_backend import AlarmBackend
+
+
+class EmulatorBackend(AlarmBackend):
+    """
+    Implementation of AlarmBackend that keeps the alarms in memory, emulating the CloudWatch API.
+    
+    Each emulated API call waits for the configured latency, and fails with a Throttling error at the
+    configured rate, like the real API would under load. Calls go through the same rate limiter as real
+    calls when one is provided, so throttled calls are retried with backoff. This allows dry runs and
+    load tests of the whole pipeline without any AWS account.
+    
+    Usage:
+        backend = EmulatorBackend(latency=0.05, throttle_rate=0.1)
+        backend.put_metric_alarm({"AlarmName": "cpu", ...})
+    """
+    
+    # Maximum number of alarm names accepted by a single DescribeAlarms or DeleteAlarms call.
+    BATCH_SIZE = 100
+    
+    # Properties required by PutMetricAlarm.
+    __REQUIRED_PROPERTIES = ("AlarmName", "EvaluationPeriods", "ComparisonOperator")
+    
+    
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            *,
+            latency: float = 0.0,
+            throttle_rate: float = 0.0,
+            limiter: ApiRateLimiter | None = None,
+            seed: int | None = None,
+            sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize an empty emulator.
+        
+        Args:
+            latency (float): Time in seconds each emulated call takes.
+            throttle_rate (float): Probability, between 0 and 1, of each emulated call to be throttled.
+            limiter (ApiRateLimiter | None): Rate limiter to send the calls through, if any.
+            seed (int | None): Seed of the random throttling, for reproducible runs.
+            sleep (Callable[[float], None]): Function used to wait for the latency.
+        
+        Raises:
+            ValueError: If the latency is negative, or the throttle rate is not between 0 and 1.
+        """
+        if latency < 0:
+            raise ValueError(f"Latency can not be negative, got {latency}")
+        if not 0 <= throttle_rate <= 1:
+            raise ValueError(f"Throttle rate must be between 0 and 1, got {throttle_rate}")
+        
+        self.__latency = latency
+        self.__throttle_rate = throttle_rate
+        self.__limiter = limiter
+        self.__random = random.Random(seed)
+        self.__sleep = sleep
+        
+        self.__lock = threading.Lock()
+        self.__alarms: dict[str, dict[str, Any]] = {}
+        self.__calls: dict[str, int] = {}
+        self.__throttled: dict[str, int] = {}
+    
+    
+    @property
+    def name(self) -> str:
+        return "emulator"
+    
+    @property
+    def is_dry_run(self) -> bool:
+        return True
+    
+    @property
+    def alarms(self) -> dict[str, dict[str, Any]]:
+        """
+        The alarms stored in the emulator.
+        
+        Returns:
+            dict[str, dict[str, Any]]: A copy of the alarms, in the DescribeAlarms format, keyed by name.
+        """
+        with self.__lock:
+            return copy.deepcopy(self.__alarms)
+    
+    @property
+    def calls(self) -> dict[str, int]:
+        """
+        The number of emulated calls of each API, including the throttled ones.
+        
+        Returns:
+            dict[str, int]: Number of calls keyed by API name, for example 'PutMetricAlarm'.
+        """
+        with self.__lock:
+            return dict(self.__calls)
+    
+    @property
+    def throttled(self) -> dict[str, int]:
+        """
+        The number of emulated calls of each API that failed with a Throttling error.
+        
+        Returns:
+            dict[str, int]: Number of throttled calls keyed by API name.
+        """
+        with self.__lock:
+            return dict(self.__throttled)
+    
+    
+    def put_metric_alarm(self, request: dict[str, Any]) -> None:
+        self.__call("PutMetricAlarm", self.__put_metric_alarm, request)
+    
+    def describe_alarms(self, names: Iterable[str]) -> dict[str, dict[str, Any]]:
+        names = list(dict.fromkeys(names))
+        existing = {}
+        
+        for i in range(0, len(names), self.BATCH_SIZE):
+            existing.update(self.__call("DescribeAlarms", self.__describe_alarms, names[i:i + self.BATCH_SIZE]))
+        
+        return existing
+    
+    def delete_alarms(self, names: Iterable[str]) -> None:
+        names = list(dict.fromkeys(names))
+        
+        for i in range(0, len(names), self.BATCH_SIZE):
+            self.__call("DeleteAlarms", self.__delete_alarms, names[i:i + self.BATCH_SIZE])
+    
+    
+    def __call(self, operation: str, callback: Callable[..., Any], *args) -> Any:
+        """
+        Emulate a single API call, through the rate limiter if there is one.
+        
+        Args:
+            operation (str): The API operation, for example 'PutMetricAlarm'.
+            callback (Callable[..., Any]): The function applying the call to the stored alarms.
+            *args: Arguments for the callback.
+        
+        Returns:
+            Any: The value returned by the callback.
+        """
+        if self.__limiter is None:
+            return self.__emulate(operation, callback, *args)
+        
+        return self.__limiter.call(f"cloudwatch.{operation}", self.__emulate, operation, callback, *args)
+    
+    def __emulate(self, operation: str, callback: Callable[..., Any], *args) -> Any:
+        """
+        Wait for the latency, then either fail with a Throttling error or apply the call.
+        
+        Args:
+            operation (str): The API operation, for example 'PutMetricAlarm'.
+            callback (Callable[..., Any]): The function applying the call to the stored alarms.
+            *args: Arguments for the callback.
+        
+        Returns:
+            Any: The value returned by the callback.
+        
+        Raises:
+            ClientError: If the call is throttled, or the request is not valid.
+        """
+        if self.__latency > 0:
+            self.__sleep(self.__latency)
+        
+        with self.__lock:
+            self.__calls[operation] = self.__calls.get(operation, 0) + 1
+            is_throttled = self.__random.random() < self.__throttle_rate
+            
+            if is_throttled:
+                self.__throttled[operation] = self.__throttled.get(operation, 0) + 1
+        
+        if is_throttled:
+            raise EmulatorBackend.__error(operation, "Throttling", "Rate exceeded")
+        
+        return callback(*args)
+    
+    def __put_metric_alarm(self, request: dict[str, Any]) -> None:
+        missing = [key for key in self.__REQUIRED_PROPERTIES if key not in request]
+        
+        if missing:
+            raise EmulatorBackend.__error(
+                "PutMetricAlarm",
+                "ValidationError",
+                f"Missing required properties: {', '.join(missing)}")
+        
+        alarm = {key: copy.deepcopy(value) for key, value in request.items() if key != "Tags"}
+        alarm["AlarmArn"] = f"arn:aws:cloudwatch:emulator:000000000000:alarm:{request['AlarmName']}"
+        alarm["StateValue"] = "INSUFFICIENT_DATA"
+        
+        with self.__lock:
+            self.__alarms[request["AlarmName"]] = alarm
+    
+    def __describe_alarms(self, names: list[str]) -> dict[str, dict[str, Any]]:
+        with self.__lock:
+            return {name: copy.deepcopy(self.__alarms[name]) for name in names if name in self.__alarms}
+    
+    def __delete_alarms(self, names: list[str]) -> None:
+        with self.__lock:
+            for name in names:
+                self.__alarms.pop(name, None)
+    
+    
+    @staticmethod
+    def __error(operation: str, code: str, message: str) -> ClientError:
+        """
+        Create the error the CloudWatch API would return.
+        
+        Args:
+            operation (str): The API operation.
+            code (str): The error code.
+            message (str): The error message.
+        
+        Returns:
+            ClientError: The error.
+        """
+        return ClientError({"Error": {"Code": code, "Message": message}}, operation)
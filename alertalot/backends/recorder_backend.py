@@ -0,0 +1,98 @@
+import json
+import threading
+
+from typing import Any, Iterable
+from datetime import datetime, timezone
+
+from alertalot.backends.alarm_backend import AlarmBackend
+
+
+class RecorderBackend(AlarmBackend):
+    """
+    Implementation of AlarmBackend that records the write requests instead of sending them.
+    
+    Reads are sent to another backend, usually the real CloudWatch, so the recorded requests are exactly
+    the ones a real run would send. Writes are kept in memory and, if a file is provided, appended to it
+    as JSON lines.
+    
+    Usage:
+        backend = RecorderBackend(CloudWatchBackend(cloudwatch), path="dry-run.jsonl", region="us-east-1")
+    """
+    
+    # Shared by all the recorders, as the recorders of several regions may append to the same file.
+    __FILE_LOCK = threading.Lock()
+    
+    
+    def __init__(self, reader: AlarmBackend, *, path: str | None = None, region: str | None = None):
+        """
+        Initialize the recorder.
+        
+        Args:
+            reader (AlarmBackend): The backend used to read the existing alarms.
+            path (str | None): Path to the file to append the recorded requests to. If None, the requests
+                are only kept in memory.
+            region (str | None): The region, added to each recorded request.
+        """
+        self.__reader = reader
+        self.__path = path
+        self.__region = region
+        self.__lock = threading.Lock()
+        self.__records: list[dict[str, Any]] = []
+    
+    
+    @property
+    def name(self) -> str:
+        return "recorder"
+    
+    @property
+    def is_dry_run(self) -> bool:
+        return True
+    
+    @property
+    def records(self) -> list[dict[str, Any]]:
+        """
+        The recorded write requests.
+        
+        Returns:
+            list[dict[str, Any]]: Each request, with the operation, region, time and arguments.
+        """
+        with self.__lock:
+            return list(self.__records)
+    
+    
+    def put_metric_alarm(self, request: dict[str, Any]) -> None:
+        self.__record("PutMetricAlarm", request)
+    
+    def describe_alarms(self, names: Iterable[str]) -> dict[str, dict[str, Any]]:
+        return self.__reader.describe_alarms(names)
+    
+    def delete_alarms(self, names: Iterable[str]) -> None:
+        self.__record("DeleteAlarms", {"AlarmNames": list(names)})
+    
+    
+    def __record(self, operation: str, request: dict[str, Any]) -> None:
+        """
+        Record a single write request.
+        
+        Args:
+            operation (str): The API operation, for example 'PutMetricAlarm'.
+            request (dict[str, Any]): The request arguments.
+        """
+        record = {
+            "time": datetime.now(timezone.utc).isoformat(),
+            "region": self.__region,
+            "operation": operation,
+            "request": request,
+        }
+        
+        with self.__lock:
+            self.__records.append(record)
+        
+        if self.__path is None:
+            return
+        
+        line = json.dumps(record, default=str)
+        
+        with RecorderBackend.__FILE_LOCK:
+            with open(self.__path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
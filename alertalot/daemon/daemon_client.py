@@ -0,0 +1,90 @@
+import json
+import socket
+
+from typing import Any
+
+
+class DaemonClient:
+    """
+    Thin client forwarding CLI runs to a DaemonServer over its Unix socket.
+    
+    Only the standard library is used, so forwarding a run does not pay for importing the actions.
+    
+    Usage:
+        response = DaemonClient("/run/alertalot.sock").run(sys.argv[1:], os.getcwd())
+        
+        if response is None:
+            ...  # No server is listening, run locally.
+    """
+    def __init__(self, path: str, timeout: float | None = None):
+        """
+        Initialize the client.
+        
+        Args:
+            path (str): Path to the server's Unix socket.
+            timeout (float | None): Timeout of the socket operations, in seconds. None waits for the run
+                to complete, however long it takes.
+        """
+        self.__path = path
+        self.__timeout = timeout
+    
+    
+    def ping(self) -> dict[str, Any] | None:
+        """
+        Check that the server is up.
+        
+        Returns:
+            dict[str, Any] | None: The server's protocol version, process ID and number of processed
+                requests, or None if no server is listening.
+        """
+        return self.__send({"command": "ping"})
+    
+    def run(self, argv: list[str], cwd: str | None = None) -> tuple[int, str] | None:
+        """
+        Execute a run on the server.
+        
+        Args:
+            argv (list[str]): The command line arguments of the run.
+            cwd (str | None): The directory relative paths are resolved from.
+        
+        Returns:
+            tuple[int, str] | None: The exit code and output of the run, or None if no server is listening.
+        """
+        response = self.__send({"command": "run", "argv": argv, "cwd": cwd})
+        
+        if response is None:
+            return None
+        
+        return response["exit_code"], response["output"]
+    
+    
+    def __send(self, request: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Send a single request, and wait for its response.
+        
+        Args:
+            request (dict[str, Any]): The request.
+        
+        Returns:
+            dict[str, Any] | None: The decoded response, or None if the server can not be reached.
+        
+        Raises:
+            ConnectionError: If the server closed the connection before responding.
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(self.__timeout)
+            
+            try:
+                connection.connect(self.__path)
+            except OSError:
+                return None
+            
+            connection.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            
+            with connection.makefile("rb") as f:
+                line = f.readline()
+        
+        if not line:
+            raise ConnectionError(f"Server at {self.__path} closed the connection without responding")
+        
+        return json.loads(line)
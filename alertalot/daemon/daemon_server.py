@@ -0,0 +1,242 @@
+import io
+import os
+import json
+import socket
+import threading
+import socketserver
+
+from typing import Any, Callable, TYPE_CHECKING
+from contextlib import redirect_stdout, redirect_stderr
+
+from alertalot.generic.args_object import ArgsObject
+
+if TYPE_CHECKING:
+    from alertalot.aws.client_registry import ClientRegistry
+
+
+class _UnixServer(socketserver.UnixStreamServer):
+    def __init__(self, path: str, daemon: "DaemonServer"):
+        self.daemon = daemon
+        super().__init__(path, _RequestHandler)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline(DaemonServer.MAX_REQUEST_SIZE)
+        
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response = DaemonServer.error(f"Request is not valid JSON: {e}")
+        else:
+            response = self.server.daemon.handle(request)  # type: ignore[attr-defined]
+        
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class DaemonServer:
+    """
+    Long-running server executing CLI runs on behalf of thin clients, over a Unix socket.
+    
+    The server keeps everything that a new process pays for on each run warm: the imported modules,
+    the AWS sessions and clients, and the parsed template and variables files. Requests are processed
+    one at a time, as each run redirects the standard output of the process to collect its output. The
+    runs themselves still create alarms concurrently.
+    
+    The protocol is a single JSON line per connection in each direction:
+        {"command": "run", "argv": ["--create-alarms", ...], "cwd": "/path"}
+            -> {"exit_code": 0, "output": "..."}
+        {"command": "ping"}
+            -> {"version": 1, "pid": 1234, "requests": 10}
+    
+    The socket is only accessible by the user running the server, as requests run with its credentials.
+    
+    Usage:
+        server = DaemonServer("/run/alertalot.sock", run)
+        server.serve_forever()
+    """
+    
+    # Version of the protocol, returned by the ping command.
+    PROTOCOL_VERSION = 1
+    
+    # Maximum size of a single request line, in bytes.
+    MAX_REQUEST_SIZE = 1024 * 1024
+    
+    
+    def __init__(self, path: str, runner: Callable[..., int]):
+        """
+        Initialize the server. The socket is not bound until serve_forever is called.
+        
+        Args:
+            path (str): Path to the Unix socket.
+            runner (Callable[..., int]): Function executing a single run, called with the command line
+                arguments and the clients keyword argument, and returning the exit code.
+        """
+        self.__path = path
+        self.__runner = runner
+        self.__lock = threading.Lock()
+        self.__clients: dict[tuple, "ClientRegistry"] = {}
+        self.__requests = 0
+        self.__server: _UnixServer | None = None
+    
+    
+    @property
+    def path(self) -> str:
+        """
+        The path to the Unix socket.
+        
+        Returns:
+            str: The socket path.
+        """
+        return self.__path
+    
+    
+    def serve_forever(self) -> None:
+        """
+        Bind the socket, and process requests until shutdown is called. The socket file is removed when
+        the server stops.
+        
+        Raises:
+            RuntimeError: If another server is already listening on the socket.
+        """
+        self.__remove_stale_socket()
+        
+        # The socket is created with owner only permissions, before it accepts any connection.
+        umask = os.umask(0o177)
+        
+        try:
+            self.__server = _UnixServer(self.__path, self)
+        finally:
+            os.umask(umask)
+        
+        try:
+            self.__server.serve_forever()
+        finally:
+            self.__server.server_close()
+            
+            try:
+                os.remove(self.__path)
+            except OSError:
+                pass
+    
+    def shutdown(self) -> None:
+        """
+        Stop processing requests. Must be called from another thread than serve_forever.
+        """
+        if self.__server is not None:
+            self.__server.shutdown()
+    
+    def handle(self, request: Any) -> dict[str, Any]:
+        """
+        Process a single decoded request.
+        
+        Args:
+            request (Any): The decoded JSON request.
+        
+        Returns:
+            dict[str, Any]: The response to send back.
+        """
+        if not isinstance(request, dict):
+            return DaemonServer.error("Request must be a JSON object")
+        
+        command = request.get("command", "run")
+        
+        if command == "ping":
+            return {"version": DaemonServer.PROTOCOL_VERSION, "pid": os.getpid(), "requests": self.__requests}
+        
+        if command != "run":
+            return DaemonServer.error(f"Unknown command '{command}'")
+        
+        argv = request.get("argv")
+        cwd = request.get("cwd")
+        
+        if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+            return DaemonServer.error("'argv' must be a list of strings")
+        
+        if cwd is not None and not isinstance(cwd, str):
+            return DaemonServer.error("'cwd' must be a string")
+        
+        return self.__run(argv, cwd)
+    
+    def clients_for(self, args: ArgsObject) -> "ClientRegistry":
+        """
+        Get the clients registry to use for a run. Runs with the same region, role and rate limits share
+        the same registry, and so the same sessions, clients and rate limiters.
+        
+        Args:
+            args (ArgsObject): The arguments of the run.
+        
+        Returns:
+            ClientRegistry: The registry to use.
+        """
+        key = (args.region, args.role_arn, args.max_in_flight, tuple(sorted(args.api_tps.items())))
+        
+        if key not in self.__clients:
+            self.__clients[key] = args.clients
+        
+        return self.__clients[key]
+    
+    
+    def __run(self, argv: list[str], cwd: str | None) -> dict[str, Any]:
+        """
+        Execute a single run, in the working directory of the client.
+        
+        Args:
+            argv (list[str]): The command line arguments of the run.
+            cwd (str | None): The working directory of the client, relative paths are resolved from it.
+        
+        Returns:
+            dict[str, Any]: The exit code and output of the run.
+        """
+        buffer = io.StringIO()
+        
+        with self.__lock:
+            self.__requests += 1
+            previous_cwd = os.getcwd()
+            
+            try:
+                if cwd is not None:
+                    os.chdir(cwd)
+                
+                with redirect_stdout(buffer), redirect_stderr(buffer):
+                    exit_code = self.__runner(argv, clients=self.clients_for)
+            except OSError as e:
+                return DaemonServer.error(str(e), exit_code=1)
+            finally:
+                os.chdir(previous_cwd)
+        
+        return {"exit_code": exit_code, "output": buffer.getvalue()}
+    
+    def __remove_stale_socket(self) -> None:
+        """
+        Remove the socket file left by a server that did not stop cleanly.
+        
+        Raises:
+            RuntimeError: If another server is listening on the socket.
+        """
+        if not os.path.exists(self.__path):
+            return
+        
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(self.__path)
+            except OSError:
+                os.remove(self.__path)
+                return
+        
+        raise RuntimeError(f"Another server is already listening on {self.__path}")
+    
+    
+    @staticmethod
+    def error(message: str, exit_code: int = 2) -> dict[str, Any]:
+        """
+        Build the response of a request that could not be processed.
+        
+        Args:
+            message (str): Description of the error.
+            exit_code (int): Exit code reported to the client.
+        
+        Returns:
+            dict[str, Any]: The response.
+        """
+        return {"exit_code": exit_code, "output": f"Error: {message}\n"}
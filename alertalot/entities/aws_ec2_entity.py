@@ -1,10 +1,12 @@
-from typing import Any
-
-import boto3
+from typing import Any, Iterable, Iterator, TYPE_CHECKING
+from itertools import islice
 
 from alertalot.generic.target_type import TargetType
 from alertalot.entities.base_aws_entity import BaseAwsEntity
 
+if TYPE_CHECKING:
+    from alertalot.aws.client_registry import ClientRegistry
+
 
 class AwsEc2Entity(BaseAwsEntity):
     """
@@ -15,21 +17,47 @@ class AwsEc2Entity(BaseAwsEntity):
     from EC2 instances.
     """
     
-    def __init__(self) -> None:
+    # Maximum number of results per page of a DescribeInstances call.
+    BATCH_SIZE = 1000
+    
+    # Maximum number of values of a single DescribeInstances filter.
+    FILTER_VALUES_SIZE = 200
+    
+    
+    def __init__(self, clients: "ClientRegistry | None" = None) -> None:
         """
         Initialize an AwsEc2Entity instance.
+        
+        Args:
+            clients (ClientRegistry | None): Registry of the AWS clients to use. If None, a new one is created
+                when the clients are first used.
         """
-        super().__init__(entity_type=TargetType.EC2)
+        super().__init__(entity_type=TargetType.EC2, clients=clients)
+    
+    
+    def load_entities(
+            self,
+            entity_ids: Iterable[str],
+            filters: list[dict[str, Any]] | None = None) -> Iterator[dict[str, Any]]:
+        # The IDs are passed as a filter rather than as InstanceIds: EC2 fails the whole call if any of the
+        # InstanceIds does not exist, while a filter only returns the instances that do.
+        entity_ids = iter(entity_ids)
+        
+        while batch := list(islice(entity_ids, self.FILTER_VALUES_SIZE)):
+            yield from self.iter_entities([*(filters or []), {"Name": "instance-id", "Values": batch}])
     
+    def iter_entities(self, filters: list[dict[str, Any]] | None = None) -> Iterator[dict[str, Any]]:
+        paginator = self.clients.client("ec2").get_paginator("describe_instances")
+        arguments = {"Filters": filters} if filters else {}
+        
+        for page in paginator.paginate(**arguments, PaginationConfig={"PageSize": self.BATCH_SIZE}):
+            yield from AwsEc2Entity.__page_instances(page)
     
-    def load_entity(self, entity_id: str) -> dict[str, any]:
-        ec2 = boto3.client("ec2")
-        response = ec2.describe_instances(InstanceIds=[entity_id])
+    def get_entity_id(self, resource: dict) -> str:
+        if "InstanceId" not in resource:
+            raise ValueError("Missing InstanceId property for EC2 instance")
         
-        try:
-            return response["Reservations"][0]["Instances"][0]
-        except (KeyError, IndexError) as e:
-            raise ValueError("Unexpected instance data format") from e
+        return resource["InstanceId"]
     
     def get_resource_values(self, resource: dict) -> dict[str, str]:
         if "InstanceId" not in resource:
@@ -82,3 +110,18 @@ class AwsEc2Entity(BaseAwsEntity):
             "EBSIOBalance%",
             "EBSByteBalance%"
         ]
+    
+    
+    @staticmethod
+    def __page_instances(page: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """
+        Get the instances of a single DescribeInstances page.
+        
+        Args:
+            page (dict[str, Any]): The DescribeInstances response
+        
+        Returns:
+            Iterator[dict[str, Any]]: The instances of all the reservations in the page
+        """
+        for reservation in page.get("Reservations", []):
+            yield from reservation.get("Instances", [])
@@ -22,8 +22,8 @@ class AwsEntityFactory:
         Returns:
             BaseAwsEntity: AWS entity instance or None if no entity can be created.
         """
-        if args.ec2_id is not None:
-            return AwsEc2Entity()
+        if args.ec2_id is not None or args.ec2_filters:
+            return AwsEc2Entity(args.clients)
         
         return None
     
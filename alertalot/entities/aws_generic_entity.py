@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from alertalot.generic.target_type import TargetType
 from alertalot.entities.base_aws_entity import BaseAwsEntity
@@ -19,8 +19,17 @@ class AwsGenericEntity(BaseAwsEntity):
     def get_additional_config(self) -> dict[str, Any]:
         return {}
     
-    def load_entity(self, entity_id: str) -> dict[str, any]:
+    def load_entities(
+            self,
+            entity_ids: Iterable[str],
+            filters: list[dict[str, Any]] | None = None) -> Iterator[dict[str, Any]]:
+        raise NotImplementedError("Invalid operation for a generic alarm type")
+    
+    def iter_entities(self, filters: list[dict[str, Any]] | None = None) -> Iterator[dict[str, Any]]:
         raise NotImplementedError("Invalid operation for a generic alarm type")
     
     def get_resource_values(self, resource: dict) -> dict[str, str]:
         raise NotImplementedError("Invalid operation for a generic alarm type")
+    
+    def get_entity_id(self, resource: dict) -> str:
+        raise NotImplementedError("Invalid operation for a generic alarm type")
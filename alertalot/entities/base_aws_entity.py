@@ -1,9 +1,15 @@
+import threading
+
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, TYPE_CHECKING
 
 from alertalot.validation.aws_alarm_validator import AwsAlarmValidator
 from alertalot.generic.target_type import TargetType
 
+# The registry, and boto3 with it, is only needed to load entities, not by the helpers rendering alarms.
+if TYPE_CHECKING:
+    from alertalot.aws.client_registry import ClientRegistry
+
 
 class BaseAwsEntity(ABC):
     """
@@ -17,15 +23,20 @@ class BaseAwsEntity(ABC):
     def __init__(
             self,
             *,
-            entity_type: TargetType.EC2):
+            entity_type: TargetType.EC2,
+            clients: "ClientRegistry | None" = None):
         """
         Creates a new AWS entity instance.
         
         Args:
             entity_type (TargetType): The type of entity.
+            clients (ClientRegistry | None): Registry of the AWS clients to use. If None, a new one is created
+                when the clients are first used.
         """
         
         self.__entity_type = entity_type
+        self.__clients = clients
+        self.__lock = threading.Lock()
     
     
     @property
@@ -38,6 +49,23 @@ class BaseAwsEntity(ABC):
         """
         return self.__entity_type
     
+    @property
+    def clients(self) -> "ClientRegistry":
+        """
+        Get the registry of AWS clients used to load entities, creating it on the first access if none was
+        passed.
+        
+        Returns:
+            ClientRegistry: The clients registry.
+        """
+        with self.__lock:
+            if self.__clients is None:
+                from alertalot.aws.client_registry import ClientRegistry  # pylint: disable=import-outside-toplevel
+                
+                self.__clients = ClientRegistry()
+            
+            return self.__clients
+    
     
     @abstractmethod
     def get_resource_values(self, resource: dict) -> dict[str, str]:
@@ -55,6 +83,55 @@ class BaseAwsEntity(ABC):
         """
     
     @abstractmethod
+    def get_entity_id(self, resource: dict) -> str:
+        """
+        Get the identifier of a loaded AWS resource.
+        
+        Args:
+            resource (dict): The AWS resource
+        
+        Returns:
+            str: The identifier of the resource
+        
+        Raises:
+            ValueError: If the resource has invalid format
+        """
+    
+    @abstractmethod
+    def load_entities(
+            self,
+            entity_ids: Iterable[str],
+            filters: list[dict[str, Any]] | None = None) -> Iterator[dict[str, Any]]:
+        """
+        Load the entities with the given identifiers from AWS, using the service's bulk describe call.
+        
+        The entities are loaded lazily, one batch at a time, as the returned iterator is consumed.
+        Identifiers that do not exist are skipped.
+        
+        Args:
+            entity_ids (Iterable[str]): The identifiers of the entities to load
+            filters (list[dict[str, Any]] | None): Service filters, in the boto3 format. If passed, only
+                the entities that also match the filters are loaded
+        
+        Returns:
+            Iterator[dict[str, Any]]: The loaded entities data
+        """
+    
+    @abstractmethod
+    def iter_entities(self, filters: list[dict[str, Any]] | None = None) -> Iterator[dict[str, Any]]:
+        """
+        Load all the entities matching the filters from AWS, using the service's paginated describe call.
+        
+        The entities are loaded lazily, one page at a time, as the returned iterator is consumed.
+        
+        Args:
+            filters (list[dict[str, Any]] | None): Service filters, in the boto3 format. If None, all
+                the entities are loaded
+        
+        Returns:
+            Iterator[dict[str, Any]]: The loaded entities data
+        """
+    
     def load_entity(self, entity_id: str) -> dict[str, any]:
         """
         Load entity data from AWS based on the provided identifier.
@@ -64,7 +141,14 @@ class BaseAwsEntity(ABC):
             
         Returns:
             dict[str, any]: The loaded entity data
+        
+        Raises:
+            ValueError: If the entity does not exist
         """
+        for entity in self.load_entities([entity_id]):
+            return entity
+        
+        raise ValueError(f"Entity {entity_id} not found")
     
     
     @abstractmethod
@@ -86,6 +170,34 @@ class BaseAwsEntity(ABC):
         """
     
     
+    def alarm_field_validators(self) -> dict[str, Callable[[AwsAlarmValidator], Any]]:
+        """
+        Get the validator of each alarm configuration field, in the order the fields are validated.
+        
+        The required fields are always validated, the optional fields only if they are present in the
+        configuration. Each field is validated independently of the others, so a field whose value does
+        not depend on the target can be validated once for all the targets.
+        
+        Returns:
+            dict[str, Callable[[AwsAlarmValidator], Any]]: Function validating and returning the parsed value
+                of the field, keyed by the field name.
+        """
+        return {
+            "metric-name":          lambda v: v.validate_metric_name(allowed=self._supported_metrics()),
+            "alarm-name":           lambda v: v.validate_alarm_name(),
+            "statistic":            lambda v: v.validate_statistic(),
+            "period":               lambda v: v.validate_period(),
+            "comparison-operator":  lambda v: v.validate_comparison_operator(),
+            "threshold":            lambda v: v.validate_threshold(min_value=0.0),
+            "evaluation-periods":   lambda v: v.validate_evaluation_periods(),
+            "alarm-actions":        lambda v: v.validate_alarm_actions(),
+            "tags":                 lambda v: v.validate_tags(),
+            "treat-missing-data":   lambda v: v.validate_treat_missing_data(),
+            "unit":                 lambda v: v.validate_unit(),
+            "namespace":            lambda v: v.validate_namespace(),
+            "dimensions":           lambda v: v.validate_dimensions(),
+        }
+    
     def validate_alarm(self, validator: AwsAlarmValidator) -> dict[str, any]:
         """
         Validates a complete CloudWatch alarm configuration.
@@ -93,35 +205,11 @@ class BaseAwsEntity(ABC):
         Args:
             validator (AwsAlarmValidator): The validator instance with configuration
         """
-        validated_config = {
-            "metric-name":          validator.validate_metric_name(allowed=self._supported_metrics()),
-            "alarm-name":           validator.validate_alarm_name(),
-            "statistic":            validator.validate_statistic(),
-            "period":               validator.validate_period(),
-            "comparison-operator":  validator.validate_comparison_operator(),
-            "threshold":            validator.validate_threshold(min_value=0.0),
-            "evaluation-periods":   validator.validate_evaluation_periods(),
+        return {
+            key: validate(validator)
+            for key, validate in self.alarm_field_validators().items()
+            if key in validator.config
         }
-        
-        if "alarm-actions" in validator.config:
-            validated_config["alarm-actions"] = validator.validate_alarm_actions()
-        
-        if "tags" in validator.config:
-            validated_config["tags"] = validator.validate_tags()
-        
-        if "treat-missing-data" in validator.config:
-            validated_config["treat-missing-data"] = validator.validate_treat_missing_data()
-        
-        if "unit" in validator.config:
-            validated_config["unit"] = validator.validate_unit()
-        
-        if "namespace" in validator.config:
-            validated_config["namespace"] = validator.validate_namespace()
-        
-        if "dimensions" in validator.config:
-            validated_config["dimensions"] = validator.validate_dimensions()
-        
-        return validated_config
     
     def to_boto3_alarm(self, alarm_config: dict[str, any]) -> dict[str, any]:
         """
@@ -140,7 +228,7 @@ class BaseAwsEntity(ABC):
             "MetricName": alarm_config["metric-name"],
             "Period": alarm_config["period"],
             "Statistic": alarm_config["statistic"],
-            "Threshold": alarm_config["threshold"] * 100,
+            "Threshold": alarm_config["threshold"],
             "ActionsEnabled": False
         }
         
@@ -183,4 +271,4 @@ class BaseAwsEntity(ABC):
                 The list of AWS keys and AWS values formated as [{key: ..., value: ...}, ....] for each
                 key/value pair from `what`.
         """
-        return [{key_name: key, value_name: value} for key, value in what]
+        return [{key_name: key, value_name: value} for key, value in what.items()]
@@ -0,0 +1,39 @@
+class AlarmsCreationException(Exception):
+    """
+    Exception raised when one or more alarms could not be created.
+    
+    Attributes:
+        __failures (list[str]): Description of each alarm that failed, and the reason it failed.
+    """
+    
+    def __init__(self, failures: list[str]):
+        """
+        Initialize the AlarmsCreationException with the list of failures.
+        
+        Args:
+            failures (list[str]): Description of each alarm that failed, and the reason it failed.
+        """
+        super().__init__()
+        self.__failures = failures
+    
+    
+    def __str__(self):
+        """
+        Return a string representation of the exception.
+        
+        Returns:
+            str: A formatted string containing all the failures, each prefixed by ' > '.
+        """
+        return (
+            f"Failed to create {len(self.__failures)} alarms: \n > " +
+            "\n > ".join(self.__failures))
+    
+    @property
+    def failures(self) -> list[str]:
+        """
+        Get the list of failures.
+        
+        Returns:
+            list[str]: Description of each alarm that failed, and the reason it failed.
+        """
+        return self.__failures
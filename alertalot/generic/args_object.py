@@ -1,17 +1,22 @@
-import boto3
+import copy
 
+from typing import TYPE_CHECKING
 
-class ArgsObject:
+# boto3 is slow to import, and most actions never use AWS. The registry is imported when first used.
+if TYPE_CHECKING:
+    from alertalot.aws.client_registry import ClientRegistry
+
+
+class ArgsObject:  # pylint: disable=too-many-public-methods
     """
     A wrapper for arguments passed to the Alertalot executable.
     """
-    def __init__(self, args):
+    def __init__(self, args, clients: "ClientRegistry | None" = None):
         self.__args = args
         self.__args.variables = dict(args.variables)
-        
-        if isinstance(self.region, str):
-            boto3.setup_default_session(region_name=self.region)
-
+        self.__clients = clients
+        self.__ec2_ids = None
+    
     
     @property
     def is_verbose(self) -> bool:
@@ -33,6 +38,16 @@ class ArgsObject:
         """
         return self.__args.quiet
     
+    @property
+    def output_format(self) -> str:
+        """
+        The format of the output, passed using the --output argument.
+        
+        Returns:
+            str: One of auto, rich, plain or jsonl.
+        """
+        return self.__args.output_format
+    
     @property
     def show_variables(self) -> bool:
         """
@@ -72,7 +87,48 @@ class ArgsObject:
             bool: True if the flag is set.
         """
         return self.__args.create_alarms
-
+    
+    @property
+    def plan_file(self) -> str | None:
+        """
+        If set, resolve the alarms and write them to this plan file, without creating them.
+        
+        Returns:
+            str | None: The path to the plan file, or None if not provided.
+        """
+        return self.__args.plan
+    
+    @property
+    def apply_file(self) -> str | None:
+        """
+        If set, create the alarms of this plan file.
+        
+        Returns:
+            str | None: The path to the plan file, or None if not provided.
+        """
+        return self.__args.apply
+    
+    @property
+    def shard(self) -> tuple[int, int] | None:
+        """
+        The part of the plan to apply, passed using the --shard argument.
+        
+        Returns:
+            tuple[int, int] | None: The zero based index of the shard and the number of shards, or None to
+                apply the whole plan.
+        """
+        return self.__args.shard
+    
+    @property
+    def ignore_inputs_hash(self) -> bool:
+        """
+        If set, a plan is applied without checking its inputs hash.
+        
+        Returns:
+            bool: True if the flag is set.
+        """
+        return self.__args.ignore_inputs_hash
+    
     @property
     def test_aws(self) -> bool:
         """
@@ -115,24 +171,71 @@ class ArgsObject:
     @property
     def region(self) -> str | None:
         """
-        The region to run on.
+        The region to run on. If more than one region is provided, the first one, ignoring the 'all' keyword.
         
         Returns:
             str | None: The region if provided, None if not.
         
         """
-        return self.__args.region
+        return next((region for region in self.regions if region != "all"), None)
+    
+    @property
+    def regions(self) -> list[str]:
+        """
+        All the regions to run on. May include the 'all' keyword, standing for all the enabled regions.
+        
+        Returns:
+            list[str]: Unique regions, in the order they were provided. Empty list if none provided.
+        """
+        regions = self.__args.region or []
+        
+        if isinstance(regions, str):
+            regions = regions.split(",")
+        
+        return list(dict.fromkeys(region.strip() for region in regions if region.strip()))
     
     @property
     def ec2_id(self) -> str|None:
         """
-        The target instance.
+        The target instance. If more than one instance is provided, the first one.
         
         Returns:
             str | None: Instance ID, or null if not provided
 
         """
-        return self.__args.ec2_id
+        return self.ec2_ids[0] if self.ec2_ids else None
+    
+    @property
+    def ec2_ids(self) -> list[str]:
+        """
+        All the target instances, passed using the --ec2-id argument, or listed in the --ec2-ids-file file.
+        
+        Returns:
+            list[str]: Unique instance IDs, in the order they were provided. Empty list if none provided.
+        """
+        if self.__ec2_ids is None:
+            ids = self.__args.ec2_id or []
+            
+            if isinstance(ids, str):
+                ids = ids.split(",")
+            
+            if self.__args.ec2_ids_file is not None:
+                with open(self.__args.ec2_ids_file, "r", encoding="utf-8") as f:
+                    ids = ids + [line.split("#", 1)[0] for line in f]
+            
+            self.__ec2_ids = list(dict.fromkeys(value.strip() for value in ids if value.strip()))
+        
+        return self.__ec2_ids
+    
+    @property
+    def ec2_filters(self) -> list[dict[str, list[str] | str]]:
+        """
+        EC2 filters used to select the target instances, passed using the --ec2-filter argument.
+        
+        Returns:
+            list[dict[str, list[str] | str]]: Filters in the DescribeInstances format. Empty list if none provided.
+        """
+        return [{"Name": name, "Values": values} for name, values in self.__args.ec2_filters]
     
     @property
     def variables(self) -> dict[str, str]:
@@ -144,6 +247,248 @@ class ArgsObject:
         """
         return self.__args.variables
     
+    @property
+    def max_in_flight(self) -> int:
+        """
+        The maximum number of AWS requests to execute at the same time.
+        
+        Returns:
+            int: Maximum number of concurrent requests.
+        """
+        return self.__args.max_in_flight
+    
+    @property
+    def api_tps(self) -> dict[str, float]:
+        """
+        Requests per second allowed for each AWS API, passed using the --api-tps argument.
+        
+        Returns:
+            dict[str, float]: Requests per second keyed by 'service.Operation' or by service.
+        """
+        return dict(self.__args.api_tps)
+    
+    @property
+    def role_arn(self) -> str | None:
+        """
+        The IAM role to assume for all AWS requests.
+        
+        Returns:
+            str | None: The role ARN, or None if the caller's credentials should be used.
+        """
+        return self.__args.role_arn
+    
+    @property
+    def backend(self) -> str:
+        """
+        The name of the backend alarms are written to, passed using the --backend argument. The --dry-run
+        argument selects the recorder backend.
+        
+        Returns:
+            str: The backend name.
+        """
+        return "recorder" if self.__args.dry_run else self.__args.backend
+    
+    @property
+    def record_file(self) -> str | None:
+        """
+        The file the recorder backend appends the requests it records to.
+        
+        Returns:
+            str | None: The path to the file, or None if the requests should only be printed.
+        """
+        return self.__args.record_file
+    
+    @property
+    def emulator_latency(self) -> float:
+        """
+        Time in seconds each call to the emulator backend takes.
+        
+        Returns:
+            float: The latency in seconds.
+        """
+        return self.__args.emulator_latency
+    
+    @property
+    def emulator_throttle_rate(self) -> float:
+        """
+        Probability of each call to the emulator backend to be throttled.
+        
+        Returns:
+            float: The probability, between 0 and 1.
+        """
+        return self.__args.emulator_throttle_rate
+    
+    @property
+    def is_stream(self) -> bool:
+        """
+        Whether the template is streamed, passed using the --stream argument.
+        
+        Returns:
+            bool: True if the alarms should be created while the template is parsed.
+        """
+        return self.__args.stream
+    
+    @property
+    def cache_dir(self) -> str | None:
+        """
+        The directory parsed files are cached in, passed using the --cache-dir argument.
+        
+        Returns:
+            str | None: The path to the directory, or None if parsed files are not cached.
+        """
+        return self.__args.cache_dir
+    
+    @property
+    def journal_file(self) -> str | None:
+        """
+        The journal file to record the completed alarms in, passed using either the --journal or the
+        --resume argument.
+        
+        Returns:
+            str | None: The path to the journal file, or None if not provided.
+        """
+        return self.__args.resume or self.__args.journal
+    
+    @property
+    def is_resume(self) -> bool:
+        """
+        If set, alarms already recorded in the journal file should be skipped.
+        
+        Returns:
+            bool: True if the --resume argument is provided.
+        """
+        return self.__args.resume is not None
+    
+    @property
+    def is_profile(self) -> bool:
+        """
+        If set, print the time spent in each phase of the run, passed using the --profile argument.
+        
+        Returns:
+            bool: True if the flag is set.
+        """
+        return self.__args.profile
+    
+    @property
+    def profile_file(self) -> str | None:
+        """
+        The file to write the cProfile statistics of the run to, passed using the --profile-file argument.
+        
+        Returns:
+            str | None: The path to the file, or None if the run is not profiled with cProfile.
+        """
+        return self.__args.profile_file
+    
+    @property
+    def tracemalloc_file(self) -> str | None:
+        """
+        The file to write the tracemalloc snapshot of the run to, passed using the --tracemalloc-file argument.
+        
+        Returns:
+            str | None: The path to the file, or None if the memory allocations are not traced.
+        """
+        return self.__args.tracemalloc_file
+    
+    @property
+    def metrics_file(self) -> str | None:
+        """
+        The file to write the JSON report of the AWS API calls to, passed using the --metrics-file argument.
+        
+        Returns:
+            str | None: The path to the file, or None if no JSON report is written.
+        """
+        return self.__args.metrics_file
+    
+    @property
+    def metrics_textfile(self) -> str | None:
+        """
+        The file to write the Prometheus report of the AWS API calls to, passed using the --metrics-textfile
+        argument.
+        
+        Returns:
+            str | None: The path to the file, or None if no Prometheus report is written.
+        """
+        return self.__args.metrics_textfile
+    
+    @property
+    def sync_file(self) -> str | None:
+        """
+        The state file of the incremental sync, passed using the --sync argument.
+        
+        Returns:
+            str | None: The path to the state file, or None if all the targets are processed.
+        """
+        return self.__args.sync
+    
+    @property
+    def worker_queue(self) -> str | None:
+        """
+        The URL of the SQS queue to consume launch events from, passed using the --worker argument.
+        
+        Returns:
+            str | None: The queue URL, or None if the worker action is not selected.
+        """
+        return self.__args.worker
+    
+    @property
+    def coalesce_seconds(self) -> float:
+        """
+        The time the worker waits for more launch events once the first event of a batch arrived.
+        
+        Returns:
+            float: The time in seconds.
+        """
+        return self.__args.coalesce_seconds
+    
+    @property
+    def is_drain(self) -> bool:
+        """
+        If set, the worker stops once the queue is empty.
+        
+        Returns:
+            bool: True if the --drain flag is set.
+        """
+        return self.__args.drain
+    
+    @property
+    def is_serve(self) -> bool:
+        """
+        If set, execute the serve action
+        
+        Returns:
+            bool: True if the flag is set.
+        """
+        return self.__args.serve
+    
+    @property
+    def socket_path(self) -> str | None:
+        """
+        The Unix socket of the server, passed using the --socket argument.
+        
+        Returns:
+            str | None: The path to the socket, or None if runs are not forwarded to a server.
+        """
+        return self.__args.socket
+    
+    @property
+    def clients(self) -> "ClientRegistry":
+        """
+        The registry of AWS clients shared by all actions of this run.
+        
+        Returns:
+            ClientRegistry: The clients registry, created on first access.
+        """
+        if self.__clients is None:
+            from alertalot.aws.client_registry import ClientRegistry  # pylint: disable=import-outside-toplevel
+            
+            self.__clients = ClientRegistry(
+                region=self.region,
+                role_arn=self.role_arn,
+                max_pool_connections=max(self.max_in_flight, 10),
+                api_tps=self.api_tps)
+        
+        return self.__clients
+    
     @property
     def is_strict(self) -> bool:
         """
@@ -154,3 +499,33 @@ class ArgsObject:
             bool: True if strict flag is set.
         """
         return self.__args.strict
+    
+    
+    def for_region(self, region: str) -> "ArgsObject":
+        """
+        Get the arguments of this run, bound to a single region. The returned object shares the clients
+        registry, and so the clients and rate limiters, of this run.
+        
+        Args:
+            region (str): The region to bind to.
+        
+        Returns:
+            ArgsObject: The arguments for the region.
+        """
+        args = copy.copy(self.__args)
+        args.region = region
+        
+        return ArgsObject(args, self.clients.for_region(region))
+    
+    def with_clients(self, clients: "ClientRegistry") -> "ArgsObject":
+        """
+        Get the arguments of this run, using another clients registry. Used by the server to share its
+        warm clients between runs.
+        
+        Args:
+            clients (ClientRegistry): The registry to use.
+        
+        Returns:
+            ArgsObject: The arguments, bound to the registry.
+        """
+        return ArgsObject(self.__args, clients)
@@ -0,0 +1,172 @@
+import time
+import threading
+
+from typing import Any, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TaskResult:
+    """
+    The outcome of a single task executed by the ConcurrentExecutor.
+    """
+    
+    def __init__(
+            self,
+            name: str,
+            *,
+            result: Any = None,
+            error: Exception | None = None,
+            runtime: float = 0.0):
+        """
+        Initialize the task result.
+        
+        Args:
+            name (str): The name of the task.
+            result (Any): The value returned by the task, if it succeeded.
+            error (Exception | None): The exception raised by the task, if it failed.
+            runtime (float): The time in seconds it took to execute the task.
+        """
+        self.__name = name
+        self.__result = result
+        self.__error = error
+        self.__runtime = runtime
+    
+    
+    @property
+    def name(self) -> str:
+        """
+        The name of the task.
+        
+        Returns:
+            str: The name of the task.
+        """
+        return self.__name
+    
+    @property
+    def result(self) -> Any:
+        """
+        The value returned by the task.
+        
+        Returns:
+            Any: The returned value, or None if the task failed.
+        """
+        return self.__result
+    
+    @property
+    def error(self) -> Exception | None:
+        """
+        The exception raised by the task.
+        
+        Returns:
+            Exception | None: The exception, or None if the task succeeded.
+        """
+        return self.__error
+    
+    @property
+    def runtime(self) -> float:
+        """
+        The time it took to execute the task.
+        
+        Returns:
+            float: Runtime in seconds.
+        """
+        return self.__runtime
+    
+    @property
+    def is_success(self) -> bool:
+        """
+        Check if the task completed without raising an exception.
+        
+        Returns:
+            bool: True if the task succeeded.
+        """
+        return self.__error is None
+
+
+class ConcurrentExecutor:
+    """
+    Execute named tasks on a bounded pool of worker threads.
+    
+    At most `max_in_flight` tasks are submitted to the pool at any given time. The tasks iterable is
+    consumed lazily, so it can be a generator that produces the tasks while earlier ones are executed.
+    
+    Usage:
+        executor = ConcurrentExecutor(max_in_flight=10)
+        results = executor.run((name, lambda: create(name)) for name in names)
+    """
+    
+    def __init__(self, max_in_flight: int = 1):
+        """
+        Initialize the executor.
+        
+        Args:
+            max_in_flight (int): The maximum number of tasks executed at the same time.
+        
+        Raises:
+            ValueError: If max_in_flight is less than 1.
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"Max in flight must be at least 1, got {max_in_flight}")
+        
+        self.__max_in_flight = max_in_flight
+    
+    
+    @property
+    def max_in_flight(self) -> int:
+        """
+        The maximum number of tasks executed at the same time.
+        
+        Returns:
+            int: Maximum number of concurrent tasks.
+        """
+        return self.__max_in_flight
+    
+    
+    def run(self, tasks: Iterable[tuple[str, Callable[[], Any]]]) -> list[TaskResult]:
+        """
+        Execute all the tasks and wait for them to complete.
+        
+        An exception raised by a task does not stop the execution of the other tasks. Instead, it is
+        stored in the task's result.
+        
+        Args:
+            tasks (Iterable[tuple[str, Callable[[], Any]]]): Pairs of task name and the callback to execute.
+        
+        Returns:
+            list[TaskResult]: The result of each task, in the same order the tasks were provided.
+        """
+        slots = threading.BoundedSemaphore(self.__max_in_flight)
+        futures = []
+        
+        with ThreadPoolExecutor(max_workers=self.__max_in_flight, thread_name_prefix="alertalot") as pool:
+            for name, callback in tasks:
+                slots.acquire()  # pylint: disable=consider-using-with
+                
+                future = pool.submit(ConcurrentExecutor.__run_task, name, callback)
+                future.add_done_callback(lambda _: slots.release())
+                
+                futures.append(future)
+        
+        return [future.result() for future in futures]
+    
+    
+    @staticmethod
+    def __run_task(name: str, callback: Callable[[], Any]) -> TaskResult:
+        """
+        Execute a single task and capture its outcome.
+        
+        Args:
+            name (str): The name of the task.
+            callback (Callable[[], Any]): The callback to execute.
+        
+        Returns:
+            TaskResult: The outcome of the task.
+        """
+        start_time = time.time()
+        
+        try:
+            result = callback()
+        except Exception as e:  # pylint: disable=W0718
+            return TaskResult(name, error=e, runtime=time.time() - start_time)
+        
+        return TaskResult(name, result=result, runtime=time.time() - start_time)
@@ -0,0 +1,240 @@
+import gzip
+import json
+import hashlib
+
+from typing import Any, TYPE_CHECKING
+from datetime import datetime, timezone
+
+if TYPE_CHECKING:
+    from alertalot.generic.args_object import ArgsObject
+
+
+class ExecutionPlan:
+    """
+    The fully resolved PutMetricAlarm requests of a run, for each region, together with a snapshot of
+    the targets they were rendered for and a hash of the inputs used to render them.
+    
+    A plan is computed once, saved to a compact gzip compressed JSON file, and applied later without
+    reading the variables and template files or describing the targets again. A plan can be split
+    into shards, so that several runners apply it in parallel.
+    
+    Usage:
+        plan = ExecutionPlan(ExecutionPlan.hash_run_inputs(run_args, regions))
+        plan.add_region("us-east-1", targets, alarms)
+        plan.save("out.plan")
+        
+        plan = ExecutionPlan.load("out.plan")
+        alarms = plan.alarms("us-east-1", shard=(0, 4))
+    """
+    
+    # Version of the file format. Plans written with a different version can not be applied.
+    VERSION = 1
+    
+    
+    def __init__(self, inputs_hash: str, created_at: str | None = None):
+        """
+        Initialize an empty plan.
+        
+        Args:
+            inputs_hash (str): Hash of the inputs the plan is computed from, see hash_inputs.
+            created_at (str | None): ISO 8601 creation time. Defaults to the current time.
+        """
+        self.__inputs_hash = inputs_hash
+        self.__created_at = created_at or datetime.now(timezone.utc).isoformat()
+        self.__regions: dict[str, dict[str, Any]] = {}
+    
+    
+    def __len__(self) -> int:
+        """
+        Get the number of alarms in the plan.
+        
+        Returns:
+            int: The number of alarms, in all the regions.
+        """
+        return sum(len(region["alarms"]) for region in self.__regions.values())
+    
+    
+    @property
+    def inputs_hash(self) -> str:
+        """
+        Hash of the inputs the plan was computed from.
+        
+        Returns:
+            str: Hex encoded SHA-256 hash.
+        """
+        return self.__inputs_hash
+    
+    @property
+    def created_at(self) -> str:
+        """
+        The time the plan was computed.
+        
+        Returns:
+            str: ISO 8601 time.
+        """
+        return self.__created_at
+    
+    @property
+    def regions(self) -> list[str]:
+        """
+        The regions of the plan.
+        
+        Returns:
+            list[str]: The regions, in the order they were added.
+        """
+        return list(self.__regions)
+    
+    
+    def add_region(
+            self,
+            region: str,
+            targets: dict[str, dict[str, str]],
+            alarms: list[tuple[str, dict[str, Any]]]) -> None:
+        """
+        Add the alarms of a region to the plan.
+        
+        Args:
+            region (str): The region.
+            targets (dict[str, dict[str, str]]): The resource values of each target, keyed by the target
+                identifier.
+            alarms (list[tuple[str, dict[str, Any]]]): The target identifier and PutMetricAlarm request of
+                each alarm.
+        """
+        self.__regions[region] = {
+            "targets": targets,
+            "alarms": [{"target": target, "request": request} for target, request in alarms],
+        }
+    
+    def targets(self, region: str) -> dict[str, dict[str, str]]:
+        """
+        Get the snapshot of the targets of a region, taken when the plan was computed.
+        
+        Args:
+            region (str): The region.
+        
+        Returns:
+            dict[str, dict[str, str]]: The resource values of each target, keyed by the target identifier.
+                Empty if the region is not in the plan.
+        """
+        return self.__regions.get(region, {}).get("targets", {})
+    
+    def alarms(self, region: str, shard: tuple[int, int] | None = None) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Get the alarms of a region.
+        
+        Args:
+            region (str): The region.
+            shard (tuple[int, int] | None): The zero based index of the shard and the number of shards. If
+                passed, only every count-th alarm, starting at the index, is returned. If None, all the
+                alarms are returned.
+        
+        Returns:
+            list[tuple[str, dict[str, Any]]]: The target identifier and PutMetricAlarm request of each alarm.
+                Empty if the region is not in the plan.
+        """
+        alarms = self.__regions.get(region, {}).get("alarms", [])
+        
+        if shard is not None:
+            index, count = shard
+            alarms = alarms[index::count]
+        
+        return [(alarm["target"], alarm["request"]) for alarm in alarms]
+    
+    def save(self, path: str) -> None:
+        """
+        Write the plan to a gzip compressed JSON file.
+        
+        Args:
+            path (str): Path to the file.
+        """
+        data = {
+            "version": ExecutionPlan.VERSION,
+            "created_at": self.__created_at,
+            "inputs_hash": self.__inputs_hash,
+            "regions": self.__regions,
+        }
+        
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"), default=str)
+    
+    
+    @staticmethod
+    def load(path: str) -> "ExecutionPlan":
+        """
+        Read a plan written by save.
+        
+        Args:
+            path (str): Path to the file.
+        
+        Returns:
+            ExecutionPlan: The loaded plan.
+        
+        Raises:
+            ValueError: If the file is not a plan, or was written with another version of the format.
+        """
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"File {path} is not a valid plan file") from e
+        
+        if not isinstance(data, dict) or data.get("version") != ExecutionPlan.VERSION:
+            raise ValueError(f"Plan file {path} has an unsupported version, expecting {ExecutionPlan.VERSION}")
+        
+        try:
+            plan = ExecutionPlan(data["inputs_hash"], data["created_at"])
+            
+            for region, content in data["regions"].items():
+                plan.add_region(
+                    region,
+                    content["targets"],
+                    [(alarm["target"], alarm["request"]) for alarm in content["alarms"]])
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Plan file {path} is not a valid plan file") from e
+        
+        return plan
+    
+    @staticmethod
+    def hash_inputs(files: list[str], values: dict[str, Any]) -> str:
+        """
+        Get the hash of the inputs a plan is computed from.
+        
+        Args:
+            files (list[str]): Paths to the input files. Their content is hashed, in order.
+            values (dict[str, Any]): Any other input, for example the command line arguments.
+        
+        Returns:
+            str: Hex encoded SHA-256 hash.
+        """
+        digest = hashlib.sha256()
+        
+        for file in files:
+            with open(file, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        
+        digest.update(json.dumps(values, sort_keys=True, default=str).encode("utf-8"))
+        
+        return digest.hexdigest()
+    
+    @staticmethod
+    def hash_run_inputs(run_args: "ArgsObject", regions: list[str]) -> str:
+        """
+        Get the hash of the inputs of a run: its variables and template files, variables, regions, role and
+        targets. Used by --plan to record the inputs of a plan, and by --apply to check they did not change.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments.
+            regions (list[str]): The regions of the plan. Their order does not change the hash.
+        
+        Returns:
+            str: Hex encoded SHA-256 hash.
+        """
+        return ExecutionPlan.hash_inputs(
+            [*run_args.var_files, run_args.template_file],
+            {
+                "variables": run_args.variables,
+                "regions": sorted(regions),
+                "role_arn": run_args.role_arn,
+                "ec2_ids": run_args.ec2_ids,
+                "ec2_filters": run_args.ec2_filters,
+            })
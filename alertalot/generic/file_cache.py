@@ -0,0 +1,279 @@
+import os
+import pickle
+import hashlib
+import tempfile
+import threading
+
+from typing import Any, Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alertalot.generic.memory_file_cache import MemoryFileCache
+
+
+class FileCache:
+    """
+    On-disk cache of parsed configuration files.
+    
+    Each entry is stored in its own file, named after the path of the source file, together with the
+    modification time, size and content hash of the source. An entry is used if the source still has
+    the same modification time and size, or, when these changed, if its content hash is unchanged. This
+    way a fresh checkout of unchanged files, as in CI, still hits the cache.
+    
+    Entries are serialized with pickle, so the cache directory must only be writable by trusted users.
+    The total size of the cache is capped, and the least recently used entries are evicted first.
+    
+    Usage:
+        FileCache.set_default(FileCache("~/.cache/alertalot"))
+        
+        data = FileCache.default().load(path, parse)
+    """
+    
+    # Version of the entries format. Entries written with another version are ignored.
+    VERSION = 1
+    
+    # Default maximum total size of the entries, in bytes.
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+    
+    __ENTRY_SUFFIX = ".entry"
+    
+    __default: "FileCache | MemoryFileCache | None" = None
+    
+    
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize the cache. The directory is created if it does not exist.
+        
+        Args:
+            directory (str): Path to the cache directory.
+            max_size (int): Maximum total size of the entries, in bytes.
+        """
+        self.__directory = os.path.abspath(os.path.expanduser(directory))
+        self.__max_size = max_size
+        self.__lock = threading.Lock()
+        
+        os.makedirs(self.__directory, exist_ok=True)
+    
+    
+    @property
+    def directory(self) -> str:
+        """
+        The path to the cache directory.
+        
+        Returns:
+            str: The absolute path to the directory.
+        """
+        return self.__directory
+    
+    
+    def load(self, path: str, parse: Callable[[str], Any]) -> Any:
+        """
+        Get the parsed content of a file, from the cache if possible.
+        
+        Args:
+            path (str): Path to the file.
+            parse (Callable[[str], Any]): Function parsing the file, used on a cache miss.
+        
+        Returns:
+            Any: The parsed content of the file.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        entry_path = self.__entry_path(path)
+        
+        header, content = self.__read_entry(entry_path, stat)
+        
+        if header is not None and content is not None:
+            return content
+        
+        with open(path, "rb") as f:
+            content_hash = hashlib.sha256(f.read()).hexdigest()
+        
+        if header is not None and header["hash"] == content_hash:
+            content = self.__read_content(entry_path)
+            
+            if content is not None:
+                self.__write_entry(entry_path, path, stat, content_hash, content)
+                return content
+        
+        content = parse(path)
+        
+        self.__write_entry(entry_path, path, stat, content_hash, content)
+        self.__evict()
+        
+        return content
+    
+    def clear(self) -> None:
+        """
+        Remove all the entries from the cache.
+        """
+        for name in os.listdir(self.__directory):
+            if name.endswith(self.__ENTRY_SUFFIX):
+                FileCache.__remove(os.path.join(self.__directory, name))
+    
+    
+    def __entry_path(self, path: str) -> str:
+        """
+        Get the path to the entry of a source file.
+        
+        Args:
+            path (str): Absolute path to the source file.
+        
+        Returns:
+            str: Path to the entry file.
+        """
+        name = hashlib.sha256(path.encode("utf-8")).hexdigest()
+        
+        return os.path.join(self.__directory, name + self.__ENTRY_SUFFIX)
+    
+    def __read_entry(self, entry_path: str, stat: os.stat_result) -> tuple[dict | None, Any]:
+        """
+        Read the header of an entry, and its content if the source file was not modified since.
+        
+        Args:
+            entry_path (str): Path to the entry file.
+            stat (os.stat_result): The current status of the source file.
+        
+        Returns:
+            tuple[dict | None, Any]: The header, or None if there is no valid entry, and the content, or
+                None if the source file's modification time or size changed.
+        """
+        try:
+            with open(entry_path, "rb") as f:
+                header = pickle.load(f)
+                
+                if not isinstance(header, dict) or header.get("version") != FileCache.VERSION:
+                    return None, None
+                
+                if header["mtime"] != stat.st_mtime_ns or header["size"] != stat.st_size:
+                    return header, None
+                
+                content = pickle.load(f)
+        except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+            return None, None
+        
+        FileCache.__touch(entry_path)
+        
+        return header, content
+    
+    def __write_entry(self, entry_path: str, path: str, stat: os.stat_result, content_hash: str, content: Any) -> None:
+        """
+        Write an entry atomically, so concurrent runs never read a partial entry.
+        
+        Args:
+            entry_path (str): Path to the entry file.
+            path (str): Absolute path to the source file.
+            stat (os.stat_result): The status of the source file when it was read.
+            content_hash (str): Hex encoded SHA-256 hash of the source file.
+            content (Any): The parsed content.
+        """
+        header = {
+            "version": FileCache.VERSION,
+            "path": path,
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": content_hash,
+        }
+        
+        fd, temp_path = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+        
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+            
+            os.replace(temp_path, entry_path)
+        except (OSError, pickle.PicklingError):
+            FileCache.__remove(temp_path)
+    
+    def __evict(self) -> None:
+        """
+        Remove the least recently used entries until the total size is below the maximum.
+        """
+        with self.__lock:
+            entries = []
+            
+            for name in os.listdir(self.__directory):
+                if not name.endswith(self.__ENTRY_SUFFIX):
+                    continue
+                
+                try:
+                    stat = os.stat(os.path.join(self.__directory, name))
+                except OSError:
+                    continue
+                
+                entries.append((stat.st_mtime_ns, stat.st_size, name))
+            
+            total_size = sum(size for _, size, _ in entries)
+            
+            for _, size, name in sorted(entries):
+                if total_size <= self.__max_size:
+                    break
+                
+                FileCache.__remove(os.path.join(self.__directory, name))
+                total_size -= size
+    
+    
+    @staticmethod
+    def __read_content(entry_path: str) -> Any:
+        """
+        Read the content of an entry, regardless of the source file's status.
+        
+        Args:
+            entry_path (str): Path to the entry file.
+        
+        Returns:
+            Any: The content, or None if the entry can not be read.
+        """
+        try:
+            with open(entry_path, "rb") as f:
+                pickle.load(f)
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+    
+    @staticmethod
+    def __touch(entry_path: str) -> None:
+        """
+        Mark an entry as recently used.
+        
+        Args:
+            entry_path (str): Path to the entry file.
+        """
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def __remove(path: str) -> None:
+        """
+        Remove a file, ignoring files already removed by another process.
+        
+        Args:
+            path (str): Path to the file.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    
+    @staticmethod
+    def default() -> "FileCache | MemoryFileCache | None":
+        """
+        Get the cache used by the file loader.
+        
+        Returns:
+            FileCache | MemoryFileCache | None: The cache, or None if parsed files are not cached.
+        """
+        return FileCache.__default
+    
+    @staticmethod
+    def set_default(cache: "FileCache | MemoryFileCache | None") -> None:
+        """
+        Set the cache used by the file loader.
+        
+        Args:
+            cache (FileCache | MemoryFileCache | None): The cache, or None to disable caching.
+        """
+        FileCache.__default = cache
@@ -1,7 +1,16 @@
 import os
 import json
+
+from typing import Any, Iterator
+
 import yaml
 
+from alertalot.generic.file_cache import FileCache
+
+
+# The LibYAML based loader is much faster, but is only available if PyYAML was built with it.
+__YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # pylint: disable=invalid-name
+
 
 def load_yaml(path: str):
     """
@@ -17,7 +26,7 @@ def load_yaml(path: str):
     path = os.path.abspath(path)
     
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=__YAML_LOADER)
 
 
 def load_json(path: str):
@@ -40,7 +49,8 @@ def load(path: str):
     """
     Loads a configuration file from the specified path based on file extension.
     
-    Supports YAML (.yaml, .yml) and JSON (.json) files.
+    Supports YAML (.yaml, .yml) and JSON (.json) files. If a default FileCache is set, the parsed
+    content is cached, and unchanged files are not parsed again.
     
     Args:
         path (str): Relative or absolute path to the config file
@@ -56,8 +66,56 @@ def load(path: str):
     ext = ext.lower()
     
     if ext in ('.yaml', '.yml'):
-        return load_yaml(path)
+        parse = load_yaml
     elif ext == '.json':
-        return load_json(path)
+        parse = load_json
     else:
         raise ValueError(f"Unsupported file extension: {ext}. Supported extensions are .yaml, .yml, and .json")
+    
+    cache = FileCache.default()
+    
+    if cache is None:
+        return parse(path)
+    
+    return cache.load(path, parse)
+
+
+def iter_documents(path: str) -> Iterator[Any]:
+    """
+    Lazily parse the documents of a configuration file, one at a time, based on file extension.
+    
+    Supports multi-document YAML (.yaml, .yml), JSON Lines (.jsonl, .ndjson) and JSON (.json) files. A
+    JSON file holds a single document. Empty lines of JSON Lines files are ignored. The parsed documents
+    are not cached, so memory usage does not depend on the size of the file.
+    
+    Args:
+        path (str): Relative or absolute path to the config file
+    
+    Returns:
+        Iterator[Any]: The parsed documents, in order.
+    
+    Raises:
+        ValueError: If the file extension is not supported, or a JSON line is not valid
+    """
+    path = os.path.abspath(path)
+    _, ext = os.path.splitext(path)
+    ext = ext.lower()
+    
+    if ext in ('.yaml', '.yml'):
+        with open(path, "r", encoding="utf-8") as f:
+            yield from yaml.load_all(f, Loader=__YAML_LOADER)
+    elif ext in ('.jsonl', '.ndjson'):
+        with open(path, "r", encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"Invalid JSON in {path} at line {number}: {e}") from e
+    elif ext == '.json':
+        yield load_json(path)
+    else:
+        raise ValueError(
+            f"Unsupported file extension: {ext}. Supported extensions are .yaml, .yml, .jsonl, .ndjson and .json")
@@ -0,0 +1,172 @@
+import json
+import hashlib
+import threading
+
+from typing import Any, TextIO
+from datetime import datetime, timezone
+
+
+class Journal:
+    """
+    Append-only JSONL journal of the alarms that were put successfully.
+    
+    Each line records a single completed alarm, keyed by its region, target and name, together with
+    a hash of the alarm's content. When a run is resumed from a journal, alarms that were already
+    put with the same content are skipped, so a failed or interrupted run only redoes the remaining work.
+    An alarm whose content changed since it was journaled is put again.
+    
+    Lines are flushed as soon as they are written. A partially written last line, left by a process
+    that died while writing it, is ignored when the journal is loaded.
+    
+    Usage:
+        with Journal("rollout.jsonl", resume=True) as journal:
+            if not journal.is_completed(region, target, name, content_hash):
+                put_alarm(...)
+                journal.record(region, target, name, content_hash, "create")
+    """
+    
+    def __init__(self, path: str, *, resume: bool = False):
+        """
+        Initialize the journal.
+        
+        Args:
+            path (str): Path to the journal file. New entries are appended to it.
+            resume (bool): If True, load the entries already in the file, so that they are reported
+                as completed.
+        """
+        self.__path = path
+        self.__lock = threading.Lock()
+        self.__file: TextIO | None = None
+        self.__completed: dict[tuple[str, str, str], str] = {}
+        
+        if resume:
+            self.__load()
+    
+    
+    def __enter__(self) -> "Journal":
+        self.open()
+        return self
+    
+    def __exit__(self, *_) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        """
+        Get the number of completed alarms.
+        
+        Returns:
+            int: The number of unique alarms recorded in the journal.
+        """
+        return len(self.__completed)
+    
+    
+    @property
+    def path(self) -> str:
+        """
+        The path to the journal file.
+        
+        Returns:
+            str: The path to the file.
+        """
+        return self.__path
+    
+    
+    def open(self) -> None:
+        """
+        Open the journal file for appending, creating it if it does not exist.
+        """
+        with self.__lock:
+            if self.__file is None:
+                self.__file = open(self.__path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+    
+    def close(self) -> None:
+        """
+        Close the journal file.
+        """
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+    
+    def is_completed(self, region: str, target: str, alarm_name: str, content_hash: str) -> bool:
+        """
+        Check if an alarm was already put with the same content.
+        
+        Args:
+            region (str): The region of the alarm.
+            target (str): The identifier of the alarm's target.
+            alarm_name (str): The name of the alarm.
+            content_hash (str): The hash of the alarm's content, see content_hash.
+        
+        Returns:
+            bool: True if the journal has a record of this alarm with the same content.
+        """
+        with self.__lock:
+            return self.__completed.get((region, target, alarm_name)) == content_hash
+    
+    def record(self, region: str, target: str, alarm_name: str, content_hash: str, change: str) -> None:
+        """
+        Append a completed alarm to the journal. Safe to call from multiple threads.
+        
+        Args:
+            region (str): The region of the alarm.
+            target (str): The identifier of the alarm's target.
+            alarm_name (str): The name of the alarm.
+            content_hash (str): The hash of the alarm's content, see content_hash.
+            change (str): The change that was applied, for example 'create'.
+        
+        Raises:
+            RuntimeError: If the journal is not open.
+        """
+        line = json.dumps({
+            "time": datetime.now(timezone.utc).isoformat(),
+            "region": region,
+            "target": target,
+            "alarm": alarm_name,
+            "hash": content_hash,
+            "change": change,
+        })
+        
+        with self.__lock:
+            if self.__file is None:
+                raise RuntimeError(f"Journal {self.__path} is not open")
+            
+            self.__file.write(line + "\n")
+            self.__file.flush()
+            
+            self.__completed[(region, target, alarm_name)] = content_hash
+    
+    
+    @staticmethod
+    def content_hash(request: dict[str, Any]) -> str:
+        """
+        Get a stable hash of an alarm's content.
+        
+        Args:
+            request (dict[str, Any]): The PutMetricAlarm arguments.
+        
+        Returns:
+            str: Hex encoded SHA-256 hash of the request.
+        """
+        content = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+        
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    
+    
+    def __load(self) -> None:
+        """
+        Load the completed alarms from the journal file. A missing file is treated as an empty journal.
+        """
+        try:
+            with open(self.__path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        key = (entry["region"], entry["target"], entry["alarm"])
+                        content_hash = entry["hash"]
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    
+                    self.__completed[key] = content_hash
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,88 @@
+import os
+import threading
+
+from typing import Any, Callable
+from collections import OrderedDict
+
+from alertalot.generic.file_cache import FileCache
+
+
+class MemoryFileCache:
+    """
+    In-process cache of parsed configuration files, for long running processes like the server.
+    
+    An entry is used while the source file keeps the same modification time and size. On a miss, the
+    file is loaded through the backing on-disk cache if one is provided, or parsed otherwise. The parsed
+    content is shared by all the callers, so it must not be modified.
+    
+    Usage:
+        FileCache.set_default(MemoryFileCache(FileCache.default()))
+    """
+    
+    # Default maximum number of entries kept in memory.
+    DEFAULT_MAX_ENTRIES = 256
+    
+    
+    def __init__(self, backing: FileCache | None = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+        
+        Args:
+            backing (FileCache | None): On-disk cache used on a miss, if any.
+            max_entries (int): Maximum number of entries. The least recently used entries are evicted first.
+        """
+        self.__backing = backing
+        self.__max_entries = max_entries
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+    
+    
+    @property
+    def backing(self) -> FileCache | None:
+        """
+        The on-disk cache used on a miss.
+        
+        Returns:
+            FileCache | None: The cache, or None if missed files are parsed directly.
+        """
+        return self.__backing
+    
+    
+    def load(self, path: str, parse: Callable[[str], Any]) -> Any:
+        """
+        Get the parsed content of a file, from memory if possible.
+        
+        Args:
+            path (str): Path to the file.
+            parse (Callable[[str], Any]): Function parsing the file, used on a cache miss.
+        
+        Returns:
+            Any: The parsed content of the file.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        
+        with self.__lock:
+            entry = self.__entries.get(path)
+            
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self.__entries.move_to_end(path)
+                return entry[2]
+        
+        content = parse(path) if self.__backing is None else self.__backing.load(path, parse)
+        
+        with self.__lock:
+            self.__entries[path] = (stat.st_mtime_ns, stat.st_size, content)
+            self.__entries.move_to_end(path)
+            
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+        
+        return content
+    
+    def clear(self) -> None:
+        """
+        Remove all the entries from memory. The backing cache is not cleared.
+        """
+        with self.__lock:
+            self.__entries.clear()
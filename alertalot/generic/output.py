@@ -1,21 +1,22 @@
 """Output formatting utilities."""
 from enum import Enum
-from typing import Any, Callable
+from typing import Any, Callable, TextIO, TYPE_CHECKING
 
+import sys
+import json
 import time
-import yaml
 
 from rich import box
 from rich.text import Text
+from rich.markup import render
 from rich.rule import Rule
-from rich.live import Live
 from rich.table import Table
-from rich.syntax import Syntax
-from rich.spinner import Spinner
 from rich.console import Console
-from rich.traceback import Traceback
 
-from alertalot.generic.variables import Variables
+# Live displays, syntax highlighting and tracebacks pull in large parts of rich and pygments. They are
+# only imported by the methods using them, to keep the start up time of short commands low.
+if TYPE_CHECKING:
+    from alertalot.generic.variables import Variables
 
 
 class OutputLevel(Enum):
@@ -41,6 +42,15 @@ class Output:
     styled messages, spinners, tables, and error handling. Provides consistent output
     styling throughout the application.
     
+    The output is written in one of the FORMATS:
+        rich: Styled with rich, with spinners, tables and syntax highlighting.
+        plain: The same content as text, written directly to the stream, without styles or spinners.
+        jsonl: One JSON object for each step, message, table or error, written directly to the stream.
+        auto: rich if the stream is a terminal, plain otherwise.
+    
+    Rendering with rich costs more than the work reported by runs with many alarms, so the plain and jsonl
+    formats bypass it. Their output is buffered by the stream, and only flushed after each step and error.
+    
     Usage:
         output = Output(is_quiet=False, is_verbose=True)
         output.print("Regular message")
@@ -53,12 +63,19 @@ class Output:
         # Display structured data
         output.print_key_value({"name": "value", "status": "active"}, title="Configuration")
     """
+    
+    # Formats accepted by the --output argument.
+    FORMATS = ("auto", "rich", "plain", "jsonl")
+    
+    
     def __init__(  # pylint: disable=too-many-arguments
             self,
             *,
             is_quiet: bool = False,
             is_verbose: bool = False,
             with_trace: bool = False,
+            output_format: str = "rich",
+            stream: TextIO | None = None,
             spinner_style: str = "bouncingBall",
             tables_style: box = box.MINIMAL):
         """
@@ -68,12 +85,26 @@ class Output:
             is_quiet (bool): If True, only critical messages are displayed
             is_verbose (bool): If True, all messages including verbose ones are displayed
             with_trace (bool): If True, full tracebacks are shown for exceptions
+            output_format (str): One of FORMATS
+            stream (TextIO | None): The stream to write to. Defaults to the standard output
             spinner_style (str): The style of spinner to use for long-running operations
             tables_style (box): The box style to use for tables
+        
+        Raises:
+            ValueError: If the format is not one of FORMATS.
         """
+        if output_format not in Output.FORMATS:
+            raise ValueError(f"Unknown output format '{output_format}', expected one of {', '.join(Output.FORMATS)}")
+        
         self.__is_first_step_printed = False
         
-        self.__console = Console()
+        self.__stream = stream if stream is not None else sys.stdout
+        
+        if output_format == "auto":
+            output_format = "rich" if self.__stream.isatty() else "plain"
+        
+        self.__format = output_format
+        self.__console = Console(file=stream) if output_format == "rich" else None
         
         self.__theme = "monokai"
         
@@ -107,6 +138,37 @@ class Output:
         """
         return self.__is_verbose
     
+    @property
+    def output_format(self) -> str:
+        """
+        The format of the output. The auto format is resolved when the output is created.
+        
+        Returns:
+            str: One of rich, plain or jsonl.
+        """
+        return self.__format
+    
+    
+    def quiet(self) -> "Output":
+        """
+        Get an output printing only errors, in the format and to the stream of this output.
+        
+        Returns:
+            Output: The quiet output.
+        """
+        return Output(
+            is_quiet=True,
+            with_trace=self.__with_trace,
+            output_format=self.__format,
+            stream=self.__stream,
+            spinner_style=self.__spinners_style,
+            tables_style=self.__tables_style)
+    
+    def flush(self) -> None:
+        """
+        Write the buffered output to the stream.
+        """
+        self.__stream.flush()
     
     def print(self, *objects: Any, level: OutputLevel = OutputLevel.NORMAL) -> None:
         """
@@ -119,8 +181,13 @@ class Output:
         if not self.__check_level(level):
             return
         
-        self.__console.print(*objects)
-        
+        if self.__format == "jsonl":
+            self.__emit("message", text=Output.__to_text(objects))
+        elif self.__format == "plain":
+            self.__write(Output.__to_text(objects))
+        else:
+            self.__console.print(*objects)
+    
     def print_step(self, text: str, level: OutputLevel = OutputLevel.VERBOSE) -> None:
         """
         Print a step separator with the given text.
@@ -132,54 +199,70 @@ class Output:
         if not self.__check_level(level):
             return
         
+        if self.__format == "jsonl":
+            self.__emit("step", text=text)
+            self.flush()
+            return
+        
         if not self.__is_first_step_printed:
             self.__is_first_step_printed = True
+        elif self.__format == "plain":
+            self.__write("")
         else:
             self.__console.print("")
         
+        if self.__format == "plain":
+            self.__write(f"➤ {text}", "")
+            self.flush()
+            return
+        
         self.print_line(level=level)
         self.__console.print(f"➤ [bold]{text}[/bold]")
         self.__console.print("")
-
-    def print_success(self, *objects: Any, level: OutputLevel = OutputLevel.VERBOSE) -> None:
+    
+    def print_success(self, *objects: Any, level: OutputLevel = OutputLevel.VERBOSE, **fields: Any) -> None:
         """
         Print a success message.
         
         Args:
             *objects: Objects to print
             level (OutputLevel): The output level for this message
+            **fields: Values added to the event in the jsonl format, for example the name of an alarm
         """
-        self.print("[bold green]✓[/bold green]", *objects, level=level)
-        
-    def print_failure(self, *objects: Any, level: OutputLevel = OutputLevel.VERBOSE) -> None:
+        self.__print_status("success", "[bold green]✓[/bold green]", objects, level, fields)
+    
+    def print_failure(self, *objects: Any, level: OutputLevel = OutputLevel.VERBOSE, **fields: Any) -> None:
         """
         Print a failure message.
         
         Args:
             *objects: Objects to print
             level (OutputLevel): The output level for this message
+            **fields: Values added to the event in the jsonl format, for example the name of an alarm
         """
-        self.print("[bold red]✗[/bold red]", *objects, level=level)
-        
-    def print_bullet(self, *objects: Any, level: OutputLevel = OutputLevel.VERBOSE) -> None:
+        self.__print_status("failure", "[bold red]✗[/bold red]", objects, level, fields)
+    
+    def print_bullet(self, *objects: Any, level: OutputLevel = OutputLevel.VERBOSE, **fields: Any) -> None:
         """
         Print a bullet point message.
         
         Args:
             *objects: Objects to print
             level (OutputLevel): The output level for this message
+            **fields: Values added to the event in the jsonl format
         """
-        self.print("[bold blue]✦[/bold blue]", *objects, level=level)
+        self.__print_status("info", "[bold blue]✦[/bold blue]", objects, level, fields)
     
     def print_line(self, level: OutputLevel = OutputLevel.VERBOSE, color: str = "Green") -> None:
         """
-        Print a horizontal line for visual separation.
+        Print a horizontal line for visual separation. Only the rich format draws lines.
         
         Args:
             level (OutputLevel): The output level for this line
             color (str): The color of the line
         """
-        self.print(Rule(style=color), level=level)
+        if self.__format == "rich":
+            self.print(Rule(style=color), level=level)
     
     def print_if_verbose(self, *objects: Any) -> None:
         """
@@ -209,6 +292,14 @@ class Output:
         if not self.__check_level(level):
             return
         
+        if self.__format == "jsonl":
+            self.__emit("list", items=[Output.__to_text([item]) for item in data])
+            return
+        
+        if self.__format == "plain":
+            self.__write("", *(f"  {symbol}{Output.__to_text([item])}" for item in data), "")
+            return
+        
         self.__console.print("")
         
         for item in data:
@@ -218,7 +309,7 @@ class Output:
     
     def print_key_value(
             self,
-            data: dict|Variables,
+            data: "dict | Variables",
             title: str | None = None,
             level: OutputLevel = OutputLevel.VERBOSE) -> None:
         """
@@ -232,6 +323,15 @@ class Output:
         if not self.__check_level(level):
             return
         
+        if self.__format == "jsonl":
+            self.__emit("values", title=title, values={str(key): str(value) for key, value in data.items()})
+            return
+        
+        if self.__format == "plain":
+            lines = [f"  {key}: {value}" for key, value in data.items()]
+            self.__write(*([title] if title is not None else []), *lines)
+            return
+        
         table = Table(
             show_header=False,
             box=self.__tables_style)
@@ -246,6 +346,46 @@ class Output:
         
         self.__console.print(table)
     
+    def print_table(
+            self,
+            columns: list[str],
+            rows: list[list[Any]],
+            title: str | None = None,
+            level: OutputLevel = OutputLevel.VERBOSE) -> None:
+        """
+        Print rows of values in a formatted table with a header.
+        
+        Args:
+            columns (list[str]): The header of each column
+            rows (list[list[Any]]): The values of each row, in the same order as the columns
+            title (str | None): Title of the table
+            level (OutputLevel): The output level for this table
+        """
+        if not self.__check_level(level):
+            return
+        
+        if self.__format == "jsonl":
+            self.__emit("table", title=title, rows=[dict(zip(columns, map(str, row))) for row in rows])
+            return
+        
+        if self.__format == "plain":
+            self.__write(*([title] if title is not None else []), *Output.__align([columns, *rows]))
+            return
+        
+        table = Table(box=self.__tables_style, header_style=self.__tables_title_style)
+        
+        if title is not None:
+            table.title = title
+            table.title_style = self.__tables_title_style
+        
+        for column in columns:
+            table.add_column(column)
+        
+        for row in rows:
+            table.add_row(*(str(value) for value in row))
+        
+        self.__console.print(table)
+    
     def spinner(self, callback: Callable[[], Any], with_time: bool = True) -> Any:
         """
         Execute a callback while displaying a spinner animation.
@@ -260,10 +400,16 @@ class Output:
         if self.__is_quiet:
             return callback()
         
-        spinner = Spinner(self.__spinners_style)
         start_time = time.time()
         
-        with Live(spinner, console=self.__console, transient=not self.__is_verbose):
+        if self.__format == "rich":
+            # pylint: disable=import-outside-toplevel
+            from rich.live import Live
+            from rich.spinner import Spinner
+            
+            with Live(Spinner(self.__spinners_style), console=self.__console, transient=not self.__is_verbose):
+                result = callback()
+        else:
             result = callback()
         
         if with_time:
@@ -282,7 +428,22 @@ class Output:
         if not self.__check_level(level):
             return
         
-        yaml_str = yaml.dump(data, default_flow_style=False, sort_keys=False)
+        if self.__format == "jsonl":
+            self.__emit("data", data=data)
+            return
+        
+        # pylint: disable=import-outside-toplevel
+        import yaml
+        
+        dumper = getattr(yaml, "CDumper", yaml.Dumper)
+        yaml_str = yaml.dump(data, Dumper=dumper, default_flow_style=False, sort_keys=False)
+        
+        if self.__format == "plain":
+            self.__write(yaml_str.rstrip("\n"))
+            return
+        
+        from rich.syntax import Syntax  # pylint: disable=import-outside-toplevel
+        
         yaml_syntax = Syntax(yaml_str, "yaml", theme=self.__theme)
         
         self.__console.print(yaml_syntax)
@@ -298,12 +459,87 @@ class Output:
         if not self.__check_level(level):
             return
         
-        if self.__with_trace:
+        if self.__format != "rich":
+            self.__print_error_text(exception)
+        elif self.__with_trace:
+            from rich.traceback import Traceback  # pylint: disable=import-outside-toplevel
+            
             traceback = Traceback.from_exception(type(exception), exception, exception.__traceback__)
             self.__console.print(traceback)
         else:
             self.print_failure(f"[bold red3]Exception:[/bold red3] {exception}", level=level)
-
+    
+    
+    def __print_status(
+            self,
+            event: str,
+            symbol: str,
+            objects: tuple[Any, ...],
+            level: OutputLevel,
+            fields: dict[str, Any]) -> None:
+        """
+        Print a message prefixed by a status symbol, or as a status event in the jsonl format.
+        
+        Args:
+            event (str): The name of the event in the jsonl format
+            symbol (str): The symbol, with its style, printed before the message
+            objects (tuple[Any, ...]): Objects to print
+            level (OutputLevel): The output level for this message
+            fields (dict[str, Any]): Values added to the event in the jsonl format
+        """
+        if not self.__check_level(level):
+            return
+        
+        if self.__format == "jsonl":
+            self.__emit(event, text=Output.__to_text(objects), **fields)
+        else:
+            self.print(symbol, *objects, level=level)
+    
+    def __print_error_text(self, exception: Exception) -> None:
+        """
+        Print an exception in the plain or jsonl format. Errors are flushed immediately.
+        
+        Args:
+            exception (Exception): The exception to print
+        """
+        # pylint: disable=import-outside-toplevel
+        import traceback
+        
+        trace = None
+        
+        if self.__with_trace:
+            trace = "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+        
+        if self.__format == "jsonl":
+            self.__emit("error", text=str(exception), type=type(exception).__name__, traceback=trace)
+        elif trace is not None:
+            self.__write(trace.rstrip("\n"))
+        else:
+            self.__write(f"✗ Exception: {exception}")
+        
+        self.flush()
+    
+    def __emit(self, event: str, **fields: Any) -> None:
+        """
+        Write a single event in the jsonl format. Fields set to None are omitted.
+        
+        Args:
+            event (str): The name of the event
+            **fields: The values of the event
+        """
+        values = {"event": event, "time": round(time.time(), 3)}
+        values.update((key, value) for key, value in fields.items() if value is not None)
+        
+        self.__stream.write(json.dumps(values, default=str) + "\n")
+    
+    def __write(self, *lines: str) -> None:
+        """
+        Write lines of text in the plain format.
+        
+        Args:
+            *lines (str): The lines to write
+        """
+        self.__stream.write("".join(f"{line}\n" for line in lines))
     
     def __check_level(self, level: OutputLevel) -> bool:
         """
@@ -327,3 +563,35 @@ class Output:
             self.__output_level = OutputLevel.VERBOSE
         else:
             self.__output_level = OutputLevel.NORMAL
+    
+    
+    @staticmethod
+    def __to_text(objects: "tuple[Any, ...] | list[Any]") -> str:
+        """
+        Convert printed objects to text, without their rich markup.
+        
+        Args:
+            objects (tuple[Any, ...] | list[Any]): The objects
+        
+        Returns:
+            str: The text of the objects, separated by spaces
+        """
+        return " ".join(
+            render(value).plain if isinstance(value, str) else value.plain if isinstance(value, Text) else str(value)
+            for value in objects)
+    
+    @staticmethod
+    def __align(rows: list[list[Any]]) -> list[str]:
+        """
+        Align the values of rows in columns.
+        
+        Args:
+            rows (list[list[Any]]): The rows, starting with the header
+        
+        Returns:
+            list[str]: The text of each row
+        """
+        texts = [[str(value) for value in row] for row in rows]
+        widths = [max(len(row[i]) for row in texts if i < len(row)) for i in range(max(map(len, texts)))]
+        
+        return ["  ".join(value.ljust(widths[i]) for i, value in enumerate(row)).rstrip() for row in texts]
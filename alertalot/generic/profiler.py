@@ -0,0 +1,231 @@
+import math
+import time
+import threading
+
+from typing import Any, Callable, Iterator
+from contextlib import contextmanager
+
+
+class Profiler:
+    """
+    Collect the time spent in each phase of a run, as named spans, for the --profile report.
+    
+    The phases record their spans with Profiler.span, which does nothing unless a profiler is set as the
+    default, so any run can be measured without changing the code. The calls made to AWS are recorded
+    for each API, by hooks attached to the clients with Profiler.attach. Paginated calls are recorded
+    once for each page, and the time of a call includes its retries and rate limiting.
+    
+    Spans can be recorded from any thread.
+    
+    Usage:
+        profiler = Profiler()
+        Profiler.set_default(profiler)
+        
+        with Profiler.span("variables"):
+            variables = Variables.parse(files)
+        
+        output.print_table(Profiler.COLUMNS, profiler.summary())
+    """
+    
+    # Header of the rows returned by summary.
+    COLUMNS = ["Phase", "Count", "Total", "p50", "p95", "Max"]
+    
+    __default: "Profiler | None" = None
+    __CONTEXT_KEY = "alertalot_profiler_start"
+    
+    
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize the profiler. The wall time of the run is measured from this point.
+        
+        Args:
+            clock (Callable[[], float]): Monotonic clock returning the current time in seconds.
+        """
+        self.__clock = clock
+        self.__started_at = clock()
+        self.__lock = threading.Lock()
+        self.__spans: dict[str, list[float]] = {}
+    
+    
+    @property
+    def wall_time(self) -> float:
+        """
+        The time elapsed since the profiler was created.
+        
+        Returns:
+            float: The wall time in seconds.
+        """
+        return self.__clock() - self.__started_at
+    
+    @property
+    def clock(self) -> Callable[[], float]:
+        """
+        The clock used to measure the spans.
+        
+        Returns:
+            Callable[[], float]: The clock.
+        """
+        return self.__clock
+    
+    
+    def record(self, name: str, duration: float) -> None:
+        """
+        Record a single span.
+        
+        Args:
+            name (str): The name of the phase.
+            duration (float): The duration of the span, in seconds.
+        """
+        with self.__lock:
+            self.__spans.setdefault(name, []).append(duration)
+    
+    def durations(self, name: str) -> list[float]:
+        """
+        Get the recorded durations of a phase.
+        
+        Args:
+            name (str): The name of the phase.
+        
+        Returns:
+            list[float]: The duration of each span, in seconds, in the order they were recorded.
+        """
+        with self.__lock:
+            return list(self.__spans.get(name, []))
+    
+    def summary(self) -> list[list[str]]:
+        """
+        Summarize the recorded spans of each phase, in the order the phases first ran, followed by the
+        wall time of the run.
+        
+        Returns:
+            list[list[str]]: The name, number of spans, total, median, 95th percentile and maximum duration
+                of each phase, formatted for a table with the COLUMNS header.
+        """
+        with self.__lock:
+            spans = {name: sorted(durations) for name, durations in self.__spans.items()}
+        
+        rows = [
+            [
+                name,
+                str(len(durations)),
+                Profiler.format_duration(sum(durations)),
+                Profiler.format_duration(Profiler.percentile(durations, 50)),
+                Profiler.format_duration(Profiler.percentile(durations, 95)),
+                Profiler.format_duration(durations[-1]),
+            ]
+            for name, durations in spans.items()
+        ]
+        
+        rows.append(["Wall time", "", Profiler.format_duration(self.wall_time), "", "", ""])
+        
+        return rows
+    
+    
+    @staticmethod
+    def default() -> "Profiler | None":
+        """
+        Get the profiler recording the spans of the current run.
+        
+        Returns:
+            Profiler | None: The profiler, or None if the run is not profiled.
+        """
+        return Profiler.__default
+    
+    @staticmethod
+    def set_default(profiler: "Profiler | None") -> None:
+        """
+        Set the profiler recording the spans of the current run.
+        
+        Args:
+            profiler (Profiler | None): The profiler, or None to stop profiling.
+        """
+        Profiler.__default = profiler
+    
+    @staticmethod
+    @contextmanager
+    def span(name: str) -> Iterator[None]:
+        """
+        Record the time spent in a block with the default profiler. Does nothing if there is none.
+        
+        Args:
+            name (str): The name of the phase.
+        """
+        profiler = Profiler.__default
+        
+        if profiler is None:
+            yield
+            return
+        
+        start = profiler.clock()
+        
+        try:
+            yield
+        finally:
+            profiler.record(name, profiler.clock() - start)
+    
+    @staticmethod
+    def attach(client: Any) -> None:
+        """
+        Register hooks on a boto3 client, recording each of its calls with the default profiler as the
+        'aws:service.Operation' phase. The hooks do nothing while there is no default profiler, so a client
+        can be attached once and used by profiled and not profiled runs.
+        
+        Args:
+            client (Any): The boto3 client.
+        """
+        client.meta.events.register("before-parameter-build", Profiler.__on_call_start)
+        client.meta.events.register("after-call", Profiler.__on_call_end)
+        client.meta.events.register("after-call-error", Profiler.__on_call_end)
+    
+    @staticmethod
+    def percentile(durations: list[float], percent: float) -> float:
+        """
+        Get a percentile of sorted durations, using the nearest rank method.
+        
+        Args:
+            durations (list[float]): The durations, sorted in ascending order.
+            percent (float): The percentile, between 0 and 100.
+        
+        Returns:
+            float: The percentile, or 0 if there are no durations.
+        """
+        if not durations:
+            return 0.0
+        
+        rank = max(1, math.ceil(percent / 100 * len(durations)))
+        
+        return durations[rank - 1]
+    
+    @staticmethod
+    def format_duration(seconds: float) -> str:
+        """
+        Format a duration for the report.
+        
+        Args:
+            seconds (float): The duration in seconds.
+        
+        Returns:
+            str: The duration, in milliseconds below one second, in seconds otherwise.
+        """
+        if seconds < 1:
+            return f"{seconds * 1000:.1f}ms"
+        
+        return f"{seconds:.2f}s"
+    
+    
+    @staticmethod
+    def __on_call_start(context: dict[str, Any] | None = None, **_) -> None:
+        profiler = Profiler.__default
+        
+        if profiler is not None and context is not None:
+            context[Profiler.__CONTEXT_KEY] = profiler.clock()
+    
+    @staticmethod
+    def __on_call_end(event_name: str, context: dict[str, Any] | None = None, **_) -> None:
+        profiler = Profiler.__default
+        
+        if profiler is None or context is None or Profiler.__CONTEXT_KEY not in context:
+            return
+        
+        start = context.pop(Profiler.__CONTEXT_KEY)
+        profiler.record(f"aws:{event_name.split('.', 1)[1]}", profiler.clock() - start)
@@ -0,0 +1,258 @@
+import os
+import json
+import tempfile
+import threading
+
+from typing import Any, Iterable
+from datetime import datetime, timedelta, timezone
+
+
+class SyncState:
+    """
+    State of the --sync runs, persisted in a local JSON file.
+    
+    For each region, the state holds a watermark, the latest launch time of the instances already
+    synced, and the IDs of the synced instances launched shortly before it. A run only needs to look at
+    the instances launched after the watermark, minus a safety margin for instances that are listed late.
+    Instances of the margin that are already known are skipped.
+    
+    The file holds, for each region:
+        {"filters": [...], "watermark": "2024-01-01T10:00:00+00:00", "known": {"i-123": "2024-01-01T09:30:00+00:00"}}
+    
+    The state of a region is reset when its target filters change, as the instances synced with other
+    filters are not the same.
+    
+    Changes are staged while a run is in progress, and only written by save, once the run succeeded.
+    
+    Usage:
+        state = SyncState.load("sync.json")
+        since = state.since("us-east-1", filters)
+        ...
+        state.stage("us-east-1", filters, [(instance_id, launch_time)])
+        state.save()
+    """
+    
+    # Version of the file format. Files written with another version are ignored.
+    VERSION = 1
+    
+    # Instances launched up to this long before the watermark are still looked at, in case they are
+    # listed late.
+    SAFETY_MARGIN = timedelta(hours=1)
+    
+    
+    def __init__(self, path: str, regions: dict[str, dict[str, Any]] | None = None):
+        """
+        Initialize the state.
+        
+        Args:
+            path (str): Path to the state file.
+            regions (dict[str, dict[str, Any]] | None): The persisted state of each region.
+        """
+        self.__path = path
+        self.__regions = regions or {}
+        self.__staged: dict[str, dict[str, Any]] = {}
+        self.__lock = threading.Lock()
+    
+    
+    @property
+    def path(self) -> str:
+        """
+        The path to the state file.
+        
+        Returns:
+            str: The path.
+        """
+        return self.__path
+    
+    
+    def watermark(self, region: str | None) -> datetime | None:
+        """
+        Get the latest launch time of the instances synced in a region.
+        
+        Args:
+            region (str | None): The region.
+        
+        Returns:
+            datetime | None: The watermark, or None if the region was never synced.
+        """
+        with self.__lock:
+            entry = self.__regions.get(SyncState.__key(region))
+        
+        return datetime.fromisoformat(entry["watermark"]) if entry and entry.get("watermark") else None
+    
+    def since(self, region: str | None, filters: list[dict[str, Any]]) -> datetime | None:
+        """
+        Get the launch time from which the instances of a region must be looked at.
+        
+        Args:
+            region (str | None): The region.
+            filters (list[dict[str, Any]]): The target filters of the run.
+        
+        Returns:
+            datetime | None: The watermark minus the safety margin, or None if all the instances must be
+                looked at, because the region was never synced with these filters.
+        """
+        with self.__lock:
+            entry = self.__regions.get(SyncState.__key(region))
+        
+        if not entry or entry.get("filters") != filters or not entry.get("watermark"):
+            return None
+        
+        return datetime.fromisoformat(entry["watermark"]) - self.SAFETY_MARGIN
+    
+    def is_new(
+            self,
+            region: str | None,
+            filters: list[dict[str, Any]],
+            instance_id: str,
+            launch_time: datetime) -> bool:
+        """
+        Check if an instance was not synced yet.
+        
+        Args:
+            region (str | None): The region.
+            filters (list[dict[str, Any]]): The target filters of the run.
+            instance_id (str): The ID of the instance.
+            launch_time (datetime): The launch time of the instance.
+        
+        Returns:
+            bool: True if the instance must be synced.
+        """
+        since = self.since(region, filters)
+        
+        if since is None:
+            return True
+        
+        if launch_time < since:
+            return False
+        
+        with self.__lock:
+            return instance_id not in self.__regions[SyncState.__key(region)]["known"]
+    
+    def stage(self, region: str | None, filters: list[dict[str, Any]], synced: Iterable[tuple[str, datetime]]) -> None:
+        """
+        Record the instances synced by the current run. The state is only changed once save is called.
+        
+        Args:
+            region (str | None): The region.
+            filters (list[dict[str, Any]]): The target filters of the run.
+            synced (Iterable[tuple[str, datetime]]): The ID and launch time of each synced instance.
+        """
+        key = SyncState.__key(region)
+        
+        with self.__lock:
+            entry = self.__regions.get(key)
+            
+            if entry is None or entry.get("filters") != filters:
+                entry = {"filters": filters, "watermark": None, "known": {}}
+            
+            known = {instance_id: datetime.fromisoformat(value) for instance_id, value in entry["known"].items()}
+            known.update(synced)
+            
+            watermark = max(known.values(), default=None)
+            
+            if entry["watermark"] and (watermark is None or datetime.fromisoformat(entry["watermark"]) > watermark):
+                watermark = datetime.fromisoformat(entry["watermark"])
+            
+            # Known instances are only needed within the safety margin of the watermark.
+            self.__staged[key] = {
+                "filters": filters,
+                "watermark": watermark.isoformat() if watermark else None,
+                "known": {
+                    instance_id: launch_time.isoformat()
+                    for instance_id, launch_time in known.items()
+                    if launch_time >= watermark - self.SAFETY_MARGIN
+                },
+            }
+    
+    def save(self) -> None:
+        """
+        Apply the staged changes, and write the state file atomically.
+        """
+        with self.__lock:
+            self.__regions.update(self.__staged)
+            self.__staged = {}
+            
+            content = json.dumps({"version": self.VERSION, "regions": self.__regions}, indent=2, default=str)
+        
+        directory = os.path.dirname(os.path.abspath(self.__path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            
+            os.replace(temp_path, self.__path)
+        except OSError:
+            os.remove(temp_path)
+            raise
+    
+    
+    @staticmethod
+    def __key(region: str | None) -> str:
+        """
+        Get the key of a region in the state file.
+        
+        Args:
+            region (str | None): The region, or None for the default region.
+        
+        Returns:
+            str: The key.
+        """
+        return region or "default"
+    
+    
+    @staticmethod
+    def load(path: str) -> "SyncState":
+        """
+        Load the state file. A missing file, or a file of another version, is an empty state.
+        
+        Args:
+            path (str): Path to the state file.
+        
+        Returns:
+            SyncState: The loaded state.
+        
+        Raises:
+            ValueError: If the file is not a valid state file.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+        except FileNotFoundError:
+            return SyncState(path)
+        
+        if not isinstance(content, dict) or not isinstance(content.get("regions", {}), dict):
+            raise ValueError(f"Invalid sync state file {path}")
+        
+        if content.get("version") != SyncState.VERSION:
+            return SyncState(path)
+        
+        return SyncState(path, content.get("regions"))
+    
+    @staticmethod
+    def launch_time_filter(since: datetime, now: datetime | None = None, max_days: int = 30) -> dict[str, Any] | None:
+        """
+        Build a DescribeInstances filter matching the instances launched since a given time. EC2 only
+        supports wildcards for launch times, so the filter matches whole days, in UTC.
+        
+        Args:
+            since (datetime): The earliest launch time to match.
+            now (datetime | None): The current time. Defaults to now.
+            max_days (int): Maximum number of days matched by the filter.
+        
+        Returns:
+            dict[str, Any] | None: The filter, or None if more than max_days days would be needed.
+        """
+        now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+        day = since.astimezone(timezone.utc).date()
+        days = []
+        
+        while day <= now.date():
+            days.append(f"{day.isoformat()}T*")
+            day += timedelta(days=1)
+            
+            if len(days) > max_days:
+                return None
+        
+        return {"Name": "launch-time", "Values": days}
@@ -1,8 +1,11 @@
 import os
 import re
 import json
+import functools
 
-import jsonschema
+from typing import Any
+from collections import ChainMap
+from collections.abc import Mapping
 
 from alertalot.generic.file_loader import load
 
@@ -10,10 +13,23 @@ from alertalot.generic.file_loader import load
 class Variables:
     """
     Container for variables used to generate an alert configuration from the config file.
+    
+    Variables are stored as a stack of scopes. Lookups go from the top scope down, and updates only
+    write to the top scope. overlay creates a new scope on top of an existing set of variables without
+    copying it, so per-target values can be layered over the variables shared by all the targets.
     """
     
     # Extract values like $INSTANCE_ID from a parameter string
-    __VARIABLE_REGEX = r"\$[a-zA-Z0-9_]+(?![a-zA-Z0-9_])"
+    __VARIABLE_REGEX = re.compile(r"\$([a-zA-Z0-9_]+)(?![a-zA-Z0-9_])")
+    
+    # Maximum number of distinct strings whose parsed segments are kept by substitute.
+    TEMPLATE_CACHE_SIZE = 4096
+    
+    # Path to the JSON schema of the variables files.
+    SCHEME_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../schemes/params.json")
+    
+    # Name of a scope in a variables file, matching the patternProperties of the schema.
+    __SCOPE_REGEX = re.compile(r"^[a-z0-9-]+$")
     
     
     def __init__(self, variables: dict|None = None):
@@ -23,7 +39,7 @@ class Variables:
         Args:
             variables (dict | None): Optional initial variables set.
         """
-        self.__arguments: dict = variables or {}
+        self.__arguments: ChainMap = ChainMap(variables or {})
     
     def __contains__(self, key: str) -> bool:
         """
@@ -74,11 +90,11 @@ class Variables:
         Add new attributes. Override any existing.
         
         Args:
-            values (dict | Variables): The attributes to add.
+            values (Mapping | Variables): The attributes to add.
         """
         if isinstance(values, Variables):
             self.__arguments.update(values.__arguments) # pylint: disable=protected-access
-        elif isinstance(values, dict):
+        elif isinstance(values, Mapping):
             self.__arguments.update(values)
         elif values is not None:
             raise ValueError("Expecting a Parameters object or dict")
@@ -98,19 +114,41 @@ class Variables:
         Raises:
             KeyError: If a variable is not found in _arguments.
         """
-        def replace_match(match: re.Match) -> str:
-            # Remove the leading '$'
-            var_name = match.group()[1:]
-            
-            if var_name not in self:
-                if not fail_if_missing:
-                    return match.group()
-                
-                raise KeyError(f"Variable '{var_name}' not found in parameters list.")
+        if "$" not in text:
+            return text
+        
+        segments = Variables.__tokenize(text)
+        result = list(segments)
+        
+        for i in range(1, len(segments), 2):
+            name = segments[i]
             
-            return str(self[var_name])
+            if name in self.__arguments:
+                result[i] = str(self.__arguments[name])
+            elif fail_if_missing:
+                raise KeyError(f"Variable '{name}' not found in parameters list.")
+            else:
+                result[i] = "$" + name
+        
+        return "".join(result)
+    
+    def overlay(self, values: dict | None = None) -> "Variables":
+        """
+        Creates and returns a new Variables object with the given values as a scope on top of this
+        instance. The values of this instance are not copied, so later changes to this instance are
+        visible through the new object, while changes to the new object are not visible here.
+        
+        Args:
+            values (dict | None):
+                Values of the new scope. They override values of this instance with the same key.
         
-        return re.sub(self.__VARIABLE_REGEX, replace_match, text)
+        Returns:
+            Variables: A new instance sharing the values of this instance.
+        """
+        params = Variables()
+        params.__arguments = self.__arguments.new_child(dict(values or {}))  # pylint: disable=protected-access,unused-private-member
+        
+        return params
     
     def merge(self, values: dict) -> "Variables":
         """
@@ -123,17 +161,49 @@ class Variables:
     
         Returns:
             Variables: A new instance containing parameters from both this instance
-                and the provided dictionary.  
+                and the provided dictionary. Unlike overlay, the values are copied.
         """
         
         params = Variables()
         
-        params.update(self.__arguments)
+        params.update(dict(self.__arguments))
         params.update(values)
         
         return params
     
     
+    @staticmethod
+    def references(text: str) -> set[str]:
+        """
+        Get the names of the variables referenced by a string.
+        
+        Args:
+            text (str): The input string containing $variable placeholders.
+        
+        Returns:
+            set[str]: The names of the referenced variables, without the leading '$'.
+        """
+        if "$" not in text:
+            return set()
+        
+        return set(Variables.__tokenize(text)[1::2])
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+    def __tokenize(text: str) -> tuple[str, ...]:
+        """
+        Split a string into its literal and variable segments. The result is cached, as the same strings
+        are substituted for every target.
+        
+        Args:
+            text (str): The input string containing $variable placeholders.
+        
+        Returns:
+            tuple[str, ...]: The segments. Even indexes hold the literal text, possibly empty, and odd
+                indexes hold the variable names, without the leading '$'.
+        """
+        return tuple(Variables.__VARIABLE_REGEX.split(text))
+    
     @staticmethod
     def parse(files: list[str] | str, region: str | None = None) -> "Variables":
         """
@@ -155,18 +225,86 @@ class Variables:
         for file in files:
             parsed = load(file)
             
-            current_file_directory = os.path.dirname(os.path.abspath(__file__))
-            full_path = os.path.join(current_file_directory, "../../schemes/params.json")
-            
-            with open(full_path, "r", encoding="utf-8") as f:
-                scheme = json.load(f)
+            # Most files are valid. The schema is only evaluated when the quick check fails, to report
+            # the exact error.
+            if not Variables.__is_well_formed(parsed):
+                Variables.__validator().validate(parsed)
             
-            jsonschema.validate(parsed, scheme)
+            scopes = (parsed or {}).get("params") or {}
             
-            if "global" in parsed["params"]:
-                params.update(parsed["params"]["global"])
+            if "global" in scopes:
+                params.update(scopes["global"] or {})
             
-            if region is not None and region in parsed["params"]:
-                params.update(parsed["params"][region])
-                
+            if region is not None and region in scopes:
+                params.update(scopes[region] or {})
+        
         return params
+    
+    
+    @staticmethod
+    def __is_well_formed(parsed: Any) -> bool:
+        """
+        Quick structural check of a parsed variables file, equivalent to a successful validation against
+        the schema in SCHEME_FILE.
+        
+        Args:
+            parsed (Any): The parsed content of the file.
+        
+        Returns:
+            bool: True if the content matches the schema. False if it does not, or if the check can not tell.
+        """
+        if not isinstance(parsed, dict) or parsed.keys() != {"params"}:
+            return False
+        
+        scopes = parsed["params"]
+        
+        if scopes is None:
+            return True
+        
+        if not isinstance(scopes, dict):
+            return False
+        
+        return all(
+            isinstance(name, str) and Variables.__SCOPE_REGEX.match(name) and Variables.__is_well_formed_scope(values)
+            for name, values in scopes.items())
+    
+    @staticmethod
+    def __is_well_formed_scope(values: Any) -> bool:
+        """
+        Quick structural check of a single scope of a parsed variables file.
+        
+        Args:
+            values (Any): The values of the scope.
+        
+        Returns:
+            bool: True if the scope is empty, or maps names to scalar values.
+        """
+        if values is None:
+            return True
+        
+        if not isinstance(values, dict):
+            return False
+        
+        return all(
+            isinstance(key, str) and isinstance(value, (str, int, float, bool, type(None)))
+            for key, value in values.items())
+    
+    @staticmethod
+    @functools.cache
+    def __validator() -> Any:
+        """
+        Get the validator of the variables files schema. The schema is loaded and compiled once, and
+        jsonschema is only imported when a file needs to be validated against it.
+        
+        Returns:
+            Any: The jsonschema validator instance.
+        """
+        import jsonschema  # pylint: disable=import-outside-toplevel
+        
+        with open(Variables.SCHEME_FILE, "r", encoding="utf-8") as f:
+            scheme = json.load(f)
+        
+        validator_class = jsonschema.validators.validator_for(scheme)
+        validator_class.check_schema(scheme)
+        
+        return validator_class(scheme)
@@ -1,16 +1,21 @@
+import os
 import sys
 import argparse
 
 
-from alertalot.actions import show_variables_action
-from alertalot.actions import show_alarms_template_action
-from alertalot.actions import create_alarms_action
-from alertalot.actions import show_target_action
-from alertalot.actions import aws_test_action
-from alertalot.generic.output import Output
+from typing import Callable, Iterator, TYPE_CHECKING
+from contextlib import contextmanager
+
+from alertalot.backends.alarm_backend_factory import AlarmBackendFactory
+from alertalot.generic.file_cache import FileCache
 from alertalot.generic.args_object import ArgsObject
 from alertalot.exception.invalid_template_exception import InvalidTemplateException
-from alertalot.generic.output import OutputLevel
+from alertalot.exception.alarms_creation_exception import AlarmsCreationException
+
+# Output imports rich, which is not needed when the run is forwarded to a server.
+if TYPE_CHECKING:
+    from alertalot.generic.output import Output
+    from alertalot.aws.client_registry import ClientRegistry
 
 
 def __parse_key_value(argument: str) -> (str, str):
@@ -30,6 +35,142 @@ def __parse_key_value(argument: str) -> (str, str):
         raise argparse.ArgumentTypeError(f"'{argument}' is not a valid key=value pair") from e
 
 
+def __parse_positive_int(argument: str) -> int:
+    """
+    Parse a string into a positive integer.
+    
+    Args:
+        argument: A string representation of an integer greater than 0.
+    
+    Returns:
+        The parsed integer.
+    """
+    try:
+        value = int(argument)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"'{argument}' is not a valid integer") from e
+    
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"'{argument}' must be greater than 0")
+    
+    return value
+
+
+def __parse_api_tps(argument: str) -> (str, float):
+    """
+    Parse a string in the format 'api=tps' into the API name and its requests per second.
+    
+    Args:
+        argument: A string like 'cloudwatch.PutMetricAlarm=5' or 'ec2=20'.
+    
+    Returns:
+        A tuple of the API name and the requests per second.
+    """
+    api, value = __parse_key_value(argument)
+    
+    try:
+        tps = float(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a valid number of requests per second") from e
+    
+    if tps < 0:
+        raise argparse.ArgumentTypeError(f"'{argument}' requests per second can not be negative")
+    
+    return api, tps
+
+
+def __parse_list(argument: str) -> list[str]:
+    """
+    Parse a comma separated string into a list of values.
+    
+    Args:
+        argument: A string in the format 'a,b,c'.
+    
+    Returns:
+        The list of non-empty values.
+    """
+    return [value.strip() for value in argument.split(",") if value.strip()]
+
+
+def __parse_filter(argument: str) -> (str, list[str]):
+    """
+    Parse a string in the format 'name=value1,value2' into an EC2 filter name and its values.
+    
+    Args:
+        argument: A string like 'tag:Role=web,api' or 'instance-state-name=running'.
+    
+    Returns:
+        A tuple of the filter name and the list of values.
+    """
+    name, values = __parse_key_value(argument)
+    values = __parse_list(values)
+    
+    if not name or not values:
+        raise argparse.ArgumentTypeError(f"'{argument}' is not a valid filter, expecting name=value1,value2")
+    
+    return name, values
+
+
+def __parse_non_negative_float(argument: str) -> float:
+    """
+    Parse a string into a float greater than or equal to 0.
+    
+    Args:
+        argument: A string representation of a number.
+    
+    Returns:
+        The parsed number.
+    """
+    try:
+        value = float(argument)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"'{argument}' is not a valid number") from e
+    
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"'{argument}' can not be negative")
+    
+    return value
+
+
+def __parse_probability(argument: str) -> float:
+    """
+    Parse a string into a float between 0 and 1.
+    
+    Args:
+        argument: A string representation of a number.
+    
+    Returns:
+        The parsed probability.
+    """
+    value = __parse_non_negative_float(argument)
+    
+    if value > 1:
+        raise argparse.ArgumentTypeError(f"'{argument}' is not a valid probability, expecting a value between 0 and 1")
+    
+    return value
+
+
+def __parse_shard(argument: str) -> (int, int):
+    """
+    Parse a string in the format 'K/N' into the zero based index of a shard and the number of shards.
+    
+    Args:
+        argument: A string like '2/4', for the second of four shards.
+    
+    Returns:
+        A tuple of the zero based shard index and the number of shards.
+    """
+    try:
+        index, count = (int(value) for value in argument.split("/", 1))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"'{argument}' is not a valid shard, expecting K/N") from e
+    
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"'{argument}' is not a valid shard, expecting 1 <= K <= N")
+    
+    return index - 1, count
+
+
 def __create_args_object() -> argparse.ArgumentParser:
     """
     Parse command line arguments for the application.
@@ -41,7 +182,31 @@ def __create_args_object() -> argparse.ArgumentParser:
         description="Create Cloudwatch alerts for "
                     "AWS resources based on predefined config")
     
-    parser.add_argument("--ec2-id", type=str, help="ID of an EC2 instance to generate the alerts for")
+    parser.add_argument(
+        "--ec2-id", "--ec2-ids",
+        action="extend",
+        type=__parse_list,
+        dest="ec2_id",
+        default=None,
+        help="ID of an EC2 instance to generate the alerts for. "
+             "Can be passed more than once, or as a comma separated list of IDs")
+    
+    parser.add_argument(
+        "--ec2-ids-file",
+        type=str,
+        dest="ec2_ids_file",
+        default=None,
+        help="Path to a file with the IDs of EC2 instances to generate the alerts for, one ID per line")
+    
+    parser.add_argument(
+        "--ec2-filter",
+        action="append",
+        type=__parse_filter,
+        dest="ec2_filters",
+        default=[],
+        help="EC2 filter used to select the instances to generate the alerts for, in the format "
+             "'name=value1,value2'. For example 'tag:Role=web', 'vpc-id=vpc-0123' or "
+             "'instance-state-name=running'. Can be passed more than once")
     
     parser.add_argument(
         "--vars-file", "--variables-file",
@@ -64,9 +229,155 @@ def __create_args_object() -> argparse.ArgumentParser:
     parser.add_argument(
         "--region",
         type=str,
-        help="The AWS region to use",
+        help="The AWS region to use. When creating alarms, a comma separated list of regions, or 'all' "
+             "for all the regions enabled for the account, to create the alarms in all of them in parallel. "
+             "Other actions use the first region.",
         default="us-east-1")
     
+    parser.add_argument(
+        "--role-arn",
+        type=str,
+        dest="role_arn",
+        default=None,
+        help="ARN of an IAM role to assume for all AWS requests, for example to target another account")
+    
+    parser.add_argument(
+        "--max-in-flight",
+        type=__parse_positive_int,
+        dest="max_in_flight",
+        default=10,
+        help="The maximum number of AWS requests to execute at the same time when creating alarms")
+    
+    parser.add_argument(
+        "--api-tps",
+        action="append",
+        type=__parse_api_tps,
+        dest="api_tps",
+        default=[],
+        help="Requests per second allowed for an AWS API, in the format 'service.Operation=tps' or "
+             "'service=tps'. For example, 'cloudwatch.PutMetricAlarm=10'. A service's rate also applies to the "
+             "operations of the service that have a default rate. Use 0 to disable the limit. "
+             "Throttled requests are retried with backoff.")
+    
+    parser.add_argument(
+        "--backend",
+        type=str,
+        choices=AlarmBackendFactory.BACKENDS,
+        dest="backend",
+        default="cloudwatch",
+        help="Where alarms are written to. 'cloudwatch' uses the CloudWatch API, 'emulator' keeps the alarms "
+             "in memory, emulating CloudWatch, and 'recorder' reads the existing alarms from CloudWatch but only "
+             "records the write requests")
+    
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        dest="dry_run",
+        help="Simulate the requests without executing them. Same as --backend recorder")
+    
+    parser.add_argument(
+        "--record-file",
+        type=str,
+        dest="record_file",
+        default=None,
+        help="Path to a JSONL file the recorder backend appends the recorded requests to")
+    
+    parser.add_argument(
+        "--emulator-latency",
+        type=__parse_non_negative_float,
+        dest="emulator_latency",
+        default=0.0,
+        help="Time in seconds each call to the emulator backend takes")
+    
+    parser.add_argument(
+        "--emulator-throttle-rate",
+        type=__parse_probability,
+        dest="emulator_throttle_rate",
+        default=0.0,
+        help="Probability, between 0 and 1, of each call to the emulator backend to fail with a Throttling error")
+    
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        dest="stream",
+        help="Parse, render and create the alarms one template entry at a time, so the first alarms are "
+             "created before the whole template is parsed. Supports multi-document YAML and JSON Lines templates")
+    
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        dest="cache_dir",
+        default=os.environ.get("ALERTALOT_CACHE_DIR"),
+        help="Directory to cache parsed template and variables files in, so unchanged files are not parsed "
+             "again. Defaults to the ALERTALOT_CACHE_DIR environment variable. If not set, files are not cached")
+    
+    parser.add_argument(
+        "--sync",
+        type=str,
+        dest="sync",
+        metavar="STATE_FILE",
+        default=None,
+        help="With --create-alarms, only target the instances launched since the previous run with the same "
+             "state file, selected with --ec2-filter, or all the instances if no filter is provided. The state "
+             "file holds the latest launch time synced in each region, and is only updated if all the alarms "
+             "were created")
+    
+    parser.add_argument(
+        "--coalesce-seconds",
+        type=__parse_non_negative_float,
+        dest="coalesce_seconds",
+        default=2.0,
+        help="With --worker, time in seconds to wait for more launch events once the first event of a batch "
+             "arrived. Events of the same instance within a batch are coalesced")
+    
+    parser.add_argument(
+        "--drain",
+        action="store_true",
+        dest="drain",
+        default=False,
+        help="With --worker, stop once no event arrives for 20 seconds, instead of waiting for more events")
+    
+    parser.add_argument(
+        "--socket",
+        type=str,
+        dest="socket",
+        default=os.environ.get("ALERTALOT_SOCKET"),
+        help="Path to the Unix socket of a server started with --serve. Runs are forwarded to the server, and "
+             "run locally if it is not reachable, and for --worker runs. Defaults to the ALERTALOT_SOCKET "
+             "environment variable")
+    
+    parser.add_argument(
+        "--journal",
+        type=str,
+        dest="journal",
+        default=None,
+        help="Path to a JSONL journal file. Every alarm that is created, updated or found unchanged is appended "
+             "to it, so that an interrupted or failed run can be resumed with --resume")
+    
+    parser.add_argument(
+        "--resume",
+        type=str,
+        dest="resume",
+        default=None,
+        help="Path to a journal file written by a previous run. Alarms recorded in it with the same content "
+             "are skipped, and the journal is updated with the alarms created by this run")
+    
+    parser.add_argument(
+        "--shard",
+        type=__parse_shard,
+        dest="shard",
+        default=None,
+        help="When applying a plan, only create the alarms of this shard, in the format 'K/N' for the K-th "
+             "of N shards. For example, run '--apply out.plan --shard 1/2' and '--apply out.plan --shard 2/2' "
+             "on two runners")
+    
+    parser.add_argument(
+        "--ignore-inputs-hash",
+        action="store_true",
+        dest="ignore_inputs_hash",
+        help="When applying a plan, do not check that the passed variables, template and target arguments are "
+             "the ones the plan was computed with")
+    
     parser.add_argument(
         "--trace",
         action="store_true",
@@ -74,6 +385,49 @@ def __create_args_object() -> argparse.ArgumentParser:
         help="If set, when printing out an exception also add a pretty print of the stack trace. "
              "Otherwise only the error message is printed.")
     
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        dest="profile",
+        help="If set, print the time spent in each phase of the run once it is done: loading the variables, "
+             "the targets and the template, validating and rendering it, and each AWS API")
+    
+    parser.add_argument(
+        "--profile-file",
+        type=str,
+        dest="profile_file",
+        metavar="FILE",
+        default=None,
+        help="Write the cProfile statistics of the run to this file, for use with pstats or snakeviz. Only "
+             "the main thread is profiled")
+    
+    parser.add_argument(
+        "--tracemalloc-file",
+        type=str,
+        dest="tracemalloc_file",
+        metavar="FILE",
+        default=None,
+        help="Trace the memory allocations of the run, and write the final tracemalloc snapshot to this file. "
+             "Tracing slows the run down")
+    
+    parser.add_argument(
+        "--metrics-file",
+        type=str,
+        dest="metrics_file",
+        metavar="FILE",
+        default=None,
+        help="Write a JSON report of the AWS API calls of the run to this file: the number of calls, errors, "
+             "retries and throttles, the bytes sent and received, and the latency histogram of each API")
+    
+    parser.add_argument(
+        "--metrics-textfile",
+        type=str,
+        dest="metrics_textfile",
+        metavar="FILE",
+        default=None,
+        help="Write the same metrics as --metrics-file in the Prometheus text format, for the textfile "
+             "collector of node_exporter. The file name must end with .prom to be collected")
+    
     parser.add_argument(
         "--strict", "-s",
         action="store_true",
@@ -98,6 +452,16 @@ def __create_args_object() -> argparse.ArgumentParser:
         dest="verbose",
         help="Enable verbose output to show details about executed actions")
     
+    parser.add_argument(
+        "--output",
+        type=str,
+        choices=("auto", "rich", "plain", "jsonl"),
+        dest="output_format",
+        default="auto",
+        help="The format of the output. 'rich' is styled for a terminal, 'plain' is the same text without styles "
+             "or spinners, and 'jsonl' writes one JSON object for each step, alarm and result. 'auto' uses "
+             "'rich' if the standard output is a terminal, and 'plain' otherwise.")
+    
     ###########
     # Actions #
     ###########
@@ -111,6 +475,25 @@ def __create_args_object() -> argparse.ArgumentParser:
              "with those in the global list.",
         default=False)
     
+    actions_group.add_argument(
+        "--plan",
+        type=str,
+        dest="plan",
+        metavar="PLAN_FILE",
+        default=None,
+        help="If specified, resolves the alarms like --create-alarms, and writes the resulting requests to "
+             "this plan file together with a snapshot of the targets, without creating them.")
+    
+    actions_group.add_argument(
+        "--apply",
+        type=str,
+        dest="apply",
+        metavar="PLAN_FILE",
+        default=None,
+        help="If specified, creates the alarms of a plan file written by --plan, without loading the targets or "
+             "rendering the alarms again. If the variables and template files are passed, they and the target "
+             "arguments are checked against the plan, unless --ignore-inputs-hash is set.")
+    
     actions_group.add_argument(
         "--show-variables", "--show-vars",
         action="store_true",
@@ -133,6 +516,22 @@ def __create_args_object() -> argparse.ArgumentParser:
              "with those in the global list.",
         default=False)
     
+    actions_group.add_argument(
+        "--worker",
+        type=str,
+        dest="worker",
+        metavar="QUEUE_URL",
+        default=None,
+        help="If specified, consumes the EC2 state change events of this SQS queue, and creates the alarms of "
+             "each instance that enters the running state.")
+    
+    actions_group.add_argument(
+        "--serve",
+        action="store_true",
+        help="If specified, starts a server on the --socket path, that executes the runs forwarded to it while "
+             "keeping AWS sessions and parsed files warm between runs.",
+        default=False)
+    
     actions_group.add_argument(
         "--test-aws",
         action="store_true",
@@ -143,20 +542,23 @@ def __create_args_object() -> argparse.ArgumentParser:
     return parser
     
 
-def __parse_args() -> ArgsObject:
+def __parse_args(argv: list[str] | None = None) -> ArgsObject:
     """
     Parse command line arguments for the application.
     
+    Args:
+        argv (list[str] | None): The arguments to parse. If None, the arguments of the process are parsed.
+    
     Returns:
         ArgsObject: An object containing all parsed command-line arguments.
     """
     args_parser = __create_args_object()
-    args_array = args_parser.parse_args()
+    args_array = args_parser.parse_args(argv)
     
     return ArgsObject(args_array)
 
 
-def __execute(args_object: ArgsObject, output: Output) -> None:
+def __execute(args_object: ArgsObject, output: "Output") -> None:
     """
     Execute the target action based on the provided arguments.
     
@@ -164,45 +566,279 @@ def __execute(args_object: ArgsObject, output: Output) -> None:
         args_object (ArgsObject): An object containing all parsed command-line arguments.
         output (Output): The output object to use.
     """
+    # A server keeps its own cache between runs.
+    if args_object.cache_dir is not None and FileCache.default() is None:
+        FileCache.set_default(FileCache(args_object.cache_dir))
+    
+    # Actions are imported only when selected, so each run only loads the modules its action needs.
+    # pylint: disable=import-outside-toplevel
     if args_object.show_variables:
+        from alertalot.actions import show_variables_action
         show_variables_action.execute(args_object, output)
     elif args_object.test_aws:
+        from alertalot.actions import aws_test_action
         aws_test_action.execute(args_object, output)
     elif args_object.show_target:
+        from alertalot.actions import show_target_action
         show_target_action.execute(args_object, output)
     elif args_object.show_template:
+        from alertalot.actions import show_alarms_template_action
         show_alarms_template_action.execute(args_object, output)
     elif args_object.create_alarms:
+        from alertalot.actions import create_alarms_action
         create_alarms_action.execute(args_object, output)
+    elif args_object.plan_file is not None:
+        from alertalot.actions import plan_alarms_action
+        plan_alarms_action.execute(args_object, output)
+    elif args_object.apply_file is not None:
+        from alertalot.actions import apply_plan_action
+        apply_plan_action.execute(args_object, output)
+    elif args_object.worker_queue is not None:
+        from alertalot.actions import worker_action
+        worker_action.execute(args_object, output)
+    elif args_object.is_serve:
+        from alertalot.actions import serve_action
+        serve_action.execute(args_object, output, run)
     else:
+        from alertalot.generic.output import OutputLevel
         output.print_failure("It seems like no action was selected", level=OutputLevel.QUITE)
         __create_args_object().print_help()
         sys.exit(1)
 
 
-def main():
+@contextmanager
+def __profile(args_object: ArgsObject, output: "Output") -> Iterator[None]:
     """
-    Main entry point for the application.
+    Record the time spent in each phase of the run, and report it once the run is done, even if it failed.
+    Does nothing unless --profile, --profile-file or --tracemalloc-file is set.
+    
+    Args:
+        args_object (ArgsObject): An object containing all parsed command-line arguments.
+        output (Output): The output object to use.
+    """
+    if not args_object.is_profile and not args_object.profile_file and not args_object.tracemalloc_file:
+        yield
+        return
+    
+    # pylint: disable=import-outside-toplevel
+    import cProfile
+    import tracemalloc
+    
+    from alertalot.generic.output import OutputLevel
+    from alertalot.generic.profiler import Profiler
+    
+    profiler = Profiler()
+    cprofile = cProfile.Profile() if args_object.profile_file else None
+    
+    if args_object.tracemalloc_file:
+        tracemalloc.start()
+    
+    Profiler.set_default(profiler)
+    
+    if cprofile is not None:
+        cprofile.enable()
+    
+    try:
+        yield
+    finally:
+        if cprofile is not None:
+            cprofile.disable()
+            cprofile.dump_stats(args_object.profile_file)
+        
+        Profiler.set_default(None)
+        rows = profiler.summary()
+        
+        if args_object.tracemalloc_file:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.take_snapshot().dump(args_object.tracemalloc_file)
+            tracemalloc.stop()
+            
+            rows.append(["Peak memory", "", f"{peak / 1024 / 1024:.1f}MB", "", "", ""])
+        
+        if args_object.is_profile:
+            output.print_step("Profile", level=OutputLevel.QUITE)
+            output.print_table(Profiler.COLUMNS, rows, level=OutputLevel.QUITE)
+        
+        if args_object.profile_file:
+            output.print_bullet(f"cProfile statistics written to {args_object.profile_file}", level=OutputLevel.QUITE)
+        
+        if args_object.tracemalloc_file:
+            output.print_bullet(
+                f"tracemalloc snapshot written to {args_object.tracemalloc_file}", level=OutputLevel.QUITE)
+
+
+@contextmanager
+def __record_api_metrics(args_object: ArgsObject, output: "Output") -> Iterator[None]:
+    """
+    Record the AWS API calls of the run, and write the reports once the run is done, even if it failed.
+    Does nothing unless --metrics-file or --metrics-textfile is set.
+    
+    Args:
+        args_object (ArgsObject): An object containing all parsed command-line arguments.
+        output (Output): The output object to use.
     """
-    args_obj = __parse_args()
+    if not args_object.metrics_file and not args_object.metrics_textfile:
+        yield
+        return
+    
+    # pylint: disable=import-outside-toplevel
+    from alertalot.generic.output import OutputLevel
+    from alertalot.aws.api_metrics import ApiMetrics
+    
+    metrics = ApiMetrics(json_file=args_object.metrics_file, textfile=args_object.metrics_textfile)
+    ApiMetrics.set_default(metrics)
+    
+    try:
+        yield
+    finally:
+        ApiMetrics.set_default(None)
+        metrics.write()
+        
+        for path in (args_object.metrics_file, args_object.metrics_textfile):
+            if path:
+                output.print_bullet(f"API metrics written to {path}", level=OutputLevel.QUITE)
+
+
+def __forward(args_object: ArgsObject, argv: list[str]) -> int | None:
+    """
+    Forward the run to the server listening on the --socket path.
+    
+    Args:
+        args_object (ArgsObject): An object containing all parsed command-line arguments.
+        argv (list[str]): The command line arguments to forward.
+    
+    Returns:
+        int | None: The exit code of the run, or None if the server is not reachable.
+    """
+    from alertalot.daemon.daemon_client import DaemonClient  # pylint: disable=import-outside-toplevel
+    
+    response = DaemonClient(args_object.socket_path).run(argv, os.getcwd())
+    
+    if response is None:
+        print(f"Server at {args_object.socket_path} is not reachable, running locally", file=sys.stderr)
+        return None
+    
+    exit_code, text = response
+    sys.stdout.write(text)
+    
+    return exit_code
+
+
+def run(argv: list[str] | None = None, *, clients: Callable[[ArgsObject], "ClientRegistry"] | None = None) -> int:
+    """
+    Execute a single run of the application.
+    
+    Args:
+        argv (list[str] | None): The command line arguments. If None, the arguments of the process are used.
+        clients (Callable[[ArgsObject], ClientRegistry] | None): Set by the server executing the run. Returns
+            the warm clients registry to use for the run's arguments. Served runs are never forwarded.
+    
+    Returns:
+        int: The exit code of the run.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    
+    try:
+        args_obj = __parse_args(argv)
+    except SystemExit as e:
+        return __exit_code(e)
+    
+    if clients is None and args_obj.socket_path is not None and not __is_long_running(args_obj):
+        exit_code = __forward(args_obj, argv)
+        
+        if exit_code is not None:
+            return exit_code
+    
+    if clients is not None:
+        args_obj = args_obj.with_clients(clients(args_obj))
+    
+    return __run_locally(args_obj, is_served=clients is not None)
+
+
+def __is_long_running(args_obj: ArgsObject) -> bool:
+    """
+    Check if the run executes an action that only stops when interrupted. Such runs are never forwarded
+    to a server, as they would block it for all the other runs.
+    
+    Args:
+        args_obj (ArgsObject): An object containing all parsed command-line arguments.
+    
+    Returns:
+        bool: True for --worker and --serve runs.
+    """
+    return args_obj.is_serve or args_obj.worker_queue is not None
+
+
+def __run_locally(args_obj: ArgsObject, is_served: bool) -> int:
+    """
+    Execute the run in this process, and report its errors.
+    
+    Args:
+        args_obj (ArgsObject): An object containing all parsed command-line arguments.
+        is_served (bool): True if the run is executed by a server.
+    
+    Returns:
+        int: The exit code of the run.
+    """
+    from alertalot.generic.output import Output, OutputLevel  # pylint: disable=import-outside-toplevel
     
     out = Output(
         is_quiet=args_obj.is_quiet,
         is_verbose=args_obj.is_verbose,
-        with_trace=args_obj.with_trace
+        with_trace=args_obj.with_trace,
+        output_format=args_obj.output_format,
     )
     
     try:
-        __execute(args_obj, out)
+        if is_served and __is_long_running(args_obj):
+            raise ValueError("--worker and --serve runs do not end, and can not be executed by a server")
+        
+        with __profile(args_obj, out), __record_api_metrics(args_obj, out):
+            __execute(args_obj, out)
     except InvalidTemplateException as e:
         out.print_line(color="red")
         out.print_failure("Errors encountered while parsing the template file", level=OutputLevel.QUITE)
         out.print_list("▷  ", "red", e.issues, level=OutputLevel.QUITE)
         out.print_line(color="red")
-        sys.exit(1)
+        return 1
+    except AlarmsCreationException as e:
+        out.print_line(color="red")
+        out.print_failure(f"Failed to create {len(e.failures)} alarms", level=OutputLevel.QUITE)
+        out.print_list("▷  ", "red", e.failures, level=OutputLevel.QUITE)
+        out.print_line(color="red")
+        return 1
+    except SystemExit as e:
+        return __exit_code(e)
     except Exception as exception:  # pylint: disable=W0718
         out.print_error(exception, level=OutputLevel.QUITE)
-        sys.exit(1)
+        return 1
+    finally:
+        out.flush()
+    
+    return 0
+
+
+def __exit_code(exception: SystemExit) -> int:
+    """
+    Get the exit code of a run stopped by sys.exit, for example by the arguments parser.
+    
+    Args:
+        exception (SystemExit): The raised exception.
+    
+    Returns:
+        int: The exit code.
+    """
+    if exception.code is None:
+        return 0
+    
+    return exception.code if isinstance(exception.code, int) else 1
+
+
+def main():
+    """
+    Main entry point for the application.
+    """
+    sys.exit(run())
 
 
 if __name__ == "__main__":
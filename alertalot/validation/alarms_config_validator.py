@@ -1,11 +1,7 @@
 from typing import Any
 
 from alertalot.generic.variables import Variables
-from alertalot.entities.base_aws_entity import BaseAwsEntity
-from alertalot.validation.aws_alarm_validator import AwsAlarmValidator
-from alertalot.entities.aws_entity_factory import AwsEntityFactory
-from alertalot.generic.target_type import TargetType
-from alertalot.entities.aws_generic_entity import AwsGenericEntity
+from alertalot.validation.alarms_template_compiler import AlarmsTemplateCompiler
 
 
 class AlarmsConfigValidator:
@@ -14,7 +10,8 @@ class AlarmsConfigValidator:
     
     This class validates that alarm configurations follow the required structure and contain
     all required keys specific to the entity type. It also handles variables substitution
-    and creates validated alarm configurations.
+    and creates validated alarm configurations. To render the same template for many targets,
+    use AlarmsTemplateCompiler directly.
     """
     
     def __init__(
@@ -91,144 +88,15 @@ class AlarmsConfigValidator:
         self.__parsed_config = None
         self.__issues = []
         
-        self.__validate_alarms_list()
+        compiler = AlarmsTemplateCompiler(self.__vars, self.__config, is_strict=is_strict)
         
-        if self.has_issues:
+        if not compiler.compile():
+            self.__issues = compiler.issues
             return False
         
-        alarms = self.__config['alarms']
-        parsed_config = []
+        parsed_config, self.__issues = compiler.render()
         
-        for i, alarm_config in enumerate(alarms):
-            if not self.__validate_alarm_entry_type(alarm_config, i):
-                continue
-            
-            entity = self.__validate_entity_type(alarm_config)
-            
-            alarm_config = alarm_config | entity.get_additional_config()
-            
-            validator = AwsAlarmValidator(alarm_config, self.__vars, is_preview=not is_strict)
-            
-            validator.validate_keys(
-                AlarmsConfigValidator.__get_required_alarm_keys(),
-                AlarmsConfigValidator.__get_optional_alarm_keys())
-            
-            if not validator.issues_found:
-                parsed_alarm_config = (
-                    {"type": self.__get_type(alarm_config)} |
-                    entity.validate_alarm(validator))
-            
-                if not validator.issues_found:
-                    parsed_config.append(parsed_alarm_config)
-            
-            if validator.issues_found:
-                for issue in validator.issues:
-                    if len(issue) > 0 and issue[0] != '[':
-                        issue = ' ' + issue
-                    
-                    self.__issues.append(f"[\"alarms\"][{i}]{issue}")
-            
         if not self.has_issues:
             self.__parsed_config = parsed_config
         
         return not self.has_issues
-    
-    
-    def __validate_alarms_list(self):
-        """
-        Validates the alarms list top level object types.
-        """
-        if "alarms" not in self.__config:
-            self.__issues.append("Missing 'alarms' key in configuration")
-            return
-        
-        alarms_list = self.__config["alarms"]
-        
-        if not isinstance(alarms_list, list):
-            self.__issues.append(f"Alarms configuration must be a list, got {type(alarms_list).__name__}")
-    
-    def __validate_alarm_entry_type(self, alarm_entry: Any, index: int) -> bool:
-        """
-        Validates that an alarm entry has the correct type and structure.
-        
-        Args:
-            alarm_entry (Any): The alarm entry to validate
-            index (int): The index of this entry in the alarms list.
-        
-        Returns:
-            bool: True if an alarm entry has the correct type and structure.
-        """
-        if not isinstance(alarm_entry, dict):
-            self.__issues.append(f"Alarm entry at index {index} must be a dictionary, got {type(alarm_entry).__name__}")
-            return False
-        
-        return True
-    
-    
-    def __get_type(self, alarm_config: dict[str, Any]) -> str:
-        """
-        Get the type of the alarm's target entity.
-        
-        Args:
-            alarm_config (dict[str, Any]): The alarm configuration
-
-        Returns:
-            str: The type of the alarm's target entity.
-        """
-        if "type" in alarm_config:
-            return alarm_config["type"]
-        
-        return TargetType.GENERIC.value
-    
-    def __validate_entity_type(self, alarm_entry: dict[str, Any]) -> BaseAwsEntity:
-        """
-        Return the target entity type of the current alarm configuration.
-        
-        Args:
-            alarm_entry (dict[str, Any]): The alarm entry to use.
-
-        Returns:
-            BaseAwsEntity: The entity type to use.
-        """
-        if "type" not in alarm_entry:
-            return AwsGenericEntity()
-        
-        target_type = TargetType.require(alarm_entry["type"])
-        
-        return AwsEntityFactory.from_type(target_type)
-
-
-    @staticmethod
-    def __get_required_alarm_keys() -> list[str]:
-        """
-        Get the list of required keys for alarms.
-        
-        Returns:
-            list[str]: List of required alarm keys
-        """
-        return [
-            "metric-name",
-            "alarm-name",
-            "statistic",
-            "period",
-            "comparison-operator",
-            "threshold",
-            "evaluation-periods"
-        ]
-    
-    @staticmethod
-    def __get_optional_alarm_keys() -> list[str]:
-        """
-        Get the list of optional keys for alarms.
-        
-        Returns:
-            list[str]: List of optional alarm keys
-        """
-        return [
-            "alarm-actions",
-            "tags",
-            "treat-missing-data",
-            "unit",
-            "namespace",
-            "dimensions"
-        ]
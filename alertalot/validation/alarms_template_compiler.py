@@ -0,0 +1,313 @@
+import copy
+
+from typing import Any, Callable, Iterable
+
+from alertalot.generic.variables import Variables
+from alertalot.entities.base_aws_entity import BaseAwsEntity
+from alertalot.validation.aws_alarm_validator import AwsAlarmValidator
+from alertalot.entities.aws_entity_factory import AwsEntityFactory
+from alertalot.generic.target_type import TargetType
+from alertalot.entities.aws_generic_entity import AwsGenericEntity
+
+
+class _CompiledAlarm:
+    def __init__(self, index: int, config: dict[str, Any]):
+        self.index = index
+        self.config = config
+        self.fields: list[tuple[str, Any, Callable[[AwsAlarmValidator], Any] | None]] = []
+        self.is_static = True
+
+
+class AlarmsTemplateCompiler:
+    """
+    Compiles an alarms template into a render plan, so it can be rendered for many targets cheaply.
+    
+    Compiling validates the structure of the template and every field whose value does not depend on
+    the target once. A field depends on the target if it references a variable provided by the targets,
+    or a variable that is not defined at all. Rendering for a target only validates and substitutes
+    those fields, and reuses the value of all the others.
+    
+    Usage:
+        compiler = AlarmsTemplateCompiler(variables, config, target_keys=["INSTANCE_ID"])
+        
+        if compiler.compile():
+            configs, issues = compiler.render({"INSTANCE_ID": "i-1234"})
+    """
+    
+    def __init__(
+            self,
+            variables: Variables,
+            config: dict[str, Any] | Any,
+            *,
+            target_keys: Iterable[str] = (),
+            first_index: int = 0,
+            is_strict: bool = True) -> None:
+        """
+        Initialize the compiler.
+        
+        Args:
+            variables (Variables): Variables shared by all the targets
+            config (dict[str, Any] | Any): The raw alarms template to compile
+            target_keys (Iterable[str]): Names of the variables provided by the targets. They override the
+                shared variables of the same name.
+            first_index (int): Index of the first alarm entry, used to locate issues when a large template
+                is compiled in parts.
+            is_strict (bool): If False, do not fail the validation for variable substitution cases.
+        """
+        self.__vars = variables
+        self.__config = config
+        self.__target_keys = set(target_keys)
+        self.__first_index = first_index
+        self.__is_strict = is_strict
+        self.__alarms: list[_CompiledAlarm] | None = None
+        self.__issues = []
+    
+    
+    @property
+    def issues(self) -> list[str]:
+        """
+        List of target independent issues found by the compile method.
+        
+        Returns:
+            The list of issues found.
+        """
+        return self.__issues
+    
+    @property
+    def is_compiled(self) -> bool:
+        """
+        Check if the template was compiled without issues, and can be rendered.
+        
+        Returns:
+            bool: True if the template can be rendered.
+        """
+        return self.__alarms is not None
+    
+    
+    def compile(self) -> bool:
+        """
+        Validate the structure of the template and the fields that do not depend on the target, and
+        prepare the render plan of each alarm.
+        
+        Returns:
+            bool: True if no issues were found, False otherwise.
+        """
+        self.__alarms = None
+        self.__issues = []
+        
+        self.__validate_alarms_list()
+        
+        if self.__issues:
+            return False
+        
+        alarms = []
+        
+        for i, alarm_config in enumerate(self.__config["alarms"], start=self.__first_index):
+            if not isinstance(alarm_config, dict):
+                self.__issues.append(
+                    f"Alarm entry at index {i} must be a dictionary, got {type(alarm_config).__name__}")
+                continue
+            
+            alarm = self.__compile_alarm(i, alarm_config)
+            
+            if alarm is not None:
+                alarms.append(alarm)
+        
+        if not self.__issues:
+            self.__alarms = alarms
+        
+        return not self.__issues
+    
+    def render(self, values: dict[str, str] | None = None) -> tuple[list[dict[str, Any]], list[str]]:
+        """
+        Render the compiled template for a single target.
+        
+        Args:
+            values (dict[str, str] | None): The variables provided by the target
+        
+        Returns:
+            tuple[list[dict[str, Any]], list[str]]: The parsed configuration of each valid alarm, and the
+                issues found for this target.
+        
+        Raises:
+            RuntimeError: If the template was not compiled successfully.
+        """
+        if self.__alarms is None:
+            raise RuntimeError("Template must be compiled without issues before it is rendered")
+        
+        variables = self.__vars.overlay(values) if values else self.__vars
+        configs = []
+        issues = []
+        
+        for alarm in self.__alarms:
+            if alarm.is_static:
+                configs.append({key: copy.copy(value) for key, value, _ in alarm.fields})
+                continue
+            
+            validator = AwsAlarmValidator(alarm.config, variables, is_preview=not self.__is_strict)
+            parsed_config = {
+                key: copy.copy(value) if validate is None else validate(validator)
+                for key, value, validate in alarm.fields
+            }
+            
+            if validator.issues_found:
+                issues.extend(AlarmsTemplateCompiler.__format_issues(alarm.index, validator.issues))
+            else:
+                configs.append(parsed_config)
+        
+        return configs, issues
+    
+    
+    def __compile_alarm(self, index: int, alarm_config: dict[str, Any]) -> _CompiledAlarm | None:
+        """
+        Validate the target independent parts of a single alarm entry, and prepare its render plan.
+        
+        Args:
+            index (int): The index of this entry in the alarms list.
+            alarm_config (dict[str, Any]): The alarm entry.
+        
+        Returns:
+            _CompiledAlarm | None: The render plan, or None if the entry is not valid.
+        """
+        entity = self.__validate_entity_type(alarm_config)
+        alarm_config = alarm_config | entity.get_additional_config()
+        
+        validator = AwsAlarmValidator(alarm_config, self.__vars, is_preview=not self.__is_strict)
+        validator.validate_keys(
+            AlarmsTemplateCompiler.__get_required_alarm_keys(),
+            AlarmsTemplateCompiler.__get_optional_alarm_keys())
+        
+        if validator.issues_found:
+            self.__issues.extend(AlarmsTemplateCompiler.__format_issues(index, validator.issues))
+            return None
+        
+        alarm = _CompiledAlarm(index, alarm_config)
+        alarm.fields.append(("type", alarm_config.get("type", TargetType.GENERIC.value), None))
+        
+        for key, validate in entity.alarm_field_validators().items():
+            if key not in alarm_config:
+                continue
+            
+            if self.__depends_on_target(alarm_config[key]):
+                alarm.fields.append((key, None, validate))
+                alarm.is_static = False
+            else:
+                alarm.fields.append((key, validate(validator), None))
+        
+        if validator.issues_found:
+            self.__issues.extend(AlarmsTemplateCompiler.__format_issues(index, validator.issues))
+            return None
+        
+        return alarm
+    
+    def __depends_on_target(self, value: Any) -> bool:
+        """
+        Check if the value of a field depends on the target it is rendered for.
+        
+        Args:
+            value (Any): The raw value of the field.
+        
+        Returns:
+            bool: True if the value references a variable provided by the targets, or an undefined variable.
+        """
+        if isinstance(value, str):
+            return any(
+                name in self.__target_keys or name not in self.__vars
+                for name in Variables.references(value))
+        
+        if isinstance(value, dict):
+            return any(self.__depends_on_target(item) for item in value.values())
+        
+        if isinstance(value, list):
+            return any(self.__depends_on_target(item) for item in value)
+        
+        return False
+    
+    def __validate_alarms_list(self):
+        """
+        Validates the alarms list top level object types.
+        """
+        if not isinstance(self.__config, dict) or "alarms" not in self.__config:
+            self.__issues.append("Missing 'alarms' key in configuration")
+            return
+        
+        alarms_list = self.__config["alarms"]
+        
+        if not isinstance(alarms_list, list):
+            self.__issues.append(f"Alarms configuration must be a list, got {type(alarms_list).__name__}")
+    
+    
+    @staticmethod
+    def __validate_entity_type(alarm_entry: dict[str, Any]) -> BaseAwsEntity:
+        """
+        Return the target entity type of the current alarm configuration.
+        
+        Args:
+            alarm_entry (dict[str, Any]): The alarm entry to use.
+        
+        Returns:
+            BaseAwsEntity: The entity type to use.
+        """
+        if "type" not in alarm_entry:
+            return AwsGenericEntity()
+        
+        target_type = TargetType.require(alarm_entry["type"])
+        
+        return AwsEntityFactory.from_type(target_type)
+    
+    @staticmethod
+    def __format_issues(index: int, issues: list[str]) -> list[str]:
+        """
+        Prefix the issues of an alarm entry with its location in the template.
+        
+        Args:
+            index (int): The index of the entry in the alarms list.
+            issues (list[str]): The issues found in the entry.
+        
+        Returns:
+            list[str]: The prefixed issues.
+        """
+        result = []
+        
+        for issue in issues:
+            if len(issue) > 0 and issue[0] != '[':
+                issue = ' ' + issue
+            
+            result.append(f"[\"alarms\"][{index}]{issue}")
+        
+        return result
+    
+    @staticmethod
+    def __get_required_alarm_keys() -> list[str]:
+        """
+        Get the list of required keys for alarms.
+        
+        Returns:
+            list[str]: List of required alarm keys
+        """
+        return [
+            "metric-name",
+            "alarm-name",
+            "statistic",
+            "period",
+            "comparison-operator",
+            "threshold",
+            "evaluation-periods"
+        ]
+    
+    @staticmethod
+    def __get_optional_alarm_keys() -> list[str]:
+        """
+        Get the list of optional keys for alarms.
+        
+        Returns:
+            list[str]: List of optional alarm keys
+        """
+        return [
+            "alarm-actions",
+            "tags",
+            "treat-missing-data",
+            "unit",
+            "namespace",
+            "dimensions"
+        ]
@@ -0,0 +1,416 @@
+import json
+import math
+import time
+
+from typing import Any, Callable
+
+from alertalot.generic.output import Output, OutputLevel
+from alertalot.generic.profiler import Profiler
+from alertalot.aws.api_metrics import ApiMetrics
+from alertalot.generic.variables import Variables
+from alertalot.generic.file_loader import load
+from alertalot.generic.args_object import ArgsObject
+from alertalot.entities.aws_ec2_entity import AwsEc2Entity
+from alertalot.validation.alarms_template_compiler import AlarmsTemplateCompiler
+from alertalot.exception.invalid_template_exception import InvalidTemplateException
+from alertalot.worker.message_queue import MessageQueue, QueueMessage
+from alertalot.actions.sub_actions.create_alarm_action import CreateAlarmAction
+from alertalot.actions.sub_actions.create_alarms_batch_action import CreateAlarmsBatchAction
+from alertalot.actions.sub_actions.load_variables_file_action import LoadVariableFilesAction
+
+
+class LaunchWorker:
+    """
+    Worker creating the alarms of EC2 instances as they launch, from the state change events of a queue.
+    
+    The queue receives the 'EC2 Instance State-change Notification' events of EventBridge, either as is
+    or wrapped in SNS notifications. Each instance entering the 'running' state gets the alarms of the
+    template. Events of other states are discarded.
+    
+    Events are collected for a short window once the first one arrives, so a burst of launches, like an
+    autoscaling storm, is handled as a few large batches. A batch is kept small enough for its alarms to
+    be created, at the PutMetricAlarm rate, well within the visibility timeout of its messages, so they
+    are not received again by another worker while still being processed. Events of the same instance
+    are coalesced. The template is compiled once for each region, and only rendered for each instance.
+    The alarms are created by a bounded pool of workers, as with --create-alarms.
+    
+    A message is only deleted once all the alarms of its instance are created, or if its instance no
+    longer exists. Messages that can not be decoded, and the messages of instances whose alarms failed,
+    are received again once their visibility timeout expires, and end up in the dead letter queue of
+    the queue, if it has one.
+    
+    Usage:
+        worker = LaunchWorker(run_args, output, SqsQueue(run_args.clients.client("sqs"), url))
+        worker.run()
+    """
+    
+    # Maximum number of messages received by a single call, as allowed by SQS.
+    MAX_MESSAGES = 10
+    
+    # Maximum number of messages, and so of instances, processed in a single batch. The instances of a
+    # batch are loaded with a single DescribeInstances call, which accepts up to 200 filter values.
+    MAX_BATCH_MESSAGES = 200
+    
+    # Time a received message is hidden from other workers while its batch is processed, in seconds.
+    VISIBILITY_TIMEOUT = 300
+    
+    # Share of the visibility timeout that creating the alarms of a batch is expected to take. The rest is
+    # a margin for throttling, retries, and loading the instances.
+    VISIBILITY_SAFETY_FACTOR = 0.5
+    
+    # Maximum time to wait for the first message of a batch, in seconds, as allowed by SQS.
+    WAIT_SECONDS = 20
+    
+    # Default time to wait for more events once the first event of a batch arrived, in seconds.
+    DEFAULT_COALESCE_SECONDS = 2.0
+    
+    __EVENT_DETAIL_TYPE = "EC2 Instance State-change Notification"
+    
+    __CREATE_ALARM_API = "cloudwatch.PutMetricAlarm"
+    
+    
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            run_args: ArgsObject,
+            output: Output,
+            queue: MessageQueue,
+            *,
+            coalesce_seconds: float = DEFAULT_COALESCE_SECONDS,
+            wait_seconds: int = WAIT_SECONDS,
+            max_batch_messages: int | None = None,
+            clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the worker.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments
+            output (Output): Output object to use
+            queue (MessageQueue): The queue to consume the events from
+            coalesce_seconds (float): Time to wait for more events once the first event of a batch arrived.
+            wait_seconds (int): Maximum time to wait for the first event of a batch.
+            max_batch_messages (int | None): Maximum number of messages of a batch. If None, it is estimated
+                from the number of alarms of the template and the PutMetricAlarm rate, see estimate_batch_size.
+            clock (Callable[[], float]): Monotonic clock returning the current time in seconds.
+        """
+        self.__run_args = run_args
+        self.__output = output
+        self.__queue = queue
+        self.__coalesce_seconds = coalesce_seconds
+        self.__wait_seconds = wait_seconds
+        self.__max_batch_messages = max_batch_messages
+        self.__clock = clock
+        self.__template: Any = None
+        self.__variables: dict[str | None, Variables] = {}
+        self.__compilers: dict[tuple[str | None, frozenset[str]], AlarmsTemplateCompiler] = {}
+    
+    
+    def run(self, drain: bool = False) -> None:
+        """
+        Process the events of the queue, until interrupted.
+        
+        Args:
+            drain (bool): If True, stop once no event arrives within the wait time, instead of waiting for
+                more events.
+        """
+        self.__output.print_step("Waiting for launch events...", level=OutputLevel.NORMAL)
+        
+        while True:
+            messages = self.collect()
+            
+            if messages:
+                self.process(messages)
+            elif drain:
+                return
+    
+    def collect(self) -> list[QueueMessage]:
+        """
+        Wait for the first message of a batch, then keep receiving messages until the coalesce window
+        ends, the queue is empty or the batch is full.
+        
+        Returns:
+            list[QueueMessage]: The messages of the batch. Empty if no message arrived within the wait time.
+        """
+        batch_size = self.batch_size()
+        messages = self.__queue.receive(
+            min(self.MAX_MESSAGES, batch_size),
+            self.__wait_seconds,
+            self.VISIBILITY_TIMEOUT)
+        
+        if not messages:
+            return []
+        
+        deadline = self.__clock() + self.__coalesce_seconds
+        
+        while len(messages) < batch_size:
+            remaining = deadline - self.__clock()
+            
+            if remaining <= 0:
+                break
+            
+            received = self.__queue.receive(
+                min(self.MAX_MESSAGES, batch_size - len(messages)),
+                min(self.__wait_seconds, math.ceil(remaining)),
+                self.VISIBILITY_TIMEOUT)
+            
+            if not received:
+                break
+            
+            messages.extend(received)
+        
+        return messages
+    
+    def batch_size(self) -> int:
+        """
+        Get the maximum number of messages of a batch, estimating it on the first call.
+        
+        Returns:
+            int: The maximum number of messages.
+        """
+        if self.__max_batch_messages is None:
+            template = self.__load_template(self.__run_args)
+            alarms = template.get("alarms") if isinstance(template, dict) else None
+            rate = self.__run_args.clients.limiter().rate_for(LaunchWorker.__CREATE_ALARM_API)
+            
+            self.__max_batch_messages = LaunchWorker.estimate_batch_size(
+                len(alarms) if isinstance(alarms, list) else 1,
+                rate)
+        
+        return self.__max_batch_messages
+    
+    def process(self, messages: list[QueueMessage]) -> dict[str, int]:
+        """
+        Create the alarms of the instances launched according to a batch of messages, and delete the
+        messages that are done with.
+        
+        Args:
+            messages (list[QueueMessage]): The messages of the batch.
+        
+        Returns:
+            dict[str, int]: The number of launched, missing and failed instances, and of discarded and
+                invalid messages.
+        """
+        launches: dict[str | None, dict[str, list[QueueMessage]]] = {}
+        done = []
+        invalid = 0
+        
+        for message in messages:
+            try:
+                event = LaunchWorker.parse_event(message.body)
+            except ValueError as e:
+                self.__output.print_failure(f"Invalid message {message.message_id}: {e}", level=OutputLevel.QUITE)
+                invalid += 1
+                continue
+            
+            if event is None:
+                done.append(message)
+            else:
+                region, instance_id = event
+                launches.setdefault(region, {}).setdefault(instance_id, []).append(message)
+        
+        summary = {"Launched": 0, "Missing": 0, "Failed": 0, "Discarded": len(done), "Invalid": invalid}
+        
+        for region, instances in launches.items():
+            created, missing = self.__process_region(region, list(instances))
+            
+            summary["Launched"] += len(created)
+            summary["Missing"] += len(missing)
+            summary["Failed"] += len(instances) - len(created) - len(missing)
+            
+            done.extend(message for instance_id in created | missing for message in instances[instance_id])
+        
+        self.__queue.delete(done)
+        
+        self.__output.print_step(f"Processed {len(messages)} events", level=OutputLevel.NORMAL)
+        self.__output.print_key_value(summary, level=OutputLevel.NORMAL)
+        
+        # The worker runs until stopped, so the API metrics are exported after each batch.
+        metrics = ApiMetrics.default()
+        
+        if metrics is not None:
+            metrics.write()
+        
+        return summary
+    
+    
+    def __process_region(self, region: str | None, instance_ids: list[str]) -> tuple[set[str], set[str]]:
+        """
+        Create the alarms of the instances launched in a single region.
+        
+        Args:
+            region (str | None): The region of the instances, or None to use the --region argument.
+            instance_ids (list[str]): The launched instances.
+        
+        Returns:
+            tuple[set[str], set[str]]: The instances whose alarms were all created, and the instances that
+                no longer exist.
+        """
+        run_args = self.__run_args.for_region(region) if region else self.__run_args
+        
+        try:
+            entity = AwsEc2Entity(run_args.clients)
+            
+            with Profiler.span("targets"):
+                targets = list(entity.iter_entities([{"Name": "instance-id", "Values": instance_ids}]))
+            
+            target_values = [(entity.get_entity_id(target), entity.get_resource_values(target)) for target in targets]
+            
+            requests, invalid = self.__render(run_args, region, target_values)
+            results = CreateAlarmsBatchAction.execute(run_args, self.__output, requests) if requests else []
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.__output.print_error(e, level=OutputLevel.QUITE)
+            return set(), set()
+        
+        found = {target_id for target_id, _ in target_values}
+        failed = set(invalid)
+        
+        for (target_id, _), result in zip(requests, results):
+            if not result.is_success:
+                self.__output.print_failure(f"{target_id}: {result.error}", level=OutputLevel.QUITE)
+                failed.add(target_id)
+        
+        return found - failed, set(instance_ids) - found
+    
+    def __render(
+            self,
+            run_args: ArgsObject,
+            region: str | None,
+            target_values: list[tuple[str, dict[str, str]]]) -> tuple[list[tuple[str, dict[str, Any]]], set[str]]:
+        """
+        Render the template for each launched instance of a region. Instances whose alarms are not valid are
+        reported, and skipped.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments, bound to the region
+            region (str | None): The region of the instances
+            target_values (list[tuple[str, dict[str, str]]]): The identifier and resource values of each instance
+        
+        Returns:
+            tuple[list[tuple[str, dict[str, Any]]], set[str]]: The target identifier and PutMetricAlarm request
+                of each alarm, and the instances whose alarms are not valid.
+        """
+        requests = []
+        invalid = set()
+        
+        for target_id, values in target_values:
+            compiler = self.__compiler(run_args, region, frozenset(values))
+            
+            with Profiler.span("render"):
+                configs, issues = compiler.render(values)
+            
+            if issues:
+                self.__output.print_failure(f"Invalid alarms for {target_id}", level=OutputLevel.QUITE)
+                self.__output.print_list("▷  ", "red", issues, level=OutputLevel.QUITE)
+                invalid.add(target_id)
+            else:
+                requests.extend((target_id, CreateAlarmAction.to_request(config)) for config in configs)
+        
+        return requests, invalid
+    
+    def __compiler(
+            self,
+            run_args: ArgsObject,
+            region: str | None,
+            target_keys: frozenset[str]) -> AlarmsTemplateCompiler:
+        """
+        Get the compiled template of a region, for targets providing the given variables.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments, bound to the region
+            region (str | None): The region
+            target_keys (frozenset[str]): Names of the variables provided by the targets
+        
+        Returns:
+            AlarmsTemplateCompiler: The compiled template.
+        
+        Raises:
+            InvalidTemplateException: If the template is not valid.
+        """
+        key = (region, target_keys)
+        
+        if key in self.__compilers:
+            return self.__compilers[key]
+        
+        template = self.__load_template(run_args)
+        
+        if region not in self.__variables:
+            self.__variables[region] = LoadVariableFilesAction.execute(run_args, self.__output.quiet())
+        
+        compiler = AlarmsTemplateCompiler(self.__variables[region], template, target_keys=target_keys)
+        
+        with Profiler.span("validation"):
+            if not compiler.compile():
+                raise InvalidTemplateException(run_args.template_file, compiler.issues)
+        
+        self.__compilers[key] = compiler
+        
+        return compiler
+    
+    def __load_template(self, run_args: ArgsObject) -> Any:
+        """
+        Get the raw alarms template, loading it on the first call.
+        
+        Args:
+            run_args (ArgsObject): CLI command line arguments
+        
+        Returns:
+            Any: The loaded template file.
+        """
+        if self.__template is None:
+            with Profiler.span("template"):
+                self.__template = load(run_args.template_file)
+        
+        return self.__template
+    
+    
+    @staticmethod
+    def estimate_batch_size(alarms_per_message: int, rate: float | None) -> int:
+        """
+        Estimate the maximum number of messages of a batch, so that creating their alarms takes at most
+        VISIBILITY_SAFETY_FACTOR of the visibility timeout.
+        
+        Args:
+            alarms_per_message (int): Number of alarms created for the instance of each message.
+            rate (float | None): PutMetricAlarm requests per second, or None if it is not rate limited.
+        
+        Returns:
+            int: The maximum number of messages, between 1 and MAX_BATCH_MESSAGES.
+        """
+        if not rate:
+            return LaunchWorker.MAX_BATCH_MESSAGES
+        
+        budget = LaunchWorker.VISIBILITY_TIMEOUT * LaunchWorker.VISIBILITY_SAFETY_FACTOR * rate
+        
+        return max(1, min(LaunchWorker.MAX_BATCH_MESSAGES, math.floor(budget / max(1, alarms_per_message))))
+    
+    @staticmethod
+    def parse_event(body: str) -> tuple[str | None, str] | None:
+        """
+        Parse the body of a queue message.
+        
+        Args:
+            body (str): The message body, an EventBridge event, or an SNS notification wrapping one.
+        
+        Returns:
+            tuple[str | None, str] | None: The region and ID of the launched instance, or None if the event
+                is not the launch of an instance.
+        
+        Raises:
+            ValueError: If the body is not a JSON object.
+        """
+        event = json.loads(body)
+        
+        if isinstance(event, dict) and event.get("Type") == "Notification" and isinstance(event.get("Message"), str):
+            event = json.loads(event["Message"])
+        
+        if not isinstance(event, dict):
+            raise ValueError(f"Expected a JSON object, got {type(event).__name__}")
+        
+        detail = event.get("detail")
+        
+        if event.get("detail-type") != LaunchWorker.__EVENT_DETAIL_TYPE or not isinstance(detail, dict):
+            return None
+        
+        if detail.get("state") != "running" or not isinstance(detail.get("instance-id"), str):
+            return None
+        
+        return event.get("region"), detail["instance-id"]
@@ -0,0 +1,103 @@
+import time
+import uuid
+import threading
+
+from typing import Callable, Iterable
+
+from alertalot.worker.message_queue import MessageQueue, QueueMessage
+
+
+class MemoryQueue(MessageQueue):
+    """
+    In-memory stand-in for an SQS queue, used to run the worker without an AWS account.
+    
+    Received messages are hidden until their visibility timeout expires, and are received again if they
+    are not deleted by then, like with SQS. Unlike SQS, messages are always received in the order they
+    were sent.
+    
+    Usage:
+        queue = MemoryQueue()
+        queue.send(json.dumps(event))
+    """
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize an empty queue.
+        
+        Args:
+            clock (Callable[[], float]): Monotonic clock returning the current time in seconds.
+        """
+        self.__clock = clock
+        self.__condition = threading.Condition()
+        self.__messages: dict[str, tuple[str, float]] = {}
+        self.__receipts: dict[str, str] = {}
+    
+    
+    def __len__(self) -> int:
+        """
+        Get the number of messages in the queue, including the ones not visible.
+        
+        Returns:
+            int: The number of messages not deleted yet.
+        """
+        with self.__condition:
+            return len(self.__messages)
+    
+    
+    def send(self, body: str) -> str:
+        """
+        Add a message to the queue.
+        
+        Args:
+            body (str): The content of the message.
+        
+        Returns:
+            str: The ID of the new message.
+        """
+        message_id = str(uuid.uuid4())
+        
+        with self.__condition:
+            self.__messages[message_id] = (body, 0.0)
+            self.__condition.notify_all()
+        
+        return message_id
+    
+    def receive(self, max_messages: int, wait_seconds: int, visibility_timeout: int) -> list[QueueMessage]:
+        deadline = time.monotonic() + wait_seconds
+        
+        with self.__condition:
+            while True:
+                now = self.__clock()
+                visible = [
+                    message_id for message_id, (_, visible_at) in self.__messages.items() if visible_at <= now
+                ][:max_messages]
+                
+                remaining = deadline - time.monotonic()
+                
+                if visible or remaining <= 0:
+                    break
+                
+                # Hidden messages become visible again without a notification, so wake up when the first one does.
+                next_visible = min((visible_at for _, visible_at in self.__messages.values()), default=float("inf"))
+                self.__condition.wait(min(remaining, max(next_visible - now, 0.01)))
+            
+            result = []
+            
+            for message_id in visible:
+                body, _ = self.__messages[message_id]
+                receipt_handle = str(uuid.uuid4())
+                
+                self.__messages[message_id] = (body, now + visibility_timeout)
+                self.__receipts[receipt_handle] = message_id
+                
+                result.append(QueueMessage(message_id, body, receipt_handle))
+            
+            return result
+    
+    def delete(self, messages: Iterable[QueueMessage]) -> None:
+        with self.__condition:
+            for message in messages:
+                message_id = self.__receipts.pop(message.receipt_handle, None)
+                
+                if message_id is not None:
+                    self.__messages.pop(message_id, None)
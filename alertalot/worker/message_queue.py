@@ -0,0 +1,86 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+
+class QueueMessage:
+    """
+    A single message received from a MessageQueue.
+    """
+    
+    def __init__(self, message_id: str, body: str, receipt_handle: str):
+        """
+        Initialize the message.
+        
+        Args:
+            message_id (str): The unique identifier of the message.
+            body (str): The content of the message.
+            receipt_handle (str): The handle of this receipt of the message, used to delete it.
+        """
+        self.__message_id = message_id
+        self.__body = body
+        self.__receipt_handle = receipt_handle
+    
+    
+    @property
+    def message_id(self) -> str:
+        """
+        The unique identifier of the message.
+        
+        Returns:
+            str: The message ID.
+        """
+        return self.__message_id
+    
+    @property
+    def body(self) -> str:
+        """
+        The content of the message.
+        
+        Returns:
+            str: The message body.
+        """
+        return self.__body
+    
+    @property
+    def receipt_handle(self) -> str:
+        """
+        The handle of this receipt of the message. A message received again has a new handle.
+        
+        Returns:
+            str: The receipt handle.
+        """
+        return self.__receipt_handle
+
+
+class MessageQueue(ABC):
+    """
+    Base abstract class for the queues the worker consumes events from.
+    
+    Messages follow the SQS semantics: a received message is hidden from other receivers until its
+    visibility timeout expires, and is only removed from the queue once deleted.
+    
+    Implementations must be thread safe.
+    """
+    
+    @abstractmethod
+    def receive(self, max_messages: int, wait_seconds: int, visibility_timeout: int) -> list[QueueMessage]:
+        """
+        Receive the next messages, waiting for messages to arrive if there are none.
+        
+        Args:
+            max_messages (int): Maximum number of messages to receive.
+            wait_seconds (int): Maximum time to wait for a message, in seconds.
+            visibility_timeout (int): Time the received messages are hidden from other receivers, in seconds.
+        
+        Returns:
+            list[QueueMessage]: The received messages. Empty if none arrived in time.
+        """
+    
+    @abstractmethod
+    def delete(self, messages: Iterable[QueueMessage]) -> None:
+        """
+        Remove processed messages from the queue.
+        
+        Args:
+            messages (Iterable[QueueMessage]): The messages to delete.
+        """
@@ -0,0 +1,69 @@
+from typing import Any, Iterable
+from itertools import islice
+
+from alertalot.worker.message_queue import MessageQueue, QueueMessage
+
+
+class SqsQueue(MessageQueue):
+    """
+    Implementation of MessageQueue for an Amazon SQS queue.
+    
+    Usage:
+        queue = SqsQueue(clients.client("sqs"), "https://sqs.us-east-1.amazonaws.com/123456789012/launches")
+    """
+    
+    # Maximum number of messages accepted by a single ReceiveMessage or DeleteMessageBatch call.
+    BATCH_SIZE = 10
+    
+    
+    def __init__(self, client: Any, url: str):
+        """
+        Initialize the queue.
+        
+        Args:
+            client (Any): The SQS client to use.
+            url (str): The URL of the queue.
+        """
+        self.__client = client
+        self.__url = url
+    
+    
+    @property
+    def url(self) -> str:
+        """
+        The URL of the queue.
+        
+        Returns:
+            str: The queue URL.
+        """
+        return self.__url
+    
+    
+    def receive(self, max_messages: int, wait_seconds: int, visibility_timeout: int) -> list[QueueMessage]:
+        response = self.__client.receive_message(
+            QueueUrl=self.__url,
+            MaxNumberOfMessages=min(max_messages, self.BATCH_SIZE),
+            WaitTimeSeconds=wait_seconds,
+            VisibilityTimeout=visibility_timeout)
+        
+        return [
+            QueueMessage(message["MessageId"], message["Body"], message["ReceiptHandle"])
+            for message in response.get("Messages", [])
+        ]
+    
+    def delete(self, messages: Iterable[QueueMessage]) -> None:
+        messages = iter(messages)
+        
+        while batch := list(islice(messages, self.BATCH_SIZE)):
+            response = self.__client.delete_message_batch(
+                QueueUrl=self.__url,
+                Entries=[
+                    {"Id": str(i), "ReceiptHandle": message.receipt_handle}
+                    for i, message in enumerate(batch)
+                ])
+            
+            failed = response.get("Failed", [])
+            
+            if failed:
+                raise RuntimeError(
+                    f"Failed to delete {len(failed)} messages from {self.__url}: {failed[0].get('Message')}")
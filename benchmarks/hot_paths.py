@@ -0,0 +1,343 @@
+"""
+Micro benchmarks of the validation and substitution hot paths of alertalot.
+
+Each benchmark runs a synthetic workload of 10, 1k and 100k items: alarm entries, variables or values to
+parse. It reports the time per item, as the minimum and median of several repeats, each long enough to
+be measured reliably. Results can be saved to a JSON file, and compared with the results saved by another
+revision. The comparison fails if any benchmark is slower than the baseline by more than a threshold.
+
+Steady state is measured: each workload runs once before it is timed, so caches, like the tokenized
+template strings of Variables, are warm, as they are when the same template is rendered for many targets.
+
+Usage:
+    python benchmarks/hot_paths.py --save baseline.json
+    python benchmarks/hot_paths.py --compare baseline.json --threshold 10
+    python benchmarks/hot_paths.py --sizes 10,1000 --filter variables
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+
+from typing import Any, Callable
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from alertalot.generic import input_parser
+from alertalot.generic.variables import Variables
+from alertalot.validation.aws_alarm_validator import AwsAlarmValidator
+from alertalot.validation.alarms_config_validator import AlarmsConfigValidator
+
+
+# Version of the results file format.
+RESULTS_VERSION = 1
+
+DEFAULT_SIZES = (10, 1_000, 100_000)
+
+# Minimum duration of a single repeat, in seconds. Small workloads are run several times per repeat.
+MIN_REPEAT_SECONDS = 0.2
+
+TIMES = ("5 minutes", "1h", "300", "2 days", "90s", "1 hour 30 minutes")
+SIZES = ("10GB", "512 MB", "1.5 TB", "2048", "64kb")
+PERCENTAGES = ("85%", "0.5", "99.9%", "0.25", "12.5%")
+
+# Field validators of AwsAlarmValidator, called with no arguments.
+FIELD_VALIDATORS = (
+    "validate_alarm_name",
+    "validate_metric_name",
+    "validate_statistic",
+    "validate_period",
+    "validate_comparison_operator",
+    "validate_threshold",
+    "validate_evaluation_periods",
+    "validate_treat_missing_data",
+    "validate_alarm_actions",
+    "validate_tags",
+    "validate_dimensions",
+    "validate_namespace",
+)
+
+
+def variables(size: int) -> Variables:
+    """
+    Build a set of variables.
+    
+    Args:
+        size (int): The number of variables.
+    
+    Returns:
+        Variables: The variables VAR_0 to VAR_{size - 1}, plus the variables used by the alarm entries.
+    """
+    values = {f"VAR_{i}": f"value-{i}" for i in range(size)}
+    values.update({
+        "INSTANCE_ID": "i-0123456789abcdef0",
+        "INSTANCE_NAME": "web",
+        "ALARM_ACTION_ARN": "arn:aws:sns:us-east-1:123456789012:alarms",
+        "CPU_LIMIT": "85%",
+    })
+    
+    return Variables(values)
+
+
+def alarm(index: int) -> dict[str, Any]:
+    """
+    Build a valid alarm entry, referencing variables in the fields that support them.
+    
+    Args:
+        index (int): Index of the entry, used to make its name unique.
+    
+    Returns:
+        dict[str, Any]: The alarm entry.
+    """
+    return {
+        "type": "ec2",
+        "alarm-name": f"AWS / CPU {index} / $INSTANCE_NAME / $INSTANCE_ID",
+        "metric-name": "CPUUtilization",
+        "namespace": "AWS/EC2",
+        "alarm-actions": "$ALARM_ACTION_ARN",
+        "statistic": "Average",
+        "period": TIMES[index % 2],
+        "comparison-operator": "GreaterThanOrEqualToThreshold",
+        "threshold": "$CPU_LIMIT",
+        "evaluation-periods": 1 + index % 3,
+        "treat-missing-data": "breaching",
+        "tags": {"level": "info", "instance": "$INSTANCE_ID"},
+        "dimensions": {"InstanceId": "$INSTANCE_ID"},
+    }
+
+
+def bench_substitute(size: int) -> Callable[[], None]:
+    """
+    Substitute {size} strings, each referencing three of {size} variables.
+    """
+    data = variables(size)
+    texts = [f"prefix $VAR_{i} / $VAR_{(i * 7) % size} / $VAR_{(i * 13) % size} suffix" for i in range(size)]
+    
+    def run():
+        for text in texts:
+            data.substitute(text)
+    
+    return run
+
+
+def bench_parser(function: Callable[[str], Any], values: tuple[str, ...]) -> Callable[[int], Callable[[], None]]:
+    """
+    Build a benchmark parsing {size} values with an input_parser function.
+    """
+    def factory(size: int) -> Callable[[], None]:
+        inputs = [values[i % len(values)] for i in range(size)]
+        
+        def run():
+            for value in inputs:
+                function(value)
+        
+        return run
+    
+    return factory
+
+
+def bench_field_validator(method: str) -> Callable[[int], Callable[[], None]]:
+    """
+    Build a benchmark validating a single field of {size} alarm entries with AwsAlarmValidator.
+    """
+    def factory(size: int) -> Callable[[], None]:
+        data = variables(10)
+        validators = [AwsAlarmValidator(alarm(i), data) for i in range(size)]
+        
+        def run():
+            for validator in validators:
+                getattr(validator, method)()
+        
+        return run
+    
+    return factory
+
+
+def bench_config_validator(size: int) -> Callable[[], None]:
+    """
+    Validate a template of {size} alarm entries with AlarmsConfigValidator.
+    """
+    data = variables(10)
+    config = {"alarms": [alarm(i) for i in range(size)]}
+    
+    def run():
+        validator = AlarmsConfigValidator(data, config)
+        
+        if not validator.validate():
+            raise RuntimeError(f"Benchmark template is not valid: {validator.issues[:3]}")
+    
+    return run
+
+
+BENCHMARKS: dict[str, Callable[[int], Callable[[], None]]] = {
+    "variables.substitute": bench_substitute,
+    "input_parser.str2time": bench_parser(input_parser.str2time, TIMES),
+    "input_parser.str2bytes": bench_parser(input_parser.str2bytes, SIZES),
+    "input_parser.percentage": bench_parser(input_parser.percentage, PERCENTAGES),
+    **{f"aws_alarm_validator.{method}": bench_field_validator(method) for method in FIELD_VALIDATORS},
+    "alarms_config_validator.validate": bench_config_validator,
+}
+
+
+def measure(factory: Callable[[int], Callable[[], None]], size: int, repeat: int) -> dict[str, float]:
+    """
+    Time a benchmark on a workload.
+    
+    Args:
+        factory (Callable[[int], Callable[[], None]]): Builds the workload, and returns the function running it.
+        size (int): The number of items of the workload.
+        repeat (int): The number of timed repeats.
+    
+    Returns:
+        dict[str, float]: The minimum and median time per item, in nanoseconds, and the number of runs of the
+            workload in each repeat.
+    """
+    run = factory(size)
+    
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    
+    number = max(1, int(MIN_REPEAT_SECONDS / max(elapsed, 1e-9)))
+    samples = []
+    
+    for _ in range(repeat):
+        start = time.perf_counter()
+        
+        for _ in range(number):
+            run()
+        
+        samples.append((time.perf_counter() - start) / (number * size) * 1e9)
+    
+    return {"min_ns": min(samples), "median_ns": statistics.median(samples), "number": number}
+
+
+def revision() -> str | None:
+    """
+    Get the git revision of the measured code.
+    
+    Returns:
+        str | None: The commit hash, with a '+dirty' suffix if the tree has changes, or None if unknown.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True, text=True, check=True)
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--", "alertalot"], cwd=root, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    
+    return commit.stdout.strip() + ("+dirty" if status.stdout.strip() else "")
+
+
+def compare(baseline: dict[str, Any], results: dict[str, Any], threshold: float) -> list[str]:
+    """
+    Print the change of each benchmark from a baseline. The minimum times are compared, as they are the
+    least affected by the noise of other processes.
+    
+    Args:
+        baseline (dict[str, Any]): The baseline results file.
+        results (dict[str, Any]): The current results file.
+        threshold (float): Maximum slowdown, in percent, before a benchmark is a regression.
+    
+    Returns:
+        list[str]: The benchmarks slower than the baseline by more than the threshold.
+    """
+    regressions = []
+    
+    print(f"\nCompared with {baseline.get('revision') or 'unknown revision'} (threshold {threshold:.0f}%):")
+    
+    for key, result in results["results"].items():
+        if key not in baseline["results"]:
+            print(f"  {key:<60} {'new':>10}")
+            continue
+        
+        before = baseline["results"][key]["min_ns"]
+        change = (result["min_ns"] - before) / before * 100
+        marker = ""
+        
+        if change > threshold:
+            marker = "  REGRESSION"
+            regressions.append(key)
+        
+        print(f"  {key:<60} {before:>10.0f} -> {result['min_ns']:>10.0f} ns  {change:+7.1f}%{marker}")
+    
+    return regressions
+
+
+def main() -> int:
+    """
+    Run the benchmarks.
+    
+    Returns:
+        int: The exit code, 0 unless a regression was found.
+    """
+    parser = argparse.ArgumentParser(description="Micro benchmarks of the alertalot validation hot paths")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, DEFAULT_SIZES)),
+        help="Comma separated workload sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repeats of each benchmark")
+    parser.add_argument("--filter", default=None, help="Only run the benchmarks whose name contains this text")
+    parser.add_argument("--save", default=None, help="Save the results to this JSON file")
+    parser.add_argument("--compare", default=None, help="Compare the results with a JSON file saved by --save")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Maximum slowdown in percent with --compare")
+    args = parser.parse_args()
+    
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = {
+        "version": RESULTS_VERSION,
+        "revision": revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {},
+    }
+    
+    print(f"{'Benchmark':<60} {'min':>10} {'median':>10}  (ns per item)")
+    
+    for name, factory in BENCHMARKS.items():
+        if args.filter and args.filter not in name:
+            continue
+        
+        for size in sizes:
+            key = f"{name}[{size}]"
+            result = measure(factory, size, args.repeat)
+            results["results"][key] = result
+            
+            print(f"{key:<60} {result['min_ns']:>10.0f} {result['median_ns']:>10.0f}", flush=True)
+    
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        
+        print(f"\nResults saved to {args.save}")
+    
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        
+        if baseline.get("version") != RESULTS_VERSION:
+            print(f"FAILED: {args.compare} was saved by another version of the benchmarks")
+            return 1
+        
+        regressions = compare(baseline, results, args.threshold)
+        
+        if regressions:
+            print(f"FAILED: {len(regressions)} benchmarks regressed")
+            return 1
+    
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+"""
+End to end load test of the --create-alarms flow, against an in-process stand-in for EC2 and CloudWatch.
+
+Each scenario creates the alarms of a synthetic fleet: a number of instances, and a template with a number of
+alarms for each instance. The whole run goes through the real code paths: argument parsing, template
+rendering, the boto3 clients, the rate limiter and the CloudWatch backend. Only the HTTP requests are
+replaced, by botocore hooks answering DescribeInstances, DescribeAlarms and PutMetricAlarm from memory,
+after an injected latency. A share of the PutMetricAlarm calls can be throttled, to exercise the retries
+of the rate limiter.
+
+Every scenario runs in a fresh interpreter, so its peak RSS is measured on its own. The report gives the
+number of alarms created per second, the peak RSS, and the number of API calls per alarm.
+
+Usage:
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --fleet 1000x10,10000x100 --latency 0.02 --throttle-rate 0.05
+    python benchmarks/load_test.py --fleet 50000x10 -- --stream --max-in-flight 64
+    python benchmarks/load_test.py --fleet 1000x10 -- --api-tps cloudwatch.PutMetricAlarm=50
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import resource
+import tempfile
+import threading
+import subprocess
+
+from typing import Any
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Fleets run by default, in the format INSTANCESxALARMS.
+DEFAULT_FLEETS = "1000x10,1000x100,10000x10,50000x10"
+
+# The default rate limits of alertalot follow the AWS quotas, and would be the bottleneck of any run. They are
+# disabled, so the load test measures alertalot itself. Limits passed after '--' still apply.
+UNLIMITED_API_TPS = ("cloudwatch.PutMetricAlarm=0", "cloudwatch.DescribeAlarms=0", "ec2=0")
+
+# EC2 metrics the alarms of the generated templates are cycled through.
+METRICS = ("CPUUtilization", "NetworkIn", "NetworkOut", "DiskReadOps", "DiskWriteOps", "StatusCheckFailed")
+
+
+class FakeAws:
+    """
+    In-memory stand-in for the EC2 and CloudWatch APIs used by --create-alarms.
+    
+    The fake registers botocore hooks answering the calls before they are sent, so the requests are still
+    validated and serialized by botocore, but never leave the process.
+    """
+    
+    __PARAMS_KEY = "load_test_params"
+    
+    
+    def __init__(self, instances: int, *, latency: float = 0.0, throttle_rate: float = 0.0, seed: int = 0):
+        """
+        Initialize the fake.
+        
+        Args:
+            instances (int): Number of instances of the fleet.
+            latency (float): Time in seconds each call takes.
+            throttle_rate (float): Probability of a PutMetricAlarm call to be throttled.
+            seed (int): Seed of the random throttling.
+        """
+        launch_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        self.instances = [
+            {
+                "InstanceId": f"i-{i:017x}",
+                "LaunchTime": launch_time,
+                "State": {"Code": 16, "Name": "running"},
+                "Tags": [{"Key": "Name", "Value": f"load-{i}"}, {"Key": "fleet", "Value": "load"}],
+            }
+            for i in range(instances)
+        ]
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.alarms: set[str] = set()
+        self.calls: dict[str, int] = {}
+        self.throttled = 0
+        
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+    
+    
+    def attach(self, events: Any) -> None:
+        """
+        Register the hooks on an event emitter. Clients created from a session copy its emitter, so attaching
+        to the session's emitter covers all its clients.
+        
+        Args:
+            events (Any): The botocore event emitter.
+        """
+        events.register("before-parameter-build", self.__on_before_parameter_build)
+        events.register("before-call.ec2.DescribeInstances", self.__on_call)
+        events.register("before-call.cloudwatch.DescribeAlarms", self.__on_call)
+        events.register("before-call.cloudwatch.PutMetricAlarm", self.__on_call)
+    
+    
+    def __on_before_parameter_build(self, params: dict[str, Any], context: dict[str, Any], **_) -> None:
+        context[self.__PARAMS_KEY] = dict(params)
+    
+    def __on_call(self, model: Any, context: dict[str, Any], **_) -> tuple[Any, dict[str, Any]]:
+        # pylint: disable=import-outside-toplevel
+        from botocore.awsrequest import AWSResponse
+        
+        params = context[self.__PARAMS_KEY]
+        
+        if self.latency > 0:
+            time.sleep(self.latency)
+        
+        with self.__lock:
+            self.calls[model.name] = self.calls.get(model.name, 0) + 1
+            is_throttled = model.name == "PutMetricAlarm" and self.__random.random() < self.throttle_rate
+            
+            if is_throttled:
+                self.throttled += 1
+            elif model.name == "PutMetricAlarm":
+                self.alarms.add(params["AlarmName"])
+        
+        if is_throttled:
+            error = {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}, "ResponseMetadata": {}}
+            return AWSResponse(None, 400, {}, None), error
+        
+        return AWSResponse(None, 200, {}, None), self.__respond(model.name, params)
+    
+    def __respond(self, operation: str, params: dict[str, Any]) -> dict[str, Any]:
+        if operation == "DescribeInstances":
+            start = int(params.get("NextToken", 0))
+            end = start + params.get("MaxResults", 1000)
+            response = {"Reservations": [{"Instances": self.instances[start:end]}]}
+            
+            if end < len(self.instances):
+                response["NextToken"] = str(end)
+            
+            return response
+        
+        if operation == "DescribeAlarms":
+            with self.__lock:
+                names = [name for name in params.get("AlarmNames", []) if name in self.alarms]
+            
+            return {"MetricAlarms": [{"AlarmName": name} for name in names]}
+        
+        return {}
+
+
+def write_inputs(directory: str, alarms: int) -> tuple[str, str]:
+    """
+    Write the variables file and a template with the given number of alarms for each instance.
+    
+    Args:
+        directory (str): Directory to write the files to.
+        alarms (int): Number of alarms of the template.
+    
+    Returns:
+        tuple[str, str]: The paths of the variables file and of the template.
+    """
+    variables_file = os.path.join(directory, "variables.json")
+    template_file = os.path.join(directory, "template.json")
+    
+    with open(variables_file, "w", encoding="utf-8") as f:
+        json.dump({"params": {"global": {"ALARM_ACTION_ARN": "arn:aws:sns:us-east-1:123456789012:load"}}}, f)
+    
+    with open(template_file, "w", encoding="utf-8") as f:
+        json.dump({
+            "alarms": [
+                {
+                    "type": "ec2",
+                    "alarm-name": f"load / {i} / $INSTANCE_NAME / $INSTANCE_ID",
+                    "metric-name": METRICS[i % len(METRICS)],
+                    "alarm-actions": "$ALARM_ACTION_ARN",
+                    "statistic": "Average",
+                    "period": "5 minutes",
+                    "comparison-operator": "GreaterThanOrEqualToThreshold",
+                    "threshold": 80 + i,
+                    "evaluation-periods": 1 + i % 3,
+                    "treat-missing-data": "breaching",
+                    "tags": {"level": "info"},
+                }
+                for i in range(alarms)
+            ],
+        }, f)
+    
+    return variables_file, template_file
+
+
+def run_scenario(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Run a single scenario in this process.
+    
+    Args:
+        args (argparse.Namespace): The arguments of the scenario.
+    
+    Returns:
+        dict[str, Any]: The results of the scenario.
+    """
+    # pylint: disable=import-outside-toplevel
+    from alertalot.main import run
+    from alertalot.aws.client_registry import ClientRegistry
+    
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "load-test")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "load-test")
+    
+    fake = FakeAws(args.instances, latency=args.latency, throttle_rate=args.throttle_rate, seed=args.seed)
+    
+    def clients(run_args):
+        registry = ClientRegistry(
+            region=run_args.region,
+            max_pool_connections=max(run_args.max_in_flight, 10),
+            api_tps=run_args.api_tps)
+        fake.attach(registry.session().events)
+        
+        return registry
+    
+    with tempfile.TemporaryDirectory() as directory:
+        variables_file, template_file = write_inputs(directory, args.alarms)
+        argv = [
+            "--create-alarms",
+            "--region", "us-east-1",
+            "--vars-file", variables_file,
+            "--template-file", template_file,
+            "--ec2-filter", "tag:fleet=load",
+            *([] if {"-v", "--verbose"} & set(args.extra) else ["-q"]),
+            *[argument for api_tps in UNLIMITED_API_TPS for argument in ("--api-tps", api_tps)],
+            *args.extra,
+        ]
+        
+        start = time.perf_counter()
+        exit_code = run(argv, clients=clients)
+        duration = time.perf_counter() - start
+    
+    created = len(fake.alarms)
+    calls = sum(fake.calls.values())
+    
+    return {
+        "instances": args.instances,
+        "alarms_per_instance": args.alarms,
+        "exit_code": exit_code,
+        "alarms": created,
+        "seconds": round(duration, 3),
+        "alarms_per_second": round(created / duration, 1) if duration > 0 else 0,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "calls": fake.calls,
+        "throttled": fake.throttled,
+        "calls_per_alarm": round(calls / created, 3) if created else None,
+    }
+
+
+def parse_fleets(value: str) -> list[tuple[int, int]]:
+    """
+    Parse the --fleet argument.
+    
+    Args:
+        value (str): Comma separated fleets, in the format INSTANCESxALARMS.
+    
+    Returns:
+        list[tuple[int, int]]: The number of instances and of alarms per instance of each fleet.
+    """
+    fleets = []
+    
+    for fleet in value.split(","):
+        instances, alarms = fleet.lower().split("x")
+        fleets.append((int(instances), int(alarms)))
+    
+    return fleets
+
+
+def main() -> int:
+    """
+    Run the load test.
+    
+    Returns:
+        int: The exit code, 0 if all the alarms of every scenario were created.
+    """
+    parser = argparse.ArgumentParser(description="End to end load test of alertalot --create-alarms")
+    parser.add_argument("--fleet", default=DEFAULT_FLEETS, help="Comma separated fleets, as INSTANCESxALARMS")
+    parser.add_argument("--latency", type=float, default=0.0, help="Injected latency of each API call, in seconds")
+    parser.add_argument(
+        "--throttle-rate",
+        type=float,
+        default=0.0,
+        help="Probability of each PutMetricAlarm call to be throttled")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random throttling")
+    parser.add_argument("--save", default=None, help="Save the results to this JSON file")
+    parser.add_argument("--instances", type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--alarms", type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("extra", nargs="*", help="Additional alertalot arguments, after '--'")
+    args = parser.parse_args()
+    
+    # A single scenario, run by the parent process in a fresh interpreter.
+    if args.instances is not None:
+        print(json.dumps(run_scenario(args)))
+        return 0
+    
+    results = []
+    failed = False
+    
+    print(f"{'Fleet':<14} {'Alarms':>9} {'Seconds':>9} {'Alarms/s':>10} {'Peak RSS':>10} {'Calls/alarm':>12} "
+          f"{'Throttled':>10}")
+    
+    for instances, alarms in parse_fleets(args.fleet):
+        process = subprocess.run(
+            [
+                sys.executable, os.path.abspath(__file__),
+                "--instances", str(instances),
+                "--alarms", str(alarms),
+                "--latency", str(args.latency),
+                "--throttle-rate", str(args.throttle_rate),
+                "--seed", str(args.seed),
+                "--", *args.extra,
+            ],
+            capture_output=True,
+            text=True,
+            check=False)
+        
+        if process.returncode != 0:
+            print(f"{instances}x{alarms}: scenario crashed\n{process.stderr}")
+            failed = True
+            continue
+        
+        result = json.loads(process.stdout.strip().splitlines()[-1])
+        results.append(result)
+        
+        if result["exit_code"] != 0 or result["alarms"] != instances * alarms:
+            failed = True
+        
+        print(f"{f'{instances}x{alarms}':<14} {result['alarms']:>9} {result['seconds']:>9.2f} "
+              f"{result['alarms_per_second']:>10.0f} {result['peak_rss_mb']:>8.0f}MB "
+              f"{result['calls_per_alarm'] or 0:>12.3f} {result['throttled']:>10}", flush=True)
+    
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"latency": args.latency, "throttle_rate": args.throttle_rate, "results": results}, f, indent=2)
+        
+        print(f"\nResults saved to {args.save}")
+    
+    if failed:
+        print("FAILED: some alarms were not created")
+        return 1
+    
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Start up time benchmark of the alertalot command line tool.
+
+Imports the CLI entry point in fresh interpreters with `python -X importtime`, and reports the median
+cumulative import time and the slowest modules. Fails if the median exceeds the budget, or if any of the
+modules that must only be loaded by the actions using them is imported at start up.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 10 --budget-ms 100
+"""
+import sys
+import argparse
+import statistics
+import subprocess
+
+
+# Modules that are slow to import, and only needed by some actions.
+LAZY_MODULES = ("boto3", "botocore", "jsonschema", "pytimeparse", "rich", "pygments")
+
+# Default budget for the cumulative import time of the entry point, in milliseconds.
+DEFAULT_BUDGET_MS = 150.0
+
+
+def measure(module: str) -> dict[str, int]:
+    """
+    Import a module in a fresh interpreter, and get the cumulative import time of every imported module.
+    
+    Args:
+        module (str): The module to import.
+    
+    Returns:
+        dict[str, int]: Cumulative import time in microseconds, keyed by module name.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True)
+    
+    times = {}
+    
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        
+        _, cumulative, name = line[len("import time:"):].split("|")
+        
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    
+    return times
+
+
+def main() -> int:
+    """
+    Run the benchmark.
+    
+    Returns:
+        int: The exit code, 0 if the budget is met.
+    """
+    parser = argparse.ArgumentParser(description="Measure the start up time of the alertalot CLI")
+    parser.add_argument("--module", default="alertalot.main", help="Module to import")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to measure")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Maximum median import time")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest modules to print")
+    args = parser.parse_args()
+    
+    runs = [measure(args.module) for _ in range(args.runs)]
+    median_ms = statistics.median(run[args.module] for run in runs) / 1000
+    
+    print(f"{args.module}: {median_ms:.1f} ms median over {args.runs} runs (budget {args.budget_ms:.1f} ms)")
+    print("Slowest modules of the last run:")
+    
+    for name, cumulative in sorted(runs[-1].items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+    
+    eager = sorted(
+        name for name in runs[-1]
+        if any(name == lazy or name.startswith(lazy + ".") for lazy in LAZY_MODULES))
+    
+    if eager:
+        print(f"FAILED: modules imported at start up: {', '.join(eager)}")
+        return 1
+    
+    if median_ms > args.budget_ms:
+        print(f"FAILED: over budget by {median_ms - args.budget_ms:.1f} ms")
+        return 1
+    
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
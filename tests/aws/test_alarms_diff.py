@@ -0,0 +1,116 @@
+import boto3
+
+from botocore.stub import Stubber
+
+from alertalot.aws.alarms_diff import AlarmsDiff, AlarmChange
+from alertalot.backends.cloudwatch_backend import CloudWatchBackend
+
+
+def _request(**overrides) -> dict:
+    return {
+        "AlarmName": "cpu",
+        "ComparisonOperator": "GreaterThanThreshold",
+        "EvaluationPeriods": 1,
+        "MetricName": "CPUUtilization",
+        "Namespace": "AWS/EC2",
+        "Period": 300,
+        "Statistic": "Average",
+        "Threshold": 70,
+        "ActionsEnabled": True,
+        "AlarmActions": ["arn:aws:sns:us-east-1:1:b", "arn:aws:sns:us-east-1:1:a"],
+        "Dimensions": [{"Name": "InstanceId", "Value": "i-1"}],
+        "Tags": [{"Key": "level", "Value": "info"}],
+    } | overrides
+
+
+def _existing(**overrides) -> dict:
+    return {
+        "AlarmName": "cpu",
+        "AlarmArn": "arn:aws:cloudwatch:us-east-1:1:alarm:cpu",
+        "ComparisonOperator": "GreaterThanThreshold",
+        "EvaluationPeriods": 1,
+        "MetricName": "CPUUtilization",
+        "Namespace": "AWS/EC2",
+        "Period": 300,
+        "Statistic": "Average",
+        "Threshold": 70.0,
+        "ActionsEnabled": True,
+        "OKActions": [],
+        "AlarmActions": ["arn:aws:sns:us-east-1:1:a", "arn:aws:sns:us-east-1:1:b"],
+        "InsufficientDataActions": [],
+        "Dimensions": [{"Name": "InstanceId", "Value": "i-1"}],
+        "StateValue": "OK",
+        "TreatMissingData": "missing",
+    } | overrides
+
+
+def test__change_for__missing_alarm():
+    diff = AlarmsDiff({})
+    
+    assert diff.change_for(_request()) == AlarmChange.CREATE
+
+
+def test__change_for__same_alarm():
+    diff = AlarmsDiff({"cpu": _existing()})
+    
+    assert len(diff) == 1
+    assert diff.change_for(_request()) == AlarmChange.UNCHANGED
+
+
+def test__change_for__tags_ignored():
+    diff = AlarmsDiff({"cpu": _existing()})
+    
+    assert diff.change_for(_request(Tags=[{"Key": "level", "Value": "critical"}])) == AlarmChange.UNCHANGED
+
+
+def test__change_for__modified_alarm():
+    diff = AlarmsDiff({"cpu": _existing()})
+    
+    assert diff.change_for(_request(Threshold=80)) == AlarmChange.UPDATE
+    assert diff.change_for(_request(AlarmActions=[])) == AlarmChange.UPDATE
+    assert diff.change_for(_request(Dimensions=[{"Name": "InstanceId", "Value": "i-2"}])) == AlarmChange.UPDATE
+    assert diff.change_for(_request(TreatMissingData="breaching")) == AlarmChange.UPDATE
+
+
+def test__change_for__default_values_compared():
+    diff = AlarmsDiff({"cpu": _existing(TreatMissingData="breaching", OKActions=["arn:aws:sns:us-east-1:1:c"])})
+    
+    assert diff.change_for(_request()) == AlarmChange.UPDATE
+
+
+def test__load__names_fetched_in_batches():
+    cloudwatch = boto3.client("cloudwatch", region_name="us-east-1")
+    names = [f"alarm-{i}" for i in range(250)]
+    
+    with Stubber(cloudwatch) as stubber:
+        stubber.add_response(
+            "describe_alarms",
+            {"MetricAlarms": [_existing(AlarmName="alarm-0")], "NextToken": "next"},
+            {"AlarmNames": names[:100], "AlarmTypes": ["MetricAlarm"]})
+        stubber.add_response(
+            "describe_alarms",
+            {"MetricAlarms": [_existing(AlarmName="alarm-99")]},
+            {"AlarmNames": names[:100], "AlarmTypes": ["MetricAlarm"], "NextToken": "next"})
+        stubber.add_response(
+            "describe_alarms",
+            {"MetricAlarms": []},
+            {"AlarmNames": names[100:200], "AlarmTypes": ["MetricAlarm"]})
+        stubber.add_response(
+            "describe_alarms",
+            {"MetricAlarms": [_existing(AlarmName="alarm-249")]},
+            {"AlarmNames": names[200:], "AlarmTypes": ["MetricAlarm"]})
+        
+        diff = AlarmsDiff.load(CloudWatchBackend(cloudwatch), names + ["alarm-0"])
+        
+        stubber.assert_no_pending_responses()
+    
+    assert len(diff) == 3
+    assert diff.change_for(_request(AlarmName="alarm-99")) == AlarmChange.UNCHANGED
+    assert diff.change_for(_request(AlarmName="alarm-1")) == AlarmChange.CREATE
+
+
+def test__load__no_names():
+    cloudwatch = boto3.client("cloudwatch", region_name="us-east-1")
+    
+    with Stubber(cloudwatch):
+        assert len(AlarmsDiff.load(CloudWatchBackend(cloudwatch), [])) == 0
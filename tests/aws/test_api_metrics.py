@@ -0,0 +1,149 @@
+import json
+
+from unittest.mock import Mock
+
+import boto3
+import pytest
+
+from botocore.hooks import HierarchicalEmitter
+from botocore.stub import Stubber
+
+from alertalot.aws.api_metrics import ApiMetrics
+
+
+@pytest.fixture(autouse=True)
+def _reset_default():
+    yield
+    ApiMetrics.set_default(None)
+
+
+def _client():
+    return boto3.client("sts", region_name="us-east-1", aws_access_key_id="a", aws_secret_access_key="b")
+
+
+def test__record_call__latency_buckets():
+    metrics = ApiMetrics()
+    
+    metrics.record_call("cloudwatch.PutMetricAlarm", "us-east-1", 0.003)
+    metrics.record_call("cloudwatch.PutMetricAlarm", "us-east-1", 0.2, retries=2)
+    metrics.record_call("cloudwatch.PutMetricAlarm", "us-east-1", 30, is_error=True)
+    
+    api = metrics.to_json()["apis"][0]
+    
+    assert api["calls"] == 3
+    assert api["retries"] == 2
+    assert api["errors"] == 1
+    assert api["latency_seconds"]["sum"] == 30.203
+    assert api["latency_seconds"]["buckets"]["0.005"] == 1
+    assert api["latency_seconds"]["buckets"]["0.1"] == 1
+    assert api["latency_seconds"]["buckets"]["0.25"] == 2
+    assert api["latency_seconds"]["buckets"]["10.0"] == 2
+    assert api["latency_seconds"]["buckets"]["+Inf"] == 3
+
+
+def test__to_json__totals_and_keys():
+    metrics = ApiMetrics()
+    
+    metrics.record_call("ec2.DescribeInstances", "eu-west-1", 0.1)
+    metrics.record_call("ec2.DescribeInstances", "us-east-1", 0.1)
+    metrics.record_attempt("ec2.DescribeInstances", "us-east-1", request_bytes=10, response_bytes=100)
+    metrics.record_attempt("ec2.DescribeInstances", "us-east-1", is_throttled=True)
+    
+    report = metrics.to_json()
+    
+    assert [(api["service"], api["operation"], api["region"]) for api in report["apis"]] == [
+        ("ec2", "DescribeInstances", "eu-west-1"),
+        ("ec2", "DescribeInstances", "us-east-1"),
+    ]
+    assert report["totals"] == {
+        "calls": 2,
+        "errors": 0,
+        "retries": 0,
+        "throttles": 1,
+        "request_bytes": 10,
+        "response_bytes": 100,
+    }
+
+
+def test__to_prometheus():
+    metrics = ApiMetrics()
+    metrics.record_call("cloudwatch.PutMetricAlarm", None, 0.02)
+    
+    lines = metrics.to_prometheus().splitlines()
+    labels = 'service="cloudwatch",operation="PutMetricAlarm",region=""'
+    
+    assert "# TYPE alertalot_aws_api_calls_total counter" in lines
+    assert f"alertalot_aws_api_calls_total{{{labels}}} 1" in lines
+    assert f"alertalot_aws_api_call_duration_seconds_bucket{{{labels},le=\"0.01\"}} 0" in lines
+    assert f"alertalot_aws_api_call_duration_seconds_bucket{{{labels},le=\"0.025\"}} 1" in lines
+    assert f"alertalot_aws_api_call_duration_seconds_bucket{{{labels},le=\"+Inf\"}} 1" in lines
+    assert f"alertalot_aws_api_call_duration_seconds_count{{{labels}}} 1" in lines
+    assert lines[-1].startswith("alertalot_last_run_timestamp_seconds ")
+
+
+def test__write(tmp_path):
+    json_file = tmp_path / "metrics.json"
+    textfile = tmp_path / "alertalot.prom"
+    metrics = ApiMetrics(json_file=str(json_file), textfile=str(textfile))
+    metrics.record_call("sts.GetCallerIdentity", "us-east-1", 0.1)
+    
+    metrics.write()
+    
+    assert json.loads(json_file.read_text(encoding="utf-8"))["totals"]["calls"] == 1
+    assert "alertalot_aws_api_calls_total" in textfile.read_text(encoding="utf-8")
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["alertalot.prom", "metrics.json"]
+
+
+def test__write__nothing_to_write(tmp_path):
+    ApiMetrics().write()
+    
+    assert not list(tmp_path.iterdir())
+
+
+def test__attach__records_calls():
+    client = _client()
+    ApiMetrics.attach(client)
+    
+    with Stubber(client) as stubber:
+        stubber.add_response("get_caller_identity", {"Account": "123456789012"})
+        stubber.add_response("get_caller_identity", {"Account": "123456789012"})
+        stubber.add_client_error("get_caller_identity", "AccessDenied", http_status_code=403)
+        
+        client.get_caller_identity()
+        
+        metrics = ApiMetrics()
+        ApiMetrics.set_default(metrics)
+        
+        client.get_caller_identity()
+        
+        with pytest.raises(client.exceptions.ClientError):
+            client.get_caller_identity()
+    
+    api = metrics.to_json()["apis"][0]
+    
+    assert (api["service"], api["operation"], api["region"]) == ("sts", "GetCallerIdentity", "us-east-1")
+    assert api["calls"] == 2
+    assert api["errors"] == 1
+
+
+def test__attach__records_attempts():
+    client = Mock()
+    client.meta.region_name = "us-east-1"
+    client.meta.events = HierarchicalEmitter()
+    ApiMetrics.attach(client)
+    
+    metrics = ApiMetrics()
+    ApiMetrics.set_default(metrics)
+    
+    client.meta.events.emit("before-send.sts.GetCallerIdentity", request=Mock(body=b"12345"))
+    client.meta.events.emit(
+        "needs-retry.sts.GetCallerIdentity",
+        response=(Mock(content=b"abc"), {"Error": {"Code": "Throttling"}}))
+    client.meta.events.emit("needs-retry.sts.GetCallerIdentity", response=None, caught_exception=OSError())
+    
+    api = metrics.to_json()["apis"][0]
+    
+    assert api["calls"] == 0
+    assert api["request_bytes"] == 5
+    assert api["response_bytes"] == 3
+    assert api["throttles"] == 1
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta, timezone
+
+from botocore.stub import Stubber
+
+from alertalot.aws.client_registry import ClientRegistry
+
+
+ROLE_ARN = "arn:aws:iam::123456789012:role/alertalot"
+
+
+def _stub_assume_role(registry: ClientRegistry, expiration: datetime, access_key: str = "AKIAROLEEXAMPLE01") -> Stubber:
+    stubber = Stubber(registry.client("sts"))
+    stubber.add_response(
+        "assume_role",
+        {
+            "Credentials": {
+                "AccessKeyId": access_key,
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": expiration,
+            }
+        },
+        {"RoleArn": ROLE_ARN, "RoleSessionName": "alertalot"})
+    stubber.activate()
+    
+    return stubber
+
+
+def test__client__same_key_returns_same_client():
+    registry = ClientRegistry(region="us-east-1")
+    
+    assert registry.client("cloudwatch") is registry.client("cloudwatch")
+    assert registry.client("cloudwatch") is registry.client("cloudwatch", region="us-east-1")
+
+
+def test__client__different_keys_return_different_clients():
+    registry = ClientRegistry(region="us-east-1")
+    
+    cloudwatch = registry.client("cloudwatch")
+    
+    assert cloudwatch is not registry.client("ec2")
+    assert cloudwatch is not registry.client("cloudwatch", region="eu-west-1")
+    assert registry.client("cloudwatch", region="eu-west-1").meta.region_name == "eu-west-1"
+    assert cloudwatch.meta.region_name == "us-east-1"
+
+
+def test__client__regions_share_session():
+    registry = ClientRegistry(region="us-east-1")
+    
+    registry.client("ec2")
+    session = registry.session()
+    registry.client("ec2", region="eu-west-1")
+    
+    assert registry.session() is session
+
+
+def test__for_region__shares_clients_and_limiters():
+    registry = ClientRegistry(region="us-east-1")
+    regional = registry.for_region("eu-west-1")
+    
+    assert regional.region == "eu-west-1"
+    assert registry.region == "us-east-1"
+    assert regional.client("ec2") is registry.client("ec2", region="eu-west-1")
+    assert regional.client("ec2").meta.region_name == "eu-west-1"
+    assert regional.limiter() is registry.limiter(region="eu-west-1")
+    assert regional.limiter() is not registry.limiter()
+    assert regional.session() is registry.session()
+
+
+def test__client__tuned_config():
+    registry = ClientRegistry(
+        region="us-east-1",
+        max_pool_connections=40,
+        max_attempts=7,
+        connect_timeout=2,
+        read_timeout=11)
+    
+    config = registry.client("cloudwatch").meta.config
+    
+    assert config.max_pool_connections == 40
+    assert config.retries["mode"] == "standard"
+    assert config.retries["total_max_attempts"] == 7
+    assert config.connect_timeout == 2
+    assert config.read_timeout == 11
+    assert config.tcp_keepalive is True
+
+
+def test__client__with_role_uses_assumed_credentials():
+    registry = ClientRegistry(region="us-east-1")
+    expiration = datetime.now(timezone.utc) + timedelta(hours=1)
+    
+    with _stub_assume_role(registry, expiration) as stubber:
+        ec2 = registry.client("ec2", role_arn=ROLE_ARN)
+        
+        assert ec2 is registry.client("ec2", role_arn=ROLE_ARN)
+        assert ec2 is not registry.client("ec2")
+        assert registry.session(role_arn=ROLE_ARN).get_credentials().access_key == "AKIAROLEEXAMPLE01"
+        stubber.assert_no_pending_responses()
+
+
+def test__client__with_expiring_role_refreshes_credentials():
+    registry = ClientRegistry(region="us-east-1")
+    expiring = datetime.now(timezone.utc) + timedelta(minutes=1)
+    
+    with _stub_assume_role(registry, expiring) as stubber:
+        ec2 = registry.client("ec2", role_arn=ROLE_ARN)
+        stubber.add_response(
+            "assume_role",
+            {
+                "Credentials": {
+                    "AccessKeyId": "AKIAROLEEXAMPLE02",
+                    "SecretAccessKey": "secret",
+                    "SessionToken": "token",
+                    "Expiration": expiring + timedelta(hours=1),
+                }
+            })
+        
+        credentials = registry.session(role_arn=ROLE_ARN).get_credentials()
+        
+        assert credentials.get_frozen_credentials().access_key == "AKIAROLEEXAMPLE02"
+        assert ec2 is registry.client("ec2", role_arn=ROLE_ARN)
+        assert ec2.client._request_signer._credentials is credentials  # pylint: disable=protected-access
+        stubber.assert_no_pending_responses()
+
+
+def test__properties():
+    registry = ClientRegistry(region="us-east-1", role_arn=ROLE_ARN)
+    
+    assert registry.role_arn == ROLE_ARN
+    assert registry.region == "us-east-1"
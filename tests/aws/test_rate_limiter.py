@@ -0,0 +1,242 @@
+from unittest.mock import Mock
+
+import boto3
+import pytest
+
+from botocore.stub import Stubber
+from botocore.exceptions import ClientError
+
+from alertalot.aws.rate_limiter import TokenBucket, AdaptiveConcurrency, ApiRateLimiter
+from alertalot.aws.throttled_client import ThrottledClient
+
+
+class FakeClock:
+    """
+    Clock that only advances when sleep is called.
+    """
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _error(code: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, "PutMetricAlarm")
+
+
+def test__token_bucket__invalid_rate():
+    with pytest.raises(ValueError, match="positive"):
+        TokenBucket(0)
+
+
+def test__token_bucket__burst_available_immediately():
+    clock = FakeClock()
+    bucket = TokenBucket(5, clock=clock, sleep=clock.sleep)
+    
+    for _ in range(5):
+        assert bucket.acquire() == 0.0
+    
+    assert not clock.sleeps
+
+
+def test__token_bucket__waits_once_empty():
+    clock = FakeClock()
+    bucket = TokenBucket(2, burst=1, clock=clock, sleep=clock.sleep)
+    
+    bucket.acquire()
+    
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test__token_bucket__refills_over_time():
+    clock = FakeClock()
+    bucket = TokenBucket(2, burst=2, clock=clock, sleep=clock.sleep)
+    
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 10
+    
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.5)
+
+
+def test__adaptive_concurrency__additive_increase():
+    concurrency = AdaptiveConcurrency(10)
+    
+    concurrency.on_throttle()
+    assert concurrency.limit == 5
+    
+    for _ in range(6):
+        concurrency.acquire()
+        concurrency.release()
+    
+    assert concurrency.limit == 6
+    assert concurrency.in_flight == 0
+
+
+def test__adaptive_concurrency__multiplicative_decrease_with_cooldown():
+    clock = FakeClock()
+    concurrency = AdaptiveConcurrency(16, cooldown=1.0, clock=clock)
+    
+    concurrency.acquire()
+    concurrency.release(is_throttled=True)
+    concurrency.on_throttle()
+    
+    assert concurrency.limit == 8
+    
+    clock.now += 1.0
+    concurrency.on_throttle()
+    
+    assert concurrency.limit == 4
+
+
+def test__adaptive_concurrency__min_and_max_limit():
+    clock = FakeClock()
+    concurrency = AdaptiveConcurrency(2, min_limit=1, cooldown=0, clock=clock)
+    
+    for _ in range(10):
+        concurrency.on_throttle()
+    
+    assert concurrency.limit == 1
+    
+    for _ in range(100):
+        concurrency.acquire()
+        concurrency.release()
+    
+    assert concurrency.limit == 2
+
+
+def test__api_rate_limiter__bucket_for():
+    limiter = ApiRateLimiter({"cloudwatch.PutMetricAlarm": 7, "sts": 0})
+    
+    assert limiter.bucket_for("cloudwatch.PutMetricAlarm").rate == 7
+    assert limiter.bucket_for("cloudwatch.DescribeAlarms").rate == 9
+    assert limiter.bucket_for("ec2.DescribeInstances") is limiter.bucket_for("ec2.DescribeRegions")
+    assert limiter.bucket_for("sts.GetCallerIdentity") is None
+    assert limiter.bucket_for("sqs.ReceiveMessage") is None
+
+
+def test__api_rate_limiter__service_rate_overrides_default_operations():
+    limiter = ApiRateLimiter({"cloudwatch": 50, "cloudwatch.DeleteAlarms": 5})
+    
+    assert limiter.rate_for("cloudwatch.PutMetricAlarm") == 50
+    assert limiter.rate_for("cloudwatch.DescribeAlarms") == 50
+    assert limiter.rate_for("cloudwatch.DeleteAlarms") == 5
+    assert limiter.bucket_for("cloudwatch.PutMetricAlarm") is limiter.bucket_for("cloudwatch.DescribeAlarms")
+
+
+def test__api_rate_limiter__rate_for():
+    limiter = ApiRateLimiter({"cloudwatch.PutMetricAlarm": 7, "sts": 0})
+    
+    assert limiter.rate_for("cloudwatch.PutMetricAlarm") == 7
+    assert limiter.rate_for("ec2.DescribeInstances") == 20
+    assert limiter.rate_for("sts.GetCallerIdentity") is None
+    assert limiter.rate_for("sqs.ReceiveMessage") is None
+
+
+def test__api_rate_limiter__call_returns_result():
+    limiter = ApiRateLimiter()
+    
+    assert limiter.call("sqs.ReceiveMessage", lambda a, b: a + b, 1, b=2) == 3
+
+
+def test__api_rate_limiter__call_retries_throttled():
+    clock = FakeClock()
+    limiter = ApiRateLimiter({"sqs": 0}, sleep=clock.sleep)
+    callback = Mock(side_effect=[_error("Throttling"), _error("RequestLimitExceeded"), "ok"])
+    
+    assert limiter.call("sqs.SendMessage", callback) == "ok"
+    assert callback.call_count == 3
+    assert len(clock.sleeps) == 2
+    assert limiter.concurrency_for("sqs.SendMessage").in_flight == 0
+
+
+def test__api_rate_limiter__call_gives_up_after_max_retries():
+    clock = FakeClock()
+    limiter = ApiRateLimiter(max_retries=2, sleep=clock.sleep)
+    callback = Mock(side_effect=_error("Throttling"))
+    
+    with pytest.raises(ClientError, match="Throttling"):
+        limiter.call("sqs.SendMessage", callback)
+    
+    assert callback.call_count == 3
+    assert limiter.concurrency_for("sqs.SendMessage").in_flight == 0
+
+
+def test__api_rate_limiter__call_counts_botocore_retries():
+    clock = FakeClock()
+    limiter = ApiRateLimiter(max_retries=5, sleep=clock.sleep)
+    error = ClientError(
+        {"Error": {"Code": "Throttling", "Message": "Throttling"}, "ResponseMetadata": {"RetryAttempts": 2}},
+        "PutMetricAlarm")
+    callback = Mock(side_effect=error)
+    
+    with pytest.raises(ClientError, match="Throttling"):
+        limiter.call("sqs.SendMessage", callback)
+    
+    assert callback.call_count == 2
+
+
+def test__api_rate_limiter__call_does_not_retry_other_errors():
+    limiter = ApiRateLimiter()
+    callback = Mock(side_effect=_error("AccessDenied"))
+    
+    with pytest.raises(ClientError, match="AccessDenied"):
+        limiter.call("sqs.SendMessage", callback)
+    
+    with pytest.raises(ValueError):
+        limiter.call("sqs.SendMessage", Mock(side_effect=ValueError()))
+    
+    assert callback.call_count == 1
+    assert limiter.concurrency_for("sqs.SendMessage").in_flight == 0
+
+
+def test__api_rate_limiter__backoff_within_bounds():
+    limiter = ApiRateLimiter(base_delay=1, max_delay=5)
+    
+    for attempt in range(10):
+        assert 0 <= limiter.backoff(attempt) <= min(5, 2 ** attempt)
+
+
+def test__api_rate_limiter__is_throttling_error():
+    assert ApiRateLimiter.is_throttling_error(_error("Throttling"))
+    assert ApiRateLimiter.is_throttling_error(_error("RequestLimitExceeded"))
+    assert not ApiRateLimiter.is_throttling_error(_error("LimitExceeded"))
+    assert not ApiRateLimiter.is_throttling_error(ValueError("Throttling"))
+
+
+def test__throttled_client__operation_retried_when_throttled():
+    clock = FakeClock()
+    limiter = ApiRateLimiter({"cloudwatch": 0}, sleep=clock.sleep)
+    client = ThrottledClient(boto3.client("cloudwatch", region_name="us-east-1"), limiter)
+    
+    with Stubber(client.client) as stubber:
+        stubber.add_client_error("delete_alarms", service_error_code="Throttling")
+        stubber.add_response("delete_alarms", {}, {"AlarmNames": ["a"]})
+        
+        client.delete_alarms(AlarmNames=["a"])
+        
+        stubber.assert_no_pending_responses()
+    
+    assert len(clock.sleeps) == 1
+    assert limiter.concurrency_for("cloudwatch.DeleteAlarms").limit == 5
+
+
+def test__throttled_client__other_attributes_not_wrapped():
+    limiter = ApiRateLimiter()
+    raw = boto3.client("cloudwatch", region_name="us-east-1")
+    client = ThrottledClient(raw, limiter)
+    
+    assert client.meta is raw.meta
+    assert client.client is raw
+    assert client.limiter is limiter
+    assert client.can_paginate("describe_alarms")
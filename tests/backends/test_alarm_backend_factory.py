@@ -0,0 +1,36 @@
+from unittest.mock import Mock
+
+import pytest
+
+from alertalot.backends.alarm_backend_factory import AlarmBackendFactory
+from alertalot.backends.cloudwatch_backend import CloudWatchBackend
+from alertalot.backends.emulator_backend import EmulatorBackend
+from alertalot.backends.recorder_backend import RecorderBackend
+
+
+def _args(backend: str) -> Mock:
+    args = Mock()
+    args.backend = backend
+    args.emulator_latency = 0.0
+    args.emulator_throttle_rate = 0.0
+    args.record_file = None
+    args.region = "us-east-1"
+    
+    return args
+
+
+@pytest.mark.parametrize("name, backend_type", [
+    ("cloudwatch", CloudWatchBackend),
+    ("emulator", EmulatorBackend),
+    ("recorder", RecorderBackend),
+])
+def test__from_args(name, backend_type):
+    backend = AlarmBackendFactory.from_args(_args(name))
+    
+    assert isinstance(backend, backend_type)
+    assert backend.name == name
+
+
+def test__from_args__unknown_backend():
+    with pytest.raises(NotImplementedError):
+        AlarmBackendFactory.from_args(_args("unknown"))
@@ -0,0 +1,38 @@
+import boto3
+
+from botocore.stub import Stubber
+
+from alertalot.backends.cloudwatch_backend import CloudWatchBackend
+
+
+def test__delete_alarms__batched():
+    cloudwatch = boto3.client("cloudwatch", region_name="us-east-1")
+    names = [f"alarm-{i}" for i in range(150)]
+    
+    with Stubber(cloudwatch) as stubber:
+        stubber.add_response("delete_alarms", {}, {"AlarmNames": names[:100]})
+        stubber.add_response("delete_alarms", {}, {"AlarmNames": names[100:]})
+        
+        CloudWatchBackend(cloudwatch).delete_alarms(names)
+        
+        stubber.assert_no_pending_responses()
+
+
+def test__put_metric_alarm():
+    cloudwatch = boto3.client("cloudwatch", region_name="us-east-1")
+    request = {
+        "AlarmName": "cpu",
+        "ComparisonOperator": "GreaterThanThreshold",
+        "EvaluationPeriods": 1,
+    }
+    
+    with Stubber(cloudwatch) as stubber:
+        stubber.add_response("put_metric_alarm", {}, request)
+        
+        backend = CloudWatchBackend(cloudwatch)
+        backend.put_metric_alarm(request)
+        
+        stubber.assert_no_pending_responses()
+    
+    assert backend.name == "cloudwatch"
+    assert backend.is_dry_run is False
@@ -0,0 +1,113 @@
+import pytest
+
+from botocore.exceptions import ClientError
+
+from alertalot.aws.rate_limiter import ApiRateLimiter
+from alertalot.backends.emulator_backend import EmulatorBackend
+
+
+def _request(name: str = "cpu", **overrides) -> dict:
+    return {
+        "AlarmName": name,
+        "ComparisonOperator": "GreaterThanThreshold",
+        "EvaluationPeriods": 1,
+        "Threshold": 70,
+        "Tags": [{"Key": "level", "Value": "info"}],
+    } | overrides
+
+
+def test__put_and_describe():
+    backend = EmulatorBackend()
+    
+    backend.put_metric_alarm(_request("cpu"))
+    backend.put_metric_alarm(_request("disk"))
+    
+    existing = backend.describe_alarms(["cpu", "missing"])
+    
+    assert list(existing) == ["cpu"]
+    assert existing["cpu"]["Threshold"] == 70
+    assert existing["cpu"]["StateValue"] == "INSUFFICIENT_DATA"
+    assert "Tags" not in existing["cpu"]
+    assert backend.calls == {"PutMetricAlarm": 2, "DescribeAlarms": 1}
+
+
+def test__put__overrides_existing_alarm():
+    backend = EmulatorBackend()
+    
+    backend.put_metric_alarm(_request(Threshold=70))
+    backend.put_metric_alarm(_request(Threshold=90))
+    
+    assert backend.alarms["cpu"]["Threshold"] == 90
+
+
+def test__put__missing_properties():
+    backend = EmulatorBackend()
+    
+    with pytest.raises(ClientError) as e:
+        backend.put_metric_alarm({"AlarmName": "cpu"})
+    
+    assert e.value.response["Error"]["Code"] == "ValidationError"
+    assert backend.alarms == {}
+
+
+def test__describe__batched():
+    backend = EmulatorBackend()
+    
+    for i in range(150):
+        backend.put_metric_alarm(_request(f"alarm-{i}"))
+    
+    existing = backend.describe_alarms([f"alarm-{i}" for i in range(150)])
+    
+    assert len(existing) == 150
+    assert backend.calls["DescribeAlarms"] == 2
+
+
+def test__delete_alarms():
+    backend = EmulatorBackend()
+    backend.put_metric_alarm(_request("cpu"))
+    backend.put_metric_alarm(_request("disk"))
+    
+    backend.delete_alarms(["cpu", "missing"])
+    
+    assert list(backend.alarms) == ["disk"]
+
+
+def test__latency():
+    sleeps = []
+    backend = EmulatorBackend(latency=0.25, sleep=sleeps.append)
+    
+    backend.put_metric_alarm(_request())
+    backend.describe_alarms(["cpu"])
+    
+    assert sleeps == [0.25, 0.25]
+
+
+def test__throttling():
+    backend = EmulatorBackend(throttle_rate=1.0)
+    
+    with pytest.raises(ClientError) as e:
+        backend.put_metric_alarm(_request())
+    
+    assert e.value.response["Error"]["Code"] == "Throttling"
+    assert backend.throttled == {"PutMetricAlarm": 1}
+    assert backend.alarms == {}
+
+
+def test__throttling__retried_by_limiter():
+    limiter = ApiRateLimiter({"cloudwatch": 0}, max_retries=50, sleep=lambda _: None)
+    backend = EmulatorBackend(throttle_rate=0.5, limiter=limiter, seed=1)
+    
+    for i in range(20):
+        backend.put_metric_alarm(_request(f"alarm-{i}"))
+    
+    assert len(backend.alarms) == 20
+    assert backend.throttled["PutMetricAlarm"] > 0
+    assert backend.calls["PutMetricAlarm"] == 20 + backend.throttled["PutMetricAlarm"]
+
+
+def test__invalid_arguments():
+    with pytest.raises(ValueError):
+        EmulatorBackend(latency=-1)
+    
+    with pytest.raises(ValueError):
+        EmulatorBackend(throttle_rate=1.5)
@@ -0,0 +1,33 @@
+import json
+
+from alertalot.backends.emulator_backend import EmulatorBackend
+from alertalot.backends.recorder_backend import RecorderBackend
+
+
+def test__put_metric_alarm__recorded_not_sent(tmp_path):
+    reader = EmulatorBackend()
+    path = tmp_path / "records.jsonl"
+    backend = RecorderBackend(reader, path=str(path), region="eu-west-1")
+    
+    backend.put_metric_alarm({"AlarmName": "cpu", "EvaluationPeriods": 1, "ComparisonOperator": "GreaterThanThreshold"})
+    backend.delete_alarms(["disk"])
+    
+    assert not reader.calls
+    assert [record["operation"] for record in backend.records] == ["PutMetricAlarm", "DeleteAlarms"]
+    
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    
+    assert len(lines) == 2
+    assert lines[0]["region"] == "eu-west-1"
+    assert lines[0]["request"]["AlarmName"] == "cpu"
+    assert lines[1]["request"] == {"AlarmNames": ["disk"]}
+
+
+def test__describe_alarms__delegated_to_reader():
+    reader = EmulatorBackend()
+    reader.put_metric_alarm({"AlarmName": "cpu", "EvaluationPeriods": 1, "ComparisonOperator": "LessThanThreshold"})
+    backend = RecorderBackend(reader)
+    
+    assert list(backend.describe_alarms(["cpu", "disk"])) == ["cpu"]
+    assert not backend.records
+    assert backend.is_dry_run is True
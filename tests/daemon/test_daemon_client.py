@@ -0,0 +1,8 @@
+from alertalot.daemon.daemon_client import DaemonClient
+
+
+def test__run__no_server(tmp_path):
+    client = DaemonClient(str(tmp_path / "missing.sock"))
+    
+    assert client.run(["--show-variables"]) is None
+    assert client.ping() is None
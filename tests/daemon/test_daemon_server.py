@@ -0,0 +1,159 @@
+import os
+import socket
+import threading
+
+from unittest.mock import Mock
+
+import pytest
+
+from alertalot.daemon.daemon_client import DaemonClient
+from alertalot.daemon.daemon_server import DaemonServer
+
+
+def _runner(argv, clients):
+    print(" ".join(argv))
+    return 3 if clients is not None else 0
+
+
+def _start(server: DaemonServer) -> threading.Thread:
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    
+    for _ in range(100):
+        if DaemonClient(server.path).ping() is not None:
+            break
+        
+        threading.Event().wait(0.01)
+    
+    return thread
+
+
+def _args(region="us-east-1"):
+    args = Mock()
+    args.region = region
+    args.role_arn = None
+    args.max_in_flight = 10
+    args.api_tps = {"cloudwatch": 5.0}
+    args.clients = Mock()
+    
+    return args
+
+
+def test__handle__run(tmp_path):
+    server = DaemonServer(str(tmp_path / "s"), _runner)
+    
+    response = server.handle({"argv": ["--show-variables", "-q"], "cwd": str(tmp_path)})
+    
+    assert response == {"exit_code": 3, "output": "--show-variables -q\n"}
+
+
+def test__handle__run_in_client_directory(tmp_path):
+    cwd = os.getcwd()
+    server = DaemonServer(str(tmp_path / "s"), lambda argv, clients: print(os.getcwd()) or 0)
+    
+    response = server.handle({"command": "run", "argv": [], "cwd": str(tmp_path)})
+    
+    assert response["output"] == f"{tmp_path}\n"
+    assert os.getcwd() == cwd
+
+
+def test__handle__missing_directory(tmp_path):
+    server = DaemonServer(str(tmp_path / "s"), _runner)
+    
+    response = server.handle({"argv": [], "cwd": str(tmp_path / "missing")})
+    
+    assert response["exit_code"] == 1
+
+
+@pytest.mark.parametrize("request_object", [
+    [],
+    {"command": "stop"},
+    {"argv": "--show-variables"},
+    {"argv": [1]},
+    {"argv": [], "cwd": 1},
+])
+def test__handle__invalid_request(tmp_path, request_object):
+    server = DaemonServer(str(tmp_path / "s"), _runner)
+    
+    response = server.handle(request_object)
+    
+    assert response["exit_code"] == 2
+    assert response["output"].startswith("Error: ")
+
+
+def test__handle__ping(tmp_path):
+    server = DaemonServer(str(tmp_path / "s"), _runner)
+    server.handle({"argv": []})
+    
+    response = server.handle({"command": "ping"})
+    
+    assert response == {"version": DaemonServer.PROTOCOL_VERSION, "pid": os.getpid(), "requests": 1}
+
+
+def test__clients_for__shared_by_same_settings(tmp_path):
+    server = DaemonServer(str(tmp_path / "s"), _runner)
+    first = _args()
+    
+    assert server.clients_for(first) is first.clients
+    assert server.clients_for(_args()) is first.clients
+    assert server.clients_for(_args(region="eu-west-1")) is not first.clients
+
+
+def test__serve_forever__round_trip(tmp_path):
+    server = DaemonServer(str(tmp_path / "s"), _runner)
+    thread = _start(server)
+    
+    try:
+        assert os.stat(server.path).st_mode & 0o777 == 0o600
+        assert DaemonClient(server.path).run(["--plan", "a.plan"], str(tmp_path)) == (3, "--plan a.plan\n")
+    finally:
+        server.shutdown()
+        thread.join(5)
+    
+    assert not os.path.exists(server.path)
+
+
+def test__serve_forever__invalid_json(tmp_path):
+    server = DaemonServer(str(tmp_path / "s"), _runner)
+    thread = _start(server)
+    
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(server.path)
+            connection.sendall(b"{\n")
+            
+            with connection.makefile("rb") as f:
+                line = f.readline()
+    finally:
+        server.shutdown()
+        thread.join(5)
+    
+    assert b"not valid JSON" in line
+
+
+def test__serve_forever__stale_socket_removed(tmp_path):
+    path = str(tmp_path / "s")
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(path)
+    
+    server = DaemonServer(path, _runner)
+    thread = _start(server)
+    
+    try:
+        assert DaemonClient(path).ping() is not None
+    finally:
+        server.shutdown()
+        thread.join(5)
+
+
+def test__serve_forever__already_running(tmp_path):
+    server = DaemonServer(str(tmp_path / "s"), _runner)
+    thread = _start(server)
+    
+    try:
+        with pytest.raises(RuntimeError):
+            DaemonServer(server.path, _runner).serve_forever()
+    finally:
+        server.shutdown()
+        thread.join(5)
@@ -0,0 +1,162 @@
+from unittest.mock import patch
+
+import boto3
+import pytest
+
+from moto import mock_aws
+from botocore.stub import Stubber
+
+from alertalot.aws.client_registry import ClientRegistry
+from alertalot.entities.aws_ec2_entity import AwsEc2Entity
+
+
+def _instances(*ids: str) -> dict:
+    return {"Reservations": [{"Instances": [{"InstanceId": instance_id} for instance_id in ids]}]}
+
+
+def _ids_filter(ids: list[str]) -> dict:
+    return {"Name": "instance-id", "Values": ids}
+
+
+def _entity() -> tuple[AwsEc2Entity, Stubber]:
+    clients = ClientRegistry(region="us-east-1", api_tps={"ec2": 0})
+    entity = AwsEc2Entity(clients)
+    
+    return entity, Stubber(clients.client("ec2").client)
+
+
+def test__load_entities__ids_chunked():
+    entity, stubber = _entity()
+    ids = [f"i-{i}" for i in range(450)]
+    
+    with stubber:
+        stubber.add_response(
+            "describe_instances", _instances("i-0", "i-1"), {"Filters": [_ids_filter(ids[:200])], "MaxResults": 1000})
+        stubber.add_response(
+            "describe_instances", _instances("i-200"), {"Filters": [_ids_filter(ids[200:400])], "MaxResults": 1000})
+        stubber.add_response(
+            "describe_instances", _instances("i-400"), {"Filters": [_ids_filter(ids[400:])], "MaxResults": 1000})
+        
+        result = [instance["InstanceId"] for instance in entity.load_entities(ids)]
+        
+        stubber.assert_no_pending_responses()
+    
+    assert result == ["i-0", "i-1", "i-200", "i-400"]
+
+
+def test__load_entities__filters_paginated():
+    entity, stubber = _entity()
+    filters = [{"Name": "tag:Role", "Values": ["web"]}]
+    
+    with stubber:
+        stubber.add_response(
+            "describe_instances",
+            _instances("i-1") | {"NextToken": "next"},
+            {"Filters": filters, "MaxResults": 1000})
+        stubber.add_response(
+            "describe_instances",
+            _instances("i-2"),
+            {"Filters": filters, "MaxResults": 1000, "NextToken": "next"})
+        
+        result = [instance["InstanceId"] for instance in entity.iter_entities(filters)]
+        
+        stubber.assert_no_pending_responses()
+    
+    assert result == ["i-1", "i-2"]
+
+
+def test__load_entities__ids_and_filters():
+    entity, stubber = _entity()
+    filters = [{"Name": "instance-state-name", "Values": ["running"]}]
+    
+    with stubber:
+        stubber.add_response(
+            "describe_instances",
+            _instances("i-1"),
+            {"Filters": [*filters, _ids_filter(["i-1", "i-2"])], "MaxResults": 1000})
+        
+        result = list(entity.load_entities(["i-1", "i-2"], filters))
+    
+    assert result == [{"InstanceId": "i-1"}]
+
+
+def test__load_entities__lazy_chunks():
+    entity, stubber = _entity()
+    ids = (f"i-{i}" for i in range(201))
+    
+    with stubber:
+        stubber.add_response(
+            "describe_instances",
+            _instances("i-0"),
+            {"Filters": [_ids_filter([f"i-{i}" for i in range(200)])], "MaxResults": 1000})
+        
+        instances = entity.load_entities(ids)
+        
+        assert next(instances) == {"InstanceId": "i-0"}
+        stubber.assert_no_pending_responses()
+        
+        stubber.add_response(
+            "describe_instances", _instances("i-200"), {"Filters": [_ids_filter(["i-200"])], "MaxResults": 1000})
+        
+        assert list(instances) == [{"InstanceId": "i-200"}]
+
+
+def test__load_entity():
+    entity, stubber = _entity()
+    
+    with stubber:
+        stubber.add_response(
+            "describe_instances", _instances("i-1"), {"Filters": [_ids_filter(["i-1"])], "MaxResults": 1000})
+        stubber.add_response(
+            "describe_instances", _instances(), {"Filters": [_ids_filter(["i-2"])], "MaxResults": 1000})
+        
+        assert entity.load_entity("i-1") == {"InstanceId": "i-1"}
+        
+        with pytest.raises(ValueError, match="i-2 not found"):
+            entity.load_entity("i-2")
+
+
+def test__get_entity_id():
+    assert AwsEc2Entity().get_entity_id({"InstanceId": "i-1"}) == "i-1"
+    
+    with pytest.raises(ValueError, match="InstanceId"):
+        AwsEc2Entity().get_entity_id({})
+
+
+def test__get_resource_values():
+    resource = {"InstanceId": "i-1", "Tags": [{"Key": "Role", "Value": "web"}, {"Key": "Name", "Value": "web-1"}]}
+    
+    assert AwsEc2Entity().get_resource_values(resource) == {"INSTANCE_ID": "i-1", "INSTANCE_NAME": "web-1"}
+
+
+def test__load_entities__missing_ids_skipped(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    
+    with mock_aws():
+        ec2 = boto3.client("ec2", region_name="us-east-1")
+        image_id = ec2.describe_images(Owners=["amazon"])["Images"][0]["ImageId"]
+        instances = ec2.run_instances(ImageId=image_id, MinCount=2, MaxCount=2)["Instances"]
+        ids = [instance["InstanceId"] for instance in instances]
+        
+        entity = AwsEc2Entity(ClientRegistry(region="us-east-1", api_tps={"ec2": 0}))
+        
+        loaded = entity.load_entities([ids[0], "i-0123456789abcdef0", ids[1]])
+        result = [entity.get_entity_id(instance) for instance in loaded]
+        
+        assert sorted(result) == sorted(ids)
+        
+        with pytest.raises(ValueError, match="i-0123456789abcdef0 not found"):
+            entity.load_entity("i-0123456789abcdef0")
+
+
+def test__clients__created_on_first_use():
+    with patch("alertalot.aws.client_registry.ClientRegistry") as registry_class:
+        entity = AwsEc2Entity()
+        
+        assert entity.get_resource_values({"InstanceId": "i-1"}) == {"INSTANCE_ID": "i-1"}
+        registry_class.assert_not_called()
+        
+        assert entity.clients is registry_class.return_value
+        assert entity.clients is registry_class.return_value
+        registry_class.assert_called_once_with()
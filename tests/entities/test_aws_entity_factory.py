@@ -18,9 +18,20 @@ def test__aws_entity_factory__from_args__with_ec2_id():
     assert isinstance(result, AwsEc2Entity)
 
 
+def test__aws_entity_factory__from_args__with_ec2_filters():
+    mock_args = Mock(spec=ArgsObject)
+    mock_args.ec2_id = None
+    mock_args.ec2_filters = [{"Name": "tag:Role", "Values": ["web"]}]
+    
+    result = AwsEntityFactory.from_args(mock_args)
+    
+    assert isinstance(result, AwsEc2Entity)
+
+
 def test__aws_entity_factory__from_args__with_no_ids():
     mock_args = Mock(spec=ArgsObject)
     mock_args.ec2_id = None
+    mock_args.ec2_filters = []
     
     result = AwsEntityFactory.from_args(mock_args)
     
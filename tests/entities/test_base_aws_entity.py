@@ -0,0 +1,50 @@
+from alertalot.entities.aws_ec2_entity import AwsEc2Entity
+
+
+def test__to_boto3_alarm__required_keys():
+    result = AwsEc2Entity().to_boto3_alarm({
+        "alarm-name": "cpu",
+        "comparison-operator": "GreaterThanThreshold",
+        "evaluation-periods": 2,
+        "metric-name": "CPUUtilization",
+        "period": 300,
+        "statistic": "Average",
+        "threshold": 70.0,
+    })
+    
+    assert result == {
+        "AlarmName": "cpu",
+        "ComparisonOperator": "GreaterThanThreshold",
+        "EvaluationPeriods": 2,
+        "MetricName": "CPUUtilization",
+        "Period": 300,
+        "Statistic": "Average",
+        "Threshold": 70.0,
+        "ActionsEnabled": False,
+    }
+
+
+def test__to_boto3_alarm__optional_keys():
+    result = AwsEc2Entity().to_boto3_alarm({
+        "alarm-name": "cpu",
+        "comparison-operator": "GreaterThanThreshold",
+        "evaluation-periods": 2,
+        "metric-name": "CPUUtilization",
+        "period": 300,
+        "statistic": "Average",
+        "threshold": 70.0,
+        "namespace": "AWS/EC2",
+        "alarm-actions": ["arn:aws:sns:us-east-1:1:a"],
+        "treat-missing-data": "breaching",
+        "unit": "Percent",
+        "tags": {"level": "info"},
+        "dimensions": {"InstanceId": "i-1"},
+    })
+    
+    assert result["Namespace"] == "AWS/EC2"
+    assert result["ActionsEnabled"] is True
+    assert result["AlarmActions"] == ["arn:aws:sns:us-east-1:1:a"]
+    assert result["TreatMissingData"] == "breaching"
+    assert result["Unit"] == "Percent"
+    assert result["Tags"] == [{"Key": "level", "Value": "info"}]
+    assert result["Dimensions"] == [{"Name": "InstanceId", "Value": "i-1"}]
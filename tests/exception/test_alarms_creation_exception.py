@@ -0,0 +1,20 @@
+from alertalot.exception.alarms_creation_exception import AlarmsCreationException
+
+
+def test__alarms_creation_exception__init():
+    failures = ["Alarm A: Throttling", "Alarm B: Access denied"]
+    
+    exception = AlarmsCreationException(failures)
+    
+    assert exception.failures == failures
+
+
+def test__alarms_creation_exception__str():
+    failures = ["Alarm A: Throttling", "Alarm B: Access denied"]
+    
+    exception = AlarmsCreationException(failures)
+    result = str(exception)
+    
+    assert "2 alarms" in result
+    assert "Alarm A: Throttling" in result
+    assert "Alarm B: Access denied" in result
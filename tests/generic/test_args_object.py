@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, patch, mock_open
 
 from alertalot.generic.args_object import ArgsObject
 
@@ -17,8 +17,13 @@ def test__init__basic_args():
     mock_args.template_file = "path/to/template.yaml"
     mock_args.region = None
     mock_args.ec2_id = "i-1234567890abcdef0"
+    mock_args.ec2_ids_file = None
+    mock_args.ec2_filters = [("tag:Role", ["web", "api"])]
     mock_args.variables = {"ENV": "prod", "APP": "test"}
     mock_args.strict = True
+    mock_args.max_in_flight = 5
+    mock_args.role_arn = "arn:aws:iam::123456789012:role/alertalot"
+    mock_args.api_tps = [("cloudwatch.PutMetricAlarm", 10.0)]
     
     
     args_obj = ArgsObject(mock_args)
@@ -36,8 +41,13 @@ def test__init__basic_args():
     assert args_obj.template_file == "path/to/template.yaml"
     assert args_obj.region is None
     assert args_obj.ec2_id == "i-1234567890abcdef0"
+    assert args_obj.ec2_ids == ["i-1234567890abcdef0"]
+    assert args_obj.ec2_filters == [{"Name": "tag:Role", "Values": ["web", "api"]}]
     assert args_obj.variables == {"ENV": "prod", "APP": "test"}
     assert args_obj.is_strict is True
+    assert args_obj.max_in_flight == 5
+    assert args_obj.role_arn == "arn:aws:iam::123456789012:role/alertalot"
+    assert args_obj.api_tps == {"cloudwatch.PutMetricAlarm": 10.0}
 
 
 @patch('boto3.setup_default_session')
@@ -51,7 +61,7 @@ def test__init__with_region(mock_setup_session):
     
     
     assert args_obj.region == "us-west-2"
-    mock_setup_session.assert_called_once_with(region_name="us-west-2")
+    mock_setup_session.assert_not_called()
 
 
 def test__variables_conversion():
@@ -65,3 +75,218 @@ def test__variables_conversion():
     
     assert isinstance(args_obj.variables, dict)
     assert args_obj.variables == {"key1": "value1", "key2": "value2"}
+
+
+def test__clients():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.region = None
+    mock_args.role_arn = None
+    mock_args.max_in_flight = 25
+    mock_args.api_tps = [("ec2", 50.0)]
+    
+    
+    args_obj = ArgsObject(mock_args)
+    
+    
+    clients = args_obj.clients
+    
+    assert args_obj.clients is clients
+    assert clients.region is None
+    assert clients.role_arn is None
+    assert clients.client("sts", region="us-east-1").meta.config.max_pool_connections == 25
+    assert clients.limiter(region="us-east-1").bucket_for("ec2.DescribeInstances").rate == 50.0
+
+
+def test__ec2_ids__from_list_and_file():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.region = None
+    mock_args.ec2_id = ["i-1", "i-2", "i-1"]
+    mock_args.ec2_ids_file = "ids.txt"
+    
+    
+    with patch("builtins.open", mock_open(read_data="i-3\n\n  i-2  \n# comment\ni-4 # web\n")):
+        args_obj = ArgsObject(mock_args)
+        
+        assert args_obj.ec2_ids == ["i-1", "i-2", "i-3", "i-4"]
+        assert args_obj.ec2_id == "i-1"
+
+
+def test__ec2_ids__none_provided():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.region = None
+    mock_args.ec2_id = None
+    mock_args.ec2_ids_file = None
+    mock_args.ec2_filters = []
+    
+    
+    args_obj = ArgsObject(mock_args)
+    
+    
+    assert args_obj.ec2_ids == []
+    assert args_obj.ec2_id is None
+    assert args_obj.ec2_filters == []
+
+
+def test__regions__list():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.region = "all, us-east-1,eu-west-1,us-east-1"
+    
+    with patch("boto3.setup_default_session"):
+        args_obj = ArgsObject(mock_args)
+    
+    assert args_obj.regions == ["all", "us-east-1", "eu-west-1"]
+    assert args_obj.region == "us-east-1"
+
+
+def test__for_region():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.region = "us-east-1,eu-west-1"
+    mock_args.role_arn = None
+    mock_args.max_in_flight = 10
+    mock_args.api_tps = []
+    
+    with patch("boto3.setup_default_session"):
+        args_obj = ArgsObject(mock_args)
+        regional = args_obj.for_region("eu-west-1")
+    
+    assert regional.region == "eu-west-1"
+    assert regional.regions == ["eu-west-1"]
+    assert regional.clients.region == "eu-west-1"
+    assert regional.clients.limiter() is args_obj.clients.limiter(region="eu-west-1")
+    assert args_obj.region == "us-east-1"
+    assert args_obj.regions == ["us-east-1", "eu-west-1"]
+
+
+def test__journal_file():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.region = None
+    mock_args.journal = "journal.jsonl"
+    mock_args.resume = None
+    
+    args_obj = ArgsObject(mock_args)
+    
+    assert args_obj.journal_file == "journal.jsonl"
+    assert args_obj.is_resume is False
+    
+    mock_args.resume = "previous.jsonl"
+    
+    assert args_obj.journal_file == "previous.jsonl"
+    assert args_obj.is_resume is True
+
+
+def test__plan_and_apply():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.region = None
+    mock_args.plan = "out.plan"
+    mock_args.apply = None
+    mock_args.shard = (1, 4)
+    
+    args_obj = ArgsObject(mock_args)
+    
+    assert args_obj.plan_file == "out.plan"
+    assert args_obj.apply_file is None
+    assert args_obj.shard == (1, 4)
+
+
+def test__backend():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.region = None
+    mock_args.backend = "emulator"
+    mock_args.dry_run = False
+    mock_args.emulator_latency = 0.1
+    mock_args.emulator_throttle_rate = 0.2
+    mock_args.record_file = "records.jsonl"
+    
+    args_obj = ArgsObject(mock_args)
+    
+    assert args_obj.backend == "emulator"
+    assert args_obj.emulator_latency == 0.1
+    assert args_obj.emulator_throttle_rate == 0.2
+    assert args_obj.record_file == "records.jsonl"
+    
+    mock_args.dry_run = True
+    
+    assert args_obj.backend == "recorder"
+
+
+def test__serve():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.serve = True
+    mock_args.socket = "/tmp/alertalot.sock"
+    
+    args_obj = ArgsObject(mock_args)
+    
+    assert args_obj.is_serve
+    assert args_obj.socket_path == "/tmp/alertalot.sock"
+
+
+def test__with_clients():
+    mock_args = Mock()
+    mock_args.variables = {"a": "b"}
+    clients = Mock()
+    
+    args_obj = ArgsObject(mock_args).with_clients(clients)
+    
+    assert args_obj.clients is clients
+    assert args_obj.variables == {"a": "b"}
+
+
+def test__sync_file():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.sync = "sync.json"
+    
+    assert ArgsObject(mock_args).sync_file == "sync.json"
+
+
+def test__profile():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.profile = True
+    mock_args.profile_file = "run.prof"
+    mock_args.tracemalloc_file = None
+    
+    args = ArgsObject(mock_args)
+    
+    assert args.is_profile
+    assert args.profile_file == "run.prof"
+    assert args.tracemalloc_file is None
+
+
+def test__metrics_files():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.metrics_file = "metrics.json"
+    mock_args.metrics_textfile = None
+    
+    args = ArgsObject(mock_args)
+    
+    assert args.metrics_file == "metrics.json"
+    assert args.metrics_textfile is None
+
+
+def test__output_format():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.output_format = "jsonl"
+    
+    args = ArgsObject(mock_args)
+    
+    assert args.output_format == "jsonl"
+
+
+def test__ignore_inputs_hash():
+    mock_args = Mock()
+    mock_args.variables = {}
+    mock_args.ignore_inputs_hash = True
+    
+    assert ArgsObject(mock_args).ignore_inputs_hash
@@ -0,0 +1,94 @@
+import time
+import threading
+
+import pytest
+
+from alertalot.generic.concurrent_executor import ConcurrentExecutor, TaskResult
+
+
+def test__task_result__success():
+    result = TaskResult("a", result=12, runtime=1.5)
+    
+    assert result.name == "a"
+    assert result.result == 12
+    assert result.error is None
+    assert result.runtime == 1.5
+    assert result.is_success is True
+
+
+def test__task_result__failure():
+    error = ValueError("failed")
+    result = TaskResult("a", error=error)
+    
+    assert result.result is None
+    assert result.error is error
+    assert result.is_success is False
+
+
+def test__init__invalid_max_in_flight():
+    with pytest.raises(ValueError, match="at least 1"):
+        ConcurrentExecutor(0)
+
+
+def test__run__empty_tasks():
+    assert not ConcurrentExecutor(4).run([])
+
+
+def test__run__results_returned_in_order():
+    executor = ConcurrentExecutor(4)
+    tasks = [(str(i), lambda i=i: i * 2) for i in range(20)]
+    
+    results = executor.run(tasks)
+    
+    assert [result.name for result in results] == [str(i) for i in range(20)]
+    assert [result.result for result in results] == [i * 2 for i in range(20)]
+
+
+def test__run__failure_does_not_stop_other_tasks():
+    def fail():
+        raise RuntimeError("Throttling")
+    
+    executor = ConcurrentExecutor(2)
+    
+    results = executor.run([("a", lambda: 1), ("b", fail), ("c", lambda: 3)])
+    
+    assert results[0].is_success
+    assert not results[1].is_success
+    assert str(results[1].error) == "Throttling"
+    assert results[2].result == 3
+
+
+def test__run__max_in_flight_respected():
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+    
+    def task():
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        
+        time.sleep(0.01)
+        
+        with lock:
+            running[0] -= 1
+    
+    executor = ConcurrentExecutor(3)
+    
+    executor.run((str(i), task) for i in range(20))
+    
+    assert 1 <= peak[0] <= 3
+
+
+def test__run__tasks_generator_consumed_lazily():
+    consumed = []
+    
+    def tasks():
+        for i in range(5):
+            consumed.append(i)
+            yield str(i), lambda: None
+    
+    results = ConcurrentExecutor(1).run(tasks())
+    
+    assert consumed == [0, 1, 2, 3, 4]
+    assert len(results) == 5
@@ -0,0 +1,108 @@
+import gzip
+import json
+
+from unittest.mock import Mock
+
+import pytest
+
+from alertalot.generic.execution_plan import ExecutionPlan
+
+
+TARGETS = {"i-1": {"INSTANCE_ID": "i-1"}, "i-2": {"INSTANCE_ID": "i-2"}}
+ALARMS = [
+    ("i-1", {"AlarmName": "cpu-1", "Threshold": 75.0}),
+    ("i-1", {"AlarmName": "disk-1", "Threshold": 90.0}),
+    ("i-2", {"AlarmName": "cpu-2", "Threshold": 75.0}),
+]
+
+
+def test__add_region():
+    plan = ExecutionPlan("hash")
+    plan.add_region("us-east-1", TARGETS, ALARMS)
+    plan.add_region("eu-west-1", {}, [])
+    
+    assert plan.regions == ["us-east-1", "eu-west-1"]
+    assert plan.targets("us-east-1") == TARGETS
+    assert plan.alarms("us-east-1") == ALARMS
+    assert plan.alarms("eu-west-1") == []
+    assert plan.alarms("ap-south-1") == []
+    assert len(plan) == 3
+
+
+def test__alarms__shards():
+    plan = ExecutionPlan("hash")
+    plan.add_region("us-east-1", TARGETS, ALARMS)
+    
+    shards = [plan.alarms("us-east-1", (index, 2)) for index in range(2)]
+    
+    assert shards == [[ALARMS[0], ALARMS[2]], [ALARMS[1]]]
+
+
+def test__save_and_load(tmp_path):
+    path = str(tmp_path / "out.plan")
+    plan = ExecutionPlan("hash", "2025-01-01T00:00:00+00:00")
+    plan.add_region("us-east-1", TARGETS, ALARMS)
+    
+    plan.save(path)
+    loaded = ExecutionPlan.load(path)
+    
+    assert loaded.inputs_hash == "hash"
+    assert loaded.created_at == "2025-01-01T00:00:00+00:00"
+    assert loaded.regions == ["us-east-1"]
+    assert loaded.targets("us-east-1") == TARGETS
+    assert loaded.alarms("us-east-1") == ALARMS
+
+
+def test__load__unsupported_version(tmp_path):
+    path = tmp_path / "out.plan"
+    
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump({"version": 999, "regions": {}}, f)
+    
+    with pytest.raises(ValueError, match="unsupported version"):
+        ExecutionPlan.load(str(path))
+
+
+def test__load__not_a_plan(tmp_path):
+    path = tmp_path / "out.plan"
+    path.write_text("not a plan", encoding="utf-8")
+    
+    with pytest.raises(ValueError, match="not a valid plan file"):
+        ExecutionPlan.load(str(path))
+
+
+def test__hash_inputs(tmp_path):
+    file = tmp_path / "vars.yaml"
+    file.write_text("params: {}", encoding="utf-8")
+    
+    first = ExecutionPlan.hash_inputs([str(file)], {"regions": ["us-east-1"]})
+    
+    assert first == ExecutionPlan.hash_inputs([str(file)], {"regions": ["us-east-1"]})
+    assert first != ExecutionPlan.hash_inputs([str(file)], {"regions": ["eu-west-1"]})
+    
+    file.write_text("params: {global: {}}", encoding="utf-8")
+    
+    assert first != ExecutionPlan.hash_inputs([str(file)], {"regions": ["us-east-1"]})
+
+
+def test__hash_run_inputs(tmp_path):
+    variables = tmp_path / "vars.yaml"
+    variables.write_text("params: {}", encoding="utf-8")
+    template = tmp_path / "template.yaml"
+    template.write_text("alarms: []", encoding="utf-8")
+    
+    run_args = Mock()
+    run_args.var_files = [str(variables)]
+    run_args.template_file = str(template)
+    run_args.variables = {"A": "b"}
+    run_args.role_arn = None
+    run_args.ec2_ids = ["i-1"]
+    run_args.ec2_filters = []
+    
+    first = ExecutionPlan.hash_run_inputs(run_args, ["us-east-1", "eu-west-1"])
+    
+    assert first == ExecutionPlan.hash_run_inputs(run_args, ["eu-west-1", "us-east-1"])
+    
+    run_args.ec2_ids = ["i-2"]
+    
+    assert first != ExecutionPlan.hash_run_inputs(run_args, ["us-east-1", "eu-west-1"])
@@ -0,0 +1,102 @@
+import os
+
+from unittest.mock import Mock
+
+from alertalot.generic.file_cache import FileCache
+
+
+def _write(path, content: str, mtime_ns: int | None = None) -> str:
+    path.write_text(content, encoding="utf-8")
+    
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    
+    return str(path)
+
+
+def test__load__parses_once(tmp_path):
+    cache = FileCache(str(tmp_path / "cache"))
+    file = _write(tmp_path / "a.yaml", "a: 1")
+    parse = Mock(return_value={"a": 1})
+    
+    assert cache.load(file, parse) == {"a": 1}
+    assert cache.load(file, parse) == {"a": 1}
+    assert FileCache(str(tmp_path / "cache")).load(file, parse) == {"a": 1}
+    
+    parse.assert_called_once_with(os.path.abspath(file))
+
+
+def test__load__same_content_new_mtime(tmp_path):
+    cache = FileCache(str(tmp_path / "cache"))
+    file = _write(tmp_path / "a.yaml", "a: 1", mtime_ns=1_000_000_000)
+    parse = Mock(return_value={"a": 1})
+    
+    cache.load(file, parse)
+    _write(tmp_path / "a.yaml", "a: 1", mtime_ns=2_000_000_000)
+    
+    assert cache.load(file, parse) == {"a": 1}
+    parse.assert_called_once()
+
+
+def test__load__modified_file(tmp_path):
+    cache = FileCache(str(tmp_path / "cache"))
+    file = _write(tmp_path / "a.yaml", "a: 1", mtime_ns=1_000_000_000)
+    
+    cache.load(file, Mock(return_value={"a": 1}))
+    _write(tmp_path / "a.yaml", "a: 2", mtime_ns=2_000_000_000)
+    
+    assert cache.load(file, Mock(return_value={"a": 2})) == {"a": 2}
+
+
+def test__load__corrupted_entry(tmp_path):
+    cache = FileCache(str(tmp_path / "cache"))
+    file = _write(tmp_path / "a.yaml", "a: 1")
+    
+    cache.load(file, Mock(return_value={"a": 1}))
+    
+    for name in os.listdir(cache.directory):
+        with open(os.path.join(cache.directory, name), "wb") as f:
+            f.write(b"not a pickle")
+    
+    assert cache.load(file, Mock(return_value={"a": 3})) == {"a": 3}
+
+
+def test__load__evicts_least_recently_used(tmp_path):
+    first = _write(tmp_path / "a.yaml", "a: 1")
+    second = _write(tmp_path / "b.yaml", "b: 1")
+    
+    FileCache(str(tmp_path / "cache")).load(first, Mock(return_value={"a": 1}))
+    entry_size = sum(entry.stat().st_size for entry in (tmp_path / "cache").iterdir())
+    
+    cache = FileCache(str(tmp_path / "cache"), max_size=entry_size + entry_size // 2)
+    cache.load(second, Mock(return_value={"b": 1}))
+    
+    assert len(os.listdir(cache.directory)) == 1
+    
+    parse = Mock(return_value={"b": 1})
+    cache.load(second, parse)
+    
+    parse.assert_not_called()
+
+
+def test__clear(tmp_path):
+    cache = FileCache(str(tmp_path / "cache"))
+    file = _write(tmp_path / "a.yaml", "a: 1")
+    
+    cache.load(file, Mock(return_value={"a": 1}))
+    cache.clear()
+    
+    assert not os.listdir(cache.directory)
+
+
+def test__default():
+    cache = Mock()
+    
+    try:
+        FileCache.set_default(cache)
+        
+        assert FileCache.default() is cache
+    finally:
+        FileCache.set_default(None)
+    
+    assert FileCache.default() is None
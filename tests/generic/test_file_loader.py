@@ -4,7 +4,8 @@ import json
 import yaml
 import pytest
 
-from alertalot.generic.file_loader import load, load_yaml, load_json
+from alertalot.generic.file_cache import FileCache
+from alertalot.generic.file_loader import load, load_yaml, load_json, iter_documents
 
 
 def test__load_yaml__valid_yaml():
@@ -123,3 +124,54 @@ def test__load_json__empty_file():
     with patch('builtins.open', mock_open(read_data='')):
         with pytest.raises(json.JSONDecodeError):
             load_json('empty.json')
+
+
+def test__load__cached(tmp_path):
+    path = tmp_path / "file.yaml"
+    path.write_text("key: value", encoding="utf-8")
+    
+    try:
+        FileCache.set_default(FileCache(str(tmp_path / "cache")))
+        
+        assert load(str(path)) == {"key": "value"}
+        
+        with patch('alertalot.generic.file_loader.load_yaml') as mock_load_yaml:
+            assert load(str(path)) == {"key": "value"}
+        
+        mock_load_yaml.assert_not_called()
+    finally:
+        FileCache.set_default(None)
+
+
+def test__iter_documents__multi_document_yaml(tmp_path):
+    path = tmp_path / "file.yaml"
+    path.write_text("a: 1\n---\nb: 2\n---\n- c\n", encoding="utf-8")
+    
+    documents = iter_documents(str(path))
+    
+    assert next(documents) == {"a": 1}
+    assert list(documents) == [{"b": 2}, ["c"]]
+
+
+def test__iter_documents__json_lines(tmp_path):
+    path = tmp_path / "file.jsonl"
+    path.write_text('{"a": 1}\n\n{"b": 2}\n', encoding="utf-8")
+    
+    assert list(iter_documents(str(path))) == [{"a": 1}, {"b": 2}]
+    
+    path.write_text('{"a": 1}\n{"b": \n', encoding="utf-8")
+    
+    with pytest.raises(ValueError, match="line 2"):
+        list(iter_documents(str(path)))
+
+
+def test__iter_documents__json(tmp_path):
+    path = tmp_path / "file.json"
+    path.write_text('{"alarms": []}', encoding="utf-8")
+    
+    assert list(iter_documents(str(path))) == [{"alarms": []}]
+
+
+def test__iter_documents__unsupported_extension():
+    with pytest.raises(ValueError, match="Unsupported file extension"):
+        list(iter_documents("file.txt"))
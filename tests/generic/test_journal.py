@@ -0,0 +1,110 @@
+import json
+import threading
+
+import pytest
+
+from alertalot.generic.journal import Journal
+
+
+REQUEST = {"AlarmName": "cpu", "Threshold": 75.0, "Dimensions": [{"Name": "InstanceId", "Value": "i-1"}]}
+
+
+def test__content_hash__stable():
+    reordered = {"Dimensions": [{"Value": "i-1", "Name": "InstanceId"}], "Threshold": 75.0, "AlarmName": "cpu"}
+    
+    assert Journal.content_hash(REQUEST) == Journal.content_hash(reordered)
+    assert Journal.content_hash(REQUEST) != Journal.content_hash(REQUEST | {"Threshold": 80.0})
+    assert len(Journal.content_hash(REQUEST)) == 64
+
+
+def test__record__appends_lines(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    
+    with Journal(str(path)) as journal:
+        journal.record("us-east-1", "i-1", "cpu", "abc", "create")
+        journal.record("us-east-1", "i-2", "cpu-2", "def", "unchanged")
+        
+        assert journal.is_completed("us-east-1", "i-1", "cpu", "abc")
+        assert len(journal) == 2
+    
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    
+    assert [line["alarm"] for line in lines] == ["cpu", "cpu-2"]
+    assert lines[0]["region"] == "us-east-1"
+    assert lines[0]["target"] == "i-1"
+    assert lines[0]["hash"] == "abc"
+    assert lines[0]["change"] == "create"
+
+
+def test__record__not_open(tmp_path):
+    journal = Journal(str(tmp_path / "journal.jsonl"))
+    
+    with pytest.raises(RuntimeError, match="not open"):
+        journal.record("us-east-1", "i-1", "cpu", "abc", "create")
+
+
+def test__resume__skips_completed_with_same_hash(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    
+    with Journal(str(path)) as journal:
+        journal.record("us-east-1", "i-1", "cpu", "abc", "create")
+        journal.record("us-east-1", "i-2", "cpu-2", "def", "create")
+    
+    with Journal(str(path), resume=True) as journal:
+        assert len(journal) == 2
+        assert journal.is_completed("us-east-1", "i-1", "cpu", "abc")
+        assert not journal.is_completed("us-east-1", "i-1", "cpu", "changed")
+        assert not journal.is_completed("eu-west-1", "i-1", "cpu", "abc")
+        
+        journal.record("us-east-1", "i-3", "cpu-3", "ghi", "create")
+    
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test__resume__without_resume_ignores_existing(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    
+    with Journal(str(path)) as journal:
+        journal.record("us-east-1", "i-1", "cpu", "abc", "create")
+    
+    assert not Journal(str(path)).is_completed("us-east-1", "i-1", "cpu", "abc")
+
+
+def test__resume__missing_file(tmp_path):
+    journal = Journal(str(tmp_path / "missing.jsonl"), resume=True)
+    
+    assert len(journal) == 0
+
+
+def test__resume__ignores_truncated_line(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    path.write_text(
+        '{"region": "us-east-1", "target": "i-1", "alarm": "cpu", "hash": "abc", "change": "create"}\n'
+        '{"region": "us-east-1", "target": "i-2", "al',
+        encoding="utf-8")
+    
+    journal = Journal(str(path), resume=True)
+    
+    assert len(journal) == 1
+    assert journal.is_completed("us-east-1", "i-1", "cpu", "abc")
+
+
+def test__record__concurrent(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    
+    with Journal(str(path)) as journal:
+        threads = [
+            threading.Thread(target=lambda n=n: journal.record("us-east-1", f"i-{n}", f"cpu-{n}", "abc", "create"))
+            for n in range(50)
+        ]
+        
+        for thread in threads:
+            thread.start()
+        
+        for thread in threads:
+            thread.join()
+    
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    
+    assert len(lines) == 50
+    assert {line["alarm"] for line in lines} == {f"cpu-{n}" for n in range(50)}
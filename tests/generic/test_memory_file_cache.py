@@ -0,0 +1,80 @@
+import os
+
+from unittest.mock import Mock
+
+from alertalot.generic.memory_file_cache import MemoryFileCache
+
+
+def _write(path, content: str, mtime_ns: int | None = None) -> str:
+    path.write_text(content, encoding="utf-8")
+    
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    
+    return str(path)
+
+
+def test__load__parses_once(tmp_path):
+    cache = MemoryFileCache()
+    file = _write(tmp_path / "a.yaml", "a: 1")
+    parse = Mock(return_value={"a": 1})
+    
+    first = cache.load(file, parse)
+    
+    assert cache.load(file, parse) is first
+    parse.assert_called_once_with(os.path.abspath(file))
+
+
+def test__load__modified_file(tmp_path):
+    cache = MemoryFileCache()
+    file = _write(tmp_path / "a.yaml", "a: 1", mtime_ns=1_000_000_000)
+    parse = Mock(side_effect=[{"a": 1}, {"a": 2}])
+    
+    cache.load(file, parse)
+    _write(tmp_path / "a.yaml", "a: 2", mtime_ns=2_000_000_000)
+    
+    assert cache.load(file, parse) == {"a": 2}
+    assert parse.call_count == 2
+
+
+def test__load__uses_backing_cache(tmp_path):
+    backing = Mock()
+    backing.load.return_value = {"a": 1}
+    cache = MemoryFileCache(backing)
+    file = _write(tmp_path / "a.yaml", "a: 1")
+    parse = Mock()
+    
+    assert cache.load(file, parse) == {"a": 1}
+    assert cache.load(file, parse) == {"a": 1}
+    
+    backing.load.assert_called_once_with(os.path.abspath(file), parse)
+    parse.assert_not_called()
+
+
+def test__load__evicts_least_recently_used(tmp_path):
+    cache = MemoryFileCache(max_entries=2)
+    files = [_write(tmp_path / f"{name}.yaml", name) for name in ("a", "b", "c")]
+    parse = Mock(side_effect=lambda path: path)
+    
+    cache.load(files[0], parse)
+    cache.load(files[1], parse)
+    cache.load(files[0], parse)
+    cache.load(files[2], parse)
+    parse.reset_mock()
+    
+    cache.load(files[0], parse)
+    cache.load(files[1], parse)
+    
+    parse.assert_called_once_with(os.path.abspath(files[1]))
+
+
+def test__clear(tmp_path):
+    cache = MemoryFileCache()
+    file = _write(tmp_path / "a.yaml", "a: 1")
+    parse = Mock(return_value={"a": 1})
+    
+    cache.load(file, parse)
+    cache.clear()
+    cache.load(file, parse)
+    
+    assert parse.call_count == 2
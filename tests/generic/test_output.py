@@ -0,0 +1,100 @@
+import io
+import json
+
+import pytest
+
+from alertalot.generic.output import Output, OutputLevel
+
+
+class _Terminal(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+def _events(stream: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test__init__unknown_format():
+    with pytest.raises(ValueError):
+        Output(output_format="html")
+
+
+def test__init__auto_format():
+    assert Output(output_format="auto", stream=io.StringIO()).output_format == "plain"
+    assert Output(output_format="auto", stream=_Terminal()).output_format == "rich"
+
+
+def test__jsonl__events():
+    stream = io.StringIO()
+    output = Output(is_verbose=True, output_format="jsonl", stream=stream)
+    
+    output.print_step("Putting alarms...")
+    output.print_success("Alarm \"a\" create", alarm="a", result="create")
+    output.print_failure("[bold]Alarm[/bold] \"b\" failed", level=OutputLevel.QUITE, alarm="b")
+    output.print_line()
+    output.print_key_value({"Created": 1}, title="Summary")
+    output.print_table(["Phase", "Count"], [["render", 2]])
+    output.print_yaml({"AlarmName": "a"})
+    
+    events = _events(stream)
+    
+    assert [event.pop("time") > 0 for event in events] == [True] * 6
+    assert events == [
+        {"event": "step", "text": "Putting alarms..."},
+        {"event": "success", "text": "Alarm \"a\" create", "alarm": "a", "result": "create"},
+        {"event": "failure", "text": "Alarm \"b\" failed", "alarm": "b"},
+        {"event": "values", "title": "Summary", "values": {"Created": "1"}},
+        {"event": "table", "rows": [{"Phase": "render", "Count": "2"}]},
+        {"event": "data", "data": {"AlarmName": "a"}},
+    ]
+
+
+def test__jsonl__levels():
+    stream = io.StringIO()
+    output = Output(is_quiet=True, output_format="jsonl", stream=stream)
+    
+    output.print_step("Hidden", level=OutputLevel.NORMAL)
+    output.print_error(ValueError("Invalid"), level=OutputLevel.QUITE)
+    
+    events = _events(stream)
+    
+    assert len(events) == 1
+    assert events[0]["event"] == "error"
+    assert events[0]["text"] == "Invalid"
+    assert events[0]["type"] == "ValueError"
+
+
+def test__plain__text():
+    stream = io.StringIO()
+    output = Output(is_verbose=True, output_format="plain", stream=stream)
+    
+    output.print_step("Loading")
+    output.print_success("[bold]Files[/bold] loaded")
+    output.print_key_value({"Region": "us-east-1"}, title="Arguments")
+    output.print_table(["Phase", "Count"], [["variables", 1], ["render", 12]])
+    output.spinner(lambda: None, with_time=False)
+    output.print_yaml({"AlarmName": "a"})
+    
+    assert stream.getvalue() == (
+        "➤ Loading\n"
+        "\n"
+        "✓ Files loaded\n"
+        "Arguments\n"
+        "  Region: us-east-1\n"
+        "Phase      Count\n"
+        "variables  1\n"
+        "render     12\n"
+        "AlarmName: a\n"
+    )
+
+
+def test__quiet__keeps_format():
+    stream = io.StringIO()
+    output = Output(is_verbose=True, output_format="jsonl", stream=stream).quiet()
+    
+    output.print_success("Hidden")
+    output.print_failure("Shown", level=OutputLevel.QUITE)
+    
+    assert output.output_format == "jsonl"
+    assert [event["text"] for event in _events(stream)] == ["Shown"]
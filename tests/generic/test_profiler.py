@@ -0,0 +1,91 @@
+import boto3
+import pytest
+
+from botocore.stub import Stubber
+
+from alertalot.generic.profiler import Profiler
+
+
+class _Clock:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _reset_default():
+    yield
+    Profiler.set_default(None)
+
+
+def test__span__without_default():
+    with Profiler.span("variables"):
+        pass
+    
+    assert Profiler.default() is None
+
+
+def test__span__records_with_default():
+    clock = _Clock()
+    profiler = Profiler(clock)
+    Profiler.set_default(profiler)
+    
+    with Profiler.span("variables"):
+        clock.now += 0.5
+    
+    with pytest.raises(ValueError):
+        with Profiler.span("variables"):
+            clock.now += 0.25
+            raise ValueError()
+    
+    assert profiler.durations("variables") == [0.5, 0.25]
+    assert not profiler.durations("targets")
+
+
+def test__summary():
+    clock = _Clock()
+    profiler = Profiler(clock)
+    
+    for i in range(1, 101):
+        profiler.record("render", i / 1000)
+    
+    profiler.record("variables", 2.5)
+    clock.now = 3
+    
+    assert profiler.summary() == [
+        ["render", "100", "5.05s", "50.0ms", "95.0ms", "100.0ms"],
+        ["variables", "1", "2.50s", "2.50s", "2.50s", "2.50s"],
+        ["Wall time", "", "3.00s", "", "", ""],
+    ]
+
+
+def test__percentile():
+    assert Profiler.percentile([], 50) == 0.0
+    assert Profiler.percentile([1.0], 95) == 1.0
+    assert Profiler.percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+    assert Profiler.percentile([1.0, 2.0, 3.0, 4.0], 95) == 4.0
+
+
+def test__format_duration():
+    assert Profiler.format_duration(0.0123) == "12.3ms"
+    assert Profiler.format_duration(12.345) == "12.35s"
+
+
+def test__attach__records_aws_calls():
+    client = boto3.client("sts", region_name="us-east-1", aws_access_key_id="a", aws_secret_access_key="b")
+    Profiler.attach(client)
+    
+    with Stubber(client) as stubber:
+        stubber.add_response("get_caller_identity", {"Account": "123456789012"})
+        stubber.add_response("get_caller_identity", {"Account": "123456789012"})
+        
+        client.get_caller_identity()
+        
+        profiler = Profiler()
+        Profiler.set_default(profiler)
+        
+        client.get_caller_identity()
+    
+    assert len(profiler.durations("aws:sts.GetCallerIdentity")) == 1
@@ -0,0 +1,122 @@
+import json
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from alertalot.generic.sync_state import SyncState
+
+
+FILTERS = [{"Name": "tag:env", "Values": ["prod"]}]
+T0 = datetime(2024, 1, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def test__load__missing_file(tmp_path):
+    state = SyncState.load(str(tmp_path / "sync.json"))
+    
+    assert state.since("us-east-1", FILTERS) is None
+    assert state.watermark("us-east-1") is None
+    assert state.is_new("us-east-1", FILTERS, "i-1", T0)
+
+
+def test__load__invalid_file(tmp_path):
+    path = tmp_path / "sync.json"
+    path.write_text("[]", encoding="utf-8")
+    
+    with pytest.raises(ValueError):
+        SyncState.load(str(path))
+
+
+def test__load__other_version(tmp_path):
+    path = tmp_path / "sync.json"
+    path.write_text(json.dumps({"version": 0, "regions": {"us-east-1": {}}}), encoding="utf-8")
+    
+    assert SyncState.load(str(path)).since("us-east-1", FILTERS) is None
+
+
+def test__save__round_trip(tmp_path):
+    path = str(tmp_path / "sync.json")
+    state = SyncState.load(path)
+    
+    state.stage("us-east-1", FILTERS, [("i-1", T0), ("i-2", T0 - timedelta(minutes=10))])
+    state.save()
+    
+    loaded = SyncState.load(path)
+    
+    assert loaded.watermark("us-east-1") == T0
+    assert loaded.since("us-east-1", FILTERS) == T0 - SyncState.SAFETY_MARGIN
+    assert loaded.watermark("eu-west-1") is None
+
+
+def test__stage__not_applied_before_save(tmp_path):
+    state = SyncState.load(str(tmp_path / "sync.json"))
+    
+    state.stage("us-east-1", FILTERS, [("i-1", T0)])
+    
+    assert state.watermark("us-east-1") is None
+    assert not (tmp_path / "sync.json").exists()
+
+
+def test__is_new(tmp_path):
+    state = SyncState.load(str(tmp_path / "sync.json"))
+    state.stage("us-east-1", FILTERS, [("i-1", T0)])
+    state.save()
+    
+    assert not state.is_new("us-east-1", FILTERS, "i-1", T0)
+    assert state.is_new("us-east-1", FILTERS, "i-2", T0)
+    assert state.is_new("us-east-1", FILTERS, "i-3", T0 - timedelta(minutes=30))
+    assert not state.is_new("us-east-1", FILTERS, "i-4", T0 - timedelta(hours=2))
+    assert state.is_new("us-east-1", [], "i-1", T0)
+
+
+def test__stage__prunes_known_instances(tmp_path):
+    path = str(tmp_path / "sync.json")
+    state = SyncState.load(path)
+    state.stage("us-east-1", FILTERS, [("i-1", T0), ("i-2", T0 + timedelta(minutes=30))])
+    state.save()
+    
+    state.stage("us-east-1", FILTERS, [("i-3", T0 + timedelta(hours=3))])
+    state.save()
+    
+    with open(path, "r", encoding="utf-8") as f:
+        content = json.load(f)
+    
+    assert list(content["regions"]["us-east-1"]["known"]) == ["i-3"]
+    assert state.watermark("us-east-1") == T0 + timedelta(hours=3)
+
+
+def test__stage__keeps_watermark_without_new_instances(tmp_path):
+    state = SyncState.load(str(tmp_path / "sync.json"))
+    state.stage("us-east-1", FILTERS, [("i-1", T0)])
+    state.save()
+    
+    state.stage("us-east-1", FILTERS, [])
+    state.save()
+    
+    assert state.watermark("us-east-1") == T0
+
+
+def test__stage__filters_changed(tmp_path):
+    state = SyncState.load(str(tmp_path / "sync.json"))
+    state.stage("us-east-1", FILTERS, [("i-1", T0)])
+    state.save()
+    
+    state.stage("us-east-1", [], [("i-2", T0 - timedelta(days=1))])
+    state.save()
+    
+    assert state.watermark("us-east-1") == T0 - timedelta(days=1)
+    assert state.since("us-east-1", FILTERS) is None
+
+
+def test__launch_time_filter():
+    since = datetime(2024, 1, 9, 23, 0, tzinfo=timezone.utc)
+    
+    assert SyncState.launch_time_filter(since, now=T0) == {
+        "Name": "launch-time",
+        "Values": ["2024-01-09T*", "2024-01-10T*"],
+    }
+
+
+def test__launch_time_filter__too_many_days():
+    assert SyncState.launch_time_filter(T0 - timedelta(days=40), now=T0) is None
+    assert SyncState.launch_time_filter(T0 - timedelta(days=3), now=T0, max_days=3) is None
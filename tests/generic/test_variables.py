@@ -1,5 +1,9 @@
+from collections import ChainMap
+
 import pytest
 
+from jsonschema import ValidationError
+
 from alertalot.generic.variables import *
 
 
@@ -123,3 +127,104 @@ def test__substitute_variables__empty_set():
     
     with pytest.raises(KeyError, match="Variable 'SERVICE' not found in parameters."):
         parameters.substitute("$SERVICE")
+
+
+def test__references():
+    assert Variables.references("") == set()
+    assert Variables.references("No variables here.") == set()
+    assert Variables.references("$A / $B_1 / $A") == {"A", "B_1"}
+    assert Variables.references("$SERVICE-CPU") == {"SERVICE"}
+
+
+def test__substitute_variables__missing_kept_when_not_failing():
+    parameters = Variables({"A": "1"})
+    
+    assert parameters.substitute("$A-$B-$A", fail_if_missing=False) == "1-$B-1"
+    assert parameters.substitute("$", fail_if_missing=False) == "$"
+    assert parameters.substitute("$$A") == "$1"
+
+
+def test__substitute_variables__same_template_other_values():
+    first = Variables({"INSTANCE_ID": "i-1"})
+    second = Variables({"INSTANCE_ID": "i-2"})
+    
+    for _ in range(3):
+        assert first.substitute("cpu / $INSTANCE_ID") == "cpu / i-1"
+        assert second.substitute("cpu / $INSTANCE_ID") == "cpu / i-2"
+    
+    assert second.substitute("No variables here.") == "No variables here."
+
+
+def test__overlay():
+    base = Variables({"REGION": "us-east-1", "SERVICE": "backend"})
+    
+    first = base.overlay({"INSTANCE_ID": "i-1", "SERVICE": "frontend"})
+    second = base.overlay({"INSTANCE_ID": "i-2"})
+    
+    assert first["SERVICE"] == "frontend"
+    assert second["SERVICE"] == "backend"
+    assert first.substitute("$SERVICE/$INSTANCE_ID/$REGION") == "frontend/i-1/us-east-1"
+    assert dict(first.items()) == {"REGION": "us-east-1", "SERVICE": "frontend", "INSTANCE_ID": "i-1"}
+    assert dict(second) == {"REGION": "us-east-1", "SERVICE": "backend", "INSTANCE_ID": "i-2"}
+    assert "INSTANCE_ID" not in base
+
+
+def test__overlay__updates_stay_in_top_scope():
+    base = Variables({"REGION": "us-east-1"})
+    overlay = base.overlay()
+    
+    overlay.update({"REGION": "eu-west-1"})
+    base.update({"SERVICE": "backend"})
+    
+    assert base["REGION"] == "us-east-1"
+    assert overlay["REGION"] == "eu-west-1"
+    assert overlay["SERVICE"] == "backend"
+
+
+def test__merge():
+    base = Variables({"REGION": "us-east-1"}).overlay({"SERVICE": "backend"})
+    
+    merged = base.merge({"SERVICE": "frontend", "INSTANCE_ID": "i-1"})
+    merged.update({"REGION": "eu-west-1"})
+    
+    assert dict(merged) == {"REGION": "eu-west-1", "SERVICE": "frontend", "INSTANCE_ID": "i-1"}
+    assert dict(base) == {"REGION": "us-east-1", "SERVICE": "backend"}
+
+
+def test__update__pass_mapping():
+    params = Variables({"A": "a"})
+    
+    params.update(ChainMap({"C": "c"}, {"B": "b"}))
+    
+    assert dict(params) == {"A": "a", "B": "b", "C": "c"}
+
+
+def test__parse(tmp_path):
+    first = tmp_path / "first.yaml"
+    first.write_text("params:\n  global:\n    A: 1\n    B: b\n  us-east-1:\n    B: region\n", encoding="utf-8")
+    second = tmp_path / "second.yaml"
+    second.write_text("params:\n  global:\n    C: true\n  eu-west-1:\n    A: other\n", encoding="utf-8")
+    
+    params = Variables.parse([str(first), str(second)], "us-east-1")
+    
+    assert dict(params) == {"A": 1, "B": "region", "C": True}
+
+
+def test__parse__empty_scopes(tmp_path):
+    file = tmp_path / "empty.yaml"
+    file.write_text("params:\n  global:\n", encoding="utf-8")
+    
+    assert not dict(Variables.parse(str(file), "us-east-1"))
+
+
+def test__parse__invalid_file(tmp_path):
+    file = tmp_path / "invalid.yaml"
+    file.write_text("params:\n  global:\n    A:\n      nested: 1\n", encoding="utf-8")
+    
+    with pytest.raises(ValidationError):
+        Variables.parse(str(file))
+    
+    file.write_text("params:\n  Invalid_Region:\n    A: 1\n", encoding="utf-8")
+    
+    with pytest.raises(ValidationError):
+        Variables.parse(str(file))
@@ -0,0 +1,162 @@
+import sys
+import json
+import threading
+import subprocess
+
+import pytest
+
+from alertalot.main import run
+from alertalot.generic.execution_plan import ExecutionPlan
+from alertalot.daemon.daemon_client import DaemonClient
+from alertalot.daemon.daemon_server import DaemonServer
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=False)
+
+
+def test__import__heavy_modules_not_loaded():
+    process = _run("-c", "import sys, alertalot.main; print('\\n'.join(sys.modules))")
+    modules = set(process.stdout.splitlines())
+    
+    assert process.returncode == 0
+    assert "alertalot.main" in modules
+    
+    for name in ("boto3", "botocore", "jsonschema", "pytimeparse", "rich", "alertalot.actions"):
+        assert name not in modules
+
+
+def test__help():
+    process = _run("-m", "alertalot.main", "--help")
+    
+    assert process.returncode == 0
+    assert "--show-variables" in process.stdout
+
+
+def test__run__exit_codes(tmp_path):
+    variables = tmp_path / "variables.yaml"
+    variables.write_text("params:\n  global:\n    A: b\n", encoding="utf-8")
+    
+    assert run(["--show-variables", "--vars-file", str(variables), "-q"]) == 0
+    assert run(["--show-variables", "-q"]) == 1
+    assert run(["--unknown-argument"]) == 2
+
+
+def test__run__emulator_throttle_rate_is_probability(capsys):
+    assert run(["--show-variables", "--emulator-throttle-rate", "1.5", "-q"]) == 2
+    assert "not a valid probability" in capsys.readouterr().err
+    
+    assert run(["--show-variables", "--emulator-throttle-rate", "-0.5", "-q"]) == 2
+
+
+def test__run__forward_to_server(tmp_path, capsys):
+    server = DaemonServer(str(tmp_path / "s"), run)
+    variables = tmp_path / "variables.yaml"
+    variables.write_text("params:\n  global:\n    A: b\n", encoding="utf-8")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    
+    try:
+        while DaemonClient(server.path).ping() is None:
+            threading.Event().wait(0.01)
+        
+        exit_code = run(["--socket", server.path, "--show-variables", "--vars-file", str(variables)])
+        requests = DaemonClient(server.path).ping()["requests"]
+    finally:
+        server.shutdown()
+        thread.join(5)
+    
+    assert exit_code == 0
+    assert requests == 1
+    assert "A" in capsys.readouterr().out
+
+
+def test__run__server_not_reachable(tmp_path, capsys):
+    variables = tmp_path / "variables.yaml"
+    variables.write_text("params:\n  global:\n    A: b\n", encoding="utf-8")
+    
+    exit_code = run(["--socket", str(tmp_path / "s"), "--show-variables", "--vars-file", str(variables)])
+    
+    assert exit_code == 0
+    assert "not reachable" in capsys.readouterr().err
+
+
+def test__run__serve_from_server(tmp_path):
+    assert run(["--serve", "--socket", str(tmp_path / "s"), "-q"], clients=lambda args: None) == 1
+
+
+def test__run__worker_from_server(capsys):
+    assert run(["--worker", "https://sqs.us-east-1.amazonaws.com/1/q"], clients=lambda args: None) == 1
+    assert "can not be executed by a server" in capsys.readouterr().out
+
+
+def test__run__worker_not_forwarded(tmp_path, monkeypatch):
+    monkeypatch.setattr(DaemonClient, "run", lambda *args, **kwargs: pytest.fail("worker run forwarded"))
+    monkeypatch.setattr("alertalot.actions.worker_action.execute", lambda *args: None)
+    
+    assert run(["--worker", "https://sqs.us-east-1.amazonaws.com/1/q", "--socket", str(tmp_path / "s"), "-q"]) == 0
+
+
+def test__run__profile(tmp_path, capsys):
+    variables = tmp_path / "variables.yaml"
+    variables.write_text("params:\n  global:\n    A: b\n", encoding="utf-8")
+    profile_file = tmp_path / "run.prof"
+    
+    exit_code = run([
+        "--show-variables",
+        "--vars-file", str(variables),
+        "--profile",
+        "--profile-file", str(profile_file),
+    ])
+    
+    output = capsys.readouterr().out
+    
+    assert exit_code == 0
+    assert profile_file.exists()
+    assert "Profile" in output
+    assert "variables" in output
+    assert "Wall time" in output
+
+
+def test__run__jsonl_output(tmp_path, capsys):
+    variables = tmp_path / "variables.yaml"
+    variables.write_text("params:\n  global:\n    A: b\n", encoding="utf-8")
+    
+    exit_code = run(["--show-variables", "--vars-file", str(variables), "--output", "jsonl"])
+    
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    
+    assert exit_code == 0
+    assert events[-1]["event"] == "values"
+    assert events[-1]["values"]["A"] == "b"
+
+
+def test__run__apply_checks_inputs_hash(tmp_path, capsys):
+    variables = tmp_path / "variables.yaml"
+    variables.write_text("params:\n  global:\n    A: b\n", encoding="utf-8")
+    template = tmp_path / "template.yaml"
+    template.write_text("alarms: []\n", encoding="utf-8")
+    plan_file = tmp_path / "out.plan"
+    
+    plan = ExecutionPlan("stale")
+    plan.add_region("us-east-1", {}, [])
+    plan.save(str(plan_file))
+    
+    arguments = ["--apply", str(plan_file), "--region", "us-east-1", "-q"]
+    inputs = ["--vars-file", str(variables), "--template-file", str(template), "--ec2-id", "i-1"]
+    
+    assert run([*arguments, *inputs]) == 1
+    assert "was computed from other inputs" in capsys.readouterr().out
+    
+    assert run([*arguments, "--vars-file", str(variables)]) == 1
+    assert "--ignore-inputs-hash" in capsys.readouterr().out
+
+
+def test__run__apply_without_inputs(tmp_path):
+    plan_file = tmp_path / "out.plan"
+    
+    plan = ExecutionPlan("any")
+    plan.add_region("us-east-1", {}, [])
+    plan.save(str(plan_file))
+    
+    assert run(["--apply", str(plan_file), "--region", "us-east-1", "-q"]) == 0
@@ -0,0 +1,126 @@
+from unittest.mock import patch
+
+import pytest
+
+from alertalot.generic.variables import Variables
+from alertalot.validation.aws_alarm_validator import AwsAlarmValidator
+from alertalot.validation.alarms_template_compiler import AlarmsTemplateCompiler
+
+
+def _template(**overrides) -> dict:
+    return {
+        "alarms": [
+            {
+                "type": "ec2",
+                "alarm-name": "cpu / $INSTANCE_ID",
+                "metric-name": "CPUUtilization",
+                "alarm-actions": "$ACTION_ARN",
+                "statistic": "Average",
+                "period": "5 minutes",
+                "comparison-operator": "GreaterThanOrEqualToThreshold",
+                "threshold": "$CPU_LIMIT",
+                "evaluation-periods": 1,
+            } | overrides
+        ]
+    }
+
+
+def _variables() -> Variables:
+    return Variables({"ACTION_ARN": "arn:aws:sns:us-east-1:1:topic", "CPU_LIMIT": "80%"})
+
+
+def test__compile_and_render():
+    compiler = AlarmsTemplateCompiler(_variables(), _template(), target_keys=["INSTANCE_ID"])
+    
+    assert compiler.compile()
+    
+    configs, issues = compiler.render({"INSTANCE_ID": "i-1"})
+    
+    assert not issues
+    assert configs == [{
+        "type": "ec2",
+        "metric-name": "CPUUtilization",
+        "alarm-name": "cpu / i-1",
+        "statistic": "Average",
+        "period": 300,
+        "comparison-operator": "GreaterThanOrEqualToThreshold",
+        "threshold": 80.0,
+        "evaluation-periods": 1,
+        "alarm-actions": ["arn:aws:sns:us-east-1:1:topic"],
+        "namespace": "AWS/EC2",
+        "dimensions": {"InstanceId": "i-1"},
+    }]
+
+
+def test__render__static_fields_validated_once():
+    compiler = AlarmsTemplateCompiler(_variables(), _template(), target_keys=["INSTANCE_ID"])
+    compiler.compile()
+    
+    with patch.object(AwsAlarmValidator, "validate_threshold") as validate_threshold, \
+            patch.object(AwsAlarmValidator, "validate_period") as validate_period:
+        for i in range(10):
+            configs, _ = compiler.render({"INSTANCE_ID": f"i-{i}"})
+            
+            assert configs[0]["alarm-name"] == f"cpu / i-{i}"
+    
+    validate_threshold.assert_not_called()
+    validate_period.assert_not_called()
+
+
+def test__render__target_values_override_shared_variables():
+    template = _template(threshold="$LIMIT")
+    compiler = AlarmsTemplateCompiler(
+        Variables({"ACTION_ARN": "arn:aws:sns:us-east-1:1:topic", "LIMIT": "10"}),
+        template,
+        target_keys=["INSTANCE_ID", "LIMIT"])
+    compiler.compile()
+    
+    first, _ = compiler.render({"INSTANCE_ID": "i-1", "LIMIT": "20"})
+    second, _ = compiler.render({"INSTANCE_ID": "i-2"})
+    
+    assert first[0]["threshold"] == 20.0
+    assert second[0]["threshold"] == 10.0
+
+
+def test__render__target_issues():
+    compiler = AlarmsTemplateCompiler(_variables(), _template(), target_keys=["INSTANCE_ID"])
+    compiler.compile()
+    
+    configs, issues = compiler.render({})
+    
+    assert not configs
+    assert len(issues) == 2
+    assert all(issue.startswith("[\"alarms\"][0]") for issue in issues)
+
+
+def test__compile__static_issues_reported_once():
+    compiler = AlarmsTemplateCompiler(_variables(), _template(statistic="Median"), target_keys=["INSTANCE_ID"])
+    
+    assert not compiler.compile()
+    assert not compiler.is_compiled
+    assert compiler.issues == ["[\"alarms\"][0][\"statistic\"] Invalid value provided: 'Median'."]
+
+
+def test__compile__invalid_structure():
+    assert not AlarmsTemplateCompiler(Variables(), {}).compile()
+    assert not AlarmsTemplateCompiler(Variables(), {"alarms": {}}).compile()
+    
+    compiler = AlarmsTemplateCompiler(Variables(), {"alarms": ["cpu", {"type": "ec2"}]})
+    
+    assert not compiler.compile()
+    assert compiler.issues[0] == "Alarm entry at index 0 must be a dictionary, got str"
+    assert all(issue.startswith("[\"alarms\"][1]") for issue in compiler.issues[1:])
+
+
+def test__render__not_compiled():
+    compiler = AlarmsTemplateCompiler(Variables(), {})
+    
+    with pytest.raises(RuntimeError):
+        compiler.render()
+
+
+def test__compile__first_index():
+    compiler = AlarmsTemplateCompiler(_variables(), _template(statistic="Median"), first_index=7)
+    
+    assert not compiler.compile()
+    assert compiler.issues[0].startswith("[\"alarms\"][7]")
@@ -0,0 +1,186 @@
+import json
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from alertalot.generic.output import Output
+from alertalot.aws.rate_limiter import ApiRateLimiter
+from alertalot.generic.concurrent_executor import TaskResult
+from alertalot.worker.memory_queue import MemoryQueue
+from alertalot.worker.launch_worker import LaunchWorker
+from alertalot.validation.alarms_template_compiler import AlarmsTemplateCompiler
+
+
+TEMPLATE = """
+alarms:
+  - type: ec2
+    alarm-name: CPU / $INSTANCE_ID
+    metric-name: CPUUtilization
+    statistic: Average
+    period: 300
+    comparison-operator: GreaterThanOrEqualToThreshold
+    threshold: $CPU_LIMIT
+    evaluation-periods: 1
+"""
+
+
+def _event(instance_id: str, state: str = "running", region: str = "us-east-1") -> str:
+    return json.dumps({
+        "detail-type": "EC2 Instance State-change Notification",
+        "source": "aws.ec2",
+        "region": region,
+        "detail": {"instance-id": instance_id, "state": state},
+    })
+
+
+def _run_args(tmp_path):
+    template = tmp_path / "template.yaml"
+    template.write_text(TEMPLATE, encoding="utf-8")
+    variables = tmp_path / "variables.yaml"
+    variables.write_text("params:\n  global:\n    CPU_LIMIT: 75\n", encoding="utf-8")
+    
+    run_args = Mock()
+    run_args.template_file = str(template)
+    run_args.var_files = [str(variables)]
+    run_args.variables = {}
+    run_args.region = "us-east-1"
+    run_args.for_region.return_value = run_args
+    run_args.clients.limiter.return_value = ApiRateLimiter()
+    
+    return run_args
+
+
+def _entity(instance_ids):
+    entity = Mock()
+    entity.iter_entities.return_value = [{"InstanceId": instance_id} for instance_id in instance_ids]
+    entity.get_entity_id.side_effect = lambda target: target["InstanceId"]
+    entity.get_resource_values.side_effect = lambda target: {"INSTANCE_ID": target["InstanceId"]}
+    
+    return entity
+
+
+def _create(failing=()):
+    def create(_run_args, _output, requests):
+        return [
+            TaskResult(request["AlarmName"], error=RuntimeError("throttled"))
+            if target in failing else TaskResult(request["AlarmName"], result="create")
+            for target, request in requests
+        ]
+    
+    return Mock(side_effect=create)
+
+
+@pytest.mark.parametrize("body, expected", [
+    (_event("i-1"), ("us-east-1", "i-1")),
+    (json.dumps({"Type": "Notification", "Message": _event("i-1")}), ("us-east-1", "i-1")),
+    (_event("i-1", state="stopped"), None),
+    (json.dumps({"detail-type": "AWS API Call via CloudTrail", "detail": {}}), None),
+])
+def test__parse_event(body, expected):
+    assert LaunchWorker.parse_event(body) == expected
+
+
+@pytest.mark.parametrize("body", ["not json", "[1]"])
+def test__parse_event__invalid(body):
+    with pytest.raises(ValueError):
+        LaunchWorker.parse_event(body)
+
+
+def test__collect__coalesces_burst():
+    queue = MemoryQueue()
+    
+    for i in range(25):
+        queue.send(_event(f"i-{i}"))
+    
+    worker = LaunchWorker(
+        Mock(),
+        Output(is_quiet=True),
+        queue,
+        coalesce_seconds=1,
+        wait_seconds=0,
+        max_batch_messages=200)
+    
+    assert len(worker.collect()) == 25
+    assert not worker.collect()
+
+
+def test__collect__limited_by_alarms_rate(tmp_path):
+    queue = MemoryQueue()
+    
+    for i in range(25):
+        queue.send(_event(f"i-{i}"))
+    
+    run_args = _run_args(tmp_path)
+    run_args.clients.limiter.return_value = ApiRateLimiter({"cloudwatch.PutMetricAlarm": 0.1})
+    worker = LaunchWorker(run_args, Output(is_quiet=True), queue, coalesce_seconds=1, wait_seconds=0)
+    
+    assert worker.batch_size() == 15
+    assert len(worker.collect()) == 15
+    assert len(worker.collect()) == 10
+
+
+@pytest.mark.parametrize("alarms, rate, expected", [
+    (5, 3, 90),
+    (1, 3, 200),
+    (1000, 3, 1),
+    (0, 3, 200),
+    (5, None, 200),
+])
+def test__estimate_batch_size(alarms, rate, expected):
+    assert LaunchWorker.estimate_batch_size(alarms, rate) == expected
+
+
+def test__process(tmp_path):
+    queue = MemoryQueue()
+    
+    for body in [_event("i-1"), _event("i-1"), _event("i-2"), _event("i-3"), _event("i-4", state="stopped"), "{"]:
+        queue.send(body)
+    
+    worker = LaunchWorker(_run_args(tmp_path), Output(is_quiet=True), queue, wait_seconds=0)
+    entity = _entity(["i-1", "i-2"])
+    create = _create(failing={"i-2"})
+    
+    with patch("alertalot.worker.launch_worker.AwsEc2Entity", return_value=entity), \
+            patch("alertalot.worker.launch_worker.CreateAlarmsBatchAction.execute", create):
+        summary = worker.process(worker.collect())
+    
+    assert summary == {"Launched": 1, "Missing": 1, "Failed": 1, "Discarded": 1, "Invalid": 1}
+    assert entity.iter_entities.call_args.args[0] == [{"Name": "instance-id", "Values": ["i-1", "i-2", "i-3"]}]
+    assert [target for target, _ in create.call_args.args[2]] == ["i-1", "i-2"]
+    assert create.call_args.args[2][0][1]["Threshold"] == 75.0
+    assert len(queue) == 2
+
+
+def test__process__invalid_alarms_kept(tmp_path):
+    queue = MemoryQueue()
+    queue.send(_event("i-1"))
+    run_args = _run_args(tmp_path)
+    (tmp_path / "variables.yaml").write_text("params:\n  global:\n    OTHER: 1\n", encoding="utf-8")
+    
+    worker = LaunchWorker(run_args, Output(is_quiet=True), queue, wait_seconds=0)
+    
+    with patch("alertalot.worker.launch_worker.AwsEc2Entity", return_value=_entity(["i-1"])), \
+            patch("alertalot.worker.launch_worker.CreateAlarmsBatchAction.execute", _create()) as create:
+        summary = worker.process(worker.collect())
+    
+    assert summary["Failed"] == 1
+    create.assert_not_called()
+    assert len(queue) == 1
+
+
+def test__run__compiles_once(tmp_path):
+    queue = MemoryQueue()
+    worker = LaunchWorker(_run_args(tmp_path), Output(is_quiet=True), queue, coalesce_seconds=0, wait_seconds=0)
+    
+    with patch("alertalot.worker.launch_worker.AwsEc2Entity", side_effect=lambda _: _entity(["i-1"])), \
+            patch("alertalot.worker.launch_worker.CreateAlarmsBatchAction.execute", _create()), \
+            patch.object(AlarmsTemplateCompiler, "compile", autospec=True,
+                         side_effect=AlarmsTemplateCompiler.compile) as compile_:
+        queue.send(_event("i-1"))
+        worker.run(drain=True)
+        queue.send(_event("i-1"))
+        worker.run(drain=True)
+    
+    compile_.assert_called_once()
+    assert len(queue) == 0
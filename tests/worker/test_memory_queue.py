@@ -0,0 +1,52 @@
+from alertalot.worker.memory_queue import MemoryQueue
+
+
+class _Clock:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def test__receive__in_order():
+    queue = MemoryQueue()
+    
+    for i in range(3):
+        queue.send(f"m{i}")
+    
+    assert [message.body for message in queue.receive(2, 0, 30)] == ["m0", "m1"]
+    assert [message.body for message in queue.receive(10, 0, 30)] == ["m2"]
+    assert not queue.receive(10, 0, 30)
+
+
+def test__receive__visibility_timeout():
+    clock = _Clock()
+    queue = MemoryQueue(clock)
+    message_id = queue.send("m")
+    
+    first = queue.receive(10, 0, 30)
+    
+    clock.now = 29
+    assert not queue.receive(10, 0, 30)
+    
+    clock.now = 30
+    second = queue.receive(10, 0, 30)
+    
+    assert [message.message_id for message in first] == [message_id]
+    assert [message.message_id for message in second] == [message_id]
+    assert first[0].receipt_handle != second[0].receipt_handle
+
+
+def test__delete():
+    clock = _Clock()
+    queue = MemoryQueue(clock)
+    queue.send("a")
+    queue.send("b")
+    
+    messages = queue.receive(10, 0, 30)
+    queue.delete(messages[:1])
+    clock.now = 30
+    
+    assert len(queue) == 1
+    assert [message.body for message in queue.receive(10, 0, 30)] == ["b"]
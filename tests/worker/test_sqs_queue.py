@@ -0,0 +1,66 @@
+import boto3
+
+from botocore.stub import Stubber
+
+from alertalot.worker.message_queue import QueueMessage
+from alertalot.worker.sqs_queue import SqsQueue
+
+
+URL = "https://sqs.us-east-1.amazonaws.com/123456789012/launches"
+
+
+def test__receive():
+    sqs = boto3.client("sqs", region_name="us-east-1")
+    
+    with Stubber(sqs) as stubber:
+        stubber.add_response(
+            "receive_message",
+            {"Messages": [{"MessageId": "1", "Body": "{}", "ReceiptHandle": "r1"}]},
+            {"QueueUrl": URL, "MaxNumberOfMessages": 10, "WaitTimeSeconds": 20, "VisibilityTimeout": 300})
+        stubber.add_response(
+            "receive_message",
+            {},
+            {"QueueUrl": URL, "MaxNumberOfMessages": 5, "WaitTimeSeconds": 0, "VisibilityTimeout": 300})
+        
+        queue = SqsQueue(sqs, URL)
+        messages = queue.receive(50, 20, 300)
+        
+        assert [(m.message_id, m.body, m.receipt_handle) for m in messages] == [("1", "{}", "r1")]
+        assert not queue.receive(5, 0, 300)
+        
+        stubber.assert_no_pending_responses()
+
+
+def test__delete__batched():
+    sqs = boto3.client("sqs", region_name="us-east-1")
+    messages = [QueueMessage(str(i), "{}", f"r{i}") for i in range(12)]
+    
+    with Stubber(sqs) as stubber:
+        stubber.add_response(
+            "delete_message_batch",
+            {"Successful": [], "Failed": []},
+            {"QueueUrl": URL, "Entries": [{"Id": str(i), "ReceiptHandle": f"r{i}"} for i in range(10)]})
+        stubber.add_response(
+            "delete_message_batch",
+            {"Successful": [], "Failed": []},
+            {"QueueUrl": URL, "Entries": [{"Id": str(i), "ReceiptHandle": f"r{i + 10}"} for i in range(2)]})
+        
+        SqsQueue(sqs, URL).delete(messages)
+        
+        stubber.assert_no_pending_responses()
+
+
+def test__delete__failed():
+    sqs = boto3.client("sqs", region_name="us-east-1")
+    
+    with Stubber(sqs) as stubber:
+        stubber.add_response(
+            "delete_message_batch",
+            {"Successful": [], "Failed": [{"Id": "0", "SenderFault": True, "Code": "x", "Message": "expired"}]},
+            {"QueueUrl": URL, "Entries": [{"Id": "0", "ReceiptHandle": "r0"}]})
+        
+        try:
+            SqsQueue(sqs, URL).delete([QueueMessage("0", "{}", "r0")])
+            assert False
+        except RuntimeError as e:
+            assert "expired" in str(e)